@@ -0,0 +1,259 @@
+"""Benchmarks for identity/auth hot paths.
+
+``JtiReplayCache`` with 10k / 100k / 1M live ``jti`` entries:
+- ``check_and_record`` of fresh ``jti`` values below capacity (prune finds
+  nothing expired) and at capacity (each insert evicts the earliest expiry)
+- ``contains`` lookups
+- Scan baseline: the pre-heap cache, which scanned every entry on each call
+  and ran ``min()`` over the map per eviction (10k only; larger sizes take
+  minutes)
+
+``verify_agent_jwt`` / ``verify_host_jwt`` for a token presented repeatedly,
+with and without a ``VerifiedTokenCache`` (in-memory stores).
+
+``JWKSValidator.validate_token`` against an IdP with 10 ms JWKS latency:
+- 100 concurrent requests while the cached key set is due for refresh
+  (stale-while-revalidate) vs hard-expired (every request waits on the fetch)
+- 100 tokens signed by an unknown key, with and without the forced-refetch
+  rate limit (one JWKS fetch per token without it)
+
+Run with: uv run pytest benchmarks/benchmark_auth.py --benchmark-only -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import itertools
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from joserfc import jwk
+from joserfc import jwt as jose_jwt
+from joserfc.errors import JoseError
+
+from asap.auth.agent_jwt import (
+    JtiReplayCache,
+    VerifiedTokenCache,
+    create_agent_jwt,
+    create_host_jwt,
+    verify_agent_jwt,
+    verify_host_jwt,
+)
+from asap.auth.jwks import JWKSCache, JWKSValidator
+from asap.auth.identity import (
+    AgentSession,
+    HostIdentity,
+    InMemoryAgentStore,
+    InMemoryHostStore,
+    jwk_thumbprint_sha256,
+)
+
+LIVE_JTIS = [10_000, 100_000, 1_000_000]
+BATCH = 1_000
+
+
+def _filled(live: int, max_size: int) -> JtiReplayCache:
+    cache = JtiReplayCache(ttl_seconds=3600.0, max_size=max_size)
+    for i in range(live):
+        cache.check_and_record(f"host_{i % 64}", f"jti_{i}")
+    return cache
+
+
+class _ScanJtiReplayCache:
+    """The pre-heap ``JtiReplayCache``: full scan per call, ``min()`` per eviction."""
+
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._expiry_by_key: dict[tuple[str, str], float] = {}
+
+    def check_and_record(self, partition_key: str, jti: str) -> bool:
+        now = time.time()
+        for k in [k for k, exp in self._expiry_by_key.items() if exp <= now]:
+            del self._expiry_by_key[k]
+        key = (partition_key, jti)
+        if key in self._expiry_by_key and self._expiry_by_key[key] > now:
+            return False
+        self._expiry_by_key[key] = now + self._ttl
+        while len(self._expiry_by_key) > self._max_size:
+            oldest = min(self._expiry_by_key, key=lambda k: self._expiry_by_key[k])
+            del self._expiry_by_key[oldest]
+        return True
+
+
+def _record_batch(cache: Any, fresh: itertools.count[int]) -> None:
+    for _ in range(BATCH):
+        assert cache.check_and_record("host_bench", f"fresh_{next(fresh)}")
+
+
+class TestJtiReplayCache:
+    """``BATCH`` operations per round against a pre-filled cache."""
+
+    @pytest.mark.parametrize("live", LIVE_JTIS)
+    def test_check_and_record(self, benchmark: Any, live: int) -> None:
+        """Benchmark first-use recording with ``live`` unexpired entries."""
+        cache = _filled(live, max_size=live * 2)
+        fresh = itertools.count()
+        benchmark.pedantic(lambda: _record_batch(cache, fresh), rounds=5, iterations=1)
+
+    @pytest.mark.parametrize("live", LIVE_JTIS)
+    def test_check_and_record_at_capacity(self, benchmark: Any, live: int) -> None:
+        """Benchmark recording into a full cache (one eviction per insert)."""
+        cache = _filled(live, max_size=live)
+        fresh = itertools.count()
+        benchmark.pedantic(lambda: _record_batch(cache, fresh), rounds=5, iterations=1)
+
+    @pytest.mark.parametrize("live", LIVE_JTIS)
+    def test_contains(self, benchmark: Any, live: int) -> None:
+        """Benchmark replay lookups of recorded ``jti`` values."""
+        cache = _filled(live, max_size=live)
+
+        def lookups() -> None:
+            for i in range(BATCH):
+                assert cache.contains(f"host_{i % 64}", f"jti_{i}")
+
+        benchmark.pedantic(lookups, rounds=5, iterations=1)
+
+    def test_scan_baseline_at_capacity(self, benchmark: Any) -> None:
+        """Baseline: the scanning cache, full at 10k entries."""
+        cache = _ScanJtiReplayCache(ttl_seconds=3600.0, max_size=LIVE_JTIS[0])
+        for i in range(LIVE_JTIS[0]):
+            cache.check_and_record(f"host_{i % 64}", f"jti_{i}")
+        fresh = itertools.count()
+        benchmark.pedantic(lambda: _record_batch(cache, fresh), rounds=1, iterations=1)
+
+
+# -- JWT verification --------------------------------------------------------
+
+VERIFY_CALLS = 100
+
+
+def _public_jwk(private_key: Ed25519PrivateKey) -> dict[str, Any]:
+    raw = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
+    )
+    return {"kty": "OKP", "crv": "Ed25519", "x": base64.urlsafe_b64encode(raw).decode().rstrip("=")}
+
+
+def _identity() -> tuple[InMemoryHostStore, InMemoryAgentStore, str, str]:
+    """Stores holding one active host and agent, plus a Host JWT and an Agent JWT."""
+    now = datetime.now(timezone.utc)
+    host_sk = Ed25519PrivateKey.generate()
+    agent_sk = Ed25519PrivateKey.generate()
+    hosts = InMemoryHostStore()
+    agents = InMemoryAgentStore()
+    host = HostIdentity(
+        host_id="h1",
+        public_key=_public_jwk(host_sk),
+        status="active",
+        created_at=now,
+        updated_at=now,
+    )
+    agent = AgentSession(
+        agent_id="a1",
+        host_id="h1",
+        public_key=_public_jwk(agent_sk),
+        mode="delegated",
+        status="active",
+        created_at=now,
+    )
+    asyncio.run(hosts.save(host))
+    asyncio.run(agents.save(agent))
+    host_token = create_host_jwt(host_sk, aud="bench")
+    agent_token = create_agent_jwt(
+        agent_sk,
+        host_thumbprint=jwk_thumbprint_sha256(host.public_key),
+        agent_id="a1",
+        aud="bench",
+    )
+    return hosts, agents, host_token, agent_token
+
+
+@pytest.mark.filterwarnings("ignore:EdDSA is deprecated:UserWarning")
+class TestJwtVerification:
+    """``VERIFY_CALLS`` verifications of the same token per round."""
+
+    @pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+    def test_verify_agent_jwt(self, benchmark: Any, cached: bool) -> None:
+        """Benchmark Agent JWT verification (no ``jti`` cache, so reuse is allowed)."""
+        hosts, agents, _, token = _identity()
+        cache = VerifiedTokenCache() if cached else None
+
+        async def verify() -> None:
+            for _ in range(VERIFY_CALLS):
+                result = await verify_agent_jwt(
+                    token, hosts, agents, expected_audience="bench", verified_cache=cache
+                )
+                assert result.ok
+
+        benchmark.pedantic(lambda: asyncio.run(verify()), rounds=5, iterations=1)
+
+    @pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+    def test_verify_host_jwt(self, benchmark: Any, cached: bool) -> None:
+        """Benchmark Host JWT verification for a registered host."""
+        hosts, _, token, _ = _identity()
+        cache = VerifiedTokenCache() if cached else None
+
+        async def verify() -> None:
+            for _ in range(VERIFY_CALLS):
+                result = await verify_host_jwt(
+                    token, hosts, expected_audience="bench", verified_cache=cache
+                )
+                assert result.ok
+
+        benchmark.pedantic(lambda: asyncio.run(verify()), rounds=5, iterations=1)
+
+
+JWKS_LATENCY_SECONDS = 0.01
+JWKS_REQUESTS = 100
+
+
+def _jwks_fixture() -> tuple[Any, str, str]:
+    signer = jwk.RSAKey.generate_key(2048, private=True)
+    unknown = jwk.RSAKey.generate_key(2048, private=True)
+    key_set = jwk.KeySet.import_key_set({"keys": [signer.as_dict(private=False)]})
+
+    async def fetcher(uri: str) -> jwk.KeySet:
+        await asyncio.sleep(JWKS_LATENCY_SECONDS)
+        return key_set
+
+    claims = {"sub": "bench", "exp": int(time.time()) + 3600}
+    token = jose_jwt.encode({"alg": "RS256"}, claims, signer)
+    unknown_token = jose_jwt.encode({"alg": "RS256"}, claims, unknown)
+    return fetcher, token, unknown_token
+
+
+class TestJwksValidation:
+    """``JWKSValidator`` request latency around JWKS refreshes."""
+
+    @pytest.mark.parametrize("state", ["stale", "expired"])
+    def test_concurrent_validation(self, benchmark: Any, state: str) -> None:
+        """Benchmark a burst of concurrent validations when the cached keys are old."""
+        fetcher, token, _ = _jwks_fixture()
+        cache = JWKSCache(refresh_after_seconds=0) if state == "stale" else JWKSCache(ttl_seconds=0)
+        validator = JWKSValidator("https://idp.example.com/jwks.json", fetcher=fetcher, cache=cache)
+
+        async def burst() -> None:
+            await validator.fetch_keys()
+            await asyncio.gather(*(validator.validate_token(token) for _ in range(JWKS_REQUESTS)))
+
+        benchmark.pedantic(lambda: asyncio.run(burst()), rounds=5, iterations=1)
+
+    @pytest.mark.parametrize("min_interval", [30.0, 0.0], ids=["rate-limited", "unlimited"])
+    def test_unknown_kid_flood(self, benchmark: Any, min_interval: float) -> None:
+        """Benchmark tokens whose key is not in the JWKS (each forces a refetch attempt)."""
+        fetcher, _, unknown_token = _jwks_fixture()
+        cache = JWKSCache(min_forced_refresh_seconds=min_interval)
+        validator = JWKSValidator("https://idp.example.com/jwks.json", fetcher=fetcher, cache=cache)
+
+        async def flood() -> None:
+            for _ in range(JWKS_REQUESTS):
+                with pytest.raises(JoseError):
+                    await validator.validate_token(unknown_token)
+
+        benchmark.pedantic(lambda: asyncio.run(flood()), rounds=3, iterations=1)
@@ -2,7 +2,10 @@
 
 Measures performance of:
 - Ed25519 signing and verification
-- JCS canonicalization overhead
+- JCS canonicalization overhead: fast ``canonical_json`` vs the reference
+  ``jcs`` package, on a plain manifest and one carrying JSON Schemas
+- Batch verification: ``verify_manifest`` per manifest vs ``ManifestVerifier``
+  (first sweep, repeat sweep, threaded ``verify_many``)
 - Compliance harness execution time (handshake)
 
 Run with: uv run pytest benchmarks/benchmark_crypto.py --benchmark-only -v
@@ -16,8 +19,12 @@ from typing import Any
 import httpx
 import pytest
 
+from asap.crypto import signing
+from asap.crypto.canonical import canonical_json, reference_canonical_json
 from asap.crypto.keys import generate_keypair
+from asap.crypto.models import SignedManifest
 from asap.crypto.signing import canonicalize, sign_manifest, verify_manifest
+from asap.crypto.verifier import ManifestVerifier
 from asap.models.entities import Capability, Endpoint, Manifest, Skill
 
 
@@ -97,6 +104,124 @@ class TestJcsCanonicalization:
         assert isinstance(result, bytes)
         assert result.startswith(b"{")
 
+    def test_canonicalize_manifest_reference(
+        self,
+        benchmark: Any,
+        benchmark_manifest: Manifest,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Baseline: ``canonicalize`` with ``ASAP_CANONICALIZER=jcs``."""
+        monkeypatch.setattr(signing, "CANONICALIZER", "jcs")
+        result = benchmark(canonicalize, benchmark_manifest)
+        assert result == canonical_json(benchmark_manifest.model_dump(exclude={"signature"}))
+
+    @pytest.mark.parametrize(
+        "encode", [canonical_json, reference_canonical_json], ids=["fast", "reference"]
+    )
+    def test_canonicalize_schema_payload(self, benchmark: Any, encode: Any) -> None:
+        """Manifest payload with 10 skills carrying input/output JSON Schemas."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "maxLength": 512, "description": "Query text"},
+                "limit": {"type": "integer", "minimum": 1, "maximum": 100, "default": 10},
+                "threshold": {"type": "number", "minimum": 0.0, "maximum": 1.0, "default": 0.75},
+            },
+            "required": ["query"],
+        }
+        manifest = Manifest(
+            id="urn:asap:agent:benchmark-schemas",
+            name="Benchmark Schema Agent",
+            version="1.0.0",
+            description="Agent with schema-heavy skills",
+            capabilities=Capability(
+                asap_version="0.1",
+                skills=[
+                    Skill(
+                        id=f"skill-{i}",
+                        description="Search",
+                        input_schema=schema,
+                        output_schema=schema,
+                    )
+                    for i in range(10)
+                ],
+                state_persistence=False,
+            ),
+            endpoints=Endpoint(asap="https://example.com/asap"),
+        )
+        payload = manifest.model_dump(exclude={"signature"})
+        result = benchmark(encode, payload)
+        assert result == reference_canonical_json(payload)
+
+
+BATCH_SIZE = 1_000
+BATCH_SIGNERS = 10
+
+
+@pytest.fixture(scope="module")
+def signed_batch() -> list[SignedManifest]:
+    """``BATCH_SIZE`` distinct manifests signed by ``BATCH_SIGNERS`` keys."""
+    keys = [generate_keypair()[0] for _ in range(BATCH_SIGNERS)]
+    return [
+        sign_manifest(
+            Manifest(
+                id=f"urn:asap:agent:batch-{i}",
+                name=f"Batch Agent {i}",
+                version="1.0.0",
+                description="Agent for batch verification benchmarks",
+                capabilities=Capability(
+                    asap_version="0.1",
+                    skills=[Skill(id=f"skill-{j}", description="Skill") for j in range(5)],
+                    state_persistence=False,
+                ),
+                endpoints=Endpoint(asap=f"https://agent-{i}.example.com/asap"),
+            ),
+            keys[i % BATCH_SIGNERS],
+        )
+        for i in range(BATCH_SIZE)
+    ]
+
+
+class TestBatchVerification:
+    """Benchmarks for verifying ``BATCH_SIZE`` signed manifests per round."""
+
+    def test_verify_manifest_loop(self, benchmark: Any, signed_batch: list[SignedManifest]) -> None:
+        """Baseline: stateless ``verify_manifest`` per manifest."""
+        benchmark.pedantic(
+            lambda: [verify_manifest(s) for s in signed_batch], rounds=3, iterations=1
+        )
+
+    def test_verify_many_first_sweep(
+        self, benchmark: Any, signed_batch: list[SignedManifest]
+    ) -> None:
+        """``verify_many`` with a fresh verifier (key cache warms, payload cache misses)."""
+
+        def sweep() -> list[Any]:
+            return ManifestVerifier(max_workers=1).verify_many(signed_batch)
+
+        errors = benchmark.pedantic(sweep, rounds=3, iterations=1)
+        assert not any(errors)
+
+    def test_verify_many_repeat_sweep(
+        self, benchmark: Any, signed_batch: list[SignedManifest]
+    ) -> None:
+        """``verify_many`` re-verifying unchanged manifests (both caches hit)."""
+        verifier = ManifestVerifier(max_workers=1)
+        verifier.verify_many(signed_batch)
+        errors = benchmark.pedantic(
+            lambda: verifier.verify_many(signed_batch), rounds=3, iterations=1
+        )
+        assert not any(errors)
+
+    def test_verify_many_threaded(self, benchmark: Any, signed_batch: list[SignedManifest]) -> None:
+        """Repeat sweep spread over the thread pool (scales with cores outside the GIL)."""
+        verifier = ManifestVerifier()
+        verifier.verify_many(signed_batch)
+        errors = benchmark.pedantic(
+            lambda: verifier.verify_many(signed_batch), rounds=3, iterations=1
+        )
+        assert not any(errors)
+
 
 class TestComplianceHarnessExecution:
     """Benchmarks for compliance harness execution time."""
@@ -0,0 +1,235 @@
+"""Benchmarks for SQLite usage metering aggregation.
+
+These benchmarks measure ``SQLiteMeteringStorage.aggregate()`` and ``summary()``
+against a pre-seeded ``usage_events`` table:
+- SQL-side ``GROUP BY`` over the ``usage_rollups`` buckets plus raw range edges
+  (current path), unbounded and over an unaligned one-week range
+- Full-scan baseline: load every row into ``UsageMetrics`` and aggregate in
+  Python (the pre-columnar path), for comparison
+- ``InMemoryMeteringStorage`` with ``IN_MEMORY_EVENTS`` events: per-agent
+  aggregate, one agent's events over a day, and retention purge, served from
+  its time/agent/consumer index and running totals
+
+The table is seeded once per module with raw ``executemany`` (not via
+``record()``), and the rollups are backfilled when the storage is first opened,
+so neither is part of any measurement.
+
+Row count defaults to 1M; run the 10M case with ``ASAP_BENCH_METERING_ROWS``:
+
+Run with: uv run pytest benchmarks/benchmark_metering.py --benchmark-only -v
+          ASAP_BENCH_METERING_ROWS=10000000 uv run pytest benchmarks/benchmark_metering.py \
+              --benchmark-only -v
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from asap.economics.metering import UsageMetrics
+from asap.economics.storage import (
+    _USAGE_EVENTS_SELECT,
+    InMemoryMeteringStorage,
+    MeteringQuery,
+    SQLiteMeteringStorage,
+    _dispatch_aggregate,
+    _row_to_metrics,
+)
+from asap.state.stores.sqlite import _USAGE_EVENTS_DDL
+
+ROWS = int(os.environ.get("ASAP_BENCH_METERING_ROWS", "1000000"))
+AGENTS = 50
+CONSUMERS = 500
+SEED_CHUNK = 50_000
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _seed_rows(count: int) -> Iterator[tuple[Any, ...]]:
+    for i in range(count):
+        tokens_in, tokens_out, duration_ms, api_calls = i % 997, i % 389, i % 5003, i % 7
+        metrics = json.dumps(
+            {
+                "tokens_in": tokens_in,
+                "tokens_out": tokens_out,
+                "duration_ms": duration_ms,
+                "api_calls": api_calls,
+            }
+        )
+        yield (
+            f"evt_{i:010d}",
+            f"task_{i}",
+            f"agent_{i % AGENTS}",
+            f"consumer_{i % CONSUMERS}",
+            metrics,
+            (START + timedelta(seconds=7 * i)).isoformat(),
+            tokens_in,
+            tokens_out,
+            duration_ms,
+            api_calls,
+        )
+
+
+@pytest.fixture(scope="module")
+def metering_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """SQLite file holding ``ROWS`` usage events spread over agents, consumers and days."""
+    db_path = tmp_path_factory.mktemp("metering") / "usage.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(_USAGE_EVENTS_DDL)
+    rows = _seed_rows(ROWS)
+    while chunk := list(itertools.islice(rows, SEED_CHUNK)):
+        conn.executemany("INSERT INTO usage_events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", chunk)
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+@pytest.fixture(scope="module")
+def storage(metering_db: Path) -> SQLiteMeteringStorage:
+    """Storage over the seeded file, opened once so the rollup backfill is not timed."""
+    store = SQLiteMeteringStorage(db_path=metering_db)
+    asyncio.run(store.stats())
+    return store
+
+
+class TestSqlAggregation:
+    """Benchmarks for aggregate()/summary() pushed down into SQL."""
+
+    @pytest.mark.parametrize("group_by", ["agent", "consumer", "day", "week"])
+    def test_aggregate(self, benchmark: Any, storage: SQLiteMeteringStorage, group_by: str) -> None:
+        """Benchmark one GROUP BY aggregate over every row."""
+        result = benchmark.pedantic(
+            lambda: asyncio.run(storage.aggregate(group_by)), rounds=3, iterations=1
+        )
+        assert sum(a.total_tasks for a in result) == ROWS
+
+    def test_aggregate_unaligned_week(self, benchmark: Any, storage: SQLiteMeteringStorage) -> None:
+        """Benchmark aggregate('day') over a week whose bounds fall mid-minute."""
+        filters = MeteringQuery(
+            start=START + timedelta(days=3, hours=5, minutes=7, seconds=11),
+            end=START + timedelta(days=10, hours=17, minutes=3, seconds=29),
+        )
+        result = benchmark.pedantic(
+            lambda: asyncio.run(storage.aggregate("day", filters)), rounds=3, iterations=1
+        )
+        assert result
+
+    def test_summary(self, benchmark: Any, storage: SQLiteMeteringStorage) -> None:
+        """Benchmark the dashboard summary over every row."""
+        result = benchmark.pedantic(lambda: asyncio.run(storage.summary()), rounds=3, iterations=1)
+        assert result.total_tasks == ROWS
+        assert result.unique_agents == AGENTS
+
+
+class TestFullScanBaseline:
+    """Pre-columnar baseline: materialize every event, then aggregate in Python."""
+
+    def test_aggregate_agent_full_scan(
+        self, benchmark: Any, storage: SQLiteMeteringStorage
+    ) -> None:
+        """Benchmark aggregate('agent') the way it ran before SQL pushdown."""
+
+        async def full_scan() -> list[Any]:
+            rows = await storage.fetch_all(f"{_USAGE_EVENTS_SELECT} ORDER BY timestamp")
+            return _dispatch_aggregate([_row_to_metrics(r) for r in rows], "agent")
+
+        result = benchmark.pedantic(lambda: asyncio.run(full_scan()), rounds=1, iterations=1)
+        assert sum(a.total_tasks for a in result) == ROWS
+
+
+# -- In-memory storage -------------------------------------------------------
+
+IN_MEMORY_EVENTS = 200_000
+
+
+def _in_memory_events() -> list[UsageMetrics]:
+    return [
+        UsageMetrics(
+            task_id=f"task_{i}",
+            agent_id=f"agent_{i % AGENTS}",
+            consumer_id=f"consumer_{i % CONSUMERS}",
+            tokens_in=i % 997,
+            tokens_out=i % 389,
+            duration_ms=i % 5003,
+            api_calls=i % 7,
+            timestamp=START + timedelta(seconds=7 * i),
+        )
+        for i in range(IN_MEMORY_EVENTS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def in_memory_events() -> list[UsageMetrics]:
+    return _in_memory_events()
+
+
+def _in_memory_storage(
+    events: list[UsageMetrics], retention_ttl_seconds: int | None = None
+) -> InMemoryMeteringStorage:
+    store = InMemoryMeteringStorage(retention_ttl_seconds=retention_ttl_seconds)
+
+    async def fill() -> None:
+        for event in events:
+            await store.record(event)
+
+    asyncio.run(fill())
+    return store
+
+
+@pytest.fixture(scope="module")
+def in_memory_storage(in_memory_events: list[UsageMetrics]) -> InMemoryMeteringStorage:
+    """``InMemoryMeteringStorage`` holding ``IN_MEMORY_EVENTS`` events over ~16 days."""
+    return _in_memory_storage(in_memory_events)
+
+
+class TestInMemoryStorage:
+    """Indexed ``InMemoryMeteringStorage`` vs aggregating the raw event list."""
+
+    def test_aggregate_agent(
+        self, benchmark: Any, in_memory_storage: InMemoryMeteringStorage
+    ) -> None:
+        """Benchmark aggregate('agent') served from running totals."""
+        result = benchmark(lambda: asyncio.run(in_memory_storage.aggregate("agent")))
+        assert sum(a.total_tasks for a in result) == IN_MEMORY_EVENTS
+
+    def test_aggregate_agent_scan(
+        self, benchmark: Any, in_memory_events: list[UsageMetrics]
+    ) -> None:
+        """Baseline: sort and aggregate every event (the pre-index path)."""
+        result = benchmark.pedantic(
+            lambda: _dispatch_aggregate(
+                sorted(in_memory_events, key=lambda e: e.timestamp), "agent"
+            ),
+            rounds=3,
+            iterations=1,
+        )
+        assert sum(a.total_tasks for a in result) == IN_MEMORY_EVENTS
+
+    def test_query_agent_day(
+        self, benchmark: Any, in_memory_storage: InMemoryMeteringStorage
+    ) -> None:
+        """Benchmark one agent's events over one day (two bisects on its index)."""
+        filters = MeteringQuery(
+            agent_id="agent_7", start=START + timedelta(days=5), end=START + timedelta(days=6)
+        )
+        result = benchmark(lambda: asyncio.run(in_memory_storage.query(filters)))
+        assert result and all(e.agent_id == "agent_7" for e in result)
+
+    def test_purge_expired(self, benchmark: Any, in_memory_events: list[UsageMetrics]) -> None:
+        """Benchmark purging the oldest ~10% of events (store rebuilt per round, untimed)."""
+        cutoff = START + timedelta(seconds=7 * IN_MEMORY_EVENTS // 10)
+
+        def setup() -> tuple[tuple[InMemoryMeteringStorage], dict[str, Any]]:
+            ttl = int((datetime.now(timezone.utc) - cutoff).total_seconds())
+            return (_in_memory_storage(in_memory_events, ttl),), {}
+
+        removed = benchmark.pedantic(
+            lambda store: asyncio.run(store.purge_expired()), setup=setup, rounds=3
+        )
+        assert removed > 0
@@ -0,0 +1,228 @@
+"""Benchmarks for delta-encoded and compressed SQLite snapshot storage.
+
+One task accumulates 1000 versions of a ~200-key state document, each step
+changing a few keys (the usual agent checkpoint pattern). Both encodings are
+measured on the same history:
+- ``full``: every version stores the whole document (``delta_interval=None``)
+- ``delta``: full copy every 20 versions, JSON patches in between
+- ``brotli``: every version in full, as a brotli-compressed BLOB
+- ``delta_brotli``: both
+
+For each: time to save the 1000 versions, time to read 100 random versions
+(cold cache, so most reads replay a chain) and the latest version, and the
+database size after a WAL checkpoint (reported in ``extra_info``).
+
+``TestSnapshotStoreLatency`` compares save+get latency across store flavours:
+``InMemorySnapshotStore``, ``SQLiteAsyncSnapshotStore``, the direct ``sqlite3``
+``SQLiteSnapshotStore``, and the async store driven through the ``_run_sync``
+bridge (the old ``SQLiteSnapshotStore``), from sync code and from a running loop.
+
+Run with: uv run pytest benchmarks/benchmark_snapshots.py --benchmark-only -v
+"""
+
+import asyncio
+import random
+import sqlite3
+from datetime import datetime, timezone
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from asap.models.entities import StateSnapshot
+from asap.state.stores._sqlite_base import close_connection_pools
+from asap.state.stores._sync_bridge import _run_sync
+from asap.state.stores.memory import InMemorySnapshotStore
+from asap.state.stores.sqlite import SQLiteAsyncSnapshotStore, SQLiteSnapshotStore
+
+VERSIONS = 1000
+TASK_ID = "task_bench_snapshots"
+MODES: dict[str, dict[str, Any]] = {
+    "full": {},
+    "delta": {"delta_interval": 20},
+    "brotli": {"compression": "br"},
+    "delta_brotli": {"delta_interval": 20, "compression": "br"},
+}
+
+
+def _history() -> list[StateSnapshot]:
+    rng = random.Random(7)
+    state: dict[str, Any] = {
+        f"field_{i}": {"value": i, "label": f"label-{i}", "tags": [i, i + 1]} for i in range(200)
+    }
+    snapshots = []
+    for version in range(1, VERSIONS + 1):
+        state = {**state, "step": version}
+        for key in rng.sample(sorted(k for k in state if k != "step"), 3):
+            state[key] = {**state[key], "value": rng.randint(0, 10_000)}
+        snapshots.append(
+            StateSnapshot(
+                id=f"snap_{version:04d}",
+                task_id=TASK_ID,
+                version=version,
+                data=state,
+                checkpoint=version % 250 == 0,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+    return snapshots
+
+
+HISTORY = _history()
+
+
+async def _save_all(store: SQLiteAsyncSnapshotStore) -> None:
+    for snapshot in HISTORY:
+        await store.save(snapshot)
+
+
+def _db_bytes(db_path: Path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        conn.close()
+    return int(page_count * page_size)
+
+
+@pytest.fixture(scope="module", params=sorted(MODES))
+def seeded(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """SQLite file holding the full history in one encoding."""
+    db_path = tmp_path_factory.mktemp(f"snapshots_{request.param}") / "snapshots.db"
+    asyncio.run(_save_all(SQLiteAsyncSnapshotStore(db_path, **MODES[request.param])))
+    return db_path
+
+
+class TestSnapshotSave:
+    """Writing a 1000-version history."""
+
+    @pytest.mark.parametrize("mode", sorted(MODES))
+    def test_save_versions(self, benchmark: Any, tmp_path: Path, mode: str) -> None:
+        """Benchmark saving every version into a fresh file."""
+        paths = iter(tmp_path / f"round_{i}.db" for i in range(100))
+
+        def run() -> Path:
+            db_path = next(paths)
+            asyncio.run(_save_all(SQLiteAsyncSnapshotStore(db_path, **MODES[mode])))
+            return db_path
+
+        db_path = benchmark.pedantic(run, rounds=3, iterations=1)
+        benchmark.extra_info["db_bytes"] = _db_bytes(db_path)
+
+
+class TestSnapshotGet:
+    """Reading versions back; ``delta`` rebuilds from the nearest full copy."""
+
+    def test_get_random_versions(self, benchmark: Any, seeded: Path) -> None:
+        """Benchmark 100 random-version reads on a store with a cold cache."""
+        versions = random.Random(11).sample(range(1, VERSIONS + 1), 100)
+
+        async def read() -> list[StateSnapshot | None]:
+            store = SQLiteAsyncSnapshotStore(seeded)
+            return [await store.get(TASK_ID, v) for v in versions]
+
+        result = benchmark.pedantic(lambda: asyncio.run(read()), rounds=5, iterations=1)
+        assert [s.data for s in result if s is not None] == [HISTORY[v - 1].data for v in versions]
+        benchmark.extra_info["db_bytes"] = _db_bytes(seeded)
+
+    def test_get_latest(self, benchmark: Any, seeded: Path) -> None:
+        """Benchmark reading the latest version 100 times (warm cache for ``delta``)."""
+        store = SQLiteAsyncSnapshotStore(seeded)
+
+        async def read() -> StateSnapshot | None:
+            latest = None
+            for _ in range(100):
+                latest = await store.get(TASK_ID)
+            return latest
+
+        latest = benchmark.pedantic(lambda: asyncio.run(read()), rounds=5, iterations=1)
+        assert latest is not None and latest.data == HISTORY[-1].data
+
+
+# -- Store flavours ----------------------------------------------------------
+
+LATENCY_OPS = 200
+
+
+def _latency_history() -> list[StateSnapshot]:
+    return [
+        StateSnapshot(
+            id=f"snap_latency_{i:04d}",
+            task_id="task_bench_latency",
+            version=i,
+            data={"step": i, "ctx": {"items": list(range(20)), "label": f"step-{i}"}},
+            checkpoint=False,
+            created_at=datetime.now(timezone.utc),
+        )
+        for i in range(1, LATENCY_OPS + 1)
+    ]
+
+
+LATENCY_HISTORY = _latency_history()
+
+
+def _run_in_memory(_db_path: Path) -> None:
+    store = InMemorySnapshotStore()
+    for snapshot in LATENCY_HISTORY:
+        store.save(snapshot)
+        store.get(snapshot.task_id, snapshot.version)
+
+
+def _run_sqlite_async(db_path: Path) -> None:
+    async def run() -> None:
+        store = SQLiteAsyncSnapshotStore(db_path)
+        for snapshot in LATENCY_HISTORY:
+            await store.save(snapshot)
+            await store.get(snapshot.task_id, snapshot.version)
+        await close_connection_pools()
+
+    asyncio.run(run())
+
+
+def _run_sqlite_sync(db_path: Path) -> None:
+    store = SQLiteSnapshotStore(db_path)
+    for snapshot in LATENCY_HISTORY:
+        store.save(snapshot)
+        store.get(snapshot.task_id, snapshot.version)
+    store.close()
+
+
+def _run_bridged(db_path: Path) -> None:
+    """The pre-2.5.5 ``SQLiteSnapshotStore``: every call through ``_run_sync``."""
+    store = SQLiteAsyncSnapshotStore(db_path)
+    for snapshot in LATENCY_HISTORY:
+        _run_sync(store.save(snapshot))
+        _run_sync(store.get(snapshot.task_id, snapshot.version))
+    _run_sync(close_connection_pools())
+
+
+def _run_bridged_in_loop(db_path: Path) -> None:
+    """Bridged calls from a running loop (a sync call inside an async handler)."""
+
+    async def run() -> None:
+        _run_bridged(db_path)
+
+    asyncio.run(run())
+
+
+STORE_RUNNERS: dict[str, Callable[[Path], None]] = {
+    "in_memory": _run_in_memory,
+    "sqlite_async": _run_sqlite_async,
+    "sqlite_sync": _run_sqlite_sync,
+    "bridged": _run_bridged,
+    "bridged_in_loop": _run_bridged_in_loop,
+}
+
+
+class TestSnapshotStoreLatency:
+    """Save+get round trips per store flavour (200 of each, fresh file per round)."""
+
+    @pytest.mark.parametrize("flavour", list(STORE_RUNNERS))
+    def test_save_get_round_trips(self, benchmark: Any, tmp_path: Path, flavour: str) -> None:
+        """Benchmark 200 save+get pairs; per-op latency is mean / 400."""
+        paths = iter(tmp_path / f"round_{i}.db" for i in range(100))
+        runner = STORE_RUNNERS[flavour]
+        benchmark.pedantic(lambda: runner(next(paths)), rounds=5, iterations=1)
@@ -7,6 +7,9 @@ These benchmarks measure the performance of:
 - Metrics endpoint
 - Connection pooling (1000+ concurrent, connection reuse)
 - Batch operations (sequential vs parallel)
+- WebSocket frame codecs (JSON text vs MessagePack binary)
+- Lambda codec formats (λ1 atoms, λ2 dictionary) vs gzip/brotli on small envelopes
+- Middleware stack overhead (pure ASGI vs BaseHTTPMiddleware)
 
 Performance targets:
 - JSON-RPC processing: < 5ms (excluding network)
@@ -15,6 +18,8 @@ Performance targets:
 - Full round-trip (local): < 10ms
 - Connection pooling: 1000+ concurrent supported, >90% connection reuse
 - Batch operations: 10x throughput improvement vs sequential
+- WebSocket frames: MessagePack smaller per frame and faster to decode than JSON
+- Lambda λ2: smaller than λ1 on every small envelope
 
 Run with: uv run pytest benchmarks/benchmark_transport.py --benchmark-only -v
 """
@@ -28,7 +33,7 @@ from fastapi.testclient import TestClient
 
 from asap.models.envelope import Envelope
 from asap.transport.client import ASAPClient
-from asap.transport.jsonrpc import JsonRpcRequest, JsonRpcResponse
+from asap.transport.jsonrpc import ASAP_METHOD, JsonRpcRequest, JsonRpcResponse
 from asap.transport.server import create_app
 
 # Concurrency for connection-pooling benchmark
@@ -804,3 +809,346 @@ class TestCompression:
             assert reduction_pct >= 50.0, (
                 f"Expected at least 50% reduction, got {reduction_pct:.1f}%"
             )
+
+
+class TestWebSocketFrameCodecs:
+    """Benchmarks for WebSocket frame codecs (frames/sec and bytes/frame).
+
+    Compares the default JSON text frames against negotiated MessagePack binary
+    frames for the two hottest frame shapes: ``task.update`` streaming progress
+    and ``MessageAck`` notifications.
+    """
+
+    FRAME_ITERATIONS = 2000
+
+    @staticmethod
+    def _frames() -> dict[str, dict[str, Any]]:
+        from asap.models.enums import TaskStatus, UpdateType
+        from asap.models.payloads import TaskUpdate
+        from asap.transport.ws.codecs import _build_ack_notification
+
+        update = Envelope(
+            asap_version="0.1",
+            sender="urn:asap:agent:worker",
+            recipient="urn:asap:agent:orchestrator",
+            payload_type="task.update",
+            payload=TaskUpdate(
+                task_id="task_benchmark",
+                update_type=UpdateType.PROGRESS,
+                status=TaskStatus.WORKING,
+                progress={"percent": 42, "message": "Indexing documents"},
+            ).model_dump(),
+        )
+        return {
+            "task.update": {
+                "jsonrpc": "2.0",
+                "method": ASAP_METHOD,
+                "params": {"envelope": update.model_dump(mode="json")},
+                "id": "req-1",
+            },
+            "MessageAck": _build_ack_notification(
+                original_envelope_id=update.id or "",
+                status="received",
+                sender="urn:asap:agent:orchestrator",
+                recipient="urn:asap:agent:worker",
+            ),
+        }
+
+    @pytest.mark.parametrize("frame_name", ["task.update", "MessageAck"])
+    @pytest.mark.parametrize("encoding", ["json", "msgpack"])
+    def test_frame_roundtrip(self, benchmark: Any, encoding: str, frame_name: str) -> None:
+        """Benchmark encode + decode of one frame per codec."""
+        from asap.transport.ws.codecs import get_frame_codec
+
+        if encoding == "msgpack":
+            pytest.importorskip("msgpack")
+        codec = get_frame_codec(encoding)
+        frame = self._frames()[frame_name]
+
+        def roundtrip() -> Any:
+            return codec.decode(codec.encode(frame))
+
+        assert benchmark(roundtrip) == frame
+        encoded = codec.encode(frame)
+        benchmark.extra_info["bytes_per_frame"] = len(
+            encoded.encode("utf-8") if isinstance(encoded, str) else encoded
+        )
+
+    def test_frame_codec_comparison(self) -> None:
+        """Report frames/sec and bytes/frame for JSON vs MessagePack."""
+        import time
+
+        from asap.transport.ws.codecs import get_frame_codec
+
+        pytest.importorskip("msgpack")
+        print("\n=== WebSocket Frame Codecs ===")
+        for frame_name, frame in self._frames().items():
+            sizes: dict[str, int] = {}
+            for encoding in ("json", "msgpack"):
+                codec = get_frame_codec(encoding)
+                encoded = codec.encode(frame)
+                raw = encoded.encode("utf-8") if isinstance(encoded, str) else encoded
+                sizes[encoding] = len(raw)
+                start = time.perf_counter()
+                for _ in range(self.FRAME_ITERATIONS):
+                    codec.decode(codec.encode(frame))
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{frame_name:<12} {encoding:<8} {sizes[encoding]:>6} bytes/frame "
+                    f"{self.FRAME_ITERATIONS / elapsed:>10,.0f} frames/s"
+                )
+            assert sizes["msgpack"] < sizes["json"]
+
+
+class TestLambdaCodecFormats:
+    """Bytes and encode+decode cost of Lambda codec formats on small JSON-RPC bodies.
+
+    General-purpose compressors have little history to work with below ~1KB, which
+    is where dictionary substitution (λ2) is meant to win.
+    """
+
+    ITERATIONS = 2000
+
+    @staticmethod
+    def _bodies() -> dict[str, str]:
+        from asap.models.payloads import MessageAck, TaskResponse
+        from asap.models.enums import TaskStatus
+
+        def rpc(payload_type: str, payload: dict[str, Any]) -> str:
+            envelope = Envelope(
+                asap_version="0.1",
+                sender="urn:asap:agent:worker",
+                recipient="urn:asap:agent:orchestrator",
+                payload_type=payload_type,
+                payload=payload,
+            )
+            return JsonRpcResponse(
+                result={"envelope": envelope.model_dump(mode="json")}, id="req-1"
+            ).model_dump_json(by_alias=True)
+
+        return {
+            "MessageAck": rpc(
+                "MessageAck",
+                MessageAck(original_envelope_id="01HXACK", status="received").model_dump(),
+            ),
+            "task.response": rpc(
+                "task.response",
+                TaskResponse(
+                    task_id="task_benchmark",
+                    status=TaskStatus.COMPLETED,
+                    result={"summary": "Indexed 42 documents"},
+                ).model_dump(),
+            ),
+        }
+
+    @staticmethod
+    def _codecs() -> dict[str, tuple[Any, Any]]:
+        from asap.transport import lambda_codec
+        from asap.transport.compression import (
+            compress_brotli,
+            compress_gzip,
+            decompress_brotli,
+            decompress_gzip,
+            is_brotli_available,
+        )
+
+        codecs: dict[str, tuple[Any, Any]] = {
+            "gzip": (lambda s: compress_gzip(s.encode("utf-8")), decompress_gzip),
+            "lambda-v1": (lambda s: lambda_codec.encode(s).encode("utf-8"), None),
+            "lambda-v2": (lambda s: lambda_codec.encode_v2(s).encode("utf-8"), None),
+        }
+        if is_brotli_available():
+            codecs["brotli"] = (lambda s: compress_brotli(s.encode("utf-8")), decompress_brotli)
+        return codecs
+
+    @pytest.mark.parametrize("body_name", ["MessageAck", "task.response"])
+    @pytest.mark.parametrize("codec_name", ["gzip", "brotli", "lambda-v1", "lambda-v2"])
+    def test_codec_roundtrip(self, benchmark: Any, codec_name: str, body_name: str) -> None:
+        """Benchmark encode + decode of one small response body per codec."""
+        from asap.transport import lambda_codec
+
+        codecs = self._codecs()
+        if codec_name not in codecs:
+            pytest.skip("brotli not installed")
+        encode, decode = codecs[codec_name]
+        body = self._bodies()[body_name]
+
+        def roundtrip() -> str:
+            encoded = encode(body)
+            if decode is None:
+                return lambda_codec.decode(encoded.decode("utf-8"))
+            return str(decode(encoded).decode("utf-8"))
+
+        assert benchmark(roundtrip) == body
+        benchmark.extra_info["bytes"] = len(encode(body))
+        benchmark.extra_info["json_bytes"] = len(body.encode("utf-8"))
+
+    def test_codec_size_comparison(self) -> None:
+        """Report bytes and round trips/sec per codec; λ2 must beat λ1."""
+        import time
+
+        from asap.transport import lambda_codec
+
+        print("\n=== Lambda codec vs gzip/brotli (small bodies) ===")
+        for body_name, body in self._bodies().items():
+            sizes: dict[str, int] = {"json": len(body.encode("utf-8"))}
+            for codec_name, (encode, decode) in self._codecs().items():
+                sizes[codec_name] = len(encode(body))
+                start = time.perf_counter()
+                for _ in range(self.ITERATIONS):
+                    encoded = encode(body)
+                    if decode is None:
+                        lambda_codec.decode(encoded.decode("utf-8"))
+                    else:
+                        decode(encoded)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{body_name:<14} {codec_name:<10} {sizes[codec_name]:>5} bytes "
+                    f"(json {sizes['json']:>5}) {self.ITERATIONS / elapsed:>10,.0f} ops/s"
+                )
+            assert sizes["lambda-v2"] < sizes["lambda-v1"]
+
+
+class TestMiddlewareStackOverhead:
+    """Per-request overhead of the size-limit / OAuth2 / ASAP-Version stack.
+
+    Drives the ASGI app directly (no TestClient / transport) so the numbers
+    isolate middleware cost. ``before`` rebuilds the previous
+    ``BaseHTTPMiddleware``-based stack with equivalent ``dispatch`` logic;
+    ``after`` is the pure ASGI stack wired by ``create_app``. OAuth2 is
+    configured with a prefix the benchmark path does not match, so only the
+    middleware hop is measured, not JWT validation.
+    """
+
+    REQUESTS_PER_ROUND = 200
+
+    @staticmethod
+    def _endpoint_app() -> Any:
+        from starlette.applications import Starlette
+        from starlette.responses import PlainTextResponse
+        from starlette.routing import Route
+
+        async def ok(request: Any) -> PlainTextResponse:
+            return PlainTextResponse("ok")
+
+        return Starlette(routes=[Route("/bench", ok, methods=["POST"])])
+
+    @classmethod
+    def _before_stack(cls) -> Any:
+        from starlette.middleware.base import BaseHTTPMiddleware
+        from starlette.responses import JSONResponse
+
+        from asap.auth.middleware import OAuth2Middleware
+        from asap.models.constants import ASAP_DEFAULT_TRANSPORT_VERSION, ASAP_VERSION_HEADER
+
+        class LegacySizeLimit(BaseHTTPMiddleware):
+            async def dispatch(self, request: Any, call_next: Any) -> Any:
+                content_length = request.headers.get("content-length")
+                if content_length and int(content_length) > 10 * 1024 * 1024:
+                    return JSONResponse(status_code=413, content={"detail": "too large"})
+                return await call_next(request)
+
+        class LegacyOAuth2(BaseHTTPMiddleware):
+            def __init__(self, app: Any) -> None:
+                super().__init__(app)
+                self._inner = OAuth2Middleware(app, "https://idp.invalid/jwks")
+
+            async def dispatch(self, request: Any, call_next: Any) -> Any:
+                if not self._inner._should_validate(request.url.path):
+                    return await call_next(request)
+                return JSONResponse(status_code=401, content={})
+
+        class LegacyVersion(BaseHTTPMiddleware):
+            async def dispatch(self, request: Any, call_next: Any) -> Any:
+                response = await call_next(request)
+                response.headers[ASAP_VERSION_HEADER] = ASAP_DEFAULT_TRANSPORT_VERSION
+                return response
+
+        app = cls._endpoint_app()
+        return LegacyVersion(LegacyOAuth2(LegacySizeLimit(app)))
+
+    @classmethod
+    def _after_stack(cls) -> Any:
+        from asap.auth.middleware import OAuth2Middleware
+        from asap.transport.middleware import ASAPVersionMiddleware, SizeLimitMiddleware
+
+        app = cls._endpoint_app()
+        app = SizeLimitMiddleware(app, max_size=10 * 1024 * 1024)
+        app = OAuth2Middleware(app, "https://idp.invalid/jwks")
+        return ASAPVersionMiddleware(app)
+
+    @classmethod
+    def _drive(cls, app: Any) -> int:
+        body = b'{"ping": true}'
+
+        def make_scope() -> dict[str, Any]:
+            return {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "POST",
+                "scheme": "http",
+                "path": "/bench",
+                "raw_path": b"/bench",
+                "root_path": "",
+                "query_string": b"",
+                "headers": [
+                    (b"host", b"bench"),
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+                "client": ("127.0.0.1", 1234),
+                "server": ("bench", 80),
+            }
+
+        async def run() -> int:
+            statuses = 0
+            for _ in range(cls.REQUESTS_PER_ROUND):
+                sent = False
+
+                async def receive() -> dict[str, Any]:
+                    nonlocal sent
+                    if sent:
+                        return {"type": "http.disconnect"}
+                    sent = True
+                    return {"type": "http.request", "body": body, "more_body": False}
+
+                async def send(message: dict[str, Any]) -> None:
+                    nonlocal statuses
+                    if message["type"] == "http.response.start" and message["status"] == 200:
+                        statuses += 1
+
+                await app(make_scope(), receive, send)
+            return statuses
+
+        return asyncio.run(run())
+
+    @pytest.mark.parametrize("stack", ["before", "after"])
+    def test_middleware_stack_overhead(self, benchmark: Any, stack: str) -> None:
+        """Benchmark REQUESTS_PER_ROUND requests through each middleware stack."""
+        app = self._before_stack() if stack == "before" else self._after_stack()
+        assert benchmark(self._drive, app) == self.REQUESTS_PER_ROUND
+
+    def test_middleware_stack_comparison(self) -> None:
+        """Report per-request overhead of both stacks against the bare endpoint."""
+        import time
+
+        timings: dict[str, float] = {}
+        apps = {
+            "bare": self._endpoint_app(),
+            "before": self._before_stack(),
+            "after": self._after_stack(),
+        }
+        for name, app in apps.items():
+            self._drive(app)  # warm-up
+            start = time.perf_counter()
+            assert self._drive(app) == self.REQUESTS_PER_ROUND
+            timings[name] = (time.perf_counter() - start) / self.REQUESTS_PER_ROUND * 1e6
+
+        print("\n=== Middleware Stack Overhead (per request) ===")
+        for name in ("before", "after"):
+            print(
+                f"{name:<7} {timings[name]:8.1f}us total, "
+                f"{timings[name] - timings['bare']:8.1f}us middleware"
+            )
+        assert timings["after"] < timings["before"]
@@ -18,6 +18,7 @@ Public exports:
     OIDCDiscovery: OIDC discovery client
     OIDCConfig: OIDC provider configuration model
     JWKSValidator: JWKS fetcher and JWT validator with key rotation support
+    JWKSCache: Shared JWKS key-set cache (stale-while-revalidate, single-flight)
     HostIdentity, AgentSession, HostStore, AgentStore, JWT helpers: per-runtime identity (Ed25519)
 """
 
@@ -36,7 +37,7 @@ from asap.auth.identity import (
     jwk_thumbprint_sha256,
 )
 from asap.auth.introspection import TokenInfo, TokenIntrospector
-from asap.auth.jwks import JWKSValidator
+from asap.auth.jwks import JWKSCache, JWKSValidator
 from asap.auth.middleware import OAuth2Claims, OAuth2Config, OAuth2Middleware
 from asap.auth.oauth2 import OAuth2ClientCredentials, Token
 from asap.auth.oidc import OIDCConfig, OIDCDiscovery
@@ -47,6 +48,7 @@ __all__ = [
     "AgentStore",
     "HostIdentity",
     "HostStore",
+    "JWKSCache",
     "JWKSValidator",
     "OIDCConfig",
     "OIDCDiscovery",
@@ -8,8 +8,11 @@ public key.
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, cast
 
@@ -32,6 +35,7 @@ from asap.auth.identity import (
 )
 from asap.auth.jti_replay_cache import JtiReplayCacheProtocol
 from asap.models.ids import generate_id
+from asap.utils.expiry import ExpiringKeySet
 
 # Encode/decode: EdDSA (RFC 8037 Ed25519); joserfc also accepts "Ed25519" alias.
 JWT_ALGS_SIGN = "EdDSA"
@@ -54,6 +58,9 @@ HOST_REVOKED_ERROR = "host revoked"
 # Clock skew allowance for ``iat`` checks (seconds).
 _IAT_MAX_FUTURE_SKEW_SECONDS = 60
 
+# Agent session statuses that cannot present an Agent JWT.
+_UNUSABLE_AGENT_STATUSES = ("revoked", "expired", "pending", "rejected")
+
 
 @dataclass(frozen=True)
 class JwtVerifyResult:
@@ -99,31 +106,26 @@ class JtiReplayCache:
     still exceeds ``max_size``, entries with the earliest expiry are removed
     first (may slightly weaken replay detection for those keys under extreme
     load; prefer Redis-backed limits in multi-instance production).
+
+    Expiries live in an :class:`~asap.utils.expiry.ExpiringKeySet`, so pruning
+    and eviction cost O(log n) per removed entry instead of a scan of every
+    live ``jti``. Safe to share across threads.
     """
 
     def __init__(self, ttl_seconds: float = 90.0, max_size: int = 10_000) -> None:
         self._ttl = ttl_seconds
         self._max_size = max_size
-        self._expiry_by_key: dict[tuple[str, str], float] = {}
-
-    def _prune_expired(self, now: float) -> None:
-        dead = [k for k, exp in self._expiry_by_key.items() if exp <= now]
-        for k in dead:
-            del self._expiry_by_key[k]
-
-    def _evict_to_max_size(self) -> None:
-        while len(self._expiry_by_key) > self._max_size:
-            oldest = min(self._expiry_by_key, key=lambda k: self._expiry_by_key[k])
-            del self._expiry_by_key[oldest]
+        self._expiry_by_key: ExpiringKeySet[tuple[str, str]] = ExpiringKeySet()
+        self._lock = threading.Lock()
 
     def contains(self, partition_key: str, jti: str) -> bool:
         """Return whether ``jti`` is still recorded for ``partition_key``."""
         if not jti or not str(jti).strip():
             return False
         now = time.time()
-        self._prune_expired(now)
-        key = (partition_key, jti)
-        return key in self._expiry_by_key and self._expiry_by_key[key] > now
+        with self._lock:
+            self._expiry_by_key.prune(now)
+            return self._expiry_by_key.live((partition_key, jti), now)
 
     def check_and_record(self, partition_key: str, jti: str) -> bool:
         """Record ``jti`` for ``partition_key``.
@@ -137,15 +139,139 @@ class JtiReplayCache:
         if not jti or not str(jti).strip():
             return False
         now = time.time()
-        self._prune_expired(now)
         key = (partition_key, jti)
-        if key in self._expiry_by_key and self._expiry_by_key[key] > now:
-            return False
-        self._expiry_by_key[key] = now + self._ttl
-        self._evict_to_max_size()
+        with self._lock:
+            self._expiry_by_key.prune(now)
+            if self._expiry_by_key.live(key, now):
+                return False
+            self._expiry_by_key.add(key, now + self._ttl)
+            self._expiry_by_key.evict_to(self._max_size)
         return True
 
 
+@dataclass(frozen=True)
+class _VerifiedToken:
+    # Only tokens of registered hosts are cached, so ``host`` is always set;
+    # ``agent`` is set for Agent JWTs.
+    claims: dict[str, Any]
+    host: HostIdentity
+    agent: AgentSession | None
+    exp: float
+
+
+_CacheKey = tuple[str, bytes, str | tuple[str, ...] | None]
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of successful Host/Agent JWT verifications.
+
+    Bearer tokens are usually presented many times within their lifetime.
+    On a hit, :func:`verify_host_jwt` / :func:`verify_agent_jwt` skip the
+    signature check, claim validation and host lookup and reuse the verified
+    claims and host row. Agent rows are re-read, because the session lifetime
+    is checked against their current ``last_used_at``. The ``jti`` replay cache
+    still applies, so single-use routes keep rejecting a second presentation;
+    Agent JWTs verified with a replay cache are not cached at all, so the cache
+    only helps Agent JWTs on routes without one (capability list, MCP).
+
+    Entries are keyed by ``(token type, SHA-256 of the token, expected
+    audience)`` and expire with the token's ``exp``. Routes that revoke or
+    rotate an identity call :meth:`invalidate_agent` / :meth:`invalidate_host`.
+    Code that mutates the host or agent stores directly must do the same, or
+    cached results stay valid until the token expires (at most
+    ``AGENT_JWT_TTL_SECONDS`` / the Host JWT TTL). Safe to share across threads.
+
+    Example:
+        >>> cache = VerifiedTokenCache()
+        >>> result = await verify_agent_jwt(token, hosts, agents, verified_cache=cache)
+        >>> cache.invalidate_agent(result.agent.agent_id)
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[_CacheKey, _VerifiedToken] = OrderedDict()
+        self._keys_by_identity: dict[tuple[str, str], set[_CacheKey]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(typ: str, token: str, audience: str | list[str] | None) -> _CacheKey:
+        aud = tuple(audience) if isinstance(audience, list) else audience
+        return typ, hashlib.sha256(token.encode("utf-8")).digest(), aud
+
+    @staticmethod
+    def _identities(entry: _VerifiedToken) -> list[tuple[str, str]]:
+        identities = [("host", entry.host.host_id)]
+        if entry.agent is not None:
+            identities.append(("agent", entry.agent.agent_id))
+        return identities
+
+    def _drop(self, key: _CacheKey) -> None:
+        entry = self._entries.pop(key)
+        for identity in self._identities(entry):
+            keys = self._keys_by_identity[identity]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_identity[identity]
+
+    def get(
+        self, typ: str, token: str, audience: str | list[str] | None, now: float
+    ) -> _VerifiedToken | None:
+        """Return the cached verification of ``token`` if it has not expired."""
+        key = self._key(typ, token, audience)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.exp <= now:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(
+        self,
+        typ: str,
+        token: str,
+        audience: str | list[str] | None,
+        *,
+        claims: dict[str, Any],
+        host: HostIdentity,
+        agent: AgentSession | None,
+    ) -> None:
+        """Cache a successful verification until the token's ``exp``."""
+        entry = _VerifiedToken(dict(claims), host, agent, float(claims["exp"]))
+        key = self._key(typ, token, audience)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            for identity in self._identities(entry):
+                self._keys_by_identity.setdefault(identity, set()).add(key)
+            while len(self._entries) > self._max_size:
+                self._drop(next(iter(self._entries)))
+
+    def _invalidate(self, identity: tuple[str, str]) -> None:
+        with self._lock:
+            for key in list(self._keys_by_identity.get(identity, ())):
+                self._drop(key)
+
+    def invalidate_agent(self, agent_id: str) -> None:
+        """Forget every cached Agent JWT of ``agent_id``."""
+        self._invalidate(("agent", agent_id))
+
+    def invalidate_host(self, host_id: str) -> None:
+        """Forget every cached Host JWT of ``host_id`` and Agent JWT under it."""
+        self._invalidate(("host", host_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_identity.clear()
+
+
 def _unverified_header_and_payload(token: str) -> tuple[dict[str, Any], dict[str, Any]]:
     """Parse JWT header and payload without verifying the signature.
 
@@ -225,6 +351,22 @@ def _validate_standard_claims(
     return None
 
 
+def _host_jti_ok(
+    jti_replay_cache: JtiReplayCacheProtocol | None,
+    claims: dict[str, Any],
+    *,
+    record_jti: bool,
+) -> bool:
+    """Apply the Host JWT ``jti`` replay check (partitioned by ``iss``)."""
+    if jti_replay_cache is None:
+        return True
+    partition = str(claims.get("iss"))
+    jti = str(claims["jti"])
+    if record_jti:
+        return jti_replay_cache.check_and_record(partition, jti)
+    return not jti_replay_cache.contains(partition, jti)
+
+
 async def verify_host_jwt(
     token: str,
     host_store: HostStore,
@@ -232,6 +374,7 @@ async def verify_host_jwt(
     expected_audience: str | list[str] | None = None,
     jti_replay_cache: JtiReplayCacheProtocol | None = None,
     record_jti: bool = True,
+    verified_cache: VerifiedTokenCache | None = None,
 ) -> JwtVerifyResult:
     """Verify a Host JWT signature and resolve the host (or inline registration).
 
@@ -251,7 +394,17 @@ async def verify_host_jwt(
     read-only replay checks. This preserves reusable polling tokens on
     read-only routes while still rejecting Host JWTs whose ``jti`` was already
     consumed by a recording route (issue #249).
+
+    With ``verified_cache``, a token already verified for a stored host skips
+    the signature check and host lookup; the ``jti`` check still runs.
     """
+    if verified_cache is not None:
+        cached = verified_cache.get(HOST_JWT_TYP, token, expected_audience, time.time())
+        if cached is not None:
+            if not _host_jti_ok(jti_replay_cache, cached.claims, record_jti=record_jti):
+                return JwtVerifyResult(ok=False, error="jti replay detected")
+            return JwtVerifyResult(ok=True, claims=dict(cached.claims), host=cached.host)
+
     try:
         header, unverified_payload = _unverified_header_and_payload(token)
     except (json.JSONDecodeError, UnicodeDecodeError, ValueError, JoseError) as e:
@@ -284,21 +437,18 @@ async def verify_host_jwt(
     if iss != expected_iss:
         return JwtVerifyResult(ok=False, error="iss does not match host_public_key thumbprint")
 
-    if jti_replay_cache is not None:
-        partition = str(iss)
-        jti = str(claims["jti"])
-        jti_ok = (
-            jti_replay_cache.check_and_record(partition, jti)
-            if record_jti
-            else not jti_replay_cache.contains(partition, jti)
-        )
-        if not jti_ok:
-            return JwtVerifyResult(ok=False, error="jti replay detected")
+    if not _host_jti_ok(jti_replay_cache, claims, record_jti=record_jti):
+        return JwtVerifyResult(ok=False, error="jti replay detected")
 
     host = await host_store.get_by_public_key(str(iss))
     if host is not None and host.status == "revoked":
         return JwtVerifyResult(ok=False, error=HOST_REVOKED_ERROR)
 
+    # Unregistered hosts are not cached: registration would see a stale ``host=None``.
+    if verified_cache is not None and host is not None:
+        verified_cache.put(
+            HOST_JWT_TYP, token, expected_audience, claims=claims, host=host, agent=None
+        )
     return JwtVerifyResult(ok=True, claims=claims, host=host)
 
 
@@ -309,6 +459,7 @@ async def verify_agent_jwt(
     *,
     expected_audience: str | list[str] | None = None,
     jti_replay_cache: JtiReplayCacheProtocol | None = None,
+    verified_cache: VerifiedTokenCache | None = None,
 ) -> JwtVerifyResult:
     """Verify an Agent JWT: typ, signatures, host/agent rows, exp/iat/jti, capabilities.
 
@@ -316,7 +467,32 @@ async def verify_agent_jwt(
 
     Returns the extended :class:`AgentSession` in ``result.agent``; the caller
     decides whether to persist it via ``await agent_store.save(agent)``.
+
+    With ``verified_cache``, a token already verified skips the signature check
+    and the host lookup. The agent row is re-read on every presentation, since
+    its status and ``last_used_at`` change with use; the ``jti`` check and
+    session lifetime checks run against that fresh row. Verifications made with
+    a ``jti_replay_cache`` are not cached: their token is single-use, so a later
+    hit could only ever be rejected as a replay.
     """
+    if verified_cache is not None:
+        cached = verified_cache.get(AGENT_JWT_TYP, token, expected_audience, time.time())
+        if cached is not None and cached.agent is not None:
+            agent = await agent_store.get(cached.agent.agent_id)
+            # A rotated key or moved agent falls through to full verification.
+            if (
+                agent is not None
+                and agent.public_key == cached.agent.public_key
+                and agent.host_id == cached.agent.host_id
+            ):
+                if agent.status in _UNUSABLE_AGENT_STATUSES:
+                    return JwtVerifyResult(
+                        ok=False, error=f"agent session not usable: {agent.status}"
+                    )
+                return _finish_agent_verification(
+                    dict(cached.claims), cached.host, agent, jti_replay_cache
+                )
+
     try:
         header, unverified_payload = _unverified_header_and_payload(token)
     except (json.JSONDecodeError, UnicodeDecodeError, ValueError, JoseError) as e:
@@ -333,7 +509,7 @@ async def verify_agent_jwt(
     if agent is None:
         return JwtVerifyResult(ok=False, error="unknown agent")
 
-    if agent.status in ("revoked", "expired", "pending", "rejected"):
+    if agent.status in _UNUSABLE_AGENT_STATUSES:
         return JwtVerifyResult(ok=False, error=f"agent session not usable: {agent.status}")
 
     try:
@@ -364,6 +540,21 @@ async def verify_agent_jwt(
     if host.host_id != agent.host_id:
         return JwtVerifyResult(ok=False, error="agent host_id does not match iss host")
 
+    result = _finish_agent_verification(claims, host, agent, jti_replay_cache)
+    if verified_cache is not None and jti_replay_cache is None and result.ok:
+        verified_cache.put(
+            AGENT_JWT_TYP, token, expected_audience, claims=claims, host=host, agent=agent
+        )
+    return result
+
+
+def _finish_agent_verification(
+    claims: dict[str, Any],
+    host: HostIdentity,
+    agent: AgentSession,
+    jti_replay_cache: JtiReplayCacheProtocol | None,
+) -> JwtVerifyResult:
+    """Per-presentation Agent JWT checks: ``jti`` replay and session lifetime."""
     if jti_replay_cache is not None:
         jti = str(claims["jti"])
         if not jti_replay_cache.check_and_record(agent.agent_id, jti):
@@ -375,9 +566,7 @@ async def verify_agent_jwt(
     if expiry_status == "expired":
         return JwtVerifyResult(ok=False, error="agent_expired")
 
-    agent = extend_session(agent)
-
-    return JwtVerifyResult(ok=True, claims=claims, host=host, agent=agent)
+    return JwtVerifyResult(ok=True, claims=claims, host=host, agent=extend_session(agent))
 
 
 def _b64url(data: bytes) -> str:
@@ -2,7 +2,16 @@
 
 Fetches JSON Web Key Sets from provider URIs and validates JWT signatures
 using joserfc. Supports key rotation (unknown kid triggers refresh).
-Caches JWKS with TTL 24 hours; cache is invalidated on validation failure.
+
+Key sets live in a :class:`JWKSCache` keyed by ``jwks_uri``:
+- Stale-while-revalidate: after ``refresh_after_seconds`` (1h) cached keys are
+  still served while one background task refetches them; only a missing or
+  hard-expired (24h) entry makes requests wait on the fetch. A failed refresh
+  is retried after ``min_forced_refresh_seconds``.
+- Single-flight: concurrent callers for the same URI share one fetch.
+- Forced refetches on key errors (unknown ``kid``, bad signature) are rate
+  limited per URI (``min_forced_refresh_seconds``, 30s); claim errors such as
+  an expired token never refetch.
 """
 
 from __future__ import annotations
@@ -14,27 +23,127 @@ from typing import Any, Awaitable, Callable, Optional
 import httpx
 from joserfc import jwk
 from joserfc import jwt as jose_jwt
-from joserfc.errors import InvalidClaimError, JoseError, MissingClaimError
+from joserfc.errors import ClaimError, DecodeError, InvalidClaimError, JoseError, MissingClaimError
 
 from asap.observability import get_logger
 
 logger = get_logger(__name__)
 
 JWKS_CACHE_TTL_SECONDS = 86400.0
+JWKS_REFRESH_AFTER_SECONDS = 3600.0
+JWKS_MIN_FORCED_REFRESH_SECONDS = 30.0
 
 # RFC 8725 §3.2: restrict accepted algorithms to prevent Algorithm Confusion attacks.
 _ALLOWED_JWT_ALGORITHMS = ["EdDSA", "RS256", "ES256"]
 
 
 class _JWKSCacheEntry:
-    """Cache entry for JWKS KeySet with TTL."""
+    """Cache entry for JWKS KeySet with a soft (refresh) and hard (expiry) age."""
 
-    def __init__(self, key_set: jwk.KeySet, ttl: float) -> None:
+    def __init__(self, key_set: jwk.KeySet, ttl: float, refresh_after: float) -> None:
+        now = time.monotonic()
         self.key_set = key_set
-        self.expires_at = time.time() + ttl
+        self.expires_at = now + ttl
+        self.refresh_at = now + min(refresh_after, ttl)
+
+    def is_expired(self, now: float) -> bool:
+        return now >= self.expires_at
+
+    def needs_refresh(self, now: float) -> bool:
+        return now >= self.refresh_at
+
+
+KeySetFetcher = Callable[[str], Awaitable[jwk.KeySet]]
+
+
+class JWKSCache:
+    """JWKS key sets keyed by ``jwks_uri``, shareable across validators.
+
+    Not thread-safe: use it from one event loop at a time (the server's).
+    Dict updates happen between awaits, so no lock is needed, and no request
+    ever queues behind another one's fetch except to share it.
+
+    Example:
+        >>> cache = JWKSCache()
+        >>> tenant_a = JWKSValidator("https://a.example.com/jwks.json", cache=cache)
+        >>> tenant_b = JWKSValidator("https://b.example.com/jwks.json", cache=cache)
+    """
 
-    def is_expired(self) -> bool:
-        return time.time() >= self.expires_at
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = JWKS_CACHE_TTL_SECONDS,
+        refresh_after_seconds: float = JWKS_REFRESH_AFTER_SECONDS,
+        min_forced_refresh_seconds: float = JWKS_MIN_FORCED_REFRESH_SECONDS,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._refresh_after = refresh_after_seconds
+        self._min_forced_refresh = min_forced_refresh_seconds
+        self._entries: dict[str, _JWKSCacheEntry] = {}
+        self._inflight: dict[str, asyncio.Task[jwk.KeySet]] = {}
+        self._last_forced: dict[str, float] = {}
+
+    async def get(self, jwks_uri: str, fetcher: KeySetFetcher) -> jwk.KeySet:
+        """Return keys for ``jwks_uri``; fetch only when none are usable."""
+        entry = self._entries.get(jwks_uri)
+        now = time.monotonic()
+        if entry is not None and not entry.is_expired(now):
+            if entry.needs_refresh(now):
+                self._fetch(jwks_uri, fetcher)
+            return entry.key_set
+        return await asyncio.shield(self._fetch(jwks_uri, fetcher))
+
+    async def force_refresh(self, jwks_uri: str, fetcher: KeySetFetcher) -> jwk.KeySet:
+        """Refetch after a key error; at most once per ``min_forced_refresh_seconds``.
+
+        Joins a fetch already in flight. Within the rate limit the cached keys
+        are returned unchanged, so the caller's retry fails the same way.
+        """
+        if jwks_uri in self._inflight:
+            return await asyncio.shield(self._fetch(jwks_uri, fetcher))
+        entry = self._entries.get(jwks_uri)
+        now = time.monotonic()
+        last = self._last_forced.get(jwks_uri)
+        if (
+            entry is not None
+            and not entry.is_expired(now)
+            and last is not None
+            and now - last < self._min_forced_refresh
+        ):
+            return entry.key_set
+        self._last_forced[jwks_uri] = now
+        return await asyncio.shield(self._fetch(jwks_uri, fetcher))
+
+    def invalidate(self, jwks_uri: str) -> None:
+        """Drop the cached keys for ``jwks_uri`` (the next ``get`` waits on a fetch)."""
+        self._entries.pop(jwks_uri, None)
+
+    def _fetch(self, jwks_uri: str, fetcher: KeySetFetcher) -> asyncio.Task[jwk.KeySet]:
+        """Start (or join) the single fetch for ``jwks_uri``."""
+        task = self._inflight.get(jwks_uri)
+        # A task left pending by a loop that has since closed can never finish.
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._load(jwks_uri, fetcher))
+            self._inflight[jwks_uri] = task
+            task.add_done_callback(lambda t: self._fetch_done(jwks_uri, t))
+        return task
+
+    async def _load(self, jwks_uri: str, fetcher: KeySetFetcher) -> jwk.KeySet:
+        key_set = await fetcher(jwks_uri)
+        self._entries[jwks_uri] = _JWKSCacheEntry(key_set, self._ttl, self._refresh_after)
+        return key_set
+
+    def _fetch_done(self, jwks_uri: str, task: asyncio.Task[jwk.KeySet]) -> None:
+        if self._inflight.get(jwks_uri) is task:
+            del self._inflight[jwks_uri]
+        # Retrieve the exception so background refresh failures are logged, not
+        # reported as "never retrieved"; stale keys keep being served meanwhile.
+        if not task.cancelled() and (error := task.exception()) is not None:
+            logger.warning("asap.jwks.fetch_failed", uri=jwks_uri, error=str(error))
+            # Back off before the next background refresh instead of refetching
+            # on every request while the IdP is down.
+            if (entry := self._entries.get(jwks_uri)) is not None:
+                entry.refresh_at = time.monotonic() + self._min_forced_refresh
 
 
 # Type alias for decoded JWT claims
@@ -175,10 +284,11 @@ class JWKSValidator:
         jwks_uri: str,
         *,
         transport: Optional[httpx.AsyncBaseTransport] = None,
-        fetcher: Optional[Callable[[str], Awaitable[jwk.KeySet]]] = None,
+        fetcher: Optional[KeySetFetcher] = None,
         expected_issuer: str | None = None,
         expected_audience: str | list[str] | None = None,
         require_exp: bool = True,
+        cache: Optional[JWKSCache] = None,
     ) -> None:
         self._jwks_uri = jwks_uri
         self._transport = transport
@@ -192,41 +302,30 @@ class JWKSValidator:
         # separately by the caller's expiry checks) pass signature/claim checks.
         self._require_exp = require_exp
         self._key_set: Optional[jwk.KeySet] = None
-        self._keys_cache: Optional[_JWKSCacheEntry] = None
-        self._lock = asyncio.Lock()
+        # Pass one ``cache`` to several validators to key all their URIs in one place.
+        self._cache = cache if cache is not None else JWKSCache()
 
-    async def fetch_keys(self, jwks_uri: Optional[str] = None) -> jwk.KeySet:
-        """Fetch JWKS; task-safe cache, 24h TTL. jwks_uri overrides constructor default."""
-        uri = jwks_uri or self._jwks_uri
-        async with self._lock:
-            if (
-                self._keys_cache is not None
-                and not self._keys_cache.is_expired()
-                and uri == self._jwks_uri
-            ):
-                self._key_set = self._keys_cache.key_set
-                return self._keys_cache.key_set
-
-        key_set = (
-            await self._fetcher(uri)
-            if self._fetcher is not None
-            else await fetch_keys(uri, transport=self._transport)
-        )
+    async def _fetch_uncached(self, uri: str) -> jwk.KeySet:
+        if self._fetcher is not None:
+            return await self._fetcher(uri)
+        return await fetch_keys(uri, transport=self._transport)
 
-        async with self._lock:
-            self._keys_cache = _JWKSCacheEntry(key_set, JWKS_CACHE_TTL_SECONDS)
-            self._key_set = key_set
+    async def fetch_keys(self, jwks_uri: Optional[str] = None) -> jwk.KeySet:
+        """Fetch JWKS through the cache. jwks_uri overrides constructor default."""
+        key_set = await self._cache.get(jwks_uri or self._jwks_uri, self._fetch_uncached)
+        self._key_set = key_set
         return key_set
 
-    async def _invalidate_keys_cache(self) -> None:
-        """Clear JWKS cache on unknown kid or key rotation."""
-        async with self._lock:
-            self._keys_cache = None
-            self._key_set = None
+    async def refresh_keys(self, jwks_uri: Optional[str] = None) -> jwk.KeySet:
+        """Refetch JWKS after a key error (rate limited per URI, see JWKSCache)."""
+        key_set = await self._cache.force_refresh(jwks_uri or self._jwks_uri, self._fetch_uncached)
+        self._key_set = key_set
+        return key_set
 
     async def invalidate_cache(self) -> None:
-        """Public cache-clear seam for callers (e.g. OAuth2Middleware retry)."""
-        await self._invalidate_keys_cache()
+        """Drop cached keys for this validator's URI; the next fetch waits on the IdP."""
+        self._cache.invalidate(self._jwks_uri)
+        self._key_set = None
 
     def validate_jwt(self, token: str, key_set: jwk.KeySet) -> Claims:
         """Validate JWT with given KeySet and return claims.
@@ -249,14 +348,17 @@ class JWKSValidator:
             require_exp=self._require_exp,
         )
 
-    async def validate_token(self, token: str) -> Claims:
-        """Validate JWT using cached keys; refetch on failure (key rotation).
+    async def validate_token(self, token: str, jwks_uri: Optional[str] = None) -> Claims:
+        """Validate JWT using cached keys; refetch on key errors (key rotation).
 
-        Fetches keys if not cached, validates token. On JoseError
-        (e.g. unknown kid), invalidates cache, refetches keys and retries once.
+        Fetches keys if not cached, validates token. On a key error (e.g.
+        unknown kid, bad signature) forces a rate-limited refetch and retries
+        once. Claim errors (expired, wrong iss/aud) and malformed tokens are
+        raised directly: the keys were not the problem.
 
         Args:
             token: Raw JWT string.
+            jwks_uri: Optional override of the constructor URI.
 
         Returns:
             Decoded claims dict.
@@ -265,11 +367,12 @@ class JWKSValidator:
             JoseError: If validation fails after refetch (e.g. BadSignatureError).
             httpx.HTTPError: On network errors during fetch.
         """
-        key_set = await self.fetch_keys(self._jwks_uri)
+        key_set = await self.fetch_keys(jwks_uri)
 
         try:
             return self.validate_jwt(token, key_set)
+        except (ClaimError, DecodeError):
+            raise
         except JoseError:
-            await self._invalidate_keys_cache()
-            key_set = await self.fetch_keys(self._jwks_uri)
+            key_set = await self.refresh_keys(jwks_uri)
             return self.validate_jwt(token, key_set)
@@ -14,11 +14,12 @@ from dataclasses import dataclass
 from typing import Any, Awaitable, Callable
 
 import httpx
-from fastapi import Request, Response
+from fastapi import Request
 from fastapi.responses import JSONResponse
 from joserfc import jwk
 from joserfc.errors import JoseError
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from asap.auth._scope_parse import parse_scope
 from asap.auth.jwks import JWKSValidator
@@ -123,9 +124,10 @@ class OAuth2Claims:
     exp: int
 
 
-def _get_bearer_token(request: Request) -> str | None:
-    """Extract Bearer token from Authorization header."""
-    auth = request.headers.get("Authorization")
+def _get_bearer_token(request: Request | Headers) -> str | None:
+    """Extract Bearer token from the Authorization header of a request (or its headers)."""
+    headers = request if isinstance(request, Headers) else request.headers
+    auth = headers.get("Authorization")
     if not auth or not auth.startswith("Bearer "):
         return None
     return auth[7:].strip() or None
@@ -152,7 +154,7 @@ def path_under_prefix(path: str, prefix: str) -> bool:
     return path == normalized or path.startswith(f"{normalized}/")
 
 
-class OAuth2Middleware(BaseHTTPMiddleware):
+class OAuth2Middleware:
     """Middleware that validates JWT Bearer tokens using JWKS.
 
     Extracts Authorization: Bearer <token>, validates the JWT signature
@@ -161,11 +163,13 @@ class OAuth2Middleware(BaseHTTPMiddleware):
     Skips ``/asap/agent/*`` (Host JWT, not IdP access tokens).
 
     Returns 401 if the token is missing or invalid, 403 if scope is insufficient.
+    Plain ASGI middleware: HTTP requests only, and accepted requests are
+    forwarded with the original ``receive``/``send`` (no response buffering).
     """
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         jwks_uri: str,
         *,
         required_scope: str | None = None,
@@ -178,7 +182,7 @@ class OAuth2Middleware(BaseHTTPMiddleware):
         expected_audience: str | list[str] | None = None,
         validator: JWKSValidator | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._jwks_uri = jwks_uri
         self._required_scope = required_scope
         self._path_prefix = path_prefix
@@ -285,25 +289,20 @@ class OAuth2Middleware(BaseHTTPMiddleware):
     async def _validate_token_claims(self, token: str) -> dict[str, Any]:
         """Decode+validate the JWT via the shared validator with key-rotation retry.
 
-        Fetches the JWKS (cached on the validator), decodes the token, and on a
-        ``JoseError`` (e.g. unknown ``kid`` from key rotation) invalidates the
-        cache and retries once. Network errors surface as ``httpx.HTTPError``
-        for the caller to map to a 503 response.
+        Fetches the JWKS (cached on the validator, refreshed in the background
+        once stale), decodes the token, and on a key error (e.g. unknown ``kid``
+        from key rotation) forces a rate-limited refetch and retries once.
+        Network errors surface as ``httpx.HTTPError`` for the caller to map to a
+        503 response.
         """
-        key_set = await self._validator.fetch_keys(self._jwks_uri)
-        try:
-            return self._validator.validate_jwt(token, key_set)
-        except JoseError:
-            await self._validator.invalidate_cache()
-            key_set = await self._validator.fetch_keys(self._jwks_uri)
-            return self._validator.validate_jwt(token, key_set)
+        return await self._validator.validate_token(token, jwks_uri=self._jwks_uri)
 
     async def validate_bearer_token(
         self, token: str, *, path: str = "", enforce_required_scope: bool = True
     ) -> tuple[OAuth2Claims | None, JSONResponse | None]:
         """Run the full JWKS validation pipeline for a single Bearer token.
 
-        Shared by the HTTP middleware ``dispatch`` and the WebSocket acceptance
+        Shared by the HTTP middleware ``__call__`` and the WebSocket acceptance
         path so both transports enforce identical OAuth2 semantics (B4/BUG #4).
         Returns ``(claims, None)`` on success or ``(None, error_response)`` on
         failure. ``path`` is used only for log context.
@@ -402,30 +401,38 @@ class OAuth2Middleware(BaseHTTPMiddleware):
 
         return OAuth2Claims(sub=sub, scope=scope_list, exp=exp_ts), None
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Validate JWT and optionally scope; return 401/403 or pass to next."""
-        if not self._should_validate(request.url.path):
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Validate JWT and optionally scope; send 401/403 or pass to next."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if not self._should_validate(path):
+            await self.app(scope, receive, send)
+            return
 
-        token = _get_bearer_token(request)
+        token = _get_bearer_token(Headers(scope=scope))
         if not token:
-            logger.warning("asap.oauth2.missing_token", path=request.url.path)
-            return JSONResponse(
+            logger.warning("asap.oauth2.missing_token", path=path)
+            response = JSONResponse(
                 status_code=HTTP_UNAUTHORIZED,
                 content={"detail": ERROR_AUTH_REQUIRED},
                 headers={"WWW-Authenticate": "Bearer"},
             )
+            await response(scope, receive, send)
+            return
 
         claims, error = await self.validate_bearer_token(
             token,
-            path=request.url.path,
-            enforce_required_scope=self._enforces_global_scope(request.url.path),
+            path=path,
+            enforce_required_scope=self._enforces_global_scope(path),
         )
         if error is not None:
-            return error
+            await error(scope, receive, send)
+            return
         # validate_bearer_token returns None claims only with an error response;
         # the guard above ensures claims is set on the success path.
-        request.state.oauth2_claims = claims
-        return await call_next(request)
+        # ``request.state`` is backed by ``scope["state"]``.
+        scope.setdefault("state", {})["oauth2_claims"] = claims
+        await self.app(scope, receive, send)
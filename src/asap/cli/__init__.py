@@ -1,8 +1,8 @@
 """Command-line interface for ASAP Protocol utilities.
 
 Wires the Typer app and delegates command groups to dedicated modules
-(``schemas``, ``keys``, ``manifest``, ``delegation``, ``trace``, ``repl``
-plus the existing ``compliance_check`` and ``audit_export`` registrations).
+(``schemas``, ``keys``, ``manifest``, ``delegation``, ``trace``, ``repl``,
+``lambda_dictionary``, ``compliance_check`` and ``audit_export``).
 
 Example:
     >>> # asap --version
@@ -24,6 +24,7 @@ from asap.cli.audit_export import register_audit_export_commands
 from asap.cli.compliance_check import register_compliance_check_command
 from asap.cli.delegation import register_delegation_commands
 from asap.cli.keys import register_keys_commands
+from asap.cli.lambda_dictionary import register_lambda_commands
 from asap.cli.manifest import register_manifest_commands
 from asap.cli.repl import register_repl_command
 from asap.cli.schemas import register_schemas_commands
@@ -64,6 +65,7 @@ register_keys_commands(app)
 register_manifest_commands(app)
 register_delegation_commands(app)
 register_trace_command(app)
+register_lambda_commands(app)
 register_repl_command(app)
 register_compliance_check_command(app)
 register_audit_export_commands(app)
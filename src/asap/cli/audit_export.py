@@ -6,6 +6,7 @@ import asyncio
 import csv
 import io
 import json
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated, Optional
@@ -38,36 +39,61 @@ def _make_store(store: str, db: Optional[Path]) -> InMemoryAuditStore | SQLiteAu
     raise typer.BadParameter("--store must be 'sqlite' or 'memory'")
 
 
-def _entry_payloads(entries: list[AuditEntry]) -> list[dict[str, object]]:
-    return [e.model_dump(mode="json") for e in entries]
+# Entries rendered per chunk written to stdout.
+_EXPORT_CHUNK_ENTRIES = 500
 
+_CSV_FIELDNAMES = ("id", "timestamp", "operation", "agent_urn", "details", "prev_hash", "hash")
 
-def _render_json(entries: list[AuditEntry]) -> str:
-    return json.dumps(_entry_payloads(entries), indent=2)
 
+def _render_json_item(row: dict[str, object], first: bool) -> str:
+    # Same layout as ``json.dumps(entries, indent=2)``, one element at a time.
+    body = json.dumps(row, indent=2).replace("\n", "\n  ")
+    return ("[\n  " if first else ",\n  ") + body
 
-def _render_jsonl(entries: list[AuditEntry]) -> str:
-    lines = [json.dumps(row, separators=(",", ":")) for row in _entry_payloads(entries)]
-    return "\n".join(lines) + ("\n" if lines else "")
 
+def _render_jsonl_item(row: dict[str, object]) -> str:
+    return json.dumps(row, separators=(",", ":")) + "\n"
 
-def _render_csv(entries: list[AuditEntry]) -> str:
+
+def _csv_line(row: dict[str, object]) -> dict[str, str]:
+    return {
+        "id": str(row["id"]),
+        "timestamp": str(row["timestamp"]),
+        "operation": str(row["operation"]),
+        "agent_urn": str(row["agent_urn"]),
+        "details": json.dumps(row["details"], sort_keys=True, default=str),
+        "prev_hash": str(row["prev_hash"]),
+        "hash": str(row["hash"]),
+    }
+
+
+async def _render_chunks(entries: AsyncIterator[AuditEntry], fmt: str) -> AsyncIterator[str]:
+    """Render streamed entries as text chunks of ``_EXPORT_CHUNK_ENTRIES`` entries."""
     buf = io.StringIO()
-    fieldnames = ("id", "timestamp", "operation", "agent_urn", "details", "prev_hash", "hash")
-    writer = csv.DictWriter(buf, fieldnames=fieldnames, lineterminator="\n")
-    writer.writeheader()
-    for row in _entry_payloads(entries):
-        line = {
-            "id": str(row["id"]),
-            "timestamp": str(row["timestamp"]),
-            "operation": str(row["operation"]),
-            "agent_urn": str(row["agent_urn"]),
-            "details": json.dumps(row["details"], sort_keys=True, default=str),
-            "prev_hash": str(row["prev_hash"]),
-            "hash": str(row["hash"]),
-        }
-        writer.writerow(line)
-    return buf.getvalue()
+    writer = csv.DictWriter(buf, fieldnames=_CSV_FIELDNAMES, lineterminator="\n")
+    if fmt == "csv":
+        writer.writeheader()
+    count = 0
+    async for entry in entries:
+        row = entry.model_dump(mode="json")
+        if fmt == "json":
+            buf.write(_render_json_item(row, first=count == 0))
+        elif fmt == "jsonl":
+            buf.write(_render_jsonl_item(row))
+        else:
+            writer.writerow(_csv_line(row))
+        count += 1
+        if count % _EXPORT_CHUNK_ENTRIES == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    if fmt == "json":
+        buf.write("\n]\n" if count else "[]\n")
+    elif fmt == "jsonl" and not count:
+        buf.write("\n")
+    tail = buf.getvalue()
+    if tail:
+        yield tail
 
 
 async def _run_export(
@@ -76,30 +102,23 @@ async def _run_export(
     agent_urn: Optional[str],
     since: Optional[datetime],
     until: Optional[datetime],
-    limit: int,
+    limit: Optional[int],
     output_format: str,
     verify_chain: bool,
-) -> str:
+    write: Callable[[str], None],
+) -> None:
+    """Stream matching entries to ``write`` chunk by chunk (constant memory)."""
     if verify_chain:
         ok = await store.verify_chain()
         if not ok:
             raise AuditChainBroken("audit hash chain verification failed")
 
-    entries = await store.query(
-        agent_urn=agent_urn,
-        start=since,
-        end=until,
-        limit=limit,
-        offset=0,
-    )
     fmt = output_format.strip().lower()
-    if fmt == "json":
-        return _render_json(entries)
-    if fmt == "jsonl":
-        return _render_jsonl(entries)
-    if fmt == "csv":
-        return _render_csv(entries)
-    raise RuntimeError(f"unexpected format: {fmt!r}")
+    if fmt not in ("json", "jsonl", "csv"):
+        raise RuntimeError(f"unexpected format: {fmt!r}")
+    entries = store.iter_entries(agent_urn=agent_urn, start=since, end=until, limit=limit)
+    async for chunk in _render_chunks(entries, fmt):
+        write(chunk)
 
 
 def register_audit_export_commands(root: typer.Typer) -> None:
@@ -136,11 +155,13 @@ def register_audit_export_commands(root: typer.Typer) -> None:
             Optional[str],
             typer.Option("--urn", help="Filter by agent URN (agent_urn column)."),
         ] = None,
-        limit: int = typer.Option(
-            10_000,
-            "--limit",
-            help="Maximum number of entries to export (ordered by insertion).",
-        ),
+        limit: Annotated[
+            Optional[int],
+            typer.Option(
+                "--limit",
+                help="Maximum number of entries to export (ordered by insertion; default: all).",
+            ),
+        ] = None,
         output_format: str = typer.Option(
             "json",
             "--format",
@@ -153,7 +174,7 @@ def register_audit_export_commands(root: typer.Typer) -> None:
             help="Verify full-store hash chain before export; exit 1 if tampered.",
         ),
     ) -> None:
-        if limit < 1:
+        if limit is not None and limit < 1:
             raise typer.BadParameter("--limit must be at least 1")
 
         fmt = output_format.strip().lower()
@@ -169,8 +190,11 @@ def register_audit_export_commands(root: typer.Typer) -> None:
 
         backing = _make_store(store, db)
 
-        async def _run() -> str:
-            return await _run_export(
+        def _write(chunk: str) -> None:
+            typer.echo(chunk, nl=False)
+
+        async def _run() -> None:
+            await _run_export(
                 backing,
                 agent_urn=agent_urn,
                 since=since_dt,
@@ -178,10 +202,11 @@ def register_audit_export_commands(root: typer.Typer) -> None:
                 limit=limit,
                 output_format=fmt,
                 verify_chain=verify_chain,
+                write=_write,
             )
 
         try:
-            text = asyncio.run(_run())
+            asyncio.run(_run())
         except AuditChainBroken as exc:
             typer.echo("Audit hash chain verification failed (possible tampering).", err=True)
             raise typer.Exit(1) from exc
@@ -190,5 +215,3 @@ def register_audit_export_commands(root: typer.Typer) -> None:
         except OSError as exc:
             typer.echo(f"Could not read audit database: {exc}", err=True)
             raise typer.Exit(2) from exc
-
-        typer.echo(text, nl=not text.endswith("\n"))
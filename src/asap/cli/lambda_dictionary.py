@@ -0,0 +1,88 @@
+"""`asap lambda train` — learn a Lambda codec ``λ2:`` dictionary from captured traffic."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from asap.transport.lambda_dictionary import (
+    PRIVATE_USE_PATTERN,
+    read_jsonl_capture,
+    train_dictionary,
+)
+
+
+def register_lambda_commands(root: typer.Typer) -> None:
+    """Register the ``lambda`` command group (Lambda codec dictionaries) on *root*."""
+    lambda_app = typer.Typer(help="Lambda codec dictionary tools.")
+    root.add_typer(lambda_app, name="lambda")
+
+    @lambda_app.command("train")
+    def lambda_train(
+        capture: Annotated[
+            Path,
+            typer.Argument(help="JSONL capture: one JSON-RPC request or response per line."),
+        ],
+        out: Annotated[
+            Path,
+            typer.Option(..., "--out", "-o", help="Output path for the dictionary JSON artifact."),
+        ],
+        dictionary_id: Annotated[
+            str,
+            typer.Option(
+                ..., "--id", help="Dictionary id, e.g. 'acme-prod-3'. Change it on retrain."
+            ),
+        ],
+        max_tokens: Annotated[
+            int, typer.Option("--max-tokens", min=1, help="Maximum number of tokens.")
+        ] = 1024,
+        min_count: Annotated[
+            int, typer.Option("--min-count", min=1, help="Minimum occurrences per token.")
+        ] = 2,
+        max_value_length: Annotated[
+            int,
+            typer.Option("--max-value-length", min=1, help="Longest string value to learn."),
+        ] = 64,
+    ) -> None:
+        """Train a dictionary from CAPTURE and report its effect on the capture.
+
+        Learns object keys, short string values and URN prefixes, ranked by
+        bytes saved. Register the artifact on both ends with
+        ``lambda_codec.register_dictionary(load_dictionary(path))``.
+        """
+        if not capture.is_file():
+            raise typer.BadParameter(f"Capture file not found: {capture}")
+        try:
+            messages = list(read_jsonl_capture(capture))
+            dictionary = train_dictionary(
+                messages,
+                dictionary_id,
+                max_tokens=max_tokens,
+                min_count=min_count,
+                max_value_length=max_value_length,
+            )
+        except ValueError as exc:
+            typer.echo(f"Error: {exc}", err=True)
+            raise typer.Exit(1) from exc
+
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(dictionary.to_json() + "\n", encoding="utf-8")
+
+        original_size = 0
+        encoded_size = 0
+        for message in messages:
+            json_str = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+            original_size += len(json_str.encode("utf-8"))
+            if PRIVATE_USE_PATTERN.search(json_str):
+                encoded_size += len(json_str.encode("utf-8"))
+            else:
+                encoded_size += len(dictionary.encode(json_str).encode("utf-8"))
+        ratio = encoded_size / original_size if original_size else 1.0
+        typer.echo(
+            f"Dictionary {dictionary.id} written to {out}: {len(dictionary.tokens)} tokens "
+            f"from {len(messages)} messages; {original_size} -> {encoded_size} bytes "
+            f"({ratio:.1%})"
+        )
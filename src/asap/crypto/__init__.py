@@ -9,6 +9,7 @@ Public exports:
     keys: Key generation and management submodule
     signing: Manifest canonicalize and sign_manifest
     models: SignedManifest, SignatureBlock
+    ManifestVerifier: Cached, batched signature verification
 """
 
 from asap.crypto import keys
@@ -17,11 +18,13 @@ from asap.crypto import trust
 from asap.crypto.models import SignatureBlock, SignedManifest
 from asap.crypto.trust import detect_trust_level, sign_with_ca, verify_ca_signature
 from asap.crypto.trust_levels import TrustLevel
+from asap.crypto.verifier import ManifestVerifier
 
 __all__ = [
     "keys",
     "signing",
     "trust",
+    "ManifestVerifier",
     "SignatureBlock",
     "SignedManifest",
     "TrustLevel",
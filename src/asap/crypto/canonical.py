@@ -0,0 +1,132 @@
+"""Fast RFC 8785 (JCS) canonical JSON for manifest signing.
+
+The ``jcs`` package encodes through a pure-Python copy of the stdlib JSON
+encoder, sorting every object's keys by their UTF-16 encoding and formatting
+every number through ``float`` (ECMAScript ``Number.prototype.toString``). On a
+typical manifest that is ~10x slower than ``json.dumps``, which runs in C.
+
+For most documents the C encoder already produces the canonical form:
+- ``sort_keys=True`` orders keys by code point, which matches UTF-16 order
+  unless a key contains a character outside the Basic Multilingual Plane.
+- ``ensure_ascii=False`` escapes exactly what JCS escapes (``"``, ``\\`` and
+  control characters, with the same short forms and lowercase ``\\u00xx``).
+- Integers with ``|n| <= 2**53`` print the same digits in both.
+- Non-integral floats with ``1e-4 <= |x| < 1e16`` print ``repr`` digits in
+  plain decimal notation in both. Integral floats print as ``1`` in JCS and
+  ``1.0`` in ``repr``, so they are converted to ``int`` first.
+
+``canonical_json`` walks the value once to check these conditions (copying
+only the containers that hold a converted float) and falls back to
+``jcs.canonicalize`` for anything else: non-BMP keys, non-string keys, large
+integers, tiny or huge floats, NaN/Infinity and unknown types. The fallback
+keeps output (and errors) identical to the reference for every input.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, cast
+
+import jcs
+
+# Largest integer magnitude whose float conversion is exact (jcs formats ints via float).
+_MAX_EXACT_INT = 2**53
+_BMP_MAX = "\uffff"
+
+
+class _NeedsReference(Exception):
+    """Raised during the walk when only the reference encoder is exact."""
+
+
+def reference_canonical_json(value: Any) -> bytes:
+    """RFC 8785 canonical UTF-8 bytes via the ``jcs`` package."""
+    return cast(bytes, jcs.canonicalize(value))
+
+
+def canonical_json(value: Any) -> bytes:
+    """RFC 8785 canonical UTF-8 bytes; byte-identical to ``reference_canonical_json``."""
+    try:
+        prepared = _prepare(value)
+    except _NeedsReference:
+        return reference_canonical_json(value)
+    return json.dumps(
+        prepared,
+        ensure_ascii=False,
+        allow_nan=False,
+        check_circular=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+
+
+def _prepare(value: Any) -> Any:
+    """Return ``value`` with integral floats as ints, or raise ``_NeedsReference``."""
+    kind = type(value)
+    if kind is dict:
+        return _prepare_dict(value)
+    if kind is list:
+        return _prepare_list(value)
+    return _prepare_other(value)
+
+
+def _prepare_dict(value: dict[Any, Any]) -> dict[Any, Any]:
+    copy: dict[Any, Any] | None = None
+    for key, item in value.items():
+        if type(key) is not str or not key.isascii():
+            _check_key(key)
+        kind = type(item)
+        # Inline the common leaves; only containers and numbers needing a check recurse.
+        if kind is str or kind is bool or item is None:
+            continue
+        if kind is int and -_MAX_EXACT_INT <= item <= _MAX_EXACT_INT:
+            continue
+        prepared = _prepare(item)
+        if prepared is not item:
+            if copy is None:
+                copy = dict(value)
+            copy[key] = prepared
+    return value if copy is None else copy
+
+
+def _prepare_list(value: list[Any] | tuple[Any, ...]) -> list[Any] | tuple[Any, ...]:
+    items: list[Any] | None = None
+    for i, item in enumerate(value):
+        kind = type(item)
+        if kind is str or kind is bool or item is None:
+            continue
+        if kind is int and -_MAX_EXACT_INT <= item <= _MAX_EXACT_INT:
+            continue
+        prepared = _prepare(item)
+        if prepared is not item:
+            if items is None:
+                items = list(value)
+            items[i] = prepared
+    return value if items is None else items
+
+
+def _check_key(key: Any) -> None:
+    if not isinstance(key, str) or (not key.isascii() and max(key) > _BMP_MAX):
+        raise _NeedsReference
+
+
+def _prepare_other(value: Any) -> Any:
+    if isinstance(value, str) or value is None or value is True or value is False:
+        return value
+    if isinstance(value, dict):
+        return _prepare_dict(value)
+    if isinstance(value, (list, tuple)):
+        return _prepare_list(value)
+    if isinstance(value, int):
+        if -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT:
+            return value
+        raise _NeedsReference
+    if isinstance(value, float):
+        if value.is_integer():
+            if -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT:
+                return int(value)
+        elif 1e-4 <= abs(value) < 1e16:
+            return value
+    raise _NeedsReference
+
+
+__all__ = ["canonical_json", "reference_canonical_json"]
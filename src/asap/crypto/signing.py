@@ -3,21 +3,26 @@
 Verification enforces RFC 8032 Strict Mode (ADR-20):
 - Signature scalar `s` must satisfy s < l (group order) to prevent malleability.
 - JCS (RFC 8785) ensures deterministic JSON before signing/verifying.
+
+``canonicalize`` uses the C-backed ``canonical_json`` by default. Set
+``ASAP_CANONICALIZER=jcs`` to use the reference ``jcs`` package instead; both
+produce identical bytes.
 """
 
 from __future__ import annotations
 
 import base64
 import binascii
-from typing import cast
+import os
+from typing import Any
 
-import jcs
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
     Ed25519PublicKey,
 )
 
+from asap.crypto.canonical import canonical_json, reference_canonical_json
 from asap.crypto.keys import load_public_key_from_base64, public_key_to_base64
 from asap.crypto.models import SignatureBlock, SignedManifest
 from asap.errors import SignatureVerificationError
@@ -27,10 +32,18 @@ from asap.models.entities import Manifest
 # Signatures (R, s) must have s < l per RFC 8032 strict verification.
 ED25519_ORDER = 2**252 + 27742317777372353535851937790883648493
 
+# "fast" (default) or "jcs" (reference package, for comparison/debugging).
+CANONICALIZER = os.environ.get("ASAP_CANONICALIZER", "fast")
+
 
 def canonicalize(manifest: Manifest) -> bytes:
-    payload = manifest.model_dump(exclude={"signature"})
-    return cast(bytes, jcs.canonicalize(payload))
+    return _canonical_payload(manifest.model_dump(exclude={"signature"}))
+
+
+def _canonical_payload(payload: dict[str, Any]) -> bytes:
+    if CANONICALIZER == "jcs":
+        return reference_canonical_json(payload)
+    return canonical_json(payload)
 
 
 def sign_manifest(
@@ -51,26 +64,43 @@ def verify_manifest(
     signed_manifest: SignedManifest,
     public_key: Ed25519PublicKey | None = None,
 ) -> bool:
+    _check_alg(signed_manifest)
+    pk = public_key
+    if pk is None:
+        pk = _load_embedded_public_key(signed_manifest.public_key)
+    _verify_signature(signed_manifest, pk, canonicalize(signed_manifest.manifest))
+    return True
+
+
+def _check_alg(signed_manifest: SignedManifest) -> None:
     if signed_manifest.signature.alg != "ed25519":
         raise SignatureVerificationError(
             f"Unsupported signature algorithm: {signed_manifest.signature.alg}. "
             "Only ed25519 is supported.",
             details={"alg": signed_manifest.signature.alg},
         )
-    pk = public_key
-    if pk is None:
-        if not signed_manifest.public_key:
-            raise SignatureVerificationError(
-                "Cannot verify: no public key provided and signed manifest has no public_key.",
-                details={},
-            )
-        try:
-            pk = load_public_key_from_base64(signed_manifest.public_key)
-        except ValueError as e:
-            raise SignatureVerificationError(
-                f"Invalid public_key in signed manifest: {e}.",
-                details={},
-            ) from e
+
+
+def _load_embedded_public_key(public_key_b64: str | None) -> Ed25519PublicKey:
+    if not public_key_b64:
+        raise SignatureVerificationError(
+            "Cannot verify: no public key provided and signed manifest has no public_key.",
+            details={},
+        )
+    try:
+        return load_public_key_from_base64(public_key_b64)
+    except ValueError as e:
+        raise SignatureVerificationError(
+            f"Invalid public_key in signed manifest: {e}.",
+            details={},
+        ) from e
+
+
+def _verify_signature(
+    signed_manifest: SignedManifest,
+    public_key: Ed25519PublicKey,
+    payload_bytes: bytes,
+) -> None:
     try:
         raw_sig = base64.b64decode(signed_manifest.signature.signature)
     except binascii.Error as e:
@@ -84,15 +114,13 @@ def verify_manifest(
             details={"signature_length": len(raw_sig)},
         )
     _enforce_strict_scalar(raw_sig)
-    payload_bytes = canonicalize(signed_manifest.manifest)
     try:
-        pk.verify(raw_sig, payload_bytes)
+        public_key.verify(raw_sig, payload_bytes)
     except InvalidSignature as e:
         raise SignatureVerificationError(
             "Signature verification failed: manifest may have been tampered with or signature is invalid.",
             details={"cause": str(e)},
         ) from e
-    return True
 
 
 def _enforce_strict_scalar(raw_sig: bytes) -> None:
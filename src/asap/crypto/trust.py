@@ -54,24 +54,35 @@ def verify_ca_signature(
     signed_manifest: SignedManifest,
     known_cas: Iterable[str] | Iterable[Ed25519PublicKey],
 ) -> bool:
-    if signed_manifest.signature.trust_level != TrustLevel.VERIFIED:
-        raise SignatureVerificationError(
-            f"Expected trust_level=verified for CA verification, got {signed_manifest.signature.trust_level.value}.",
-            details={"trust_level": signed_manifest.signature.trust_level.value},
-        )
+    _check_ca_trust_level(signed_manifest)
     if not signed_manifest.public_key:
         raise SignatureVerificationError(
             "Cannot verify CA: signed manifest has no public_key.",
             details={},
         )
     public_key = load_public_key_from_base64(signed_manifest.public_key)
-    known_ca_b64 = {
+    _check_known_ca(public_key_to_base64(public_key), _ca_key_set(known_cas))
+    verify_manifest(signed_manifest, public_key=public_key)
+    return True
+
+
+def _ca_key_set(known_cas: Iterable[str] | Iterable[Ed25519PublicKey]) -> frozenset[str]:
+    return frozenset(
         public_key_to_base64(ca) if isinstance(ca, Ed25519PublicKey) else ca for ca in known_cas
-    }
-    if public_key_to_base64(public_key) not in known_ca_b64:
+    )
+
+
+def _check_ca_trust_level(signed_manifest: SignedManifest) -> None:
+    if signed_manifest.signature.trust_level != TrustLevel.VERIFIED:
+        raise SignatureVerificationError(
+            f"Expected trust_level=verified for CA verification, got {signed_manifest.signature.trust_level.value}.",
+            details={"trust_level": signed_manifest.signature.trust_level.value},
+        )
+
+
+def _check_known_ca(public_key_b64: str, known_ca_b64: frozenset[str]) -> None:
+    if public_key_b64 not in known_ca_b64:
         raise SignatureVerificationError(
             "CA not in known_cas: signature from unknown CA.",
-            details={"public_key_preview": signed_manifest.public_key[:16] + "..."},
+            details={"public_key_preview": public_key_b64[:16] + "..."},
         )
-    verify_manifest(signed_manifest, public_key=public_key)
-    return True
@@ -2,16 +2,24 @@
 
 Serves GET /.well-known/asap/manifest.json with optional HTTP caching
 (Cache-Control, ETag, If-None-Match) for discovery by other agents.
+
+The serialized body (identity, gzip and brotli variants) and the ETags are
+computed once per manifest version by :class:`ManifestResponseCache`. Each
+encoded variant has its own strong ETag (``"<sha256>-gzip"``, ``"<sha256>-br"``)
+since the bodies differ byte for byte (RFC 9110 §8.8.3).
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Collection
+from typing import Any, Union
 
 from fastapi import Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response
 
+from asap.crypto.models import SignedManifest
 from asap.models.entities import Manifest
 
 WELLKNOWN_MANIFEST_PATH = "/.well-known/asap/manifest.json"
@@ -29,6 +37,15 @@ CACHE_CONTROL_VALUE = f"public, max-age={CACHE_MAX_AGE_SECONDS}"
 HEADER_ETAG = "etag"
 HEADER_IF_NONE_MATCH = "if-none-match"
 HEADER_CACHE_CONTROL = "cache-control"
+HEADER_ACCEPT_ENCODING = "accept-encoding"
+HEADER_CONTENT_ENCODING = "content-encoding"
+HEADER_VARY = "vary"
+
+ManifestDocument = Union[Manifest, SignedManifest]
+"""Document served on the well-known path (plain or signed manifest)."""
+
+# Content codings that get their own ETag suffix (``CompressionAlgorithm`` values).
+_VARIANT_ENCODINGS = ("gzip", "br")
 
 
 def get_manifest_json(manifest: Manifest) -> dict[str, object]:
@@ -54,7 +71,11 @@ def compute_manifest_etag(manifest: Manifest) -> str:
     Returns:
         ETag value without quotes (caller adds quotes in header if needed).
     """
-    payload = json.dumps(get_manifest_json(manifest), sort_keys=True)
+    return _etag_for_json(get_manifest_json(manifest))
+
+
+def _etag_for_json(content: dict[str, Any]) -> str:
+    payload = json.dumps(content, sort_keys=True)
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
@@ -63,43 +84,165 @@ def _etag_header_value(etag: str) -> str:
     return f'"{etag}"'
 
 
-async def get_manifest_response(manifest: Manifest, request: Request) -> Response:
+def _if_none_match_hits(if_none_match: str | None, etag_headers: Collection[str]) -> bool:
+    # RFC 9110 §13.1.2: "*" or a comma-separated list, compared weakly (W/ ignored).
+    if if_none_match is None:
+        return False
+    for part in if_none_match.split(","):
+        tag = part.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag in etag_headers:
+            return True
+    return False
+
+
+class CachedManifest:
+    """Serialized form of one manifest version: body bytes, encoded variants and ETags.
+
+    The identity body matches ``JSONResponse`` rendering byte for byte and its
+    ETag (``etag_header``) matches :func:`compute_manifest_etag`; each encoded
+    variant's ETag adds the content coding as a suffix. Compressed variants are
+    built on first request for each encoding and kept for the lifetime of the entry.
+    """
+
+    __slots__ = ("document", "etag_header", "etag_headers", "body", "_etag", "_encoded")
+
+    def __init__(self, document: ManifestDocument) -> None:
+        content = document.model_dump(mode="json", by_alias=True)
+        self.document = document
+        self._etag = _etag_for_json(content)
+        self.etag_header = _etag_header_value(self._etag)
+        self.etag_headers = frozenset(
+            [self.etag_header, *(self.etag_for(encoding) for encoding in _VARIANT_ENCODINGS)]
+        )
+        self.body = json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+        self._encoded: dict[str, bytes] = {}
+
+    def etag_for(self, content_encoding: str | None) -> str:
+        """Quoted ETag of the variant sent with *content_encoding* (None: identity)."""
+        if content_encoding is None:
+            return self.etag_header
+        return _etag_header_value(f"{self._etag}-{content_encoding}")
+
+    def encoding_for(self, accept_encoding: str | None) -> str | None:
+        """Content coding to send for the client's Accept-Encoding (None: identity).
+
+        Bodies below the transport ``COMPRESSION_THRESHOLD`` are always sent as
+        identity.
+        """
+        # Deferred: asap.transport imports this module through its route groups.
+        from asap.transport.compression import (
+            COMPRESSION_THRESHOLD,
+            CompressionAlgorithm,
+            select_best_encoding,
+        )
+
+        if len(self.body) < COMPRESSION_THRESHOLD:
+            return None
+        algorithm = select_best_encoding(accept_encoding)
+        if algorithm == CompressionAlgorithm.IDENTITY:
+            return None
+        encoding: str = algorithm.value
+        return encoding
+
+    def encoded_body(self, content_encoding: str | None) -> bytes:
+        """Body bytes for *content_encoding*, compressing on first use."""
+        from asap.transport.compression import (
+            CompressionAlgorithm,
+            compress_brotli,
+            compress_gzip,
+        )
+
+        if content_encoding is None:
+            return self.body
+        encoded = self._encoded.get(content_encoding)
+        if encoded is None:
+            brotli = content_encoding == CompressionAlgorithm.BROTLI.value
+            compress = compress_brotli if brotli else compress_gzip
+            encoded = self._encoded[content_encoding] = compress(self.body)
+        return encoded
+
+    def body_for(self, accept_encoding: str | None) -> tuple[bytes, str | None]:
+        """Return ``(body, content_encoding)`` for the client's Accept-Encoding.
+
+        ``content_encoding`` is None for identity.
+        """
+        encoding = self.encoding_for(accept_encoding)
+        return self.encoded_body(encoding), encoding
+
+
+class ManifestResponseCache:
+    """Per-app cache of the well-known manifest response.
+
+    Entries are keyed by the identity of the served document, so assigning a
+    new manifest (or signed manifest) to ``app.state`` rebuilds the entry on the
+    next request. :meth:`invalidate` drops the entry explicitly, e.g. on handler
+    hot reload or after mutating a :class:`SignedManifest` in place.
+
+    Example:
+        >>> cache = ManifestResponseCache()
+        >>> entry = cache.get(manifest)
+        >>> entry is cache.get(manifest)
+        True
+    """
+
+    def __init__(self) -> None:
+        self._entry: CachedManifest | None = None
+
+    def get(self, document: ManifestDocument) -> CachedManifest:
+        """Return the cached entry for *document*, rebuilding it on version change."""
+        entry = self._entry
+        if entry is None or entry.document is not document:
+            entry = CachedManifest(document)
+            self._entry = entry
+        return entry
+
+    def invalidate(self) -> None:
+        """Drop the cached entry; the next request re-serializes the manifest."""
+        self._entry = None
+
+
+async def get_manifest_response(
+    manifest: ManifestDocument,
+    request: Request,
+    cache: ManifestResponseCache | None = None,
+) -> Response:
     """Return FastAPI response for GET /.well-known/asap/manifest.json.
 
     Returns the agent manifest as JSON with Content-Type: application/json,
     Cache-Control: public, max-age=300, and ETag. If the request sends
-    If-None-Match matching the current ETag, returns 304 Not Modified.
+    If-None-Match matching the current ETag of any variant, returns 304 Not
+    Modified. The body is gzip/brotli encoded when the client accepts it, with
+    that variant's ETag.
 
     Args:
-        manifest: The agent's manifest.
-        request: The incoming request (used for If-None-Match).
+        manifest: The agent's manifest (or signed manifest).
+        request: The incoming request (used for If-None-Match and Accept-Encoding).
+        cache: Optional response cache; when omitted the body and ETag are
+            computed for this request only.
 
     Returns:
-        JSONResponse (200) with body and caching headers, or Response (304) when
+        Response (200) with body and caching headers, or Response (304) when
         client sent matching If-None-Match.
     """
-    etag = compute_manifest_etag(manifest)
-    etag_header = _etag_header_value(etag)
-    if_none_match = request.headers.get(HEADER_IF_NONE_MATCH)
-
-    # RFC 7232: If-None-Match can be a single value or comma-separated list
-    match = if_none_match is not None and any(
-        part.strip() == etag_header for part in if_none_match.split(",")
-    )
-    if match:
-        return Response(
-            status_code=304,
-            headers={
-                HEADER_ETAG: etag_header,
-                HEADER_CACHE_CONTROL: CACHE_CONTROL_VALUE,
-            },
-        )
-
-    return JSONResponse(
-        content=get_manifest_json(manifest),
-        media_type=CONTENT_TYPE_JSON,
-        headers={
-            HEADER_ETAG: etag_header,
-            HEADER_CACHE_CONTROL: CACHE_CONTROL_VALUE,
-        },
-    )
+    entry = cache.get(manifest) if cache is not None else CachedManifest(manifest)
+    content_encoding = entry.encoding_for(request.headers.get(HEADER_ACCEPT_ENCODING))
+    headers = {
+        HEADER_ETAG: entry.etag_for(content_encoding),
+        HEADER_CACHE_CONTROL: CACHE_CONTROL_VALUE,
+        HEADER_VARY: "Accept-Encoding",
+    }
+
+    # Every variant carries the same content, so any of their ETags validates.
+    if _if_none_match_hits(request.headers.get(HEADER_IF_NONE_MATCH), entry.etag_headers):
+        return Response(status_code=304, headers=headers)
+
+    body = entry.encoded_body(content_encoding)
+    if content_encoding is not None:
+        headers[HEADER_CONTENT_ENCODING] = content_encoding
+    return Response(content=body, media_type=CONTENT_TYPE_JSON, headers=headers)
@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
 
@@ -18,7 +19,12 @@ from pydantic import ConfigDict, Field
 
 from asap.models.base import ASAPBaseModel
 from asap.models.ids import generate_id
-from asap.state.stores import AsyncSqliteRepository
+from asap.state.stores import AsyncSqliteRepository, GroupCommitWriter, Page, decode_cursor
+from asap.state.stores._group_commit import (
+    DEFAULT_GROUP_COMMIT_DELAY,
+    DEFAULT_GROUP_COMMIT_MAX_BATCH,
+)
+from asap.state.stores._keyset import cursor_offset, page_from_rows
 
 
 class AuditChainBroken(Exception):
@@ -105,6 +111,50 @@ class AuditStore(Protocol):
         ...
 
 
+# Rows fetched per page by ``iter_entries`` (exports stream page by page).
+DEFAULT_AUDIT_PAGE_SIZE = 1000
+
+
+async def _audit_offset_page(
+    store: AuditStore,
+    agent_urn: str | None,
+    start: datetime | None,
+    end: datetime | None,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+) -> Page[AuditEntry]:
+    """Offset-cursor fallback for ``query_page`` built on ``query`` alone."""
+    first = cursor_offset(cursor, offset)
+    entries = await store.query(agent_urn, start, end, limit=limit + 1, offset=first)
+    return page_from_rows(entries, limit, key=lambda _: (first + limit,), to_item=lambda e: e)
+
+
+async def query_audit_page(
+    store: AuditStore,
+    agent_urn: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> Page[AuditEntry]:
+    """Fetch one cursor-paginated page from any ``AuditStore`` (used by ``GET /audit``).
+
+    Uses the store's ``query_page`` when it has one and falls back to offset
+    cursors over ``query`` for other protocol implementations. ``offset`` only
+    applies when ``cursor`` is ``None``; raises ``InvalidCursor`` for a cursor
+    the store did not issue.
+    """
+    query_page = getattr(store, "query_page", None)
+    if query_page is None:
+        return await _audit_offset_page(store, agent_urn, start, end, limit, offset, cursor)
+    page: Page[AuditEntry] = await query_page(
+        agent_urn=agent_urn, start=start, end=end, limit=limit, offset=offset, cursor=cursor
+    )
+    return page
+
+
 class InMemoryAuditStore:
     """In-memory audit store for testing and development."""
 
@@ -141,6 +191,31 @@ class InMemoryAuditStore:
             results = [e for e in results if e.timestamp <= end]
         return results[offset : offset + limit]
 
+    async def query_page(
+        self,
+        agent_urn: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> Page[AuditEntry]:
+        """Query one page of entries; the cursor encodes the next list position."""
+        return await _audit_offset_page(self, agent_urn, start, end, limit, offset, cursor)
+
+    async def iter_entries(
+        self,
+        agent_urn: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+        page_size: int = DEFAULT_AUDIT_PAGE_SIZE,
+    ) -> AsyncIterator[AuditEntry]:
+        """Yield matching entries in insertion order (``limit=None`` means all)."""
+        entries = await self.query(agent_urn, start, end, limit=len(self._entries))
+        for entry in entries[:limit]:
+            yield entry
+
     async def verify_chain(self) -> bool:
         """Walk the full chain and verify every hash link."""
         prev_hash = ""
@@ -171,25 +246,111 @@ CREATE TABLE IF NOT EXISTS audit_log (
 );
 CREATE INDEX IF NOT EXISTS idx_audit_urn ON audit_log(agent_urn);
 CREATE INDEX IF NOT EXISTS idx_audit_ts ON audit_log(timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_urn_ts ON audit_log(agent_urn, timestamp);
 """
 
 
+async def _seal_and_insert(
+    conn: aiosqlite.Connection, entries: list[AuditEntry]
+) -> list[AuditEntry]:
+    """Group-commit batch writer: chain *entries* onto the last stored hash."""
+    cursor = await conn.execute("SELECT hash FROM audit_log ORDER BY rowid DESC LIMIT 1")
+    row = await cursor.fetchone()
+    prev_hash = row[0] if row else ""
+
+    sealed_entries: list[AuditEntry] = []
+    for entry in entries:
+        computed_hash = compute_entry_hash(
+            prev_hash, entry.timestamp, entry.operation, entry.details
+        )
+        sealed_entries.append(
+            entry.model_copy(update={"prev_hash": prev_hash, "hash": computed_hash})
+        )
+        prev_hash = computed_hash
+
+    await conn.executemany(
+        """
+        INSERT INTO audit_log (id, timestamp, operation, agent_urn, details, prev_hash, hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                sealed.id,
+                sealed.timestamp.isoformat(),
+                sealed.operation,
+                sealed.agent_urn,
+                json.dumps(sealed.details, sort_keys=True, default=str),
+                sealed.prev_hash,
+                sealed.hash,
+            )
+            for sealed in sealed_entries
+        ],
+    )
+    return sealed_entries
+
+
+_AUDIT_COLUMNS = "id, timestamp, operation, agent_urn, details, prev_hash, hash"
+_AUDIT_SELECT = f"SELECT {_AUDIT_COLUMNS} FROM audit_log"  # nosec B608 - fixed column list
+
+
+def _audit_filters(
+    agent_urn: str | None,
+    start: datetime | None,
+    end: datetime | None,
+) -> tuple[list[str], list[str | int]]:
+    """WHERE fragments (static) and bound values for the audit query filters."""
+    clauses: list[str] = []
+    params: list[str | int] = []
+    if agent_urn:
+        clauses.append("agent_urn = ?")
+        params.append(agent_urn)
+    if start:
+        clauses.append("timestamp >= ?")
+        params.append(start.isoformat())
+    if end:
+        clauses.append("timestamp <= ?")
+        params.append(end.isoformat())
+    return clauses, params
+
+
+def _row_to_entry(row: tuple[Any, ...] | aiosqlite.Row) -> AuditEntry:
+    return AuditEntry(
+        id=row[0],
+        timestamp=datetime.fromisoformat(row[1]),
+        operation=row[2],
+        agent_urn=row[3],
+        details=json.loads(row[4]),
+        prev_hash=row[5],
+        hash=row[6],
+    )
+
+
 class SQLiteAuditStore(AsyncSqliteRepository):
     """SQLite-backed audit store with hash chain verification.
 
     Subclasses :class:`AsyncSqliteRepository` so aiosqlite plumbing, the
     ``:memory:`` persistent connection, per-path WAL setup, and idempotent
-    schema init are owned by the base. An ``asyncio.Lock`` serialises the
-    logical read-prev-hash-then-write step in :meth:`append` so the hash
-    chain stays linear across concurrent writers (independent of which
-    backend holds the connection).
+    schema init are owned by the base. Appends go through a
+    :class:`GroupCommitWriter`: concurrent appends are sealed and inserted in
+    one transaction per batch, and batches run one at a time, so the hash
+    chain stays linear across concurrent writers.
     """
 
-    def __init__(self, db_path: str = ":memory:") -> None:
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        *,
+        commit_batch_size: int = DEFAULT_GROUP_COMMIT_MAX_BATCH,
+        commit_delay_seconds: float = DEFAULT_GROUP_COMMIT_DELAY,
+    ) -> None:
         super().__init__(db_path, schema_ddl=_AUDIT_LOG_DDL)
-        # Serialises the read-prev-hash + INSERT of an append so concurrent
-        # appends form one linear hash chain (the base owns connection mgmt).
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self._writer: GroupCommitWriter[AuditEntry, AuditEntry] = GroupCommitWriter(
+            self,
+            _seal_and_insert,
+            name="audit_log",
+            max_batch_size=commit_batch_size,
+            max_delay_seconds=commit_delay_seconds,
+        )
 
     async def _get_connection(self) -> aiosqlite.Connection:
         """Return an open connection the caller must close (unless persistent).
@@ -209,38 +370,14 @@ class SQLiteAuditStore(AsyncSqliteRepository):
     async def append(self, entry: AuditEntry) -> AuditEntry:
         """Append an entry, linking it to the last stored hash.
 
-        The ``self._lock`` serialises the read-prev-hash + INSERT so
-        concurrent appends form a single linear chain; ``self._connect``
-        owns the connection lifecycle (persistent for ``:memory:``,
-        per-call WAL connection for files).
+        Returns once the sealed entry is committed. Entries appended
+        concurrently are chained in submission order within one batch.
         """
-        async with self._lock, self._connect() as conn:
-            cursor = await conn.execute("SELECT hash FROM audit_log ORDER BY rowid DESC LIMIT 1")
-            row = await cursor.fetchone()
-            prev_hash = row[0] if row else ""
+        return await self._writer.submit(entry)
 
-            computed_hash = compute_entry_hash(
-                prev_hash, entry.timestamp, entry.operation, entry.details
-            )
-            sealed = entry.model_copy(update={"prev_hash": prev_hash, "hash": computed_hash})
-
-            await conn.execute(
-                """
-                INSERT INTO audit_log (id, timestamp, operation, agent_urn, details, prev_hash, hash)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    sealed.id,
-                    sealed.timestamp.isoformat(),
-                    sealed.operation,
-                    sealed.agent_urn,
-                    json.dumps(sealed.details, sort_keys=True, default=str),
-                    sealed.prev_hash,
-                    sealed.hash,
-                ),
-            )
-            await conn.commit()
-        return sealed
+    async def flush(self) -> None:
+        """Wait until every entry appended so far is committed."""
+        await self._writer.flush()
 
     async def query(
         self,
@@ -251,47 +388,78 @@ class SQLiteAuditStore(AsyncSqliteRepository):
         offset: int = 0,
     ) -> list[AuditEntry]:
         """Query entries with optional filters, ordered by insertion order."""
-        clauses: list[str] = []
-        params: list[str | int] = []
-        if agent_urn:
-            clauses.append("agent_urn = ?")
-            params.append(agent_urn)
-        if start:
-            clauses.append("timestamp >= ?")
-            params.append(start.isoformat())
-        if end:
-            clauses.append("timestamp <= ?")
-            params.append(end.isoformat())
-
-        select_from = (
-            "SELECT id, timestamp, operation, agent_urn, details, prev_hash, hash FROM audit_log"
-        )
+        clauses, params = _audit_filters(agent_urn, start, end)
         where_sql = (" WHERE " + " AND ".join(clauses)) if clauses else ""
-        sql = select_from + where_sql + " ORDER BY rowid LIMIT ? OFFSET ?"
+        sql = _AUDIT_SELECT + where_sql + " ORDER BY rowid LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        entries: list[AuditEntry] = []
-        async with self._connect() as conn:
+        async with self._connect(write=False) as conn:
             cursor = await conn.execute(sql, params)
             rows = await cursor.fetchall()
+        return [_row_to_entry(row) for row in rows]
+
+    async def query_page(
+        self,
+        agent_urn: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> Page[AuditEntry]:
+        """Query one page of entries in insertion order, resuming after ``cursor``.
+
+        The cursor carries the last ``rowid`` returned, so a page deep into the
+        log is an index seek (``idx_audit_urn`` and the primary key both end in
+        ``rowid``) instead of an ``OFFSET`` walk.
+        """
+        clauses, params = _audit_filters(agent_urn, start, end)
+        if cursor is not None:
+            (last_rowid,) = decode_cursor(cursor, int)
+            clauses.append("rowid > ?")
+            params.append(last_rowid)
+            offset = 0
+        where_sql = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        sql = f"SELECT rowid, {_AUDIT_COLUMNS} FROM audit_log{where_sql} ORDER BY rowid LIMIT ? OFFSET ?"  # nosec B608 - fixed column list; filter clauses are static fragments
+        rows = await self.fetch_all(sql, (*params, limit + 1, offset))
+        return page_from_rows(
+            rows, limit, key=lambda r: (r[0],), to_item=lambda r: _row_to_entry(r[1:])
+        )
+
+    async def iter_entries(
+        self,
+        agent_urn: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+        page_size: int = DEFAULT_AUDIT_PAGE_SIZE,
+    ) -> AsyncIterator[AuditEntry]:
+        """Yield matching entries in insertion order, one keyset page at a time.
+
+        Pages resume after the last ``rowid`` seen (the chain order), so memory
+        stays bounded by ``page_size`` and deep pages cost the same as the first.
+        ``limit=None`` exports every matching entry.
+        """
+        clauses, params = _audit_filters(agent_urn, start, end)
+        remaining = limit
+        last_rowid = 0
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            where_sql = " WHERE " + " AND ".join([*clauses, "rowid > ?"])
+            sql = f"SELECT rowid, {_AUDIT_COLUMNS} FROM audit_log{where_sql} ORDER BY rowid LIMIT ?"  # nosec B608 - fixed column list; filter clauses are static fragments
+            rows = await self.fetch_all(sql, (*params, last_rowid, size))
             for row in rows:
-                entries.append(
-                    AuditEntry(
-                        id=row[0],
-                        timestamp=datetime.fromisoformat(row[1]),
-                        operation=row[2],
-                        agent_urn=row[3],
-                        details=json.loads(row[4]),
-                        prev_hash=row[5],
-                        hash=row[6],
-                    )
-                )
-        return entries
+                yield _row_to_entry(row[1:])
+            if len(rows) < size:
+                return
+            last_rowid = rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
 
     async def verify_chain(self) -> bool:
         """Verify every hash link in insertion order."""
         prev_hash = ""
-        async with self._connect() as conn:
+        async with self._connect(write=False) as conn:
             cursor = await conn.execute(
                 "SELECT timestamp, operation, details, prev_hash, hash "
                 "FROM audit_log ORDER BY rowid"
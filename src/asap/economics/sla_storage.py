@@ -20,7 +20,15 @@ import aiosqlite  # noqa: F401 - retained so tests can patch `sla_storage.aiosql
 
 from asap.economics.metering import StorageStats
 from asap.economics.sla import SLABreach, SLAMetrics
-from asap.state.stores import DEFAULT_DB_PATH, AsyncSqliteRepository, build_where, parse_iso
+from asap.state.stores import (
+    DEFAULT_DB_PATH,
+    AsyncSqliteRepository,
+    Page,
+    build_where,
+    decode_cursor,
+    parse_iso,
+)
+from asap.state.stores._keyset import cursor_offset, page_from_rows
 
 # Backward-compat alias: tests/economics/test_sla_storage.py:18 imports
 # `_parse_iso` from this module. The canonical impl now lives in the shared base.
@@ -37,10 +45,15 @@ _BREACH_WHERE: dict[str, str] = {
     "agent_id": "agent_id = ?",
     "start": "detected_at >= ?",
     "end": "detected_at <= ?",
+    "severity": "severity = ?",
 }
 
-# Canonical SLA schema (both tables + both indexes); the base runs it
-# idempotently under the per-instance lock.
+# Canonical SLA schema (both tables + their indexes); the base runs it
+# idempotently under the per-instance lock. Each index ends with the keyset
+# order of its listing (``(period_start, rowid)`` for metrics -- rowid is
+# implicit in every index -- and ``(detected_at, id)`` for breaches), with and
+# without the agent filter, so cursor pages are index seeks. The breach index
+# on (agent_id, detected_at) is superseded by the one that also carries ``id``.
 _SLA_SCHEMA_DDL = """
 CREATE TABLE IF NOT EXISTS sla_metrics (
     agent_id TEXT NOT NULL,
@@ -54,6 +67,8 @@ CREATE TABLE IF NOT EXISTS sla_metrics (
 );
 CREATE INDEX IF NOT EXISTS idx_sla_metrics_agent_period
     ON sla_metrics (agent_id, period_start);
+CREATE INDEX IF NOT EXISTS idx_sla_metrics_period
+    ON sla_metrics (period_start);
 
 CREATE TABLE IF NOT EXISTS sla_breaches (
     id TEXT PRIMARY KEY,
@@ -65,8 +80,11 @@ CREATE TABLE IF NOT EXISTS sla_breaches (
     detected_at TEXT NOT NULL,
     resolved_at TEXT
 );
-CREATE INDEX IF NOT EXISTS idx_sla_breaches_agent_detected
-    ON sla_breaches (agent_id, detected_at);
+DROP INDEX IF EXISTS idx_sla_breaches_agent_detected;
+CREATE INDEX IF NOT EXISTS idx_sla_breaches_agent_detected_id
+    ON sla_breaches (agent_id, detected_at, id);
+CREATE INDEX IF NOT EXISTS idx_sla_breaches_detected_id
+    ON sla_breaches (detected_at, id);
 """
 
 
@@ -137,6 +155,110 @@ class SLAStorageBase(ABC):
     @abstractmethod
     async def stats(self) -> StorageStats: ...
 
+    async def query_metrics_page(
+        self,
+        agent_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> Page[SLAMetrics]:
+        """Return one page of ``query_metrics`` results and the cursor for the next page.
+
+        ``offset`` only applies when ``cursor`` is ``None``. The default encodes a
+        ``query_metrics`` offset; SQL stores override it with keyset cursors.
+        Raises ``InvalidCursor`` for a cursor this store did not issue.
+        """
+        return await _metrics_offset_page(self, agent_id, start, end, limit, offset, cursor)
+
+    async def query_breaches_page(
+        self,
+        agent_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        severity: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Page[SLABreach]:
+        """Return one page of breaches (optionally of one ``severity``) and the next cursor."""
+        return await _breaches_offset_page(self, agent_id, start, end, severity, limit, cursor)
+
+
+async def _metrics_offset_page(
+    storage: SLAStorage | SLAStorageBase,
+    agent_id: str | None,
+    start: datetime | None,
+    end: datetime | None,
+    limit: int | None,
+    offset: int,
+    cursor: str | None,
+) -> Page[SLAMetrics]:
+    """Offset-cursor fallback for ``query_metrics_page`` built on ``query_metrics``."""
+    first = cursor_offset(cursor, offset)
+    metrics = await storage.query_metrics(
+        agent_id, start, end, limit=None if limit is None else limit + 1, offset=first
+    )
+    return page_from_rows(
+        metrics, limit, key=lambda _: (first + (limit or 0),), to_item=lambda m: m
+    )
+
+
+async def _breaches_offset_page(
+    storage: SLAStorage | SLAStorageBase,
+    agent_id: str | None,
+    start: datetime | None,
+    end: datetime | None,
+    severity: str | None,
+    limit: int | None,
+    cursor: str | None,
+) -> Page[SLABreach]:
+    """Offset-cursor fallback for ``query_breaches_page`` built on ``query_breaches``."""
+    first = cursor_offset(cursor)
+    breaches = await storage.query_breaches(agent_id, start, end)
+    if severity is not None:
+        breaches = [b for b in breaches if b.severity == severity]
+    window = breaches[first:] if limit is None else breaches[first : first + limit + 1]
+    return page_from_rows(window, limit, key=lambda _: (first + (limit or 0),), to_item=lambda b: b)
+
+
+async def query_sla_metrics_page(
+    storage: SLAStorage,
+    agent_id: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> Page[SLAMetrics]:
+    """Fetch one cursor-paginated page of metrics from any ``SLAStorage``.
+
+    Uses ``query_metrics_page`` when the storage derives from
+    :class:`SLAStorageBase` and falls back to offset cursors otherwise.
+    """
+    if isinstance(storage, SLAStorageBase):
+        return await storage.query_metrics_page(agent_id, start, end, limit, offset, cursor)
+    return await _metrics_offset_page(storage, agent_id, start, end, limit, offset, cursor)
+
+
+async def query_sla_breaches_page(
+    storage: SLAStorage,
+    agent_id: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    severity: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> Page[SLABreach]:
+    """Fetch one cursor-paginated page of breaches from any ``SLAStorage``.
+
+    Uses ``query_breaches_page`` when the storage derives from
+    :class:`SLAStorageBase` and falls back to offset cursors otherwise.
+    """
+    if isinstance(storage, SLAStorageBase):
+        return await storage.query_breaches_page(agent_id, start, end, severity, limit, cursor)
+    return await _breaches_offset_page(storage, agent_id, start, end, severity, limit, cursor)
+
 
 def _metrics_matches(
     m: SLAMetrics, agent_id: str | None, start: datetime | None, end: datetime | None
@@ -235,6 +357,28 @@ def _metrics_filters(
     }
 
 
+def _breach_filters(
+    agent_id: str | None,
+    start: datetime | None,
+    end: datetime | None,
+    severity: str | None = None,
+) -> dict[str, Any]:
+    """Build the filter dict shared by query_breaches/query_breaches_page."""
+    return {
+        "agent_id": agent_id,
+        "start": start.isoformat() if start else None,
+        "end": end.isoformat() if end else None,
+        "severity": severity,
+    }
+
+
+_METRICS_COLUMNS = (
+    "agent_id, period_start, period_end, uptime_percent, latency_p95_ms, "
+    "error_rate_percent, tasks_completed, tasks_failed"
+)
+_BREACH_COLUMNS = "id, agent_id, breach_type, threshold, actual, severity, detected_at, resolved_at"
+
+
 def _row_to_metrics(r: tuple[Any, ...]) -> SLAMetrics:
     # Columns are NOT NULL; the `or now()` fallback only guards corrupted rows
     # so the non-Optional SLAMetrics fields stay non-None.
@@ -305,11 +449,7 @@ class SQLiteSLAStorage(AsyncSqliteRepository, SLAStorageBase):
         where, params = build_where(_metrics_filters(agent_id, start, end), _METRICS_WHERE)
         # `where` is assembled by build_where from the _METRICS_WHERE allow-list;
         # values are bound via params — never interpolated into SQL.
-        query = (
-            f"SELECT agent_id, period_start, period_end, uptime_percent, "
-            f"latency_p95_ms, error_rate_percent, tasks_completed, tasks_failed "
-            f"FROM sla_metrics WHERE {where} ORDER BY period_start"  # nosec B608
-        )
+        query = f"SELECT {_METRICS_COLUMNS} FROM sla_metrics WHERE {where} ORDER BY period_start"  # nosec B608
         if limit is not None:
             query += " LIMIT ? OFFSET ?"
             params.extend([limit, offset])
@@ -319,6 +459,33 @@ class SQLiteSLAStorage(AsyncSqliteRepository, SLAStorageBase):
         rows = await self.fetch_all(query, tuple(params))
         return [_row_to_metrics(r) for r in rows]
 
+    async def query_metrics_page(
+        self,
+        agent_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> Page[SLAMetrics]:
+        """Keyset page ordered by ``(period_start, rowid)``; resumes after ``cursor``."""
+        if offset < 0:
+            raise ValueError("offset must be non-negative")
+        after = decode_cursor(cursor, str, int) if cursor is not None else None
+        where, params = build_where(_metrics_filters(agent_id, start, end), _METRICS_WHERE)
+        if after is not None:
+            where += " AND (period_start, rowid) > (?, ?)"
+            params.extend(after)
+        query = (
+            f"SELECT rowid, {_METRICS_COLUMNS} FROM sla_metrics WHERE {where} "
+            f"ORDER BY period_start, rowid LIMIT ? OFFSET ?"  # nosec B608
+        )
+        params.extend([-1 if limit is None else limit + 1, 0 if after is not None else offset])
+        rows = await self.fetch_all(query, tuple(params))
+        return page_from_rows(
+            rows, limit, key=lambda r: (r[2], r[0]), to_item=lambda r: _row_to_metrics(r[1:])
+        )
+
     async def count_metrics(
         self,
         agent_id: str | None = None,
@@ -355,20 +522,37 @@ class SQLiteSLAStorage(AsyncSqliteRepository, SLAStorageBase):
         start: datetime | None = None,
         end: datetime | None = None,
     ) -> list[SLABreach]:
-        filters = {
-            "agent_id": agent_id,
-            "start": start.isoformat() if start else None,
-            "end": end.isoformat() if end else None,
-        }
-        where, params = build_where(filters, _BREACH_WHERE)
+        where, params = build_where(_breach_filters(agent_id, start, end), _BREACH_WHERE)
         query = (
-            f"SELECT id, agent_id, breach_type, threshold, actual, severity, "
-            f"detected_at, resolved_at FROM sla_breaches WHERE {where} "
+            f"SELECT {_BREACH_COLUMNS} FROM sla_breaches WHERE {where} "
             f"ORDER BY detected_at"  # nosec B608
         )
         rows = await self.fetch_all(query, tuple(params))
         return [_row_to_breach(r) for r in rows]
 
+    async def query_breaches_page(
+        self,
+        agent_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        severity: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Page[SLABreach]:
+        """Keyset page ordered by ``(detected_at, id)``; resumes after ``cursor``."""
+        after = decode_cursor(cursor, str, str) if cursor is not None else None
+        where, params = build_where(_breach_filters(agent_id, start, end, severity), _BREACH_WHERE)
+        if after is not None:
+            where += " AND (detected_at, id) > (?, ?)"
+            params.extend(after)
+        query = (
+            f"SELECT {_BREACH_COLUMNS} FROM sla_breaches WHERE {where} "
+            f"ORDER BY detected_at, id LIMIT ?"  # nosec B608
+        )
+        params.append(-1 if limit is None else limit + 1)
+        rows = await self.fetch_all(query, tuple(params))
+        return page_from_rows(rows, limit, key=lambda r: (r[6], r[0]), to_item=_row_to_breach)
+
     async def stats(self) -> StorageStats:
         m_count_row = await self.fetch_one("SELECT COUNT(*) FROM sla_metrics")
         b_count_row = await self.fetch_one("SELECT COUNT(*) FROM sla_breaches")
@@ -398,4 +582,6 @@ __all__ = [
     "InMemorySLAStorage",
     "SQLiteSLAStorage",
     "_parse_iso",
+    "query_sla_breaches_page",
+    "query_sla_metrics_page",
 ]
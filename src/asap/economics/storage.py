@@ -13,11 +13,13 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta, timezone
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol, Union, cast, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, Union, runtime_checkable
 
 if TYPE_CHECKING:
     # ``MeteringStore`` is referenced only as a string return annotation on the
@@ -41,8 +43,25 @@ from asap.models.ids import generate_id
 # usage_events DDL + repository base here cannot form a cycle. One canonical DDL
 # owner prevents divergent indexes when both stores share asap_state.db; the
 # shared base owns WAL pragmas, ``:memory:`` handling, and idempotent schema init.
-from asap.state.stores import DEFAULT_DB_PATH, AsyncSqliteRepository, build_where, parse_iso
-from asap.state.stores.sqlite import _USAGE_EVENTS_DDL
+from asap.state.stores import (
+    DEFAULT_DB_PATH,
+    GroupCommitWriter,
+    Page,
+    build_where,
+    decode_cursor,
+    parse_iso,
+)
+from asap.state.stores._group_commit import (
+    DEFAULT_GROUP_COMMIT_DELAY,
+    DEFAULT_GROUP_COMMIT_MAX_BATCH,
+)
+from asap.state.stores._keyset import cursor_offset, page_from_rows
+from asap.state.stores._usage_index import UsageIndex, UsageTotals
+from asap.state.stores.sqlite import (
+    _USAGE_ROLLUP_GRANULARITIES,
+    _UsageEventsRepository,
+    _insert_event_rows,
+)
 
 UsageAggregate = Union[
     UsageAggregateByAgent,
@@ -53,21 +72,8 @@ UsageAggregate = Union[
 
 _VALID_GROUP_BY = ("agent", "consumer", "day", "week")
 
-
-def _dispatch_aggregate(events: list[UsageMetrics], group_by: str) -> list[UsageAggregate]:
-    """Dispatch aggregation by ``group_by`` and widen the concrete result to ``UsageAggregate``.
-
-    Python's invariant ``list`` means a ``list[UsageAggregateByAgent]`` is not assignable to
-    ``list[UsageAggregate]`` even though the element types are compatible; the single ``cast``
-    centralized here is what the type system needs. Invalid ``group_by`` raises ``ValueError``.
-    """
-    if group_by == "agent":
-        return cast("list[UsageAggregate]", _aggregate_by_agent(events))
-    if group_by == "consumer":
-        return cast("list[UsageAggregate]", _aggregate_by_consumer(events))
-    if group_by in ("day", "week"):
-        return cast("list[UsageAggregate]", _aggregate_by_period(events, group_by))
-    raise ValueError(f"group_by must be one of {_VALID_GROUP_BY!r}; got {group_by!r}")
+# Rows fetched per page by ``iter_events`` (exports stream page by page).
+DEFAULT_ITER_PAGE_SIZE = 1000
 
 
 class MeteringQuery(ASAPBaseModel):
@@ -117,216 +123,320 @@ class MeteringStorageBase(ABC):
     @abstractmethod
     async def purge_expired(self) -> int: ...
 
+    async def iter_events(
+        self,
+        filters: MeteringQuery,
+        page_size: int = DEFAULT_ITER_PAGE_SIZE,
+    ) -> AsyncIterator[UsageMetrics]:
+        """Yield events matching ``filters`` page by page, in timestamp order.
+
+        ``filters.limit`` caps the total yielded (``None`` means all). The default
+        pages with ``query`` offsets; stores override it with cheaper cursors.
+        """
+        async for event in _iter_query_pages(self, filters, page_size):
+            yield event
+
+    async def query_page(
+        self,
+        filters: MeteringQuery,
+        cursor: str | None = None,
+    ) -> Page[UsageMetrics]:
+        """Return one page of ``query`` results and the cursor for the next page.
 
-def _matches(e: UsageMetrics, f: MeteringQuery) -> bool:
-    return (
-        (f.agent_id is None or e.agent_id == f.agent_id)
-        and (f.consumer_id is None or e.consumer_id == f.consumer_id)
-        and (f.task_id is None or e.task_id == f.task_id)
-        and (f.start is None or e.timestamp >= f.start)
-        and (f.end is None or e.timestamp <= f.end)
-    )
+        ``filters.limit`` is the page size (``None`` returns everything in one
+        page) and ``filters.offset`` only applies when ``cursor`` is ``None``.
+        The default encodes a ``query`` offset; SQL stores override it with
+        keyset cursors. Raises ``InvalidCursor`` for a cursor this store did not issue.
+        """
+        return await _query_offset_page(self, filters, cursor)
 
 
-def _apply_query_filters(
-    events: list[UsageMetrics],
+async def _query_offset_page(
+    storage: MeteringStorage | MeteringStorageBase,
+    filters: MeteringQuery,
+    cursor: str | None,
+) -> Page[UsageMetrics]:
+    """Offset-cursor fallback for ``query_page`` built on ``query`` alone."""
+    start = cursor_offset(cursor, filters.offset)
+    limit = filters.limit
+    fetch = None if limit is None else limit + 1
+    events = await storage.query(filters.model_copy(update={"limit": fetch, "offset": start}))
+    return page_from_rows(events, limit, key=lambda _: (start + (limit or 0),), to_item=lambda e: e)
+
+
+async def query_usage_page(
+    storage: MeteringStorage,
     filters: MeteringQuery,
-) -> list[UsageMetrics]:
-    filtered = sorted((e for e in events if _matches(e, filters)), key=lambda x: x.timestamp)
-    out = filtered[filters.offset :]
-    return out[: filters.limit] if filters.limit else out
+    cursor: str | None = None,
+) -> Page[UsageMetrics]:
+    """Fetch one cursor-paginated page from any ``MeteringStorage`` (used by ``GET /usage``).
 
+    Uses ``query_page`` when the storage derives from :class:`MeteringStorageBase`
+    and falls back to offset cursors over ``query`` for other protocol implementations.
+    """
+    if isinstance(storage, MeteringStorageBase):
+        return await storage.query_page(filters, cursor)
+    return await _query_offset_page(storage, filters, cursor)
 
-def _aggregate_by_agent(events: list[UsageMetrics]) -> list[UsageAggregateByAgent]:
-    """Aggregate usage by agent_id."""
-    by_agent: dict[str, list[UsageMetrics]] = {}
-    for e in events:
-        by_agent.setdefault(e.agent_id, []).append(e)
-    out: list[UsageAggregateByAgent] = []
-    for agent_id, agent_events in by_agent.items():
-        total_tokens = sum(e.tokens_in + e.tokens_out for e in agent_events)
-        total_duration = sum(e.duration_ms for e in agent_events)
-        total_tasks = len(agent_events)
-        total_api_calls = sum(e.api_calls for e in agent_events)
-        avg_tokens = total_tokens / total_tasks if total_tasks else 0.0
-        avg_duration = total_duration / total_tasks if total_tasks else 0.0
-        out.append(
-            UsageAggregateByAgent(
-                agent_id=agent_id,
-                period="all",
-                total_tokens=total_tokens,
-                total_duration_ms=total_duration,
-                total_tasks=total_tasks,
-                total_api_calls=total_api_calls,
-                avg_tokens_per_task=avg_tokens,
-                avg_duration_ms_per_task=avg_duration,
-            )
-        )
-    return sorted(out, key=lambda a: a.agent_id)
 
+async def _iter_query_pages(
+    storage: MeteringStorage | MeteringStorageBase,
+    filters: MeteringQuery,
+    page_size: int,
+) -> AsyncIterator[UsageMetrics]:
+    """Offset-paged fallback for ``iter_events`` built on ``query`` alone."""
+    remaining = filters.limit
+    offset = filters.offset
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        page = await storage.query(filters.model_copy(update={"limit": size, "offset": offset}))
+        for event in page:
+            yield event
+        if len(page) < size:
+            return
+        offset += len(page)
+        if remaining is not None:
+            remaining -= len(page)
+
+
+async def iter_usage_events(
+    storage: MeteringStorage,
+    filters: MeteringQuery,
+    page_size: int = DEFAULT_ITER_PAGE_SIZE,
+) -> AsyncIterator[UsageMetrics]:
+    """Stream events from any ``MeteringStorage`` (used by exports).
+
+    Uses ``iter_events`` when the storage derives from :class:`MeteringStorageBase`
+    and falls back to offset-paged ``query`` calls for other protocol implementations.
+    """
+    if isinstance(storage, MeteringStorageBase):
+        async for event in storage.iter_events(filters, page_size):
+            yield event
+        return
+    async for event in _iter_query_pages(storage, filters, page_size):
+        yield event
+
+
+def _usage_metrics_of(e: UsageMetrics) -> tuple[int, int, int, int]:
+    return e.tokens_in, e.tokens_out, e.duration_ms, e.api_calls
+
+
+def _week_label(day: str) -> str:
+    """ISO week label (``YYYY-Www``) of an ISO date string."""
+    iso = date.fromisoformat(day).isocalendar()
+    return f"{iso[0]}-W{iso[1]:02d}"
 
-def _aggregate_by_consumer(events: list[UsageMetrics]) -> list[UsageAggregateByConsumer]:
-    """Aggregate usage by consumer_id."""
-    by_consumer: dict[str, list[UsageMetrics]] = {}
+
+def _group_key(e: UsageMetrics, group_by: str) -> str:
+    if group_by == "agent":
+        return e.agent_id
+    if group_by == "consumer":
+        return e.consumer_id
+    day = e.timestamp.date().isoformat()
+    return day if group_by == "day" else _week_label(day)
+
+
+def _group_totals(events: Iterable[UsageMetrics], group_by: str) -> dict[str, UsageTotals]:
+    """Sum ``events`` per agent, consumer, day or ISO week."""
+    groups: dict[str, UsageTotals] = {}
     for e in events:
-        by_consumer.setdefault(e.consumer_id, []).append(e)
-    out: list[UsageAggregateByConsumer] = []
-    for consumer_id, consumer_events in by_consumer.items():
-        total_tokens = sum(e.tokens_in + e.tokens_out for e in consumer_events)
-        total_duration = sum(e.duration_ms for e in consumer_events)
-        total_tasks = len(consumer_events)
-        total_api_calls = sum(e.api_calls for e in consumer_events)
-        avg_tokens = total_tokens / total_tasks if total_tasks else 0.0
-        out.append(
-            UsageAggregateByConsumer(
-                consumer_id=consumer_id,
-                period="all",
-                total_tokens=total_tokens,
-                total_duration_ms=total_duration,
-                total_tasks=total_tasks,
-                total_api_calls=total_api_calls,
-                avg_tokens_per_task=avg_tokens,
+        totals = groups.setdefault(_group_key(e, group_by), UsageTotals())
+        totals.apply(1, _usage_metrics_of(e), e.agent_id, e.consumer_id)
+    return groups
+
+
+def _weeks_from_days(days: dict[str, UsageTotals]) -> dict[str, UsageTotals]:
+    weeks: dict[str, UsageTotals] = {}
+    for day, totals in days.items():
+        weeks.setdefault(_week_label(day), UsageTotals()).merge(totals)
+    return weeks
+
+
+def _aggregates_from_totals(
+    groups: dict[str, UsageTotals],
+    group_by: str,
+) -> list[UsageAggregate]:
+    """Build the ``group_by`` aggregate models from per-group totals, sorted by key."""
+    out: list[UsageAggregate] = []
+    for key in sorted(groups):
+        t = groups[key]
+        avg_tokens = t.tokens / t.tasks if t.tasks else 0.0
+        if group_by == "agent":
+            out.append(
+                UsageAggregateByAgent(
+                    agent_id=key,
+                    period="all",
+                    total_tokens=t.tokens,
+                    total_duration_ms=t.duration_ms,
+                    total_tasks=t.tasks,
+                    total_api_calls=t.api_calls,
+                    avg_tokens_per_task=avg_tokens,
+                    avg_duration_ms_per_task=t.duration_ms / t.tasks if t.tasks else 0.0,
+                )
             )
-        )
-    return sorted(out, key=lambda a: a.consumer_id)
+        elif group_by == "consumer":
+            out.append(
+                UsageAggregateByConsumer(
+                    consumer_id=key,
+                    period="all",
+                    total_tokens=t.tokens,
+                    total_duration_ms=t.duration_ms,
+                    total_tasks=t.tasks,
+                    total_api_calls=t.api_calls,
+                    avg_tokens_per_task=avg_tokens,
+                )
+            )
+        else:
+            out.append(
+                UsageAggregateByPeriod(
+                    period=key,
+                    total_tokens=t.tokens,
+                    total_duration_ms=t.duration_ms,
+                    total_tasks=t.tasks,
+                    total_api_calls=t.api_calls,
+                    unique_agents=len(t.agents),
+                    unique_consumers=len(t.consumers),
+                )
+            )
+    return out
 
 
-def _compute_summary(events: list[UsageMetrics]) -> UsageSummary:
-    """Compute UsageSummary from a list of events."""
-    if not events:
+def _dispatch_aggregate(events: Iterable[UsageMetrics], group_by: str) -> list[UsageAggregate]:
+    """Aggregate ``events`` by ``group_by``; invalid ``group_by`` raises ``ValueError``."""
+    _check_group_by(group_by)
+    return _aggregates_from_totals(_group_totals(events, group_by), group_by)
+
+
+# MeteringQuery fields that filter rows (``limit``/``offset`` only page them).
+_ROW_FILTERS = ("agent_id", "consumer_id", "task_id", "start", "end")
+
+
+def _set_filters(filters: MeteringQuery | None) -> set[str]:
+    """Names of the row filters ``filters`` sets."""
+    if filters is None:
+        return set()
+    return {name for name in _ROW_FILTERS if getattr(filters, name) is not None}
+
+
+def _check_group_by(group_by: str) -> None:
+    if group_by not in _VALID_GROUP_BY:
+        raise ValueError(f"group_by must be one of {_VALID_GROUP_BY!r}; got {group_by!r}")
+
+
+def _summary_from_totals(totals: UsageTotals) -> UsageSummary:
+    if not totals.tasks:
         return UsageSummary()
-    total_tokens = sum(e.tokens_in + e.tokens_out for e in events)
-    total_duration = sum(e.duration_ms for e in events)
-    total_tasks = len(events)
-    total_api_calls = sum(e.api_calls for e in events)
-    unique_agents = len({e.agent_id for e in events})
-    unique_consumers = len({e.consumer_id for e in events})
     return UsageSummary(
-        total_tasks=total_tasks,
-        total_tokens=total_tokens,
-        total_duration_ms=total_duration,
-        unique_agents=unique_agents,
-        unique_consumers=unique_consumers,
-        total_api_calls=total_api_calls,
+        total_tasks=totals.tasks,
+        total_tokens=totals.tokens,
+        total_duration_ms=totals.duration_ms,
+        unique_agents=len(totals.agents),
+        unique_consumers=len(totals.consumers),
+        total_api_calls=totals.api_calls,
     )
 
 
-def _aggregate_by_period(
-    events: list[UsageMetrics],
-    period_format: str,
-) -> list[UsageAggregateByPeriod]:
-    """Aggregate usage by time period (day or week)."""
-
-    def _period_key(ts: datetime) -> str:
-        d = ts.date()
-        if period_format == "day":
-            return d.isoformat()
-        iso = d.isocalendar()
-        return f"{iso[0]}-W{iso[1]:02d}"
-
-    by_period: dict[str, list[UsageMetrics]] = {}
+def _compute_summary(events: Iterable[UsageMetrics]) -> UsageSummary:
+    """Compute UsageSummary from a list of events."""
+    totals = UsageTotals()
     for e in events:
-        key = _period_key(e.timestamp)
-        by_period.setdefault(key, []).append(e)
-
-    out: list[UsageAggregateByPeriod] = []
-    for period, period_events in by_period.items():
-        total_tokens = sum(e.tokens_in + e.tokens_out for e in period_events)
-        total_duration = sum(e.duration_ms for e in period_events)
-        total_tasks = len(period_events)
-        total_api_calls = sum(e.api_calls for e in period_events)
-        unique_agents = len({e.agent_id for e in period_events})
-        unique_consumers = len({e.consumer_id for e in period_events})
-        out.append(
-            UsageAggregateByPeriod(
-                period=period,
-                total_tokens=total_tokens,
-                total_duration_ms=total_duration,
-                total_tasks=total_tasks,
-                total_api_calls=total_api_calls,
-                unique_agents=unique_agents,
-                unique_consumers=unique_consumers,
-            )
-        )
-    return sorted(out, key=lambda a: a.period)
+        totals.apply(1, _usage_metrics_of(e), e.agent_id, e.consumer_id)
+    return _summary_from_totals(totals)
 
 
 class InMemoryMeteringStorage(MeteringStorageBase):
     """In-memory MeteringStorage for development and testing.
 
-    Stores UsageMetrics in a list. Not persistent across restarts.
+    Indexes UsageMetrics by agent, consumer and time and keeps running totals
+    per agent, consumer and day (see :mod:`asap.state.stores._usage_index`), so
+    a query costs in proportion to its result and unfiltered aggregates and
+    summaries read counters. Not persistent across restarts.
     Async-safe via asyncio.Lock. Optional retention_ttl_seconds for auto-cleanup.
     """
 
     def __init__(self, retention_ttl_seconds: int | None = None) -> None:
         self._lock = asyncio.Lock()
-        self._events: list[UsageMetrics] = []
+        self._index: UsageIndex[UsageMetrics] = UsageIndex(_usage_metrics_of)
         self._retention_ttl_seconds = retention_ttl_seconds
 
+    def _select(self, filters: MeteringQuery) -> Iterator[UsageMetrics]:
+        """Matching events in timestamp order, ignoring ``limit``/``offset``."""
+        events = self._index.select(
+            agent_id=filters.agent_id,
+            consumer_id=filters.consumer_id,
+            start=filters.start,
+            end=filters.end,
+        )
+        if filters.task_id is None:
+            return events
+        return (e for e in events if e.task_id == filters.task_id)
+
+    def _page(self, filters: MeteringQuery) -> list[UsageMetrics]:
+        stop = filters.offset + filters.limit if filters.limit else None
+        return list(itertools.islice(self._select(filters), filters.offset, stop))
+
     async def record(self, metrics: UsageMetrics) -> None:
         """Append a usage event (async-safe)."""
         async with self._lock:
-            self._events.append(metrics)
+            self._index.add(metrics)
 
     async def query(self, filters: MeteringQuery) -> list[UsageMetrics]:
         """Return events matching filters, sorted by timestamp."""
         async with self._lock:
-            return _apply_query_filters(list(self._events), filters)
+            return self._page(filters)
+
+    async def iter_events(
+        self,
+        filters: MeteringQuery,
+        page_size: int = DEFAULT_ITER_PAGE_SIZE,
+    ) -> AsyncIterator[UsageMetrics]:
+        """Yield events matching ``filters`` from one filtered snapshot."""
+        async with self._lock:
+            events = self._page(filters)
+        for event in events:
+            yield event
 
     async def aggregate(
         self,
         group_by: str,
         filters: MeteringQuery | None = None,
     ) -> list[UsageAggregate]:
-        """Aggregate by agent, consumer, day, or week, optionally filtered."""
+        """Aggregate by agent, consumer, day, or week, optionally filtered.
+
+        Unfiltered, or filtered only on the grouped id, the result comes from the
+        running counters; other filters aggregate the indexed selection.
+        """
+        _check_group_by(group_by)
+        set_filters = _set_filters(filters)
         async with self._lock:
-            events = list(self._events)
-        if filters is not None:
-            agg_filters = MeteringQuery(
-                agent_id=filters.agent_id,
-                consumer_id=filters.consumer_id,
-                task_id=filters.task_id,
-                start=filters.start,
-                end=filters.end,
-                limit=None,
-                offset=0,
-            )
-            events = _apply_query_filters(events, agg_filters)
-        return _dispatch_aggregate(events, group_by)
+            if filters is None or not set_filters:
+                if group_by == "week":
+                    groups = _weeks_from_days(self._index.totals("day"))
+                else:
+                    groups = self._index.totals(group_by)
+            elif set_filters == {f"{group_by}_id"}:
+                key = getattr(filters, f"{group_by}_id")
+                totals = self._index.totals(group_by).get(key)
+                groups = {} if totals is None else {key: totals}
+            else:
+                return _dispatch_aggregate(self._select(filters), group_by)
+            return _aggregates_from_totals(groups, group_by)
 
     async def summary(self, filters: MeteringQuery | None = None) -> UsageSummary:
         """Return dashboard summary, optionally filtered."""
         async with self._lock:
-            events = list(self._events)
-        if filters is not None:
-            agg_filters = MeteringQuery(
-                agent_id=filters.agent_id,
-                consumer_id=filters.consumer_id,
-                task_id=filters.task_id,
-                start=filters.start,
-                end=filters.end,
-                limit=None,
-                offset=0,
-            )
-            events = _apply_query_filters(events, agg_filters)
-        return _compute_summary(events)
+            if filters is None or not _set_filters(filters):
+                return _summary_from_totals(self._index.overall())
+            return _compute_summary(self._select(filters))
 
     async def stats(self) -> StorageStats:
         """Return storage statistics."""
         async with self._lock:
-            events = list(self._events)
-        if not events:
             return StorageStats(
-                total_events=0,
-                oldest_timestamp=None,
+                total_events=len(self._index),
+                oldest_timestamp=self._index.oldest(),
                 retention_ttl_seconds=self._retention_ttl_seconds,
             )
-        oldest = min(e.timestamp for e in events)
-        return StorageStats(
-            total_events=len(events),
-            oldest_timestamp=oldest,
-            retention_ttl_seconds=self._retention_ttl_seconds,
-        )
 
     async def purge_expired(self) -> int:
         """Remove events older than retention_ttl_seconds. Returns count removed."""
@@ -335,9 +445,7 @@ class InMemoryMeteringStorage(MeteringStorageBase):
         cutoff = datetime.now(timezone.utc) - timedelta(seconds=self._retention_ttl_seconds)
         cutoff = cutoff.replace(microsecond=0)
         async with self._lock:
-            before = len(self._events)
-            self._events = [e for e in self._events if e.timestamp >= cutoff]
-            return before - len(self._events)
+            return self._index.evict_before(cutoff)
 
 
 # Compat shim: the MeteringStorage -> MeteringStore bridge now lives in the
@@ -369,13 +477,125 @@ _USAGE_EVENTS_WHERE: dict[str, str] = {
     "end": "timestamp <= ?",
 }
 
-# SELECT projection for usage_events (shared by query/aggregate/summary full scans).
+# SELECT projection for usage_events; metrics come from the typed columns, not JSON.
 _USAGE_EVENTS_SELECT = (
-    "SELECT id, task_id, agent_id, consumer_id, metrics, timestamp FROM usage_events"
+    "SELECT id, task_id, agent_id, consumer_id, "
+    "tokens_in, tokens_out, duration_ms, api_calls, timestamp FROM usage_events"
+)
+
+# Aggregates read a union of row sources with one shape: (agent_id, consumer_id,
+# day, tasks, tokens, duration_ms, api_calls). Rollup rows carry bucket totals; raw
+# usage_events rows count as one task each.
+_ROLLUP_SOURCE_SELECT = (
+    "SELECT agent_id, consumer_id, substr(bucket, 1, 10) AS day, tasks, "
+    "tokens_in + tokens_out AS tokens, duration_ms, api_calls FROM usage_rollups"
+)
+_RAW_SOURCE_SELECT = (
+    "SELECT agent_id, consumer_id, substr(timestamp, 1, 10) AS day, 1 AS tasks, "
+    "tokens_in + tokens_out AS tokens, duration_ms, api_calls FROM usage_events"
 )
 
+# Allow-listed WHERE fragments for the rollup / raw sources (values bound via build_where).
+_USAGE_SOURCE_WHERE: dict[str, str] = {
+    "granularity": "granularity = ?",
+    "bucket_from": "bucket >= ?",
+    "bucket_to": "bucket < ?",
+    "ts_from": "timestamp >= ?",
+    "ts_to": "timestamp < ?",
+    "agent_id": "agent_id = ?",
+    "consumer_id": "consumer_id = ?",
+}
+
+# Shared SUM() projection over the unified sources (aggregates and the summary).
+_USAGE_TOTALS_SELECT = (
+    "SUM(tokens), SUM(duration_ms), SUM(tasks), SUM(api_calls), "
+    "COUNT(DISTINCT agent_id), COUNT(DISTINCT consumer_id)"
+)
+
+# ISO-8601 week label (``YYYY-Www``) computed in SQL, matching ``date.isocalendar()``:
+# the Thursday of a date's ISO week decides both the ISO year and the week number.
+_ISO_WEEK_SQL = (
+    "printf('%s-W%02d', strftime('%Y', date(day, '-3 days', 'weekday 4')), "
+    "(CAST(strftime('%j', date(day, '-3 days', 'weekday 4')) AS INTEGER) - 1) / 7 + 1)"
+)
+
+# group_by -> SQL grouping key. ``day`` is the stored ISO date prefix, so periods
+# follow each event's recorded offset, like the in-memory path.
+_AGGREGATE_GROUP_KEYS: dict[str, str] = {
+    "agent": "agent_id",
+    "consumer": "consumer_id",
+    "day": "day",
+    "week": _ISO_WEEK_SQL,
+}
 
-def _metrics_to_row(metrics: UsageMetrics, event_id: str) -> tuple[str, str, str, str, str, str]:
+# Bucket floor per rollup granularity, coarsest first (matches _USAGE_ROLLUP_GRANULARITIES).
+_ROLLUP_FLOORS: dict[str, Callable[[datetime], datetime]] = {
+    "day": lambda ts: ts.replace(hour=0, minute=0, second=0, microsecond=0),
+    "hour": lambda ts: ts.replace(minute=0, second=0, microsecond=0),
+    "minute": lambda ts: ts.replace(second=0, microsecond=0),
+}
+_ROLLUP_STEPS: dict[str, timedelta] = {
+    "day": timedelta(days=1),
+    "hour": timedelta(hours=1),
+    "minute": timedelta(minutes=1),
+}
+
+
+def _plan_usage_sources(
+    start: datetime | None,
+    end: datetime | None,
+) -> list[dict[str, str | None]]:
+    """Split ``[start, end]`` into rollup bucket ranges plus the raw edges.
+
+    Whole days come from day rollups, the remaining whole hours and minutes from
+    hour/minute rollups, and only the sub-minute edges from ``usage_events``, so
+    query cost no longer depends on how many raw events the range holds. Each
+    returned dict holds ``_USAGE_SOURCE_WHERE`` keys for one source; bounds are
+    half-open and ``None`` means unbounded.
+    """
+    sources: list[dict[str, str | None]] = []
+    # Inclusive ``end`` becomes the exclusive bound one microsecond later.
+    upper = end + timedelta(microseconds=1) if end is not None else None
+
+    def cover(lo: datetime | None, hi: datetime | None, level: int) -> None:
+        if lo is not None and hi is not None and lo >= hi:
+            return
+        if level == len(_USAGE_ROLLUP_GRANULARITIES):
+            sources.append(
+                {
+                    "ts_from": lo.isoformat() if lo is not None else None,
+                    "ts_to": hi.isoformat() if hi is not None else None,
+                }
+            )
+            return
+        granularity, prefix_len = _USAGE_ROLLUP_GRANULARITIES[level]
+        floor = _ROLLUP_FLOORS[granularity]
+        first = None
+        if lo is not None:
+            first = floor(lo)
+            if first != lo:
+                first += _ROLLUP_STEPS[granularity]
+        last = floor(hi) if hi is not None else None
+        if first is not None and last is not None and first >= last:
+            cover(lo, hi, level + 1)
+            return
+        sources.append(
+            {
+                "granularity": granularity,
+                "bucket_from": first.isoformat()[:prefix_len] if first is not None else None,
+                "bucket_to": last.isoformat()[:prefix_len] if last is not None else None,
+            }
+        )
+        if lo is not None:
+            cover(lo, first, level + 1)
+        if hi is not None:
+            cover(last, hi, level + 1)
+
+    cover(start, upper, 0)
+    return sources
+
+
+def _metrics_to_row(metrics: UsageMetrics, event_id: str) -> tuple[Any, ...]:
     """Serialize UsageMetrics to DB row (same schema as state UsageEvent)."""
     metrics_json = json.dumps(
         {
@@ -393,26 +613,68 @@ def _metrics_to_row(metrics: UsageMetrics, event_id: str) -> tuple[str, str, str
         metrics.consumer_id,
         metrics_json,
         ts,
+        metrics.tokens_in,
+        metrics.tokens_out,
+        metrics.duration_ms,
+        metrics.api_calls,
     )
 
 
 def _row_to_metrics(row: tuple[Any, ...]) -> UsageMetrics:
-    """Build UsageMetrics from DB row."""
-    _id, task_id, agent_id, consumer_id, metrics_json, ts_str = row
-    data = json.loads(metrics_json)
+    """Build UsageMetrics from a ``_USAGE_EVENTS_SELECT`` row."""
+    _id, task_id, agent_id, consumer_id, tokens_in, tokens_out, duration_ms, api_calls, ts_str = row
     ts = datetime.fromisoformat(str(ts_str).replace("Z", "+00:00"))
     return UsageMetrics(
         task_id=task_id,
         agent_id=agent_id,
         consumer_id=consumer_id,
-        tokens_in=data.get("tokens_in", 0),
-        tokens_out=data.get("tokens_out", 0),
-        duration_ms=data.get("duration_ms", 0),
-        api_calls=data.get("api_calls", 0),
+        tokens_in=tokens_in,
+        tokens_out=tokens_out,
+        duration_ms=duration_ms,
+        api_calls=api_calls,
         timestamp=ts,
     )
 
 
+def _row_to_aggregate(group_by: str, row: tuple[Any, ...]) -> UsageAggregate:
+    """Build one aggregate model from a GROUP BY row (key, totals..., distinct counts)."""
+    key, tokens, duration, tasks, api_calls, unique_agents, unique_consumers = row
+    tasks = tasks or 0
+    tokens = tokens or 0
+    duration = duration or 0
+    api_calls = api_calls or 0
+    if group_by == "agent":
+        return UsageAggregateByAgent(
+            agent_id=key,
+            period="all",
+            total_tokens=tokens,
+            total_duration_ms=duration,
+            total_tasks=tasks,
+            total_api_calls=api_calls,
+            avg_tokens_per_task=tokens / tasks if tasks else 0.0,
+            avg_duration_ms_per_task=duration / tasks if tasks else 0.0,
+        )
+    if group_by == "consumer":
+        return UsageAggregateByConsumer(
+            consumer_id=key,
+            period="all",
+            total_tokens=tokens,
+            total_duration_ms=duration,
+            total_tasks=tasks,
+            total_api_calls=api_calls,
+            avg_tokens_per_task=tokens / tasks if tasks else 0.0,
+        )
+    return UsageAggregateByPeriod(
+        period=key,
+        total_tokens=tokens,
+        total_duration_ms=duration,
+        total_tasks=tasks,
+        total_api_calls=api_calls,
+        unique_agents=unique_agents,
+        unique_consumers=unique_consumers,
+    )
+
+
 def _filters_to_where(filters: MeteringQuery) -> tuple[str, list[Any]]:
     """Map a ``MeteringQuery`` to a WHERE clause via the base allow-list builder.
 
@@ -431,44 +693,61 @@ def _filters_to_where(filters: MeteringQuery) -> tuple[str, list[Any]]:
     )
 
 
-class SQLiteMeteringStorage(AsyncSqliteRepository, MeteringStorageBase):
+class SQLiteMeteringStorage(_UsageEventsRepository, MeteringStorageBase):
     """SQLite-backed MeteringStorage; usage events persist across restarts.
 
-    Subclasses :class:`AsyncSqliteRepository` so aiosqlite plumbing, WAL pragmas,
-    the ``:memory:`` persistent connection, and idempotent schema init are owned
-    by the shared base. Uses the same ``usage_events`` table as the state
-    ``SQLiteMeteringStore`` (canonical DDL via ``_USAGE_EVENTS_DDL``) for physical
+    Subclasses the shared ``usage_events`` repository so aiosqlite plumbing, WAL
+    pragmas, the ``:memory:`` persistent connection, and idempotent schema init
+    (including the typed-column migration) are owned by the state layer. Uses the
+    same ``usage_events`` table as the state ``SQLiteMeteringStore`` for physical
     compatibility. Optional ``retention_ttl_seconds`` for configurable TTL; call
     ``purge_expired()`` periodically to remove old data.
+
+    Every insert also updates the ``usage_rollups`` table (per-minute, hour and
+    day totals per agent/consumer). :meth:`aggregate` and :meth:`summary` read
+    whole buckets from the rollups and only the sub-minute edges of the range
+    from raw events, so their cost does not grow with the event count. Purging
+    raw events keeps the rollups; ``rollup_retention_ttl_seconds`` (default: keep
+    forever) bounds them separately. Filtering by ``task_id`` reads raw events,
+    since rollups are not kept per task.
+
+    Concurrent :meth:`record` calls share one transaction per batch (group
+    commit, see :class:`GroupCommitWriter`); each call still returns only after
+    its row is committed. :meth:`flush` drains the queue (e.g. on shutdown).
     """
 
     def __init__(
         self,
         db_path: str | Path = DEFAULT_DB_PATH,
         retention_ttl_seconds: int | None = None,
+        *,
+        rollup_retention_ttl_seconds: int | None = None,
+        commit_batch_size: int = DEFAULT_GROUP_COMMIT_MAX_BATCH,
+        commit_delay_seconds: float = DEFAULT_GROUP_COMMIT_DELAY,
     ) -> None:
-        super().__init__(db_path, schema_ddl=_USAGE_EVENTS_DDL)
+        super().__init__(db_path)
         self._retention_ttl_seconds = retention_ttl_seconds
+        self._rollup_retention_ttl_seconds = rollup_retention_ttl_seconds
+        self._writer: GroupCommitWriter[tuple[Any, ...], None] = GroupCommitWriter(
+            self,
+            _insert_event_rows,
+            name="usage_events",
+            max_batch_size=commit_batch_size,
+            max_delay_seconds=commit_delay_seconds,
+        )
 
     # Fail-closed guard: tests monkeypatch this to ``frozenset()`` to verify
     # ``_query_impl`` rejects any WHERE fragment not in the allow-list.
     _ALLOWED_QUERY_FRAGMENTS: frozenset[str] = frozenset(_USAGE_EVENTS_WHERE.values())
 
     async def _record_impl(self, metrics: UsageMetrics) -> None:
-        """Insert one usage event row."""
+        """Queue one usage event row and wait for its batch to commit."""
         event_id = f"evt_{generate_id()}"
         row = _metrics_to_row(metrics, event_id)
-        await self.execute(
-            """
-            INSERT INTO usage_events
-            (id, task_id, agent_id, consumer_id, metrics, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            row,
-        )
+        await self._writer.submit(row)
 
-    async def _query_impl(self, filters: MeteringQuery) -> list[UsageMetrics]:
-        """Select events matching ``filters`` via the base allow-list WHERE builder."""
+    def _checked_where(self, filters: MeteringQuery) -> tuple[str, list[Any]]:
+        """Build the WHERE clause for ``filters`` after the fail-closed fragment check."""
         # Fail-closed: derive the emitted fragments from the non-None filter keys
         # (rather than splitting the assembled WHERE string, which would be brittle
         # if a fragment ever embedded " AND "). Tests empty _ALLOWED_QUERY_FRAGMENTS
@@ -481,7 +760,11 @@ class SQLiteMeteringStorage(AsyncSqliteRepository, MeteringStorageBase):
         emitted = [_USAGE_EVENTS_WHERE[key] for key in active_keys]
         if not all(f in self._ALLOWED_QUERY_FRAGMENTS for f in emitted):
             raise ValueError("unexpected WHERE fragment")
-        where, params = _filters_to_where(filters)
+        return _filters_to_where(filters)
+
+    async def _query_impl(self, filters: MeteringQuery) -> list[UsageMetrics]:
+        """Select events matching ``filters`` via the base allow-list WHERE builder."""
+        where, params = self._checked_where(filters)
         sql = f"""
             {_USAGE_EVENTS_SELECT}
             WHERE {where}
@@ -493,30 +776,113 @@ class SQLiteMeteringStorage(AsyncSqliteRepository, MeteringStorageBase):
         rows = await self.fetch_all(sql, tuple(params))
         return [_row_to_metrics(r) for r in rows]
 
-    async def _fetch_all_events(self) -> list[UsageMetrics]:
-        """Read every usage_events row (full-table scan path for unfiltered aggregate/summary)."""
-        rows = await self.fetch_all(f"{_USAGE_EVENTS_SELECT} ORDER BY timestamp")  # nosec B608 - static SQL
-        return [_row_to_metrics(r) for r in rows]
+    def _usage_sources(self, filters: MeteringQuery | None) -> tuple[str, list[Any]]:
+        """Build the ``UNION ALL`` of rollup and raw sources covering ``filters``.
+
+        ``limit``/``offset`` are ignored, as in the in-memory store.
+        """
+        filters = filters or MeteringQuery()
+        if filters.task_id is not None:
+            where, params = self._checked_where(filters)
+            return f"{_RAW_SOURCE_SELECT} WHERE {where}", params  # nosec B608 - see _checked_where
+        self._checked_where(filters)
+        selects: list[str] = []
+        params = []
+        for source in _plan_usage_sources(filters.start, filters.end):
+            where, source_params = build_where(
+                {**source, "agent_id": filters.agent_id, "consumer_id": filters.consumer_id},
+                _USAGE_SOURCE_WHERE,
+            )
+            table_select = _ROLLUP_SOURCE_SELECT if "granularity" in source else _RAW_SOURCE_SELECT
+            selects.append(f"{table_select} WHERE {where}")  # nosec B608 - allow-listed fragments
+            params.extend(source_params)
+        if not selects:  # start > end: nothing can match
+            return f"{_RAW_SOURCE_SELECT} WHERE 0", []  # nosec B608 - static SQL
+        return " UNION ALL ".join(selects), params
+
+    async def _fetch_keyset_rows(
+        self,
+        filters: MeteringQuery,
+        after: tuple[str, ...] | None,
+        limit: int,
+        offset: int = 0,
+    ) -> list[tuple[Any, ...]]:
+        """Fetch up to ``limit`` rows (``-1``: all) ordered by ``(timestamp, id)`` after ``after``.
+
+        The agent, consumer and ``(timestamp, id)`` indexes serve the seek, so
+        a page deep into history costs the same as the first one.
+        """
+        where, params = self._checked_where(filters)
+        if after is not None:
+            where += " AND (timestamp, id) > (?, ?)"
+            params.extend(after)
+        sql = f"""
+            {_USAGE_EVENTS_SELECT}
+            WHERE {where}
+            ORDER BY timestamp, id
+            LIMIT ? OFFSET ?
+        """  # nosec B608 - ``where`` is assembled by build_where from _USAGE_EVENTS_WHERE; values parameterized
+        return await self.fetch_all(sql, (*params, limit, offset))
+
+    async def _query_page_impl(
+        self,
+        filters: MeteringQuery,
+        cursor: str | None,
+    ) -> Page[UsageMetrics]:
+        """Keyset page: resume after the ``(timestamp, id)`` encoded in ``cursor``."""
+        after = decode_cursor(cursor, str, str) if cursor is not None else None
+        limit = filters.limit
+        rows = await self._fetch_keyset_rows(
+            filters,
+            after,
+            -1 if limit is None else limit + 1,
+            0 if after is not None else filters.offset,
+        )
+        return page_from_rows(rows, limit, key=lambda r: (r[-1], r[0]), to_item=_row_to_metrics)
+
+    async def _iter_events_impl(
+        self,
+        filters: MeteringQuery,
+        page_size: int,
+    ) -> AsyncIterator[UsageMetrics]:
+        """Keyset-paged scan ordered by ``(timestamp, id)``.
+
+        Each page resumes after the last row of the previous one, so deep pages
+        cost the same as the first (``filters.offset`` applies to the first page).
+        """
+        remaining = filters.limit
+        offset = filters.offset
+        after: tuple[str, str] | None = None
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            rows = await self._fetch_keyset_rows(filters, after, size, offset)
+            for row in rows:
+                yield _row_to_metrics(row)
+            if len(rows) < size:
+                return
+            offset = 0
+            after = (rows[-1][-1], rows[-1][0])
+            if remaining is not None:
+                remaining -= len(rows)
 
     async def _aggregate_impl(
         self,
         group_by: str,
         filters: MeteringQuery | None = None,
     ) -> list[UsageAggregate]:
-        if filters is not None:
-            agg_filters = MeteringQuery(
-                agent_id=filters.agent_id,
-                consumer_id=filters.consumer_id,
-                task_id=filters.task_id,
-                start=filters.start,
-                end=filters.end,
-                limit=None,
-                offset=0,
-            )
-            events = await self._query_impl(agg_filters)
-        else:
-            events = await self._fetch_all_events()
-        return _dispatch_aggregate(events, group_by)
+        """Aggregate in SQL: one ``GROUP BY`` row per agent, consumer, day, or week."""
+        group_key = _AGGREGATE_GROUP_KEYS.get(group_by)
+        if group_key is None:
+            raise ValueError(f"group_by must be one of {_VALID_GROUP_BY!r}; got {group_by!r}")
+        sources, params = self._usage_sources(filters)
+        sql = f"""
+            SELECT {group_key} AS group_key, {_USAGE_TOTALS_SELECT}
+            FROM ({sources})
+            GROUP BY group_key
+            ORDER BY group_key
+        """  # nosec B608 - group_key from _AGGREGATE_GROUP_KEYS, sources from allow-listed fragments; values parameterized
+        rows = await self.fetch_all(sql, tuple(params))
+        return [_row_to_aggregate(group_by, r) for r in rows]
 
     async def record(self, metrics: UsageMetrics) -> None:
         """Record a usage event."""
@@ -526,6 +892,23 @@ class SQLiteMeteringStorage(AsyncSqliteRepository, MeteringStorageBase):
         """Query events with filters."""
         return await self._query_impl(filters)
 
+    async def query_page(
+        self,
+        filters: MeteringQuery,
+        cursor: str | None = None,
+    ) -> Page[UsageMetrics]:
+        """Return one page of events and the keyset cursor for the next page."""
+        return await self._query_page_impl(filters, cursor)
+
+    async def iter_events(
+        self,
+        filters: MeteringQuery,
+        page_size: int = DEFAULT_ITER_PAGE_SIZE,
+    ) -> AsyncIterator[UsageMetrics]:
+        """Stream events matching ``filters`` with keyset pagination."""
+        async for event in self._iter_events_impl(filters, page_size):
+            yield event
+
     async def aggregate(
         self,
         group_by: str,
@@ -535,21 +918,21 @@ class SQLiteMeteringStorage(AsyncSqliteRepository, MeteringStorageBase):
         return await self._aggregate_impl(group_by, filters)
 
     async def _summary_impl(self, filters: MeteringQuery | None = None) -> UsageSummary:
-        """Compute summary from events, optionally filtered."""
-        if filters is not None:
-            summary_filters = MeteringQuery(
-                agent_id=filters.agent_id,
-                consumer_id=filters.consumer_id,
-                task_id=filters.task_id,
-                start=filters.start,
-                end=filters.end,
-                limit=None,
-                offset=0,
-            )
-            events = await self._query_impl(summary_filters)
-        else:
-            events = await self._fetch_all_events()
-        return _compute_summary(events)
+        """Compute the summary with one SQL aggregate, optionally filtered."""
+        sources, params = self._usage_sources(filters)
+        sql = f"SELECT {_USAGE_TOTALS_SELECT} FROM ({sources})"  # nosec B608 - see _usage_sources
+        row = await self.fetch_one(sql, tuple(params))
+        if row is None or not row[2]:
+            return UsageSummary()
+        tokens, duration, tasks, api_calls, unique_agents, unique_consumers = row
+        return UsageSummary(
+            total_tasks=tasks,
+            total_tokens=tokens or 0,
+            total_duration_ms=duration or 0,
+            unique_agents=unique_agents,
+            unique_consumers=unique_consumers,
+            total_api_calls=api_calls or 0,
+        )
 
     async def summary(self, filters: MeteringQuery | None = None) -> UsageSummary:
         """Return dashboard summary."""
@@ -571,10 +954,22 @@ class SQLiteMeteringStorage(AsyncSqliteRepository, MeteringStorageBase):
         return await self._stats_impl()
 
     async def _purge_expired_impl(self) -> int:
-        """Delete events older than retention_ttl_seconds. Returns count removed."""
+        """Delete events older than retention_ttl_seconds. Returns count removed.
+
+        Rollups are left in place unless ``rollup_retention_ttl_seconds`` is set,
+        in which case buckets ending before that cutoff are dropped as well.
+        """
+        now = datetime.now(timezone.utc)
+        if self._rollup_retention_ttl_seconds is not None:
+            rollup_cutoff = now - timedelta(seconds=self._rollup_retention_ttl_seconds)
+            for granularity, prefix_len in _USAGE_ROLLUP_GRANULARITIES:
+                await self.execute(
+                    "DELETE FROM usage_rollups WHERE granularity = ? AND bucket < ?",
+                    (granularity, rollup_cutoff.isoformat()[:prefix_len]),
+                )
         if self._retention_ttl_seconds is None:
             return 0
-        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self._retention_ttl_seconds)
+        cutoff = now - timedelta(seconds=self._retention_ttl_seconds)
         cutoff = cutoff.replace(microsecond=0)
         return await self.execute(
             "DELETE FROM usage_events WHERE timestamp < ?",
@@ -582,5 +977,12 @@ class SQLiteMeteringStorage(AsyncSqliteRepository, MeteringStorageBase):
         )
 
     async def purge_expired(self) -> int:
-        """Remove events older than retention_ttl_seconds. Returns count removed."""
+        """Remove raw events older than retention_ttl_seconds (rollups are kept).
+
+        Returns the number of raw events removed.
+        """
         return await self._purge_expired_impl()
+
+    async def flush(self) -> None:
+        """Wait until every event recorded so far is committed."""
+        await self._writer.flush()
@@ -186,7 +186,7 @@ def create_worker_app(
         ),
         endpoints=Endpoint(asap=endpoint),
     )
-    store = snapshot_store or create_snapshot_store()
+    store = snapshot_store or create_snapshot_store(asynchronous=False)
     registry = HandlerRegistry()
     registry.register("task.request", _create_failover_work_handler(store))
     registry.register("state_restore", _create_state_restore_handler(store))
@@ -22,7 +22,7 @@ from asap.state.stores import create_snapshot_store
 
 def main() -> None:
     """Run a minimal save/get cycle with the configured store."""
-    store = create_snapshot_store()
+    store = create_snapshot_store(asynchronous=False)
     task_id = "task_demo_01"
     snapshot = StateSnapshot(
         id="snap_demo_01",
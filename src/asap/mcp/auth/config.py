@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass, field
 
+from asap.auth.agent_jwt import VerifiedTokenCache
 from asap.auth.jti_replay_cache import JtiReplayCacheProtocol
 from asap.auth.capabilities import CapabilityRegistry
 from asap.auth.identity import AgentStore, HostStore
@@ -46,6 +47,7 @@ class MCPAuthConfig:
     jwt_extractor: Callable[[CallToolRequestParams], str | None] | None = None
     allow_env_jwt_fallback: bool = False
     jti_replay_cache: JtiReplayCacheProtocol | None = None
+    verified_token_cache: VerifiedTokenCache | None = None
     expected_audience: str | list[str] | None = None
     manifest_url: str | None = None
 
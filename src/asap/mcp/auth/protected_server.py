@@ -116,6 +116,7 @@ class ProtectedMCPServer(MCPServer):
             self._auth_config.agent_store,
             expected_audience=self._auth_config.expected_audience,
             jti_replay_cache=self._auth_config.jti_replay_cache,
+            verified_cache=self._auth_config.verified_token_cache,
         )
         if not verify_result.ok:
             return tool_error_result(INVALID_TOKEN, verify_result.error)
@@ -9,6 +9,7 @@ Features:
 - Automatic trace_id and correlation_id propagation
 - Logger factory with common context binding
 - Prometheus-compatible metrics collection
+- Opt-in per-stage request profiling with pluggable hooks
 
 Example:
     >>> from asap.observability import get_logger, get_metrics
@@ -34,6 +35,11 @@ from asap.observability.metrics import (
     get_metrics,
     reset_metrics,
 )
+from asap.observability.profiling import (
+    RequestProfiler,
+    RequestStageHook,
+    SlowRequestHook,
+)
 
 __all__ = [
     "bind_context",
@@ -45,5 +51,8 @@ __all__ = [
     "is_debug_mode",
     "reset_metrics",
     "MetricsCollector",
+    "RequestProfiler",
+    "RequestStageHook",
+    "SlowRequestHook",
     "sanitize_for_logging",
 ]
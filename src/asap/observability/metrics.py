@@ -52,6 +52,34 @@ class Counter:
 # Default histogram buckets for latency (in seconds)
 DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 
+# Buckets for compressed/original size ratios (lower is better)
+COMPRESSION_RATIO_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+
+# Buckets for per-response compression CPU time (in seconds)
+COMPRESSION_CPU_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+# Buckets for individual request pipeline stages (in seconds)
+REQUEST_STAGE_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+
+# Buckets for the number of rows queued at each group-commit flush
+GROUP_COMMIT_QUEUE_BUCKETS = (1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0, 512.0, 1024.0)
+
 
 @dataclass
 class Histogram:
@@ -142,12 +170,41 @@ class MetricsCollector:
         "asap_invalid_timestamp_total": "Total number of invalid timestamp rejections",
         "asap_invalid_nonce_total": "Total number of invalid nonce rejections",
         "asap_sender_mismatch_total": "Total number of sender identity mismatches",
+        "asap_websocket_dispatch_total": "Total number of envelopes dispatched over WebSocket",
+        "asap_websocket_dispatch_backpressure_total": (
+            "Total number of WebSocket frames that waited for a free dispatch slot"
+        ),
+        "asap_response_uncompressed_bytes_total": (
+            "Total response bytes before compression, for compressed responses"
+        ),
+        "asap_response_compressed_bytes_total": "Total response bytes sent after compression",
     }
 
     DEFAULT_HISTOGRAMS: ClassVar[dict[str, str]] = {
         "asap_request_duration_seconds": "Request processing duration in seconds",
         "asap_handler_duration_seconds": "Handler execution duration in seconds",
         "asap_transport_send_duration_seconds": "Transport send duration in seconds",
+        "asap_websocket_dispatch_wait_seconds": (
+            "Time a WebSocket frame waited for a free dispatch slot in seconds"
+        ),
+        "asap_response_compression_ratio": "Compressed to original response size ratio",
+        "asap_response_compression_cpu_seconds": "CPU time spent compressing a response in seconds",
+        "asap_request_stage_duration_seconds": (
+            "Duration of one request pipeline stage in seconds (opt-in profiling)"
+        ),
+        "asap_group_commit_queue_depth": "Rows queued for a SQLite group-commit writer at flush",
+        "asap_group_commit_flush_duration_seconds": (
+            "Duration of one SQLite group-commit batch transaction in seconds"
+        ),
+    }
+
+    # Histograms that need buckets other than DEFAULT_LATENCY_BUCKETS
+    HISTOGRAM_BUCKETS: ClassVar[dict[str, tuple[float, ...]]] = {
+        "asap_response_compression_ratio": COMPRESSION_RATIO_BUCKETS,
+        "asap_response_compression_cpu_seconds": COMPRESSION_CPU_BUCKETS,
+        "asap_request_stage_duration_seconds": REQUEST_STAGE_BUCKETS,
+        "asap_group_commit_queue_depth": GROUP_COMMIT_QUEUE_BUCKETS,
+        "asap_group_commit_flush_duration_seconds": REQUEST_STAGE_BUCKETS,
     }
 
     def __init__(self) -> None:
@@ -161,7 +218,11 @@ class MetricsCollector:
             self._counters[name] = Counter(name=name, help_text=help_text)
 
         for name, help_text in self.DEFAULT_HISTOGRAMS.items():
-            self._histograms[name] = Histogram(name=name, help_text=help_text)
+            self._histograms[name] = Histogram(
+                name=name,
+                help_text=help_text,
+                buckets=self.HISTOGRAM_BUCKETS.get(name, DEFAULT_LATENCY_BUCKETS),
+            )
 
     def register_counter(self, name: str, help_text: str) -> None:
         """Register a new counter metric.
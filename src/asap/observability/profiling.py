@@ -0,0 +1,248 @@
+"""Opt-in per-stage profiling for the ASAP request pipeline.
+
+``ASAPRequestHandler`` runs every JSON-RPC request through a fixed sequence of
+stages (parse → auth → envelope → trace → sender → timestamp → nonce →
+dispatch → audit → serialize → compress). A :class:`RequestProfiler` times each stage
+with ``time.perf_counter_ns``, exports the durations as the
+``asap_request_stage_duration_seconds{stage=...}`` histogram and calls
+pluggable :class:`RequestStageHook` callbacks around every stage and once per
+request, so expensive tooling (e.g. a sampling profiler) can be attached to
+slow requests only.
+
+Profiling is disabled unless a profiler is passed to ``create_app``; without
+one the handler does no extra timing work. Single and batched ``POST /asap``
+requests are profiled; streaming and WebSocket requests are not.
+
+Example:
+    >>> from asap.observability.profiling import RequestProfiler, SlowRequestHook
+    >>> def report(profile):
+    ...     print(profile.request_id, profile.stage_seconds())
+    >>> profiler = RequestProfiler(hooks=[SlowRequestHook(0.25, report)])
+    >>> app = create_app(manifest, request_profiler=profiler)  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar, Token
+from types import TracebackType
+
+from asap.observability.logging import get_logger
+from asap.observability.metrics import MetricsCollector, get_metrics
+
+logger = get_logger(__name__)
+
+# Histogram exported for every completed stage
+STAGE_DURATION_METRIC = "asap_request_stage_duration_seconds"
+
+# Pipeline stages, in execution order
+REQUEST_STAGES = (
+    "parse",
+    "auth",
+    "envelope",
+    "trace",
+    "sender",
+    "timestamp",
+    "nonce",
+    "dispatch",
+    "audit",
+    "serialize",
+    "compress",
+)
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class RequestProfile:
+    """Stage timings collected for one request.
+
+    Attributes:
+        request_id: JSON-RPC request id, set once the request has been parsed
+        payload_type: Envelope payload type, set once the envelope is validated
+        started_ns: ``perf_counter_ns`` value when profiling started
+        finished_ns: ``perf_counter_ns`` value when the request finished, or None
+        stages: Stage name to accumulated duration in nanoseconds, in completion order
+    """
+
+    __slots__ = ("request_id", "payload_type", "started_ns", "finished_ns", "stages")
+
+    def __init__(self) -> None:
+        self.request_id: str | int | None = None
+        self.payload_type = "unknown"
+        self.started_ns = time.perf_counter_ns()
+        self.finished_ns: int | None = None
+        self.stages: dict[str, int] = {}
+
+    @property
+    def total_ns(self) -> int:
+        """Wall time from start to finish (or to now while still running)."""
+        end = self.finished_ns if self.finished_ns is not None else time.perf_counter_ns()
+        return end - self.started_ns
+
+    @property
+    def total_seconds(self) -> float:
+        return self.total_ns / _NS_PER_SECOND
+
+    def stage_seconds(self) -> dict[str, float]:
+        """Return the stage durations converted to seconds."""
+        return {stage: ns / _NS_PER_SECOND for stage, ns in self.stages.items()}
+
+
+class RequestStageHook:
+    """Base class for profiling callbacks; override the methods you need.
+
+    Hooks run inline on the request path, so they should be cheap. Exceptions
+    raised by a hook are logged and never fail the request.
+    """
+
+    def before_stage(self, stage: str, profile: RequestProfile) -> None:
+        """Called right before *stage* starts."""
+
+    def after_stage(self, stage: str, profile: RequestProfile, duration_ns: int) -> None:
+        """Called when *stage* ends (also when it returned an error or raised)."""
+
+    def on_request_end(self, profile: RequestProfile) -> None:
+        """Called once per request after the last stage, with the complete profile."""
+
+
+class SlowRequestHook(RequestStageHook):
+    """Call *on_slow* with the profile of every request slower than a threshold.
+
+    Args:
+        threshold_seconds: Minimum total request time that counts as slow.
+        on_slow: Callback receiving the finished :class:`RequestProfile`.
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        on_slow: Callable[[RequestProfile], None],
+    ) -> None:
+        self._threshold_ns = int(threshold_seconds * _NS_PER_SECOND)
+        self._on_slow = on_slow
+
+    def on_request_end(self, profile: RequestProfile) -> None:
+        if profile.total_ns >= self._threshold_ns:
+            self._on_slow(profile)
+
+
+class _StageTimer:
+    """Context manager timing one stage of the active profile."""
+
+    __slots__ = ("_profiler", "_profile", "_stage", "_start_ns")
+
+    def __init__(self, profiler: RequestProfiler, profile: RequestProfile, stage: str) -> None:
+        self._profiler = profiler
+        self._profile = profile
+        self._stage = stage
+        self._start_ns = 0
+
+    def __enter__(self) -> None:
+        self._profiler._call_hooks("before_stage", self._stage, self._profile)
+        self._start_ns = time.perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        duration_ns = time.perf_counter_ns() - self._start_ns
+        self._profiler._record_stage(self._profile, self._stage, duration_ns)
+
+
+class _NullStage:
+    """No-op stage used when no profile is active."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+NULL_STAGE = _NullStage()
+
+# Profile of the request being processed in the current task
+_active_profile: ContextVar[RequestProfile | None] = ContextVar(
+    "asap_request_profile", default=None
+)
+
+
+class RequestProfiler:
+    """Times request pipeline stages and fans them out to metrics and hooks.
+
+    Args:
+        hooks: Callbacks invoked around every stage and at request end.
+        record_metrics: When True (default), observe each stage duration in
+            ``asap_request_stage_duration_seconds`` with a ``stage`` label.
+        metrics: Collector to record into; defaults to the global collector
+            returned by :func:`get_metrics` at record time.
+    """
+
+    def __init__(
+        self,
+        hooks: Iterable[RequestStageHook] = (),
+        *,
+        record_metrics: bool = True,
+        metrics: MetricsCollector | None = None,
+    ) -> None:
+        self.hooks = tuple(hooks)
+        self.record_metrics = record_metrics
+        self._metrics = metrics
+
+    def start(self) -> tuple[RequestProfile, Token[RequestProfile | None]]:
+        """Start profiling a request in the current context.
+
+        Returns:
+            The new profile and a token to pass to :meth:`finish`.
+        """
+        profile = RequestProfile()
+        return profile, _active_profile.set(profile)
+
+    def finish(self, profile: RequestProfile, token: Token[RequestProfile | None]) -> None:
+        """Close *profile*, run ``on_request_end`` hooks and deactivate it."""
+        profile.finished_ns = time.perf_counter_ns()
+        _active_profile.reset(token)
+        self._call_hooks("on_request_end", profile)
+
+    def stage(self, name: str) -> _StageTimer | _NullStage:
+        """Return a context manager timing stage *name* of the active profile."""
+        profile = _active_profile.get()
+        if profile is None:
+            return NULL_STAGE
+        return _StageTimer(self, profile, name)
+
+    def _record_stage(self, profile: RequestProfile, stage: str, duration_ns: int) -> None:
+        profile.stages[stage] = profile.stages.get(stage, 0) + duration_ns
+        if self.record_metrics:
+            metrics = self._metrics if self._metrics is not None else get_metrics()
+            metrics.observe_histogram(
+                STAGE_DURATION_METRIC, duration_ns / _NS_PER_SECOND, {"stage": stage}
+            )
+        self._call_hooks("after_stage", stage, profile, duration_ns)
+
+    def _call_hooks(self, method: str, *args: object) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, method)(*args)
+            except Exception:
+                logger.warning(
+                    "asap.profiling.hook_failed",
+                    hook=type(hook).__name__,
+                    method=method,
+                    exc_info=True,
+                )
+
+
+def current_profile() -> RequestProfile | None:
+    """Return the profile of the request being processed, if profiling is active."""
+    return _active_profile.get()
@@ -19,7 +19,13 @@ from .metering import (
     UsageEvent,
     UsageMetrics,
 )
-from .snapshot import AsyncSnapshotStore, SnapshotStore, create_async_snapshot_store
+from .snapshot import (
+    AsyncSnapshotStore,
+    LazySnapshot,
+    SnapshotInfo,
+    SnapshotStore,
+    create_async_snapshot_store,
+)
 from .stores.memory import InMemorySnapshotStore
 from .stores import create_snapshot_store
 from .stores.sqlite import SQLiteMeteringStore, SQLiteSnapshotStore
@@ -33,6 +39,8 @@ __all__ = [
     "transition",
     "AsyncSnapshotStore",
     "SnapshotStore",
+    "SnapshotInfo",
+    "LazySnapshot",
     "InMemorySnapshotStore",
     "SQLiteSnapshotStore",
     "SQLiteMeteringStore",
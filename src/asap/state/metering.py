@@ -12,6 +12,7 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import itertools
 import warnings
 from collections.abc import Awaitable
 from datetime import datetime, timedelta, timezone
@@ -191,18 +192,24 @@ class MeteringStore(Protocol):
 class InMemoryMeteringStore:
     """In-memory implementation of :class:`AsyncMeteringStore` / :class:`MeteringStore`.
 
-    Stores usage events in a list with asyncio.Lock for async-safe concurrent access.
+    Indexes usage events by agent and time (see :mod:`state.stores._usage_index`)
+    under an asyncio.Lock for async-safe concurrent access, so ``query`` costs
+    two bisects plus the page and ``aggregate`` reads running per-agent totals.
     Used for testing and development; not persistent across restarts.
     """
 
     def __init__(self) -> None:
+        # Deferred: importing state.stores at module load would cycle back here
+        # (stores.memory re-exports this class).
+        from asap.state.stores._usage_index import UsageIndex
+
         self._lock = asyncio.Lock()
-        self._events: list[UsageEvent] = []
+        self._index: UsageIndex[UsageEvent] = UsageIndex(_event_metrics)
 
     async def record(self, event: UsageEvent) -> None:
         """Append a usage event to the store (async-safe)."""
         async with self._lock:
-            self._events.append(event)
+            self._index.add(event)
 
     async def query(
         self,
@@ -215,29 +222,30 @@ class InMemoryMeteringStore:
         """Return events for the agent in [start, end], sorted by timestamp."""
         if offset < 0:
             raise ValueError("offset must be non-negative")
+        stop = offset + limit if limit is not None else None
         async with self._lock:
-            out = [
-                e for e in self._events if e.agent_id == agent_id and start <= e.timestamp <= end
-            ]
-        out = sorted(out, key=lambda e: e.timestamp)
-        return out[offset : offset + limit] if limit is not None else out[offset:]
+            events = self._index.select(agent_id=agent_id, start=start, end=end)
+            return list(itertools.islice(events, offset, stop))
 
     async def aggregate(self, agent_id: str, period: str) -> UsageAggregate:
         """Aggregate all stored events for the agent into one UsageAggregate."""
         async with self._lock:
-            agent_events = [e for e in self._events if e.agent_id == agent_id]
-        total_tokens = sum(e.metrics.tokens_in + e.metrics.tokens_out for e in agent_events)
-        total_duration = sum(e.metrics.duration_ms for e in agent_events)
-        total_tasks = len(agent_events)
-        total_api_calls = sum(e.metrics.api_calls for e in agent_events)
-        return UsageAggregate(
-            agent_id=agent_id,
-            period=period,
-            total_tokens=total_tokens,
-            total_duration=total_duration,
-            total_tasks=total_tasks,
-            total_api_calls=total_api_calls,
-        )
+            totals = self._index.totals("agent").get(agent_id)
+            if totals is None:
+                return UsageAggregate(agent_id=agent_id, period=period)
+            return UsageAggregate(
+                agent_id=agent_id,
+                period=period,
+                total_tokens=totals.tokens,
+                total_duration=totals.duration_ms,
+                total_tasks=totals.tasks,
+                total_api_calls=totals.api_calls,
+            )
+
+
+def _event_metrics(event: UsageEvent) -> tuple[int, int, int, int]:
+    m = event.metrics
+    return m.tokens_in, m.tokens_out, m.duration_ms, m.api_calls
 
 
 class MeteringStorageBridge:
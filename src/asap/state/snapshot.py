@@ -13,13 +13,60 @@ from __future__ import annotations
 
 import os
 import warnings
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Any, Protocol, runtime_checkable
 
 from asap.models.entities import StateSnapshot
 from asap.models.types import TaskID
 
 
+@dataclass(frozen=True)
+class SnapshotInfo:
+    """Snapshot metadata read without touching the ``data`` payload.
+
+    ``size`` is the length in bytes of ``data`` serialized as JSON (``None`` for
+    rows whose size was never recorded).
+    """
+
+    id: str
+    task_id: TaskID
+    version: int
+    checkpoint: bool
+    created_at: datetime
+    size: int | None
+
+
+@dataclass(frozen=True)
+class LazySnapshot(SnapshotInfo):
+    """:class:`SnapshotInfo` whose ``data`` is decoded on first access.
+
+    Stores return it from ``get_lazy`` so callers that only inspect metadata
+    never decompress or parse the payload; ``loader`` runs at most once.
+    """
+
+    loader: Callable[[], dict[str, Any]] = field(repr=False, compare=False, kw_only=True)
+
+    @cached_property
+    def data(self) -> dict[str, Any]:
+        """The snapshot state, decoded on first access."""
+        return self.loader()
+
+    def to_snapshot(self) -> StateSnapshot:
+        """Return the equivalent :class:`StateSnapshot` (decodes ``data``)."""
+        return StateSnapshot(
+            id=self.id,
+            task_id=self.task_id,
+            version=self.version,
+            data=self.data,
+            checkpoint=self.checkpoint,
+            created_at=self.created_at,
+        )
+
+
 @runtime_checkable
 class AsyncSnapshotStore(Protocol):
     """Async snapshot storage (:class:`SnapshotStore` methods as ``async def``).
@@ -177,6 +224,8 @@ from asap.state.stores.memory import InMemorySnapshotStore  # noqa: E402
 
 __all__ = [
     "AsyncSnapshotStore",
+    "LazySnapshot",
+    "SnapshotInfo",
     "SnapshotStore",
     "create_async_snapshot_store",
     "InMemorySnapshotStore",
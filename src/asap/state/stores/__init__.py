@@ -5,18 +5,32 @@ This package provides SnapshotStore and MeteringStore implementations:
 - SQLiteAsyncSnapshotStore, SQLiteSnapshotStore, SQLiteMeteringStore (from stores.sqlite)
 
 Factory:
-- create_snapshot_store() — env ASAP_STORAGE_BACKEND / ASAP_STORAGE_PATH
+- create_snapshot_store() — env ASAP_STORAGE_BACKEND / ASAP_STORAGE_PATH; async store
+  when called from a running event loop
 - create_async_snapshot_store() — re-exported; default sqlite, optional memory
 """
 
+import asyncio
 import os
 from pathlib import Path
+from typing import Literal, overload
 
-from asap.state.snapshot import SnapshotStore, create_async_snapshot_store
+from asap.state.snapshot import AsyncSnapshotStore, SnapshotStore, create_async_snapshot_store
+from asap.state.stores._group_commit import GroupCommitWriter as GroupCommitWriter
+from asap.state.stores._keyset import (
+    InvalidCursor as InvalidCursor,
+    Page as Page,
+    decode_cursor as decode_cursor,
+    encode_cursor as encode_cursor,
+)
 from asap.state.stores._sqlite_base import (
     DEFAULT_DB_PATH as DEFAULT_DB_PATH,
     AsyncSqliteRepository as AsyncSqliteRepository,
+    SqliteConnectionPool as SqliteConnectionPool,
+    SyncSqliteRepository as SyncSqliteRepository,
     build_where as build_where,
+    close_connection_pools as close_connection_pools,
+    get_connection_pool as get_connection_pool,
     parse_iso as parse_iso,
 )
 from asap.state.stores.memory import (
@@ -34,15 +48,40 @@ ASAP_STORAGE_BACKEND_ENV = "ASAP_STORAGE_BACKEND"
 ASAP_STORAGE_PATH_ENV = "ASAP_STORAGE_PATH"
 
 
-def create_snapshot_store() -> SnapshotStore:
-    """Create a SnapshotStore from environment.
+@overload
+def create_snapshot_store(*, asynchronous: Literal[False]) -> SnapshotStore: ...
+
+
+@overload
+def create_snapshot_store(*, asynchronous: Literal[True]) -> AsyncSnapshotStore: ...
+
+
+@overload
+def create_snapshot_store(
+    *, asynchronous: bool | None = None
+) -> SnapshotStore | AsyncSnapshotStore: ...
+
+
+def create_snapshot_store(
+    *, asynchronous: bool | None = None
+) -> SnapshotStore | AsyncSnapshotStore:
+    """Create a snapshot store from environment.
 
     Reads ASAP_STORAGE_BACKEND (default "memory") and ASAP_STORAGE_PATH
     (default "asap_state.db" for sqlite). Use "memory" for tests and
     "sqlite" for persistent state.
 
+    With ``asynchronous=None`` (default) the flavour follows the calling
+    context: from a running event loop it returns an async-first
+    :class:`AsyncSnapshotStore` (:class:`SQLiteAsyncSnapshotStore` or
+    :class:`AsyncInMemorySnapshotStore`), otherwise a sync
+    :class:`SnapshotStore` (:class:`SQLiteSnapshotStore` on blocking
+    ``sqlite3``, or :class:`InMemorySnapshotStore`). Pass ``True``/``False``
+    to choose explicitly, e.g. when building a store in async startup code
+    for sync handlers.
+
     Returns:
-        Configured SnapshotStore instance.
+        Configured snapshot store instance.
 
     Raises:
         ValueError: If ASAP_STORAGE_BACKEND is not "memory" or "sqlite".
@@ -50,23 +89,43 @@ def create_snapshot_store() -> SnapshotStore:
     backend = os.environ.get(ASAP_STORAGE_BACKEND_ENV, "memory").strip().lower()
     path = os.environ.get(ASAP_STORAGE_PATH_ENV, DEFAULT_DB_PATH).strip()
 
+    if backend not in ("memory", "sqlite"):
+        raise ValueError(
+            f"Unknown {ASAP_STORAGE_BACKEND_ENV}={backend!r}. Use 'memory' or 'sqlite'."
+        )
+    if asynchronous is None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asynchronous = False
+        else:
+            asynchronous = True
+    if asynchronous:
+        return create_async_snapshot_store(backend, db_path=Path(path))
     if backend == "memory":
         return InMemorySnapshotStore()
-    if backend == "sqlite":
-        return SQLiteSnapshotStore(db_path=Path(path))
-    raise ValueError(f"Unknown {ASAP_STORAGE_BACKEND_ENV}={backend!r}. Use 'memory' or 'sqlite'.")
+    return SQLiteSnapshotStore(db_path=Path(path))
 
 
 __all__ = [
     "AsyncInMemorySnapshotStore",
     "AsyncSqliteRepository",
+    "GroupCommitWriter",
     "InMemorySnapshotStore",
     "InMemoryMeteringStore",
+    "InvalidCursor",
+    "Page",
     "SQLiteAsyncSnapshotStore",
     "SQLiteSnapshotStore",
     "SQLiteMeteringStore",
+    "SqliteConnectionPool",
+    "SyncSqliteRepository",
     "build_where",
+    "close_connection_pools",
     "create_async_snapshot_store",
     "create_snapshot_store",
+    "decode_cursor",
+    "encode_cursor",
+    "get_connection_pool",
     "parse_iso",
 ]
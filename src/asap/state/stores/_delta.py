@@ -0,0 +1,226 @@
+"""JSON-patch delta encoding for snapshot versions (opt-in per store).
+
+Agents that snapshot after every step write a long run of versions whose
+``data`` differs by a handful of keys, yet each version stores the whole
+document. With ``delta_interval=K`` a store instead keeps a full copy only for
+the first version of a task, every checkpoint, and every K-th link of a chain;
+the versions in between hold an RFC 6902 patch against the previous version.
+
+Patches produced by :func:`diff` use ``add``/``remove``/``replace`` only and
+recurse into objects; lists and scalars are replaced whole. Reading a delta
+version walks back to its full base (at most ``K - 1`` patches) and applies the
+patches forward; :class:`MaterializedCache` keeps recently rebuilt versions so
+sequential reads and the next save's diff start from memory.
+
+Example:
+    >>> patch = diff({"step": 1, "ctx": {"a": 1, "b": 2}}, {"step": 2, "ctx": {"a": 1}})
+    >>> patch
+    [{'op': 'replace', 'path': '/step', 'value': 2}, {'op': 'remove', 'path': '/ctx/b'}]
+    >>> apply_patch({"step": 1, "ctx": {"a": 1, "b": 2}}, patch)
+    {'step': 2, 'ctx': {'a': 1}}
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+JsonPatch = list[dict[str, Any]]
+
+#: Materialized versions kept per store by default.
+DEFAULT_DELTA_CACHE_SIZE = 32
+
+
+def check_delta_interval(interval: int | None) -> int | None:
+    """Validate a store's ``delta_interval`` (``None`` keeps every version full)."""
+    if interval is not None and interval < 1:
+        raise ValueError(f"delta_interval must be >= 1 or None, got {interval}")
+    return interval
+
+
+_CONTAINERS = (dict, list)
+
+
+def _escape(key: object) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(old: Any, new: Any) -> bool:
+    """JSON equality: unlike ``==``, ``1``, ``1.0`` and ``True`` all differ."""
+    if type(old) is not type(new) or old != new:
+        return False
+    # ``==`` holds, so only a bool/int/float alias can still differ.
+    if type(old) is dict:
+        return all(_same(v, new[k]) for k, v in old.items())
+    if type(old) is list:
+        if list(map(type, old)) != list(map(type, new)):
+            return False
+        return all(_same(a, b) for a, b in zip(old, new, strict=True) if type(a) in _CONTAINERS)
+    return True
+
+
+def _diff_into(patch: JsonPatch, prefix: str, old: dict[str, Any], new: dict[str, Any]) -> None:
+    for key, old_value in old.items():
+        if key not in new:
+            patch.append({"op": "remove", "path": f"{prefix}/{_escape(key)}"})
+            continue
+        new_value = new[key]
+        if old_value is new_value:
+            continue
+        if type(old_value) is dict and type(new_value) is dict:
+            _diff_into(patch, f"{prefix}/{_escape(key)}", old_value, new_value)
+        elif not _same(old_value, new_value):
+            patch.append({"op": "replace", "path": f"{prefix}/{_escape(key)}", "value": new_value})
+    for key, new_value in new.items():
+        if key not in old:
+            patch.append({"op": "add", "path": f"{prefix}/{_escape(key)}", "value": new_value})
+
+
+def diff(old: dict[str, Any], new: dict[str, Any]) -> JsonPatch:
+    """Return the RFC 6902 patch that turns ``old`` into ``new``."""
+    patch: JsonPatch = []
+    _diff_into(patch, "", old, new)
+    return patch
+
+
+def apply_patch(doc: dict[str, Any], patch: JsonPatch) -> dict[str, Any]:
+    """Return ``doc`` with ``patch`` applied; ``doc`` itself is left untouched.
+
+    Only the objects on a patched path are copied; untouched subtrees are shared
+    with ``doc``.
+    """
+    root = dict(doc)
+    owned = {id(root)}
+    for op in patch:
+        *parents, last = (_unescape(t) for t in op["path"].split("/")[1:])
+        node = root
+        for key in parents:
+            child = node[key]
+            if id(child) not in owned:
+                child = node[key] = dict(child)
+                owned.add(id(child))
+            node = child
+        if op["op"] == "remove":
+            del node[last]
+        elif op["op"] in ("add", "replace"):
+            node[last] = op["value"]
+        else:
+            raise ValueError(f"unsupported patch op {op['op']!r}")
+    return root
+
+
+def encode_version(
+    interval: int | None,
+    data: dict[str, Any],
+    checkpoint: bool,
+    base: tuple[int, dict[str, Any], int] | None,
+) -> tuple[int | None, Any, int]:
+    """Choose how to store ``data`` given its predecessor ``(version, data, depth)``.
+
+    Returns ``(None, data, 0)`` for a full copy, else ``(base_version, patch,
+    depth)`` where ``depth`` counts the patches back to the nearest full copy.
+    """
+    if interval is None or checkpoint or base is None:
+        return None, data, 0
+    base_version, base_data, base_depth = base
+    if base_depth + 1 >= interval:
+        return None, data, 0
+    return base_version, diff(base_data, data), base_depth + 1
+
+
+class MaterializedCache:
+    """Thread-safe LRU of rebuilt ``data`` keyed by ``(task_id, version)``.
+
+    Entries carry the snapshot id they were built from, so a version replaced
+    through another store instance misses instead of serving stale data.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_DELTA_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, int], tuple[str, dict[str, Any], int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, task_id: str, version: int, snapshot_id: str
+    ) -> tuple[dict[str, Any], int] | None:
+        """Return ``(data, depth)`` for the version, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get((task_id, version))
+            if entry is None or entry[0] != snapshot_id:
+                return None
+            self._entries.move_to_end((task_id, version))
+            return entry[1], entry[2]
+
+    def put(
+        self, task_id: str, version: int, snapshot_id: str, data: dict[str, Any], depth: int
+    ) -> None:
+        """Remember ``data`` for the version, evicting the least recently used entry."""
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[(task_id, version)] = (snapshot_id, data, depth)
+            self._entries.move_to_end((task_id, version))
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, task_id: str, version: int | None = None) -> None:
+        """Forget one version, or every version of ``task_id``."""
+        with self._lock:
+            if version is not None:
+                self._entries.pop((task_id, version), None)
+                return
+            for key in [k for k in self._entries if k[0] == task_id]:
+                del self._entries[key]
+
+
+def materialize(
+    cache: MaterializedCache,
+    task_id: str,
+    version: int,
+    load: Callable[[int], tuple[str, int | None, Any]],
+    decode: Callable[[Any], Any] | None = None,
+) -> tuple[dict[str, Any], int]:
+    """Rebuild ``version`` and return ``(data, depth)``.
+
+    ``load(v)`` returns the stored ``(snapshot_id, base_version, payload)`` of
+    version ``v``; ``decode`` turns a payload into a document or patch (e.g.
+    ``json.loads``) and only runs for links not served from ``cache``.
+    """
+    patches: list[Any] = []
+    target_id = load(version)[0]
+    current = version
+    while True:
+        snapshot_id, base_version, payload = load(current)
+        hit = cache.get(task_id, current, snapshot_id)
+        if hit is not None:
+            data, depth = hit
+            break
+        decoded = decode(payload) if decode is not None else payload
+        if base_version is None:
+            data, depth = decoded, 0
+            break
+        patches.append(decoded)
+        current = base_version
+    for patch in reversed(patches):
+        data = apply_patch(data, patch)
+        depth += 1
+    cache.put(task_id, version, target_id, data, depth)
+    return data, depth
+
+
+__all__ = [
+    "DEFAULT_DELTA_CACHE_SIZE",
+    "JsonPatch",
+    "MaterializedCache",
+    "apply_patch",
+    "check_delta_interval",
+    "diff",
+    "encode_version",
+    "materialize",
+]
@@ -0,0 +1,257 @@
+"""Group-commit batching for append-only SQLite inserts.
+
+Stores that append one row per event (usage metering, audit log) would
+otherwise pay one ``INSERT`` + ``COMMIT`` (and one WAL sync) per event. A
+:class:`GroupCommitWriter` queues the rows submitted by concurrent callers and
+writes them in a single ``BEGIN IMMEDIATE`` transaction, flushing when the
+queue reaches ``max_batch_size`` or when the oldest queued row has waited
+``max_delay_seconds``. While a flush is in flight new rows keep queuing, so
+batches grow with load.
+
+:meth:`GroupCommitWriter.submit` resolves only after the row's transaction has
+committed, so callers keep "awaited means persisted" semantics;
+:meth:`GroupCommitWriter.flush` waits for everything queued so far (shutdown,
+tests).
+
+Example:
+    >>> async def insert(conn, rows):
+    ...     await conn.executemany("INSERT INTO t(a) VALUES (?)", rows)
+    ...     return [None] * len(rows)
+    >>> writer = GroupCommitWriter(repo, insert, name="t")
+    >>> await writer.submit((1,))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+import aiosqlite
+
+from asap.observability.logging import get_logger
+from asap.observability.metrics import MetricsCollector, get_metrics
+
+if TYPE_CHECKING:
+    from asap.state.stores._sqlite_base import AsyncSqliteRepository
+
+logger = get_logger(__name__)
+
+# Flush once this many rows are queued...
+DEFAULT_GROUP_COMMIT_MAX_BATCH = 256
+
+# ...or once the oldest queued row has waited this long (seconds)
+DEFAULT_GROUP_COMMIT_DELAY = 0.002
+
+# Histograms recorded per flush, labelled with the writer name
+QUEUE_DEPTH_METRIC = "asap_group_commit_queue_depth"
+FLUSH_DURATION_METRIC = "asap_group_commit_flush_duration_seconds"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Writes one batch on a connection inside an open transaction; returns one
+# result per item, in order.
+BatchWriter = Callable[[aiosqlite.Connection, list[T]], Awaitable[list[R]]]
+
+
+class GroupCommitWriter(Generic[T, R]):
+    """Coalesce concurrent single-row writes into one transaction per batch.
+
+    Args:
+        repository: Repository whose :meth:`~AsyncSqliteRepository.transaction`
+            wraps every batch.
+        write_batch: Coroutine writing a batch on the transaction connection
+            (typically one ``executemany``) and returning per-item results.
+        name: ``writer`` label on the queue depth / flush latency histograms.
+        max_batch_size: Maximum rows per transaction; a full queue flushes
+            immediately.
+        max_delay_seconds: Longest a queued row waits for more rows before its
+            batch is flushed. ``0`` flushes on the next event loop iteration.
+        metrics: Collector to record into; defaults to the global collector
+            returned by :func:`get_metrics` at record time.
+
+    If a batch transaction fails, its rows are retried one transaction each,
+    so only the callers whose own row fails see the exception.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncSqliteRepository,
+        write_batch: BatchWriter[T, R],
+        *,
+        name: str,
+        max_batch_size: int = DEFAULT_GROUP_COMMIT_MAX_BATCH,
+        max_delay_seconds: float = DEFAULT_GROUP_COMMIT_DELAY,
+        metrics: MetricsCollector | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_delay_seconds < 0:
+            raise ValueError("max_delay_seconds must be >= 0")
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self.max_delay_seconds = max_delay_seconds
+        self._repository = repository
+        self._write_batch = write_batch
+        self._metrics = metrics
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._in_flight: list[asyncio.Future[R]] = []
+        self._oldest_enqueued = 0.0
+        self._flusher: asyncio.Task[None] | None = None
+        # Set by flush(): skip the batching delay until the queue drains.
+        self._flush_requested = False
+        # Resolved to cut the batching delay short (queue full or flush()).
+        self._wakeup: asyncio.Future[None] | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Rows queued and not yet handed to a transaction."""
+        return len(self._pending)
+
+    async def submit(self, item: T) -> R:
+        """Queue *item* and return its result once its batch has committed.
+
+        Called while this task holds the file's writer (inside a transaction
+        on a repository sharing it), *item* is written inline in that
+        transaction instead: the flusher could not get the writer until the
+        caller released it.
+
+        Raises:
+            Exception: Whatever ``write_batch`` raised for this item.
+        """
+        if self._repository.holds_writer():
+            async with self._repository.transaction() as conn:
+                return (await self._write_batch(conn, [item]))[0]
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        if not self._pending:
+            self._oldest_enqueued = time.monotonic()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._wake()
+        self._ensure_flusher(loop)
+        return await future
+
+    async def flush(self) -> None:
+        """Commit every row queued before this call, skipping the batching delay.
+
+        Failures are reported to the submitting callers, not raised here.
+        """
+        if self._pending:
+            self._flush_requested = True
+            self._wake()
+            self._ensure_flusher(asyncio.get_running_loop())
+        waiting = [future for _, future in self._pending] + self._in_flight
+        if waiting:
+            await asyncio.gather(*waiting, return_exceptions=True)
+
+    def _ensure_flusher(self, loop: asyncio.AbstractEventLoop) -> None:
+        flusher = self._flusher
+        if flusher is not None and not flusher.done() and flusher.get_loop() is loop:
+            return
+        self._flusher = loop.create_task(self._run())
+
+    def _wake(self) -> None:
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    async def _wait_for_batch(self) -> None:
+        """Sleep until the oldest row's deadline, unless woken by a full queue."""
+        remaining = self._oldest_enqueued + self.max_delay_seconds - time.monotonic()
+        if self._flush_requested or len(self._pending) >= self.max_batch_size:
+            return
+        if remaining <= 0:
+            await asyncio.sleep(0)
+            return
+        self._wakeup = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait({self._wakeup}, timeout=remaining)
+        finally:
+            self._wakeup = None
+
+    async def _run(self) -> None:
+        in_flight: list[asyncio.Future[R]] = []
+        try:
+            while self._pending:
+                await self._wait_for_batch()
+                depth = len(self._pending)
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+                in_flight = self._in_flight = [future for _, future in batch]
+                started = time.perf_counter()
+                try:
+                    await self._commit(batch)
+                finally:
+                    self._in_flight = []
+                    self._record_flush(depth, time.perf_counter() - started)
+        except BaseException as exc:
+            # The flusher died (cancelled, or an unexpected error): the batch in
+            # flight was rolled back and nothing else will drain the queue, so
+            # release every waiting caller instead of leaving it hanging.
+            abandoned = in_flight + [future for _, future in self._pending]
+            self._pending.clear()
+            self._flush_requested = False
+            for future in abandoned:
+                if isinstance(exc, Exception):
+                    _settle(future, exc=exc)
+                elif not future.done():
+                    with suppress(RuntimeError):
+                        future.cancel()
+            raise
+        self._flush_requested = False
+
+    async def _commit(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            async with self._repository.transaction() as conn:
+                results = await self._write_batch(conn, items)
+        except Exception as exc:
+            if len(batch) == 1:
+                _settle(batch[0][1], exc=exc)
+                return
+            logger.warning(
+                "asap.group_commit.batch_failed",
+                writer=self.name,
+                batch_size=len(batch),
+                error=str(exc),
+            )
+            for entry in batch:
+                await self._commit([entry])
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            _settle(future, result=result)
+
+    def _record_flush(self, depth: int, duration_seconds: float) -> None:
+        metrics = self._metrics if self._metrics is not None else get_metrics()
+        labels = {"writer": self.name}
+        metrics.observe_histogram(QUEUE_DEPTH_METRIC, float(depth), labels)
+        metrics.observe_histogram(FLUSH_DURATION_METRIC, duration_seconds, labels)
+
+
+def _settle(
+    future: asyncio.Future[R],
+    *,
+    result: R | None = None,
+    exc: BaseException | None = None,
+) -> None:
+    """Resolve *future* unless its caller already gave up (cancelled)."""
+    if future.done():
+        return
+    # The submitting loop may be gone (e.g. asyncio.run returned mid-flush).
+    with suppress(RuntimeError):
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)  # type: ignore[arg-type]
+
+
+__all__ = [
+    "DEFAULT_GROUP_COMMIT_DELAY",
+    "DEFAULT_GROUP_COMMIT_MAX_BATCH",
+    "FLUSH_DURATION_METRIC",
+    "QUEUE_DEPTH_METRIC",
+    "GroupCommitWriter",
+]
@@ -0,0 +1,109 @@
+"""Opaque cursors for keyset (seek) pagination.
+
+``LIMIT ? OFFSET ?`` makes SQLite walk and discard every skipped row, so page N
+of a listing costs O(N * page size). Keyset pagination resumes after the sort
+key of the last row returned instead (``WHERE (timestamp, id) > (?, ?)``), which
+an index on that key turns into a seek: every page costs the same.
+
+Clients receive the sort key as an opaque, URL-safe ``next_cursor`` token
+(:func:`encode_cursor`) and send it back unchanged. :func:`decode_cursor`
+checks the token's shape and raises :class:`InvalidCursor` for anything else;
+the HTTP layer maps that (and only that) to ``400``. In-memory stores, which have no index to seek,
+encode a list position with the same codec (:func:`cursor_offset`).
+
+Example:
+    >>> rows = [("2026-01-01T00:00:00", "evt_a"), ("2026-01-01T00:00:01", "evt_b")]
+    >>> page = page_from_rows(rows, 1, key=lambda r: r, to_item=lambda r: r[1])
+    >>> page.items, decode_cursor(page.next_cursor, str, str)
+    (['evt_a'], ('2026-01-01T00:00:00', 'evt_a'))
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class InvalidCursor(ValueError):
+    """Raised for a pagination cursor that is malformed or from another listing."""
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of results; ``next_cursor`` is ``None`` on the last page."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(*key: str | int) -> str:
+    """Encode a sort key as an opaque URL-safe token."""
+    payload = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple[Any, ...]:
+    """Decode a token from :func:`encode_cursor` whose key has exactly ``types``.
+
+    Raises:
+        InvalidCursor: If ``cursor`` is malformed or was issued for another key shape.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii") + b"=" * (-len(cursor) % 4))
+        key = json.loads(raw)
+    except (ValueError, UnicodeError) as exc:
+        raise InvalidCursor("invalid cursor") from exc
+    if (
+        not isinstance(key, list)
+        or len(key) != len(types)
+        or not all(type(value) is expected for value, expected in zip(key, types, strict=True))
+    ):
+        raise InvalidCursor("invalid cursor")
+    return tuple(key)
+
+
+def cursor_offset(cursor: str | None, default: int = 0) -> int:
+    """Return the list position encoded in ``cursor`` (``default`` when ``None``)."""
+    if cursor is None:
+        return default
+    (offset,) = decode_cursor(cursor, int)
+    if offset < 0:
+        raise InvalidCursor("invalid cursor")
+    return int(offset)
+
+
+def page_from_rows(
+    rows: Sequence[R],
+    limit: int | None,
+    *,
+    key: Callable[[R], tuple[str | int, ...]],
+    to_item: Callable[[R], T],
+) -> Page[T]:
+    """Build a page from a ``LIMIT limit + 1`` fetch.
+
+    The extra row is never returned; it only signals that another page follows,
+    so the last page carries no cursor. ``key`` extracts the sort key of the last
+    row kept.
+    """
+    if limit is not None and limit <= 0:
+        return Page()
+    if limit is None or len(rows) <= limit:
+        return Page([to_item(r) for r in rows])
+    kept = rows[:limit]
+    return Page([to_item(r) for r in kept], encode_cursor(*key(kept[-1])))
+
+
+__all__ = [
+    "InvalidCursor",
+    "Page",
+    "cursor_offset",
+    "decode_cursor",
+    "encode_cursor",
+    "page_from_rows",
+]
@@ -0,0 +1,92 @@
+"""Snapshot payload encoding: JSON text or a compressed JSON BLOB.
+
+Snapshot documents are repetitive JSON, so SQLite stores opened with
+``compression="br"`` (brotli) or ``compression="zstd"`` keep each payload of at
+least :data:`COMPRESSION_MIN_BYTES` as a compressed BLOB and record the codec in
+the row's ``encoding`` column. ``encoding`` NULL means plain JSON text, the only
+format older versions wrote, so every row stays readable whatever the setting.
+
+``brotli`` is a core dependency; ``zstd`` uses the standard library's
+``compression.zstd`` and therefore needs Python 3.14+.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+from collections.abc import Callable
+from typing import Any
+
+#: Payloads smaller than this stay plain JSON text; compressing them saves little.
+COMPRESSION_MIN_BYTES = 256
+
+# Brotli quality 5: most of the ratio of higher levels on repetitive JSON at a
+# fraction of the CPU (the transport layer uses 4 for latency-bound responses).
+_BROTLI_QUALITY = 5
+_ZSTD_LEVEL = 3
+
+
+@functools.cache
+def _brotli() -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    import brotli
+
+    return (lambda raw: brotli.compress(raw, quality=_BROTLI_QUALITY)), brotli.decompress
+
+
+@functools.cache
+def _zstd() -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    try:
+        # By name: ``compression.zstd`` is missing from pre-3.14 stubs.
+        zstd = importlib.import_module("compression.zstd")
+    except ImportError as exc:
+        raise ValueError("zstd snapshot compression requires Python 3.14+") from exc
+    return (lambda raw: zstd.compress(raw, level=_ZSTD_LEVEL)), zstd.decompress
+
+
+_CODECS: dict[str, Callable[[], tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]] = {
+    "br": _brotli,
+    "zstd": _zstd,
+}
+
+
+def check_compression(compression: str | None) -> str | None:
+    """Validate a store's ``compression`` setting and that its codec is importable."""
+    if compression is None:
+        return None
+    if compression not in _CODECS:
+        raise ValueError(
+            f"compression must be one of {sorted(_CODECS)} or None, got {compression!r}"
+        )
+    _CODECS[compression]()
+    return compression
+
+
+def encode_payload(value: Any, compression: str | None) -> tuple[str | None, str | bytes, str]:
+    """Serialize ``value`` for the ``data`` column.
+
+    Returns ``(encoding, stored, text)``: ``text`` is the JSON, ASCII-only so its
+    length is its size in bytes; ``stored`` is ``text`` itself when ``encoding``
+    is ``None``, else its compressed bytes.
+    """
+    text = json.dumps(value)
+    if compression is None or len(text) < COMPRESSION_MIN_BYTES:
+        return None, text, text
+    compress, _ = _CODECS[compression]()
+    return compression, compress(text.encode("ascii")), text
+
+
+def decode_payload(encoding: str | None, stored: str | bytes) -> Any:
+    """Inverse of :func:`encode_payload`."""
+    if encoding is None:
+        return json.loads(stored)
+    _, decompress = _CODECS[encoding]()
+    return json.loads(decompress(stored if isinstance(stored, bytes) else stored.encode()))
+
+
+__all__ = [
+    "COMPRESSION_MIN_BYTES",
+    "check_compression",
+    "decode_payload",
+    "encode_payload",
+]
@@ -3,9 +3,17 @@
 One source of truth for aiosqlite connection lifecycle, WAL pragma setup,
 idempotent schema init, WHERE-clause assembly, ISO timestamp parsing, and
 IN-clause placeholders. Subclasses supply ``schema_ddl`` and per-method SQL.
+:class:`SyncSqliteRepository` is the blocking ``sqlite3`` counterpart for stores
+with a synchronous API.
 
 The per-path WAL lock + LRU ``journal_mode`` metadata below serialize concurrent
-openings on the same DB file (``journal_mode=WAL`` raced before the lock).
+openings on the same DB file (``journal_mode=WAL`` raced before the lock), from
+async and blocking openers alike.
+
+File-backed repositories draw connections from a :class:`SqliteConnectionPool`
+shared by every repository on the same resolved path: one dedicated writer
+connection plus a bounded set of reader connections, opened once (pragmas
+applied at open) and reused across calls instead of reconnecting per query.
 
 Example:
     >>> repo = AsyncSqliteRepository(":memory:", schema_ddl=DDL)
@@ -18,11 +26,13 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import sqlite3
 import threading
+import time
 import weakref
 from collections import OrderedDict
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager, suppress
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -32,10 +42,6 @@ import aiosqlite
 # Single canonical default DB path (deletes the 5 copies across stores).
 DEFAULT_DB_PATH = "asap_state.db"
 
-# Per-DB asyncio lock: concurrent openings raced on journal_mode=WAL before the
-# lock existed. Weak values drop entries when locks are collectable (limits
-# growth in long test runs that spin many tmp_path DBs).
-_PRAGMA_SETUP_LOCKS: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
 _PRAGMA_DICT_GUARD = threading.Lock()
 
 # journal_mode=WAL is persistent per DB file; skip redundant SET after first
@@ -45,18 +51,33 @@ _PRAGMA_DICT_GUARD = threading.Lock()
 _MAX_WAL_METADATA_KEYS = 512
 _WAL_INITIALIZED_LRU: OrderedDict[str, None] = OrderedDict()
 
+# Per-DB lock around journal_mode=WAL: concurrent openings raced on it before
+# the lock existed. A ``threading.Lock`` so the async and blocking openers share
+# it; LRU-bounded like the metadata above (tmp_path-heavy suites).
+_WAL_SETUP_LOCKS: OrderedDict[str, threading.Lock] = OrderedDict()
+
+# How often an async opener re-polls a WAL setup lock held elsewhere (seconds).
+_WAL_SETUP_POLL_INTERVAL = 0.001
+
 
-def _pragma_setup_lock(db_path: Path) -> asyncio.Lock:
-    """Per-DB asyncio lock keyed by resolved path (snapshot + metering share it)."""
-    key = str(db_path.resolve())
+def _wal_setup_lock(db_key: str) -> threading.Lock:
+    """Per-DB WAL setup lock keyed by resolved path (every store on the file shares it)."""
     with _PRAGMA_DICT_GUARD:
-        lock = _PRAGMA_SETUP_LOCKS.get(key)
+        lock = _WAL_SETUP_LOCKS.get(db_key)
         if lock is None:
-            lock = asyncio.Lock()
-            _PRAGMA_SETUP_LOCKS[key] = lock
+            lock = _WAL_SETUP_LOCKS[db_key] = threading.Lock()
+            while len(_WAL_SETUP_LOCKS) > _MAX_WAL_METADATA_KEYS:
+                _WAL_SETUP_LOCKS.popitem(last=False)
+        else:
+            _WAL_SETUP_LOCKS.move_to_end(db_key)
         return lock
 
 
+def _wal_needs_journal_mode(db_key: str) -> bool:
+    with _PRAGMA_DICT_GUARD:
+        return db_key not in _WAL_INITIALIZED_LRU
+
+
 def _wal_mark_initialized(db_key: str) -> None:
     """Record that journal_mode=WAL was applied for this resolved path (LRU-bounded)."""
     with _PRAGMA_DICT_GUARD:
@@ -69,16 +90,294 @@ def _wal_mark_initialized(db_key: str) -> None:
 
 
 async def _apply_wal_pragmas(conn: aiosqlite.Connection, db_key: str) -> None:
-    """Apply WAL pragmas; busy_timeout runs before journal_mode to reduce lock errors."""
+    """Apply WAL pragmas; busy_timeout runs before journal_mode to reduce lock errors.
+
+    The per-path setup lock is polled rather than waited on, so a blocking
+    opener holding it never stalls the event loop.
+    """
     await conn.execute("PRAGMA busy_timeout=15000")
-    with _PRAGMA_DICT_GUARD:
-        need_journal_mode = db_key not in _WAL_INITIALIZED_LRU
-    if need_journal_mode:
-        await conn.execute("PRAGMA journal_mode=WAL")
-        _wal_mark_initialized(db_key)
+    if _wal_needs_journal_mode(db_key):
+        lock = _wal_setup_lock(db_key)
+        # A threading.Lock shared with blocking openers; no event to await.
+        while not lock.acquire(blocking=False):  # noqa: ASYNC110
+            await asyncio.sleep(_WAL_SETUP_POLL_INTERVAL)
+        try:
+            if _wal_needs_journal_mode(db_key):
+                await conn.execute("PRAGMA journal_mode=WAL")
+                _wal_mark_initialized(db_key)
+        finally:
+            lock.release()
     await conn.execute("PRAGMA synchronous=NORMAL")
 
 
+def _apply_wal_pragmas_sync(conn: sqlite3.Connection, db_key: str) -> None:
+    """:func:`_apply_wal_pragmas` for a blocking ``sqlite3`` connection."""
+    conn.execute("PRAGMA busy_timeout=15000")
+    if _wal_needs_journal_mode(db_key):
+        with _wal_setup_lock(db_key):
+            if _wal_needs_journal_mode(db_key):
+                conn.execute("PRAGMA journal_mode=WAL")
+                _wal_mark_initialized(db_key)
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+
+# Reader connections kept per DB file, in addition to the single writer.
+DEFAULT_POOL_READERS = 4
+
+# Pooled connections idle for longer than this are pinged before reuse.
+_POOL_HEALTH_CHECK_INTERVAL = 30.0
+
+# One pool per resolved DB path, shared by every repository on that file. Weak
+# values drop a pool once no repository references it; its finalizer then stops
+# the connections it still had open.
+_CONNECTION_POOLS: weakref.WeakValueDictionary[str, SqliteConnectionPool] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _daemonize(conn: aiosqlite.Connection) -> None:
+    """Mark the aiosqlite worker thread as daemon before it is started.
+
+    Pooled connections stay open for the life of the process; a non-daemon
+    worker would block interpreter exit when nobody closes the pool. aiosqlite
+    < 0.22 connections are threads themselves; newer ones own ``_thread``.
+    """
+    worker = conn if isinstance(conn, threading.Thread) else getattr(conn, "_thread", None)
+    if isinstance(worker, threading.Thread):
+        worker.daemon = True
+
+
+def _stop_connections(conns: set[aiosqlite.Connection]) -> None:
+    """Close a collected pool's open connections (``weakref.finalize`` callback).
+
+    Nothing can be awaited from a finalizer, so each connection is handed to
+    ``stop()``, which closes it on its worker thread and ends that thread.
+    """
+    for conn in list(conns):
+        with suppress(Exception):
+            conn.stop()
+    conns.clear()
+
+
+class SqliteConnectionPool:
+    """Persistent connections for one SQLite file: one writer, N readers.
+
+    The writer connection is handed out under a pool-wide ``asyncio.Lock``, so
+    all repositories sharing the file queue for it in-process instead of
+    contending on SQLite's file lock; other processes are still serialized by
+    ``BEGIN IMMEDIATE`` + ``busy_timeout``. Up to ``max_readers`` reader
+    connections serve concurrent reads (WAL readers never block the writer).
+
+    The writer is reentrant for the task holding it: a nested :meth:`writer`
+    block in that task (e.g. a transaction on one repository calling another
+    repository on the same file) gets the same connection without waiting,
+    and the outermost block keeps ownership of health checks and reset.
+
+    Connections get the WAL pragmas once, when opened. A connection idle for
+    longer than ``_POOL_HEALTH_CHECK_INTERVAL`` (or one whose last use raised)
+    is pinged with ``SELECT 1`` before reuse and replaced if that fails; an
+    open transaction left behind by a failed statement is rolled back on
+    release. Connections still open when the pool is garbage-collected are
+    stopped by a finalizer.
+
+    aiosqlite connections work from any event loop, but the pool's locks bind
+    to one. The pool follows the first loop that uses it and re-binds once that
+    loop is closed (e.g. successive ``asyncio.run`` calls from the sync bridge);
+    calls from any other concurrently running loop fall back to a per-call
+    connection.
+
+    Use :func:`get_connection_pool` rather than constructing pools directly.
+    """
+
+    def __init__(self, db_path: Path, max_readers: int = DEFAULT_POOL_READERS) -> None:
+        if max_readers < 1:
+            raise ValueError("max_readers must be >= 1")
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self._db_key = str(db_path.resolve())
+        self._writer: aiosqlite.Connection | None = None
+        self._writer_suspect = False
+        self._writer_last_used = 0.0
+        self._writer_owner: asyncio.Task[Any] | None = None
+        # Idle readers with the monotonic time they were last released.
+        self._idle_readers: list[tuple[aiosqlite.Connection, float]] = []
+        self._loop_ref: weakref.ref[asyncio.AbstractEventLoop] | None = None
+        self._writer_lock = asyncio.Lock()
+        self._reader_slots = asyncio.Semaphore(max_readers)
+        self._closed = False
+        # Every connection opened and not yet closed; must not reference the pool.
+        self._connections: set[aiosqlite.Connection] = set()
+        weakref.finalize(self, _stop_connections, self._connections)
+
+    def _owns_running_loop(self) -> bool:
+        """Bind to the running loop if possible; False if another loop owns the pool."""
+        loop = asyncio.get_running_loop()
+        bound = self._loop_ref() if self._loop_ref is not None else None
+        if bound is loop:
+            return True
+        if bound is not None and not bound.is_closed():
+            return False
+        self._loop_ref = weakref.ref(loop)
+        self._writer_lock = asyncio.Lock()
+        self._reader_slots = asyncio.Semaphore(self.max_readers)
+        return True
+
+    def holds_writer(self) -> bool:
+        """True when the current task is inside a :meth:`writer` block of this pool."""
+        task = asyncio.current_task()
+        return task is not None and self._writer_owner is task
+
+    async def _open(self) -> aiosqlite.Connection:
+        pending = aiosqlite.connect(self.db_path, timeout=15.0)
+        _daemonize(pending)
+        conn = await pending
+        try:
+            await _apply_wal_pragmas(conn, self._db_key)
+        except BaseException:
+            await conn.close()
+            raise
+        self._connections.add(conn)
+        return conn
+
+    async def _is_healthy(self, conn: aiosqlite.Connection) -> bool:
+        try:
+            await conn.execute("SELECT 1")
+        except (sqlite3.Error, ValueError):
+            return False
+        return True
+
+    async def _discard(self, conn: aiosqlite.Connection) -> None:
+        self._connections.discard(conn)
+        with suppress(sqlite3.Error, ValueError):
+            await conn.close()
+
+    async def _reset(self, conn: aiosqlite.Connection) -> bool:
+        """Roll back a transaction left open by a failed statement; False if unusable."""
+        try:
+            if conn.in_transaction:
+                await conn.rollback()
+        except (sqlite3.Error, ValueError):
+            return False
+        return True
+
+    @asynccontextmanager
+    async def _ephemeral(self) -> AsyncIterator[aiosqlite.Connection]:
+        conn = await self._open()
+        try:
+            yield conn
+        finally:
+            self._connections.discard(conn)
+            await conn.close()
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield the writer connection; held exclusively until the block exits."""
+        held = self._writer if self.holds_writer() else None
+        if held is not None:
+            yield held
+            return
+        if self._closed or not self._owns_running_loop():
+            async with self._ephemeral() as temp_conn:
+                yield temp_conn
+            return
+        async with self._writer_lock:
+            conn: aiosqlite.Connection | None = self._writer
+            stale = time.monotonic() - self._writer_last_used > _POOL_HEALTH_CHECK_INTERVAL
+            if (
+                conn is not None
+                and (self._writer_suspect or stale)
+                and not await self._is_healthy(conn)
+            ):
+                await self._discard(conn)
+                conn = self._writer = None
+            if conn is None:
+                conn = self._writer = await self._open()
+            self._writer_suspect = False
+            self._writer_owner = asyncio.current_task()
+            try:
+                yield conn
+            except BaseException:
+                self._writer_suspect = True
+                raise
+            finally:
+                self._writer_owner = None
+                self._writer_last_used = time.monotonic()
+                if not await self._reset(conn):
+                    await self._discard(conn)
+                    self._writer = None
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield a reader connection; at most ``max_readers`` are out at once."""
+        if self._closed or not self._owns_running_loop():
+            async with self._ephemeral() as temp_conn:
+                yield temp_conn
+            return
+        async with self._reader_slots:
+            conn: aiosqlite.Connection | None = None
+            while self._idle_readers and conn is None:
+                candidate, released_at = self._idle_readers.pop()
+                if time.monotonic() - released_at <= _POOL_HEALTH_CHECK_INTERVAL or (
+                    await self._is_healthy(candidate)
+                ):
+                    conn = candidate
+                else:
+                    await self._discard(candidate)
+            if conn is None:
+                conn = await self._open()
+            healthy = True
+            try:
+                yield conn
+            except BaseException:
+                healthy = await self._is_healthy(conn)
+                raise
+            finally:
+                if healthy and not self._closed and await self._reset(conn):
+                    self._idle_readers.append((conn, time.monotonic()))
+                else:
+                    await self._discard(conn)
+
+    async def close(self) -> None:
+        """Close every idle connection; connections in use close on release."""
+        self._closed = True
+        idle, self._idle_readers = self._idle_readers, []
+        for conn, _ in idle:
+            await self._discard(conn)
+        async with self._writer_lock:
+            if self._writer is not None:
+                await self._discard(self._writer)
+                self._writer = None
+
+
+def get_connection_pool(
+    db_path: str | Path,
+    max_readers: int = DEFAULT_POOL_READERS,
+) -> SqliteConnectionPool:
+    """Return the pool for *db_path*, creating it on first use.
+
+    Repositories pointing at the same file (snapshots, metering, audit, SLA,
+    delegation) share one pool, so the process holds a single writer
+    connection per DB. *max_readers* only applies when the pool is created.
+    """
+    path = Path(db_path)
+    key = str(path.resolve())
+    with _PRAGMA_DICT_GUARD:
+        pool = _CONNECTION_POOLS.get(key)
+        if pool is None or pool._closed:
+            pool = SqliteConnectionPool(path, max_readers)
+            _CONNECTION_POOLS[key] = pool
+        return pool
+
+
+async def close_connection_pools() -> None:
+    """Close every shared connection pool (e.g. on application shutdown)."""
+    with _PRAGMA_DICT_GUARD:
+        pools = list(_CONNECTION_POOLS.values())
+        _CONNECTION_POOLS.clear()
+    for pool in pools:
+        await pool.close()
+
+
 def _assert_sql_in_placeholders(placeholders: str) -> str:
     """Fail closed when dynamic IN-clause placeholders are not ``?,?,…`` only."""
     if set(placeholders) - {"?", ","}:
@@ -91,6 +390,23 @@ def _build_sql_in_placeholders(count: int) -> str:
     return _assert_sql_in_placeholders(",".join("?" for _ in range(count)))
 
 
+def _split_sql_script(script: str) -> list[str]:
+    """Split a DDL script into complete statements (``;`` inside triggers is kept)."""
+    statements: list[str] = []
+    pending = ""
+    for part in script.split(";"):
+        pending += part
+        if sqlite3.complete_statement(pending + ";"):
+            if pending.strip():
+                statements.append(pending.strip())
+            pending = ""
+        else:
+            pending += ";"
+    if pending.strip():
+        statements.append(pending.strip())
+    return statements
+
+
 def parse_iso(value: str | None) -> datetime | None:
     """Parse an ISO-8601 timestamp stored in SQLite; ``None``/empty -> ``None``.
 
@@ -145,14 +461,20 @@ class AsyncSqliteRepository:
     Subclasses supply ``schema_ddl`` (one ``CREATE TABLE IF NOT EXISTS`` block)
     and per-method SQL + row mappers; the boilerplate lives here once.
 
+    File-backed repositories share the :class:`SqliteConnectionPool` of their
+    resolved path: writes (:meth:`execute`, :meth:`transaction`, ``_connect()``)
+    run on the pool's writer connection, reads (:meth:`fetch_all`,
+    :meth:`fetch_one`, ``_connect(write=False)``) on one of its readers.
+
     Writes use a two-level serialization model. On one repository instance, a
     per-instance ``asyncio.Lock`` acquired by both :meth:`execute` and
     :meth:`transaction` closes the pre-``BEGIN IMMEDIATE`` setup window from
     issue #245 where a same-instance ``execute()`` could commit before another
-    write had reached SQLite's lock boundary. Across repository instances,
-    SQLite ``BEGIN IMMEDIATE`` plus ``PRAGMA busy_timeout=15000`` serialize
-    contended writers at the database level instead of failing fast with
-    ``database is locked``.
+    write had reached SQLite's lock boundary. Across repository instances in
+    one process, the pool's writer lock hands the single writer connection out
+    in turn; across processes, SQLite ``BEGIN IMMEDIATE`` plus
+    ``PRAGMA busy_timeout=15000`` serialize contended writers at the database
+    level instead of failing fast with ``database is locked``.
 
     Atomic multi-step operations use :meth:`transaction`, which opens one
     connection, issues ``BEGIN IMMEDIATE``, yields it, and ``COMMIT``s on success
@@ -164,26 +486,41 @@ class AsyncSqliteRepository:
         self,
         db_path: str | Path = DEFAULT_DB_PATH,
         schema_ddl: str | None = None,
+        pool_readers: int = DEFAULT_POOL_READERS,
     ) -> None:
         self._db_path = Path(db_path)
         self._schema_ddl = schema_ddl
+        self._pool_readers = pool_readers
+        self._pool: SqliteConnectionPool | None = None
         self._initialized = False
         self._init_lock = asyncio.Lock()
         # Issue #245: acquire before _connect()/BEGIN IMMEDIATE so no same-instance
         # execute() can slip into the setup window before the transaction has its
-        # SQLite write lock. This lock is intentionally non-reentrant.
+        # SQLite write lock. This lock is intentionally non-reentrant; re-entry
+        # from the holding task raises instead of deadlocking (see _write_guard).
         self._write_lock = asyncio.Lock()
+        self._write_owner: asyncio.Task[Any] | None = None
         # ``:memory:`` creates a *new* empty DB on every connect, so keep one
         # persistent connection alive and serialise access to it. File-backed
-        # DBs use per-call connections (handled in ``_connect``). This mirrors
+        # DBs use the shared per-path pool (handled in ``_connect``). This mirrors
         # the SQLiteAuditStore pattern and makes ``:memory:`` usable in tests
         # without each store re-implementing it.
         self._is_memory = str(db_path) == ":memory:"
         self._persistent_conn: aiosqlite.Connection | None = None
         self._memory_lock = asyncio.Lock()
 
+    def _connection_pool(self) -> SqliteConnectionPool:
+        """Return the shared pool for this file, replacing one that was closed."""
+        pool = self._pool
+        if pool is None or pool._closed:
+            pool = self._pool = get_connection_pool(self._db_path, self._pool_readers)
+        return pool
+
     async def _acquire_connection(self) -> aiosqlite.Connection:
-        """Return an open connection (persistent for ``:memory:``).
+        """Return an open connection (persistent for ``:memory:``, else a new one).
+
+        Bypasses the pool: the caller owns the connection and must hand it back
+        through :meth:`_release_connection`.
 
         Caller must hold ``_memory_lock`` when ``_is_memory`` is set, so this
         method does not re-acquire it (``asyncio.Lock`` is non-reentrant).
@@ -200,12 +537,21 @@ class AsyncSqliteRepository:
             await conn.close()
 
     @asynccontextmanager
-    async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Yield a connection with WAL pragmas applied (file-backed path only).
+    async def _connect(self, *, write: bool = True) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield a pooled connection with WAL pragmas and the schema applied.
+
+        File-backed repositories get the pool's writer connection (held
+        exclusively across every repository on the file until the block exits)
+        or, with ``write=False``, a reader connection. Reader blocks must not
+        write; the schema is installed through the writer before the first read.
+        A task that already holds the writer (an enclosing :meth:`transaction`
+        on any repository sharing the file) reads on the writer too, so it sees
+        its own uncommitted writes and never waits on itself.
 
         For ``:memory:`` the persistent connection is yielded under
-        ``_memory_lock``; WAL pragmas are skipped (in-memory DBs have no WAL).
-        The caller is released from managing close lifecycle in both cases.
+        ``_memory_lock`` for both modes; WAL pragmas are skipped (in-memory DBs
+        have no WAL). The caller is released from managing close lifecycle in
+        all cases.
         """
         if self._is_memory:
             async with self._memory_lock:
@@ -217,15 +563,17 @@ class AsyncSqliteRepository:
                     # Never close the persistent in-memory connection here.
                     pass
             return
-        db_key = str(self._db_path.resolve())
-        conn = await aiosqlite.connect(self._db_path, timeout=15.0)
-        try:
-            async with _pragma_setup_lock(self._db_path):
-                await _apply_wal_pragmas(conn, db_key)
-            await self._ensure_schema(conn)
+        pool = self._connection_pool()
+        if write or pool.holds_writer():
+            async with pool.writer() as conn:
+                await self._ensure_schema(conn)
+                yield conn
+            return
+        if not self._initialized:
+            async with pool.writer() as conn:
+                await self._ensure_schema(conn)
+        async with pool.reader() as conn:
             yield conn
-        finally:
-            await conn.close()
 
     async def _ensure_schema(self, conn: aiosqlite.Connection) -> None:
         """Apply ``schema_ddl`` once, idempotently, under the per-instance lock."""
@@ -234,22 +582,61 @@ class AsyncSqliteRepository:
         async with self._init_lock:
             if self._initialized:
                 return
-            if self._schema_ddl:
+            enclosed = conn.in_transaction
+            if self._schema_ddl and enclosed:
+                # First use inside another repository's transaction: executescript()
+                # would COMMIT it early, so run the DDL inside it instead and retry
+                # on a later call in case that transaction rolls back.
+                for statement in _split_sql_script(self._schema_ddl):
+                    await conn.execute(statement)
+            elif self._schema_ddl:
                 await conn.executescript(self._schema_ddl)
                 await conn.commit()
-            self._initialized = True
+            self._initialized = not enclosed
+
+    def holds_writer(self) -> bool:
+        """True when the current task holds this file's pooled writer connection.
+
+        That is the case inside a :meth:`transaction` (or write) on any
+        repository sharing the file; writes from here join that transaction.
+        """
+        return not self._is_memory and self._connection_pool().holds_writer()
+
+    @asynccontextmanager
+    async def _write_guard(self) -> AsyncIterator[None]:
+        """Hold the per-instance write lock; raise on re-entry from the holding task."""
+        task = asyncio.current_task()
+        if task is not None and self._write_owner is task:
+            raise RuntimeError(
+                "write re-entered inside this repository's own transaction(); "
+                "use the connection it yields"
+            )
+        if self.holds_writer():
+            # No other task can write the file meanwhile, and one holding the
+            # instance lock may be queued for the writer this task holds.
+            yield
+            return
+        async with self._write_lock:
+            self._write_owner = task
+            try:
+                yield
+            finally:
+                self._write_owner = None
 
     async def execute(self, sql: str, params: tuple[Any, ...] = ()) -> int:
         """Run a write query; commit; return affected row count (0 if unknown).
 
         The per-instance write lock serializes this with :meth:`transaction`.
-        Because ``asyncio.Lock`` is non-reentrant, callers must not invoke
-        :meth:`execute` from inside the same instance's active
-        :meth:`transaction` block.
+        Calling :meth:`execute` from inside the same instance's active
+        :meth:`transaction` raises ``RuntimeError``; from inside another
+        repository's transaction on the same file, the statement joins that
+        transaction and is committed (or rolled back) with it.
         """
-        async with self._write_lock, self._connect() as conn:
+        async with self._write_guard(), self._connect() as conn:
+            enclosed = conn.in_transaction
             cursor = await conn.execute(sql, params)
-            await conn.commit()
+            if not enclosed:
+                await conn.commit()
             return cursor.rowcount if cursor.rowcount is not None else 0
 
     async def fetch_all(
@@ -258,7 +645,7 @@ class AsyncSqliteRepository:
         params: tuple[Any, ...] = (),
     ) -> list[tuple[Any, ...]]:
         """Run a read query; return all rows as tuples."""
-        async with self._connect() as conn:
+        async with self._connect(write=False) as conn:
             cursor = await conn.execute(sql, params)
             rows = await cursor.fetchall()
             return [tuple(r) for r in rows]
@@ -269,7 +656,7 @@ class AsyncSqliteRepository:
         params: tuple[Any, ...] = (),
     ) -> tuple[Any, ...] | None:
         """Run a read query; return the first row as a tuple, or ``None``."""
-        async with self._connect() as conn:
+        async with self._connect(write=False) as conn:
             cursor = await conn.execute(sql, params)
             row = await cursor.fetchone()
             return tuple(row) if row else None
@@ -284,21 +671,34 @@ class AsyncSqliteRepository:
         connection is reused (so the transaction sees prior writes).
 
         ``BEGIN IMMEDIATE`` acquires the SQLite write lock at transaction start
-        (rather than deferring it to the first write). This serializes the
-        transaction against concurrent ``execute()`` writes on separate
-        connections (e.g. ``register_issued`` during a ``revoke_cascade``), so a
-        concurrent issuer cannot insert a child that escapes the cascade's
-        snapshot (CR#6). ``busy_timeout=15000`` (set in ``_apply_wal_pragmas``)
-        makes a contended ``BEGIN IMMEDIATE`` wait instead of failing fast.
+        (rather than deferring it to the first write). Together with the pool's
+        writer lock (in-process) this serializes the transaction against
+        concurrent ``execute()`` writes (e.g. ``register_issued`` during a
+        ``revoke_cascade``), so a concurrent issuer cannot insert a child that
+        escapes the cascade's snapshot (CR#6). ``busy_timeout=15000`` (set in
+        ``_apply_wal_pragmas``) makes a ``BEGIN IMMEDIATE`` contended by another
+        process wait instead of failing fast.
 
         The same per-instance write lock used by :meth:`execute` is acquired
         before opening the connection, so a same-instance ``execute()`` cannot
-        interleave during the setup window before ``BEGIN IMMEDIATE`` runs. This
-        lock is non-reentrant: while this context manager is active, the caller
-        must use the yielded ``conn`` directly instead of calling
-        :meth:`execute` or nesting :meth:`transaction` on the same instance.
+        interleave during the setup window before ``BEGIN IMMEDIATE`` runs.
+        That lock is not reentrant: inside the block, use the yielded ``conn``
+        rather than this repository's :meth:`execute` or :meth:`transaction`
+        (both raise ``RuntimeError``). Other repositories on the same file may
+        be called from the block; they share the writer connection, and a
+        nested :meth:`transaction` becomes a ``SAVEPOINT`` of the outer one.
         """
-        async with self._write_lock, self._connect() as conn:
+        async with self._write_guard(), self._connect() as conn:
+            if conn.in_transaction:
+                await conn.execute("SAVEPOINT asap_nested")
+                try:
+                    yield conn
+                    await conn.execute("RELEASE asap_nested")
+                except BaseException:
+                    await conn.execute("ROLLBACK TO asap_nested")
+                    await conn.execute("RELEASE asap_nested")
+                    raise
+                return
             await conn.execute("BEGIN IMMEDIATE")
             try:
                 yield conn
@@ -308,9 +708,167 @@ class AsyncSqliteRepository:
                 raise
 
 
+def _close_sync_connections(conns: list[sqlite3.Connection], guard: threading.Lock) -> None:
+    with guard:
+        closing = conns[:]
+        conns.clear()
+    for conn in closing:
+        with suppress(sqlite3.Error):
+            conn.close()
+
+
+def _close_sync_reader(
+    conn: sqlite3.Connection, conns: list[sqlite3.Connection], guard: threading.Lock
+) -> None:
+    """Close a thread's reader once the thread is gone (its thread-local slot died)."""
+    with guard:
+        if conn in conns:
+            conns.remove(conn)
+    with suppress(sqlite3.Error):
+        conn.close()
+
+
+class _ReaderSlot:
+    """Thread-local holder of one reader; dropped (and finalized) on thread exit."""
+
+    __slots__ = ("__weakref__", "conn")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+class SyncSqliteRepository:
+    """Blocking ``sqlite3`` counterpart of :class:`AsyncSqliteRepository`.
+
+    For stores with a synchronous API (scripts, sync FastAPI handlers running
+    in the threadpool): every call runs on the caller's thread, with no event
+    loop and no hop to a worker thread. Same pragmas, schema-init contract and
+    query shapes as the async base.
+
+    One writer connection is shared by all threads under a per-instance
+    ``threading.Lock`` (non-reentrant, like the async write lock); each thread
+    reads on its own connection, so WAL readers never wait for the writer.
+    ``:memory:`` uses the writer connection for reads too, since every
+    connection to it is a separate database. A thread's reader is closed when
+    the thread exits. Connections are opened in autocommit mode;
+    :meth:`transaction` issues ``BEGIN IMMEDIATE`` itself.
+    """
+
+    def __init__(
+        self, db_path: str | Path = DEFAULT_DB_PATH, schema_ddl: str | None = None
+    ) -> None:
+        self._db_path = Path(db_path)
+        self._schema_ddl = schema_ddl
+        self._is_memory = str(db_path) == ":memory:"
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._writer: sqlite3.Connection | None = None
+        self._local = threading.local()
+        # Every connection opened (writer and all threads' readers), so that
+        # :meth:`close`, or the finalizer once the repository is collected, can
+        # close them from any thread.
+        self._opened: list[sqlite3.Connection] = []
+        self._opened_guard = threading.Lock()
+        weakref.finalize(self, _close_sync_connections, self._opened, self._opened_guard)
+
+    def _open(self) -> sqlite3.Connection:
+        if self._is_memory:
+            conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+        else:
+            conn = sqlite3.connect(
+                self._db_path, timeout=15.0, check_same_thread=False, isolation_level=None
+            )
+            try:
+                _apply_wal_pragmas_sync(conn, str(self._db_path.resolve()))
+            except BaseException:
+                conn.close()
+                raise
+        with self._opened_guard:
+            self._opened.append(conn)
+        return conn
+
+    @contextmanager
+    def _connect(self, *, write: bool = True) -> Iterator[sqlite3.Connection]:
+        """Yield the writer (held under the write lock) or this thread's reader."""
+        if write or self._is_memory:
+            with self._write_lock:
+                if self._writer is None:
+                    self._writer = self._open()
+                self._ensure_schema(self._writer)
+                yield self._writer
+            return
+        if not self._initialized:
+            with self._connect():
+                pass
+        slot: _ReaderSlot | None = getattr(self._local, "reader", None)
+        if slot is None:
+            slot = self._local.reader = _ReaderSlot(self._open())
+            weakref.finalize(slot, _close_sync_reader, slot.conn, self._opened, self._opened_guard)
+        yield slot.conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """Apply ``schema_ddl`` once, idempotently, under the per-instance lock."""
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            if self._schema_ddl:
+                conn.executescript(self._schema_ddl)
+            self._initialized = True
+
+    def execute(self, sql: str, params: tuple[Any, ...] = ()) -> int:
+        """Run a write query (autocommit); return affected row count (0 if unknown)."""
+        with self._connect() as conn:
+            cursor = conn.execute(sql, params)
+            return cursor.rowcount if cursor.rowcount is not None else 0
+
+    def fetch_all(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Run a read query; return all rows as tuples."""
+        with self._connect(write=False) as conn:
+            return [tuple(r) for r in conn.execute(sql, params).fetchall()]
+
+    def fetch_one(self, sql: str, params: tuple[Any, ...] = ()) -> tuple[Any, ...] | None:
+        """Run a read query; return the first row as a tuple, or ``None``."""
+        with self._connect(write=False) as conn:
+            row = conn.execute(sql, params).fetchone()
+            return tuple(row) if row else None
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield the writer inside BEGIN IMMEDIATE/COMMIT; ROLLBACK on any exception.
+
+        As with :meth:`AsyncSqliteRepository.transaction`, use the yielded
+        ``conn`` directly: the write lock is held and is not reentrant.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """Close the writer and every reader connection; the next call reopens."""
+        with self._write_lock:
+            self._local = threading.local()
+            self._writer = None
+            if self._is_memory:
+                self._initialized = False
+            _close_sync_connections(self._opened, self._opened_guard)
+
+
 __all__ = [
     "DEFAULT_DB_PATH",
+    "DEFAULT_POOL_READERS",
     "AsyncSqliteRepository",
+    "SqliteConnectionPool",
+    "SyncSqliteRepository",
     "build_where",
+    "close_connection_pools",
+    "get_connection_pool",
     "parse_iso",
 ]
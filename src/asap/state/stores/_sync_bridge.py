@@ -1,13 +1,13 @@
-"""Sync->async bridge for the synchronous :class:`SQLiteSnapshotStore` (v2.5.1 S1).
+"""Sync->async bridge: run an async snapshot coroutine from synchronous code (v2.5.1 S1).
 
-``SQLiteSnapshotStore`` exposes a *synchronous* :class:`~asap.state.snapshot.SnapshotStore`
-interface but the backend is async (``aiosqlite``); ``_run_sync`` bridges that. When
-no event loop is running it uses ``asyncio.run``; when a loop is running (e.g. inside
-a FastAPI handler) it submits the coroutine to a shared 4-worker thread pool so the
-caller's loop is not blocked and we do not create a per-call executor.
+``_run_sync`` uses ``asyncio.run`` when no event loop is running; when a loop is
+running (e.g. inside a FastAPI handler) it submits the coroutine to a shared
+4-worker thread pool so we do not create a per-call executor.
 
-The coroutine wrappers keep a reference to the backend's impl methods so the sync
-store stays a thin facade over the async backend.
+:class:`SQLiteSnapshotStore` used to be a facade over the async backend through
+this bridge; it now runs on blocking ``sqlite3`` directly (no loop, no thread
+hop), so ``_run_sync`` is kept only for code that must drive an async store from
+sync code. The coroutine wrappers back :class:`SQLiteAsyncSnapshotStore`.
 """
 
 from __future__ import annotations
@@ -0,0 +1,243 @@
+"""Time-ordered indexes and running totals for the in-memory usage stores.
+
+``InMemoryMeteringStore`` (state) and ``InMemoryMeteringStorage`` (economics)
+keep every event in memory for dev/staging and test harnesses. Scanning and
+sorting the whole history on each query made their cost grow with total
+history; :class:`UsageIndex` keeps instead:
+
+- one global and one per-agent / per-consumer array of ``(timestamp, seq,
+  event)`` entries kept sorted by timestamp, so a time range is two bisects;
+- running :class:`UsageTotals` per agent, consumer and day (plus overall), so
+  unfiltered aggregates never touch events;
+- a moving head per array: retention eviction drops a sorted prefix by
+  advancing the head (ring-buffer style) and only compacts the array once the
+  dead prefix outgrows the live part, instead of rebuilding lists.
+
+Events usually arrive in timestamp order, so inserts are appends; late events
+are bisect-inserted. ``seq`` breaks timestamp ties in arrival order.
+
+Example:
+    >>> index = UsageIndex(lambda e: (e.tokens_in, e.tokens_out, e.duration_ms, e.api_calls))
+    >>> index.add(event)
+    >>> list(index.select(agent_id="agent_a", start=start, end=end))
+    [event]
+    >>> index.totals("agent")["agent_a"].tasks
+    1
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, Protocol, TypeVar
+
+
+class UsageRecord(Protocol):
+    """Fields the index reads from an event (both usage event models have them)."""
+
+    @property
+    def agent_id(self) -> str: ...
+
+    @property
+    def consumer_id(self) -> str: ...
+
+    @property
+    def timestamp(self) -> datetime: ...
+
+
+E = TypeVar("E", bound=UsageRecord)
+
+#: ``(tokens_in, tokens_out, duration_ms, api_calls)`` of an event.
+MetricsOf = Callable[[E], tuple[int, int, int, int]]
+
+
+@dataclass(slots=True)
+class UsageTotals:
+    """Running sums for one group of events; ``agents``/``consumers`` count events per id."""
+
+    tasks: int = 0
+    tokens: int = 0
+    duration_ms: int = 0
+    api_calls: int = 0
+    agents: Counter[str] = field(default_factory=Counter)
+    consumers: Counter[str] = field(default_factory=Counter)
+
+    def apply(
+        self, sign: int, metrics: tuple[int, int, int, int], agent_id: str, consumer_id: str
+    ) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) one event."""
+        tokens_in, tokens_out, duration_ms, api_calls = metrics
+        self.tasks += sign
+        self.tokens += sign * (tokens_in + tokens_out)
+        self.duration_ms += sign * duration_ms
+        self.api_calls += sign * api_calls
+        self.agents[agent_id] += sign
+        self.consumers[consumer_id] += sign
+        if sign < 0:
+            for counter, key in ((self.agents, agent_id), (self.consumers, consumer_id)):
+                if counter[key] <= 0:
+                    del counter[key]
+
+    def merge(self, other: UsageTotals) -> None:
+        """Add ``other``'s sums into this one (e.g. days into a week)."""
+        self.tasks += other.tasks
+        self.tokens += other.tokens
+        self.duration_ms += other.duration_ms
+        self.api_calls += other.api_calls
+        self.agents.update(other.agents)
+        self.consumers.update(other.consumers)
+
+
+class _TimeArray(Generic[E]):
+    """Entries sorted by ``(timestamp, seq)``; the live part starts at ``head``."""
+
+    __slots__ = ("entries", "head")
+
+    def __init__(self) -> None:
+        self.entries: list[tuple[datetime, int, E]] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.entries) - self.head
+
+    def add(self, entry: tuple[datetime, int, E]) -> None:
+        entries = self.entries
+        if len(entries) == self.head or entry[0] >= entries[-1][0]:
+            entries.append(entry)
+        else:
+            insort(entries, entry, lo=self.head)
+
+    def bounds(self, start: datetime | None, end: datetime | None) -> tuple[int, int]:
+        """Index range of entries with ``start <= timestamp <= end``."""
+        entries = self.entries
+        lo = self.head if start is None else bisect_left(entries, (start, -1), lo=self.head)
+        hi = len(entries) if end is None else bisect_right(entries, (end, math.inf), lo=lo)
+        return lo, hi
+
+    def evict_before(self, cutoff: datetime) -> list[tuple[datetime, int, E]]:
+        """Drop and return the entries older than ``cutoff``."""
+        lo, hi = self.head, bisect_left(self.entries, (cutoff, -1), lo=self.head)
+        evicted = self.entries[lo:hi]
+        self.head = hi
+        # Compact once the dead prefix is at least half the array: the memmove
+        # is paid for by the evictions since the last one (amortized O(1)).
+        if self.head * 2 >= len(self.entries):
+            del self.entries[: self.head]
+            self.head = 0
+        return evicted
+
+
+class UsageIndex(Generic[E]):
+    """Usage events indexed by time, agent and consumer, with running totals.
+
+    Not thread-safe: the stores call it under their own ``asyncio.Lock``.
+    ``metrics_of`` extracts ``(tokens_in, tokens_out, duration_ms, api_calls)``.
+    """
+
+    def __init__(self, metrics_of: MetricsOf[E]) -> None:
+        self._metrics_of = metrics_of
+        self._seq = itertools.count()
+        self._all: _TimeArray[E] = _TimeArray()
+        self._by_agent: dict[str, _TimeArray[E]] = {}
+        self._by_consumer: dict[str, _TimeArray[E]] = {}
+        self._overall = UsageTotals()
+        self._totals: dict[str, dict[str, UsageTotals]] = {
+            "agent": {},
+            "consumer": {},
+            "day": {},
+        }
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def oldest(self) -> datetime | None:
+        """Timestamp of the oldest live event, or ``None`` when empty."""
+        return self._all.entries[self._all.head][0] if len(self._all) else None
+
+    def _group_keys(self, event: E) -> tuple[tuple[str, str], ...]:
+        return (
+            ("agent", event.agent_id),
+            ("consumer", event.consumer_id),
+            ("day", event.timestamp.date().isoformat()),
+        )
+
+    def add(self, event: E) -> None:
+        """Index ``event`` and add it to the running totals."""
+        entry = (event.timestamp, next(self._seq), event)
+        self._all.add(entry)
+        self._by_agent.setdefault(event.agent_id, _TimeArray()).add(entry)
+        self._by_consumer.setdefault(event.consumer_id, _TimeArray()).add(entry)
+        metrics = self._metrics_of(event)
+        self._overall.apply(1, metrics, event.agent_id, event.consumer_id)
+        for dimension, key in self._group_keys(event):
+            totals = self._totals[dimension].setdefault(key, UsageTotals())
+            totals.apply(1, metrics, event.agent_id, event.consumer_id)
+
+    def select(
+        self,
+        *,
+        agent_id: str | None = None,
+        consumer_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[E]:
+        """Yield matching events in timestamp order, scanning only the narrowest index.
+
+        Callers apply any remaining predicate (e.g. ``task_id``) themselves.
+        """
+        candidates: list[_TimeArray[E]] = [self._all]
+        if agent_id is not None or consumer_id is not None:
+            candidates = []
+            for key, arrays in ((agent_id, self._by_agent), (consumer_id, self._by_consumer)):
+                if key is not None:
+                    array = arrays.get(key)
+                    if array is None:
+                        return
+                    candidates.append(array)
+        ranges = [(array, *array.bounds(start, end)) for array in candidates]
+        array, lo, hi = min(ranges, key=lambda r: r[2] - r[1])
+        entries = array.entries
+        for i in range(lo, hi):
+            event = entries[i][2]
+            if (agent_id is None or event.agent_id == agent_id) and (
+                consumer_id is None or event.consumer_id == consumer_id
+            ):
+                yield event
+
+    def totals(self, dimension: str) -> dict[str, UsageTotals]:
+        """Running totals keyed by agent, consumer or day (``YYYY-MM-DD``); do not mutate."""
+        return self._totals[dimension]
+
+    def overall(self) -> UsageTotals:
+        """Running totals over every live event; do not mutate."""
+        return self._overall
+
+    def evict_before(self, cutoff: datetime) -> int:
+        """Remove events with ``timestamp < cutoff``; return how many were removed."""
+        evicted = self._all.evict_before(cutoff)
+        agents: set[str] = set()
+        consumers: set[str] = set()
+        for _ts, _seq, event in evicted:
+            agents.add(event.agent_id)
+            consumers.add(event.consumer_id)
+            metrics = self._metrics_of(event)
+            self._overall.apply(-1, metrics, event.agent_id, event.consumer_id)
+            for dimension, key in self._group_keys(event):
+                groups = self._totals[dimension]
+                groups[key].apply(-1, metrics, event.agent_id, event.consumer_id)
+                if groups[key].tasks == 0:
+                    del groups[key]
+        for keys, arrays in ((agents, self._by_agent), (consumers, self._by_consumer)):
+            for key in keys:
+                arrays[key].evict_before(cutoff)
+                if not arrays[key]:
+                    del arrays[key]
+        return len(evicted)
+
+
+__all__ = ["UsageIndex", "UsageRecord", "UsageTotals"]
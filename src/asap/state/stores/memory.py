@@ -8,11 +8,20 @@ from __future__ import annotations
 
 import asyncio
 import threading
+from typing import Any
 
 from asap.models.entities import StateSnapshot
 from asap.models.types import TaskID
 
 from asap.state.metering import InMemoryMeteringStore
+from asap.state.stores._delta import (
+    DEFAULT_DELTA_CACHE_SIZE,
+    JsonPatch,
+    MaterializedCache,
+    check_delta_interval,
+    encode_version,
+    materialize,
+)
 
 
 class InMemorySnapshotStore:
@@ -22,12 +31,79 @@ class InMemorySnapshotStore:
     and simple applications that don't require persistence across restarts.
 
     This implementation is thread-safe using RLock for concurrent access.
+
+    With ``delta_interval=K`` versions between full copies are kept as JSON
+    patches against their predecessor (see :mod:`state.stores._delta`), so a
+    long-running task holds roughly one full document per K versions.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        delta_interval: int | None = None,
+        delta_cache_size: int = DEFAULT_DELTA_CACHE_SIZE,
+    ) -> None:
         self._lock = threading.RLock()
         self._snapshots: dict[TaskID, dict[int, StateSnapshot]] = {}
         self._latest_versions: dict[TaskID, int] = {}
+        self._delta_interval = check_delta_interval(delta_interval)
+        # Delta versions: version -> (base_version, patch); their entry in
+        # ``_snapshots`` carries the metadata with empty ``data``.
+        self._deltas: dict[TaskID, dict[int, tuple[int, JsonPatch]]] = {}
+        self._delta_cache = MaterializedCache(delta_cache_size)
+
+    def _materialize(self, task_id: TaskID, version: int) -> tuple[dict[str, Any], int]:
+        versions = self._snapshots[task_id]
+        deltas = self._deltas.get(task_id, {})
+
+        def load(v: int) -> tuple[str, int | None, Any]:
+            if v in deltas:
+                base_version, patch = deltas[v]
+                return versions[v].id, base_version, patch
+            return versions[v].id, None, versions[v].data
+
+        return materialize(self._delta_cache, task_id, version, load)
+
+    def _rebase_dependents(self, task_id: TaskID, version: int) -> None:
+        """Store full copies of the versions patched against ``version``."""
+        deltas = self._deltas.get(task_id)
+        if not deltas:
+            return
+        for dependent in [v for v, (base, _) in deltas.items() if base == version]:
+            data, _depth = self._materialize(task_id, dependent)
+            versions = self._snapshots[task_id]
+            versions[dependent] = versions[dependent].model_copy(update={"data": data})
+            del deltas[dependent]
+            self._delta_cache.discard(task_id, dependent)
+
+    def _predecessor(self, task_id: TaskID, version: int) -> tuple[int, dict[str, Any], int] | None:
+        latest = self._latest_versions.get(task_id)
+        if latest is None:
+            return None
+        if latest < version:
+            base_version = latest
+        else:
+            earlier = [v for v in self._snapshots[task_id] if v < version]
+            if not earlier:
+                return None
+            base_version = max(earlier)
+        return (base_version, *self._materialize(task_id, base_version))
+
+    def _store(self, snapshot: StateSnapshot, base: tuple[int, dict[str, Any], int] | None) -> int:
+        """Place ``snapshot`` in full or as a patch against ``base``; return its depth."""
+        task_id, version = snapshot.task_id, snapshot.version
+        base_version, payload, depth = encode_version(
+            self._delta_interval, snapshot.data, snapshot.checkpoint, base
+        )
+        deltas = self._deltas.setdefault(task_id, {})
+        if base_version is None:
+            deltas.pop(version, None)
+            self._snapshots[task_id][version] = snapshot
+        else:
+            deltas[version] = (base_version, payload)
+            self._snapshots[task_id][version] = snapshot.model_copy(update={"data": {}})
+        self._delta_cache.put(task_id, version, snapshot.id, snapshot.data, depth)
+        return depth
 
     def save(self, snapshot: StateSnapshot) -> None:
         """Save a snapshot to the in-memory store."""
@@ -35,7 +111,12 @@ class InMemorySnapshotStore:
             task_id = snapshot.task_id
             if task_id not in self._snapshots:
                 self._snapshots[task_id] = {}
-            self._snapshots[task_id][snapshot.version] = snapshot
+            if snapshot.version in self._snapshots[task_id]:
+                self._rebase_dependents(task_id, snapshot.version)
+            base = None
+            if self._delta_interval is not None and not snapshot.checkpoint:
+                base = self._predecessor(task_id, snapshot.version)
+            self._store(snapshot, base)
             self._latest_versions[task_id] = max(
                 self._latest_versions.get(task_id, 0), snapshot.version
             )
@@ -53,8 +134,12 @@ class InMemorySnapshotStore:
                 latest_version = self._latest_versions.get(task_id)
                 if latest_version is None:
                     return None
-                return self._snapshots[task_id].get(latest_version)
-            return self._snapshots[task_id].get(version)
+                version = latest_version
+            snapshot = self._snapshots[task_id].get(version)
+            if snapshot is None or version not in self._deltas.get(task_id, {}):
+                return snapshot
+            data, _depth = self._materialize(task_id, version)
+            return snapshot.model_copy(update={"data": data})
 
     def list_versions(self, task_id: TaskID) -> list[int]:
         """List all available versions for a task."""
@@ -70,11 +155,16 @@ class InMemorySnapshotStore:
                 return False
             if version is None:
                 del self._snapshots[task_id]
+                self._deltas.pop(task_id, None)
+                self._delta_cache.discard(task_id)
                 if task_id in self._latest_versions:
                     del self._latest_versions[task_id]
                 return True
             if version in self._snapshots[task_id]:
+                self._rebase_dependents(task_id, version)
                 del self._snapshots[task_id][version]
+                self._deltas.get(task_id, {}).pop(version, None)
+                self._delta_cache.discard(task_id, version)
                 if self._latest_versions.get(task_id) == version:
                     if self._snapshots[task_id]:
                         self._latest_versions[task_id] = max(self._snapshots[task_id].keys())
@@ -82,11 +172,39 @@ class InMemorySnapshotStore:
                         del self._latest_versions[task_id]
                 if not self._snapshots[task_id]:
                     del self._snapshots[task_id]
+                    self._deltas.pop(task_id, None)
                     if task_id in self._latest_versions:
                         del self._latest_versions[task_id]
                 return True
             return False
 
+    def compact(self, task_id: TaskID | None = None) -> int:
+        """Re-encode stored versions under the current ``delta_interval``.
+
+        Turns full copies into patches (or back, when ``delta_interval`` is
+        ``None``) and restores the full-copy cadence of chains that deletes or
+        overwrites have broken. Returns the number of versions re-encoded.
+        """
+        with self._lock:
+            task_ids = [task_id] if task_id is not None else list(self._snapshots)
+            changed = 0
+            for tid in task_ids:
+                versions = self._snapshots.get(tid)
+                if not versions:
+                    continue
+                materialized = [
+                    (versions[v], self._materialize(tid, v)[0]) for v in sorted(versions)
+                ]
+                deltas = self._deltas.setdefault(tid, {})
+                base = None
+                for snapshot, data in materialized:
+                    previous = deltas.get(snapshot.version, (None,))[0]
+                    full = snapshot.model_copy(update={"data": data})
+                    depth = self._store(full, None if snapshot.checkpoint else base)
+                    changed += deltas.get(snapshot.version, (None,))[0] != previous
+                    base = (snapshot.version, data, depth)
+            return changed
+
 
 class AsyncInMemorySnapshotStore:
     """In-memory :class:`~asap.state.snapshot.AsyncSnapshotStore` (asyncio.Lock)."""
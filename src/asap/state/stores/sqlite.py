@@ -1,9 +1,10 @@
 """SQLite-backed SnapshotStore and MeteringStore (persistent, file-based).
 
-Both stores subclass :class:`AsyncSqliteRepository` (v2.5.1 S1): the base owns
-aiosqlite connection lifecycle, WAL pragma setup, and idempotent schema init;
-this module supplies per-store DDL, SQL, and row mappers. The sync->async bridge
-for :class:`SQLiteSnapshotStore` lives in :mod:`state.stores._sync_bridge`.
+The async stores subclass :class:`AsyncSqliteRepository` (v2.5.1 S1): the base
+owns aiosqlite connection lifecycle, WAL pragma setup, and idempotent schema
+init; this module supplies per-store DDL, SQL, and row mappers. The synchronous
+:class:`SQLiteSnapshotStore` runs the same SQL on blocking ``sqlite3`` through
+:class:`SyncSqliteRepository` instead of bridging to the async backend.
 
 The canonical ``usage_events`` DDL + :func:`_ensure_usage_events_schema` stay here
 because ``asap.economics.storage`` imports the helper directly (state is the lower
@@ -12,7 +13,11 @@ layer, so the import direction is acyclic).
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import sqlite3
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any, cast
@@ -23,19 +28,45 @@ from asap.models.entities import StateSnapshot
 from asap.models.ids import generate_id
 from asap.models.types import TaskID
 from asap.state.metering import UsageAggregate, UsageEvent, UsageMetrics
-from asap.state.stores._sqlite_base import DEFAULT_DB_PATH, AsyncSqliteRepository
+from asap.state.stores._delta import (
+    DEFAULT_DELTA_CACHE_SIZE,
+    MaterializedCache,
+    apply_patch,
+    check_delta_interval,
+    encode_version,
+    materialize,
+)
+from asap.state.snapshot import LazySnapshot, SnapshotInfo
+from asap.state.stores._group_commit import (
+    DEFAULT_GROUP_COMMIT_DELAY,
+    DEFAULT_GROUP_COMMIT_MAX_BATCH,
+    GroupCommitWriter,
+)
+from asap.state.stores._keyset import Page, decode_cursor, page_from_rows
+from asap.state.stores._payload import check_compression, decode_payload, encode_payload
+from asap.state.stores._sqlite_base import (
+    DEFAULT_DB_PATH,
+    AsyncSqliteRepository,
+    SyncSqliteRepository,
+)
 from asap.state.stores._sync_bridge import (
     _co_snapshot_delete,
     _co_snapshot_get,
     _co_snapshot_list_versions,
     _co_snapshot_save,
-    _run_sync,
 )
 
-# Canonical usage_events DDL: single source of truth for the table + BOTH indexes
-# (agent and consumer). State is the lower layer, so economics.storage can import
+# Canonical usage_events DDL: single source of truth for the table + its indexes
+# (agent, consumer, task, and the (timestamp, id) keyset order used by cursor
+# pages and exports; the agent/consumer indexes seek the same keyset once the
+# filter column is fixed). State is the lower layer, so economics.storage can import
 # it without forming an import cycle; both stores call _ensure_usage_events_schema
 # so the physical schema is identical regardless of which store initializes first.
+#
+# The numeric metrics live in typed INTEGER columns so aggregation runs as plain
+# SUM()/GROUP BY; ``metrics`` keeps the JSON copy for readers that predate them.
+# Indexes reference only the original columns: on a legacy table this script runs
+# before ``_migrate_usage_events_columns`` has added the typed ones.
 _USAGE_EVENTS_DDL = """
 CREATE TABLE IF NOT EXISTS usage_events (
     id TEXT PRIMARY KEY,
@@ -43,14 +74,66 @@ CREATE TABLE IF NOT EXISTS usage_events (
     agent_id TEXT NOT NULL,
     consumer_id TEXT NOT NULL,
     metrics TEXT NOT NULL,
-    timestamp TEXT NOT NULL
+    timestamp TEXT NOT NULL,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    api_calls INTEGER NOT NULL DEFAULT 0
 );
 CREATE INDEX IF NOT EXISTS idx_usage_agent_timestamp
 ON usage_events (agent_id, timestamp);
 CREATE INDEX IF NOT EXISTS idx_usage_consumer_timestamp
 ON usage_events (consumer_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_usage_timestamp_id
+ON usage_events (timestamp, id);
+CREATE INDEX IF NOT EXISTS idx_usage_task
+ON usage_events (task_id);
+"""
+
+# Rollup granularities: (name, length of the ISO timestamp prefix naming a bucket).
+# A bucket is the prefix itself ("2026-02-17", "2026-02-17T12", "2026-02-17T12:05"),
+# so it follows the offset each event was recorded with.
+_USAGE_ROLLUP_GRANULARITIES: tuple[tuple[str, int], ...] = (
+    ("day", 10),
+    ("hour", 13),
+    ("minute", 16),
+)
+
+# Materialized per-bucket totals of usage_events, keyed by (agent, consumer, bucket)
+# and maintained on every insert. Rollups outlive raw-event retention, so long-range
+# aggregates stay cheap after ``purge_expired`` drops the raw rows. Created (and
+# backfilled from usage_events) by ``_migrate_usage_rollups``, not by the DDL
+# script above, so a table that predates rollups is always backfilled.
+_USAGE_ROLLUPS_DDL = """
+CREATE TABLE IF NOT EXISTS usage_rollups (
+    granularity TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    consumer_id TEXT NOT NULL,
+    tasks INTEGER NOT NULL DEFAULT 0,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    api_calls INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (granularity, bucket, agent_id, consumer_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_usage_rollups_agent
+ON usage_rollups (granularity, agent_id, bucket);
+CREATE INDEX IF NOT EXISTS idx_usage_rollups_consumer
+ON usage_rollups (granularity, consumer_id, bucket);
 """
 
+# ``base_version`` is NULL for a full copy of ``data``; otherwise ``data`` holds a
+# JSON patch against that version of the same task (delta mode, see _delta.py).
+# ``encoding`` is NULL for JSON text, else the codec of a compressed BLOB in
+# ``data`` (TEXT affinity leaves BLOBs untouched; see _payload.py); ``size`` is the
+# uncompressed JSON length of the full document.
+#
+# Legacy tables gain the three columns via _ensure_snapshots_schema, so the
+# indexes are created after it: the partial index finds the versions patched
+# against one about to be replaced or deleted, and idx_snapshots_meta covers
+# metadata scans (list_versions, list_snapshots, predecessor lookups) so they
+# never read ``data`` or its overflow pages.
 _SNAPSHOTS_DDL = """
 CREATE TABLE IF NOT EXISTS snapshots (
     task_id TEXT NOT NULL,
@@ -59,24 +142,75 @@ CREATE TABLE IF NOT EXISTS snapshots (
     data TEXT NOT NULL,
     checkpoint INTEGER NOT NULL,
     created_at TEXT NOT NULL,
+    base_version INTEGER,
+    encoding TEXT,
+    size INTEGER,
     PRIMARY KEY (task_id, version)
 )
 """
+_SNAPSHOTS_ADDED_COLUMNS = (("base_version", "INTEGER"), ("encoding", "TEXT"), ("size", "INTEGER"))
+_SNAPSHOTS_INDEXES_DDL = """
+CREATE INDEX IF NOT EXISTS idx_snapshots_base
+ON snapshots (task_id, base_version) WHERE base_version IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_snapshots_meta
+ON snapshots (task_id, version, id, checkpoint, created_at, size);
+"""
+# Legacy rows are full JSON text, so their size is the text's byte length.
+_BACKFILL_SNAPSHOT_SIZE_SQL = """
+UPDATE snapshots SET size = length(CAST(data AS BLOB))
+WHERE size IS NULL AND base_version IS NULL AND encoding IS NULL
+"""
 
-_SNAPSHOT_COLS = "task_id, id, version, data, checkpoint, created_at"
-_SAVE_SQL = f"INSERT OR REPLACE INTO snapshots ({_SNAPSHOT_COLS}) VALUES (?, ?, ?, ?, ?, ?)"
+_SNAPSHOT_COLS = "task_id, id, version, data, checkpoint, created_at, base_version, encoding, size"
+_SNAPSHOT_META_COLS = "id, task_id, version, checkpoint, created_at, size"
+_SAVE_SQL = (
+    f"INSERT OR REPLACE INTO snapshots ({_SNAPSHOT_COLS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
 _GET_BY_VERSION_SQL = f"SELECT {_SNAPSHOT_COLS} FROM snapshots WHERE task_id = ? AND version = ?"  # nosec B608 — _SNAPSHOT_COLS is a hardcoded constant, not user input
 _GET_LATEST_SQL = (
     f"SELECT {_SNAPSHOT_COLS} FROM snapshots WHERE task_id = ? ORDER BY version DESC LIMIT 1"  # nosec B608 — _SNAPSHOT_COLS is a hardcoded constant, not user input
 )
 _LIST_VERSIONS_SQL = "SELECT version FROM snapshots WHERE task_id = ? ORDER BY version"
+_LIST_SNAPSHOTS_SQL = (
+    f"SELECT {_SNAPSHOT_META_COLS} FROM snapshots WHERE task_id = ? ORDER BY version"  # nosec B608 — _SNAPSHOT_META_COLS is a hardcoded constant, not user input
+)
 _DELETE_VERSION_SQL = "DELETE FROM snapshots WHERE task_id = ? AND version = ?"
 _DELETE_TASK_SQL = "DELETE FROM snapshots WHERE task_id = ?"
+_PREDECESSOR_SQL = (
+    "SELECT version, id FROM snapshots WHERE task_id = ? AND version < ? "
+    "ORDER BY version DESC LIMIT 1"
+)
+_DEPENDENTS_SQL = "SELECT version, id FROM snapshots WHERE task_id = ? AND base_version = ?"
+_REENCODE_SQL = (
+    "UPDATE snapshots SET data = ?, base_version = ?, encoding = ? "
+    "WHERE task_id = ? AND version = ?"
+)
+_SNAPSHOT_TASKS_SQL = "SELECT DISTINCT task_id FROM snapshots"
+_COMPACT_ROWS_SQL = (
+    "SELECT version, id, base_version, encoding, data, checkpoint FROM snapshots "
+    "WHERE task_id = ? ORDER BY version"
+)
+# Walks a delta chain from one version back to its full copy in one round trip.
+_CHAIN_SQL = """
+WITH RECURSIVE chain(version, id, base_version, encoding, data) AS (
+    SELECT version, id, base_version, encoding, data
+    FROM snapshots WHERE task_id = ? AND version = ?
+    UNION ALL
+    SELECT s.version, s.id, s.base_version, s.encoding, s.data
+    FROM snapshots s JOIN chain c ON s.version = c.base_version
+    WHERE s.task_id = ?
+)
+SELECT version, id, base_version, encoding, data FROM chain
+"""
+
+# Typed metric columns added to usage_events by the columnar migration, in row order.
+_USAGE_METRIC_COLUMNS = ("tokens_in", "tokens_out", "duration_ms", "api_calls")
 
 _INSERT_EVENT_SQL = (
     "INSERT INTO usage_events "
-    "(id, task_id, agent_id, consumer_id, metrics, timestamp) "
-    "VALUES (?, ?, ?, ?, ?, ?)"
+    "(id, task_id, agent_id, consumer_id, metrics, timestamp, "
+    "tokens_in, tokens_out, duration_ms, api_calls) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
 )
 _QUERY_EVENTS_SQL = (
     "SELECT id, task_id, agent_id, consumer_id, metrics, timestamp "
@@ -84,59 +218,292 @@ _QUERY_EVENTS_SQL = (
     "WHERE agent_id = ? AND timestamp >= ? AND timestamp <= ? "
     "ORDER BY timestamp"
 )
+# Keyset variant of _QUERY_EVENTS_SQL: resumes after a (timestamp, id) cursor.
+_QUERY_EVENTS_PAGE_SQL = (
+    "SELECT id, task_id, agent_id, consumer_id, metrics, timestamp "
+    "FROM usage_events "
+    "WHERE agent_id = ? AND timestamp >= ? AND timestamp <= ? AND (timestamp, id) > (?, ?) "
+    "ORDER BY timestamp, id LIMIT ?"
+)
+# All-time totals for one agent, read from the day rollups (kept past raw retention).
 _AGGREGATE_SQL = """
 SELECT
-    SUM(CAST(json_extract(metrics, '$.tokens_in') AS INTEGER) + CAST(json_extract(metrics, '$.tokens_out') AS INTEGER)),
-    SUM(CAST(json_extract(metrics, '$.duration_ms') AS INTEGER)),
-    COUNT(*),
-    SUM(CAST(json_extract(metrics, '$.api_calls') AS INTEGER))
+    SUM(tokens_in + tokens_out),
+    SUM(duration_ms),
+    SUM(tasks),
+    SUM(api_calls)
+FROM usage_rollups
+WHERE granularity = 'day' AND agent_id = ?
+"""
+
+_UPSERT_ROLLUP_SQL = """
+INSERT INTO usage_rollups
+    (granularity, bucket, agent_id, consumer_id,
+     tasks, tokens_in, tokens_out, duration_ms, api_calls)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (granularity, bucket, agent_id, consumer_id) DO UPDATE SET
+    tasks = tasks + excluded.tasks,
+    tokens_in = tokens_in + excluded.tokens_in,
+    tokens_out = tokens_out + excluded.tokens_out,
+    duration_ms = duration_ms + excluded.duration_ms,
+    api_calls = api_calls + excluded.api_calls
+"""
+
+_BACKFILL_ROLLUPS_SQL = """
+INSERT INTO usage_rollups
+    (granularity, bucket, agent_id, consumer_id,
+     tasks, tokens_in, tokens_out, duration_ms, api_calls)
+SELECT ?, substr(timestamp, 1, ?), agent_id, consumer_id,
+    COUNT(*), SUM(tokens_in), SUM(tokens_out), SUM(duration_ms), SUM(api_calls)
 FROM usage_events
-WHERE agent_id = ?
+GROUP BY 2, 3, 4
 """
 
+# Backfill for rows written before the typed columns existed (JSON is the only copy).
+_BACKFILL_USAGE_METRICS_SQL = """
+UPDATE usage_events SET
+    tokens_in = COALESCE(CAST(json_extract(metrics, '$.tokens_in') AS INTEGER), 0),
+    tokens_out = COALESCE(CAST(json_extract(metrics, '$.tokens_out') AS INTEGER), 0),
+    duration_ms = COALESCE(CAST(json_extract(metrics, '$.duration_ms') AS INTEGER), 0),
+    api_calls = COALESCE(CAST(json_extract(metrics, '$.api_calls') AS INTEGER), 0)
+"""
+
+
+async def _missing_usage_metric_columns(conn: aiosqlite.Connection) -> list[str]:
+    cursor = await conn.execute("PRAGMA table_info(usage_events)")
+    rows = await cursor.fetchall()
+    columns = {row[1] for row in rows}
+    return [col for col in _USAGE_METRIC_COLUMNS if col not in columns]
+
+
+async def _usage_rollups_exist(conn: aiosqlite.Connection) -> bool:
+    cursor = await conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'usage_rollups'"
+    )
+    return await cursor.fetchone() is not None
+
+
+async def _migrate_usage_rollups(conn: aiosqlite.Connection) -> None:
+    """Create ``usage_rollups`` and backfill every granularity from ``usage_events``.
+
+    Runs only when the table is missing; creation and backfill share one
+    transaction, so the rollups never exist without the history they summarize.
+    """
+    if await _usage_rollups_exist(conn):
+        return
+    await conn.execute("BEGIN IMMEDIATE")
+    try:
+        if not await _usage_rollups_exist(conn):
+            # executescript() would commit the open transaction; run statements singly.
+            for statement in _USAGE_ROLLUPS_DDL.split(";"):
+                if statement.strip():
+                    await conn.execute(statement)
+            for granularity, prefix_len in _USAGE_ROLLUP_GRANULARITIES:
+                await conn.execute(_BACKFILL_ROLLUPS_SQL, (granularity, prefix_len))
+        await conn.commit()
+    except BaseException:
+        await conn.rollback()
+        raise
+
+
+async def _migrate_usage_events_columns(conn: aiosqlite.Connection) -> None:
+    """Add the typed metric columns to a legacy ``usage_events`` table and backfill them.
+
+    Idempotent: a table that already has every column is left untouched. The
+    ``ALTER``s and the backfill share one transaction, so an interrupted migration
+    leaves the legacy schema in place and is simply re-run on the next open.
+    """
+    if not await _missing_usage_metric_columns(conn):
+        return
+    await conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Re-check under the write lock: another process may have migrated first.
+        for col in await _missing_usage_metric_columns(conn):
+            # ``col`` comes from the static _USAGE_METRIC_COLUMNS tuple.
+            await conn.execute(
+                f"ALTER TABLE usage_events ADD COLUMN {col} INTEGER NOT NULL DEFAULT 0"
+            )
+        await conn.execute(_BACKFILL_USAGE_METRICS_SQL)
+        await conn.commit()
+    except BaseException:
+        await conn.rollback()
+        raise
+
 
 async def _ensure_usage_events_schema(conn: aiosqlite.Connection) -> None:
     """Apply the canonical usage_events schema (table + both indexes), idempotently.
 
     Economics imports this and calls it with a raw connection; ``SQLiteMeteringStore``
     instead relies on the base's ``_ensure_schema`` (same DDL), so the table is never
-    created twice on one instance.
+    created twice on one instance. Legacy tables get the typed metric columns via
+    :func:`_migrate_usage_events_columns`, then the rollup tables via
+    :func:`_migrate_usage_rollups`.
     """
     await conn.executescript(_USAGE_EVENTS_DDL)
     await conn.commit()
+    await _migrate_usage_events_columns(conn)
+    await _migrate_usage_rollups(conn)
 
 
-def _snapshot_to_row(snapshot: StateSnapshot) -> tuple[str, str, int, str, int, str]:
+class _UsageEventsRepository(AsyncSqliteRepository):
+    """Repository base for stores sharing the ``usage_events`` table (internal).
+
+    Replaces the base's schema step with :func:`_ensure_usage_events_schema` so
+    the typed-column and rollup migrations (conditional steps that
+    ``executescript`` cannot express) complete before ``_initialized`` is set;
+    reader connections skip schema setup once that flag is up, so they never
+    see a legacy table.
+    """
+
+    def __init__(self, db_path: str | Path = DEFAULT_DB_PATH) -> None:
+        super().__init__(db_path, schema_ddl=_USAGE_EVENTS_DDL)
+
+    async def _ensure_schema(self, conn: aiosqlite.Connection) -> None:
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if self._initialized:
+                return
+            await _ensure_usage_events_schema(conn)
+            self._initialized = True
+
+
+async def _insert_event_rows(conn: aiosqlite.Connection, rows: list[tuple[Any, ...]]) -> list[None]:
+    """Group-commit batch writer for ``usage_events`` rows.
+
+    Also folds the batch into ``usage_rollups`` inside the same transaction: rows
+    are summed per (granularity, bucket, agent, consumer) first, so a batch costs
+    one upsert per distinct bucket rather than three per event.
+    """
+    await conn.executemany(_INSERT_EVENT_SQL, rows)
+    totals: dict[tuple[str, str, str, str], list[int]] = {}
+    for _id, _task_id, agent_id, consumer_id, _metrics, ts, *metric_values in rows:
+        for granularity, prefix_len in _USAGE_ROLLUP_GRANULARITIES:
+            acc = totals.setdefault((granularity, ts[:prefix_len], agent_id, consumer_id), [0] * 5)
+            acc[0] += 1
+            for i, value in enumerate(metric_values, start=1):
+                acc[i] += value
+    await conn.executemany(_UPSERT_ROLLUP_SQL, [(*key, *acc) for key, acc in totals.items()])
+    return [None] * len(rows)
+
+
+def _snapshot_to_row(
+    snapshot: StateSnapshot,
+    payload: tuple[str | None, str | bytes, str],
+    base_version: int | None = None,
+) -> tuple[Any, ...]:
+    """Row for ``snapshot`` storing ``payload`` (from :func:`encode_payload`).
+
+    ``payload`` encodes ``snapshot.data``, or the patch against ``base_version``.
+    """
+    encoding, stored, text = payload
     return (
         snapshot.task_id,
         snapshot.id,
         snapshot.version,
-        json.dumps(snapshot.data),
+        stored,
         1 if snapshot.checkpoint else 0,
         snapshot.created_at.isoformat(),
+        base_version,
+        encoding,
+        len(text) if base_version is None else len(json.dumps(snapshot.data)),
     )
 
 
-def _row_to_snapshot(row: tuple[Any, ...]) -> StateSnapshot:
-    task_id, id_, version, data_json, checkpoint, created_at_str = row
+def _parse_created_at(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _row_to_snapshot(row: tuple[Any, ...], data: dict[str, Any] | None = None) -> StateSnapshot:
+    task_id, id_, version, stored, checkpoint, created_at_str, _base, encoding, _size = row
     return StateSnapshot(
         id=id_,
         task_id=task_id,
         version=version,
-        data=json.loads(data_json),
+        data=decode_payload(encoding, stored) if data is None else data,
         checkpoint=bool(checkpoint),
-        created_at=datetime.fromisoformat(created_at_str.replace("Z", "+00:00")),
+        created_at=_parse_created_at(created_at_str),
     )
 
 
-def _event_to_row(event: UsageEvent, event_id: str) -> tuple[str, str, str, str, str, str]:
+def _row_to_info(row: tuple[Any, ...]) -> SnapshotInfo:
+    id_, task_id, version, checkpoint, created_at_str, size = row
+    return SnapshotInfo(
+        id=id_,
+        task_id=task_id,
+        version=version,
+        checkpoint=bool(checkpoint),
+        created_at=_parse_created_at(created_at_str),
+        size=size,
+    )
+
+
+async def _snapshot_columns(conn: aiosqlite.Connection) -> set[str]:
+    cursor = await conn.execute("PRAGMA table_info(snapshots)")
+    return {row[1] for row in await cursor.fetchall()}
+
+
+async def _ensure_snapshots_schema(conn: aiosqlite.Connection) -> None:
+    """Create ``snapshots``, migrate a legacy table's columns, then the indexes.
+
+    The ``ALTER``s and the ``size`` backfill share one transaction, so an
+    interrupted migration is simply re-run on the next open.
+    """
+    await conn.executescript(_SNAPSHOTS_DDL)
+    await conn.commit()
+    if {col for col, _ in _SNAPSHOTS_ADDED_COLUMNS} - await _snapshot_columns(conn):
+        await conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-check under the write lock: another process may have migrated first.
+            existing = await _snapshot_columns(conn)
+            for col, col_type in _SNAPSHOTS_ADDED_COLUMNS:
+                if col not in existing:
+                    # ``col``/``col_type`` come from the static _SNAPSHOTS_ADDED_COLUMNS.
+                    await conn.execute(f"ALTER TABLE snapshots ADD COLUMN {col} {col_type}")
+            await conn.execute(_BACKFILL_SNAPSHOT_SIZE_SQL)
+            await conn.commit()
+        except BaseException:
+            await conn.rollback()
+            raise
+    await conn.executescript(_SNAPSHOTS_INDEXES_DDL)
+    await conn.commit()
+
+
+def _snapshot_columns_sync(conn: sqlite3.Connection) -> set[str]:
+    return {row[1] for row in conn.execute("PRAGMA table_info(snapshots)").fetchall()}
+
+
+def _ensure_snapshots_schema_sync(conn: sqlite3.Connection) -> None:
+    """:func:`_ensure_snapshots_schema` on a blocking autocommit connection."""
+    conn.executescript(_SNAPSHOTS_DDL)
+    if {col for col, _ in _SNAPSHOTS_ADDED_COLUMNS} - _snapshot_columns_sync(conn):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = _snapshot_columns_sync(conn)
+            for col, col_type in _SNAPSHOTS_ADDED_COLUMNS:
+                if col not in existing:
+                    conn.execute(f"ALTER TABLE snapshots ADD COLUMN {col} {col_type}")
+            conn.execute(_BACKFILL_SNAPSHOT_SIZE_SQL)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    conn.executescript(_SNAPSHOTS_INDEXES_DDL)
+
+
+def _event_to_row(event: UsageEvent, event_id: str) -> tuple[Any, ...]:
+    metrics = event.metrics
     return (
         event_id,
         event.task_id,
         event.agent_id,
         event.consumer_id,
-        event.metrics.model_dump_json(),
+        metrics.model_dump_json(),
         event.timestamp.isoformat(),
+        metrics.tokens_in,
+        metrics.tokens_out,
+        metrics.duration_ms,
+        metrics.api_calls,
     )
 
 
@@ -151,41 +518,270 @@ def _row_to_event(row: tuple[Any, ...]) -> UsageEvent:
     )
 
 
-class _SQLiteSnapshotBackend(AsyncSqliteRepository):
-    """Shared SQLite snapshot table access (internal).
+def _decode_link(link: tuple[str | None, str | bytes]) -> Any:
+    return decode_payload(*link)
+
+
+def _chain_links(
+    rows: list[Any],
+) -> dict[int, tuple[str, int | None, tuple[str | None, str | bytes]]]:
+    """Index ``_CHAIN_SQL`` rows (still encoded) by version for :func:`materialize`."""
+    return {v: (id_, base, (encoding, stored)) for v, id_, base, encoding, stored in rows}
+
+
+def _copy_data(data: dict[str, Any]) -> dict[str, Any]:
+    # Round-trip so callers never share (and mutate) objects held by the cache.
+    return cast(dict[str, Any], json.loads(json.dumps(data)))
+
+
+class _SnapshotEncoding:
+    """Delta and compression policy shared by the SQLite snapshot stores (internal).
+
+    With ``delta_interval=K`` a version is written as a JSON patch against its
+    predecessor unless it is a checkpoint, the first version of its task, or
+    would make the chain K links long (see :mod:`state.stores._delta`). With
+    ``compression`` set, payloads are stored as compressed BLOBs (see
+    :mod:`state.stores._payload`). Reads honour ``base_version`` and ``encoding``
+    whatever the settings, so a store opened without them still reads a table
+    written with them. Replacing or deleting a version first rewrites the
+    versions patched against it as full copies.
+
+    This class holds the settings and the work between queries; the async
+    (``aiosqlite``) and sync (``sqlite3``) stores only differ in issuing them.
+    """
+
+    _delta_interval: int | None
+    _delta_cache: MaterializedCache
+    _compression: str | None
+
+    def _configure_encoding(
+        self,
+        delta_interval: int | None,
+        delta_cache_size: int,
+        compression: str | None,
+    ) -> None:
+        self._delta_interval = check_delta_interval(delta_interval)
+        self._delta_cache = MaterializedCache(delta_cache_size)
+        self._compression = check_compression(compression)
+
+    def _materialize_chain(
+        self, task_id: TaskID, version: int, rows: list[Any]
+    ) -> tuple[dict[str, Any], int]:
+        """Rebuild ``version`` from its ``_CHAIN_SQL`` rows; the result is cache-owned."""
+        links = _chain_links(rows)
+        return materialize(self._delta_cache, task_id, version, links.__getitem__, _decode_link)
+
+    def _reencode_full(self, task_id: TaskID, version: int, data: Any) -> tuple[Any, ...]:
+        """``_REENCODE_SQL`` params rewriting ``version`` as a full copy of ``data``."""
+        encoding, stored, _text = encode_payload(data, self._compression)
+        self._delta_cache.discard(task_id, version)
+        return (stored, None, encoding, task_id, version)
+
+    def _encode_save(
+        self,
+        snapshot: StateSnapshot,
+        base: tuple[int, dict[str, Any], int] | None,
+    ) -> tuple[tuple[Any, ...], tuple[dict[str, Any], int] | None]:
+        """Return the ``_SAVE_SQL`` row and the entry to cache once it is committed.
+
+        ``base`` is ``(version, materialized data, chain depth)`` of the
+        predecessor, or ``None`` when delta encoding does not apply.
+        """
+        base_version, value, depth = encode_version(
+            self._delta_interval, snapshot.data, snapshot.checkpoint, base
+        )
+        payload = encode_payload(value, self._compression)
+        row = _snapshot_to_row(snapshot, payload, base_version)
+        if self._delta_interval is None:
+            return row, None
+        # Cache a private copy rebuilt from the stored JSON, never the caller's dict.
+        parsed = json.loads(payload[2])
+        data = parsed if base is None or base_version is None else apply_patch(base[1], parsed)
+        return row, (data, depth)
+
+    def _cache_saved(
+        self, snapshot: StateSnapshot, entry: tuple[dict[str, Any], int] | None
+    ) -> None:
+        if entry is None:
+            self._delta_cache.discard(snapshot.task_id, snapshot.version)
+        else:
+            self._delta_cache.put(snapshot.task_id, snapshot.version, snapshot.id, *entry)
+
+    def _lazy_snapshot(self, row: tuple[Any, ...], chain_rows: list[Any] | None) -> LazySnapshot:
+        """Wrap a fetched row; ``chain_rows`` are its ``_CHAIN_SQL`` rows if it is a delta."""
+        task_id, id_, version, stored, checkpoint, created_at, _base, encoding, size = row
+        loader: Callable[[], dict[str, Any]]
+        if chain_rows is None:
+            loader = functools.partial(decode_payload, encoding, stored)
+        else:
+
+            def loader() -> dict[str, Any]:
+                return _copy_data(self._materialize_chain(task_id, version, chain_rows)[0])
+
+        return LazySnapshot(
+            id=id_,
+            task_id=task_id,
+            version=version,
+            checkpoint=bool(checkpoint),
+            created_at=_parse_created_at(created_at),
+            size=size,
+            loader=loader,
+        )
+
+    def _compact_updates(self, task_id: TaskID, rows: list[Any]) -> list[tuple[Any, ...]]:
+        """``_REENCODE_SQL`` params for the ``_COMPACT_ROWS_SQL`` rows that change."""
+        # Versions only patch against earlier ones, so one ascending pass
+        # rebuilds every version from data already materialized.
+        updates = []
+        materialized: dict[int, dict[str, Any]] = {}
+        base = None
+        for version, _id, stored_base, encoding, stored, checkpoint in rows:
+            value = decode_payload(encoding, stored)
+            data = value if stored_base is None else apply_patch(materialized[stored_base], value)
+            materialized[version] = data
+            base_version, target, depth = encode_version(
+                self._delta_interval, data, bool(checkpoint), base
+            )
+            payload = encode_payload(target, self._compression)
+            if (base_version, payload[0]) != (stored_base, encoding):
+                updates.append((payload[1], base_version, payload[0], task_id, version))
+            base = (version, data, depth)
+        return updates
+
+
+class _SQLiteSnapshotBackend(_SnapshotEncoding, AsyncSqliteRepository):
+    """Shared aiosqlite snapshot table access (internal).
 
     The base's idempotent ``_ensure_schema`` replaces the old per-connect
-    ``_ensure_snapshots_table`` (both are ``IF NOT EXISTS``).
+    ``_ensure_snapshots_table`` (both are ``IF NOT EXISTS``); this class extends
+    it with the column migration of :func:`_ensure_snapshots_schema`.
     """
 
-    def __init__(self, db_path: str | Path = DEFAULT_DB_PATH) -> None:
+    def __init__(
+        self,
+        db_path: str | Path = DEFAULT_DB_PATH,
+        *,
+        delta_interval: int | None = None,
+        delta_cache_size: int = DEFAULT_DELTA_CACHE_SIZE,
+        compression: str | None = None,
+    ) -> None:
         super().__init__(db_path, schema_ddl=_SNAPSHOTS_DDL)
+        self._configure_encoding(delta_interval, delta_cache_size, compression)
+
+    async def _ensure_schema(self, conn: aiosqlite.Connection) -> None:
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if self._initialized:
+                return
+            await _ensure_snapshots_schema(conn)
+            self._initialized = True
+
+    async def _chain_rows(
+        self, conn: aiosqlite.Connection, task_id: TaskID, version: int
+    ) -> list[Any]:
+        cursor = await conn.execute(_CHAIN_SQL, (task_id, version, task_id))
+        return list(await cursor.fetchall())
+
+    async def _materialize(
+        self, conn: aiosqlite.Connection, task_id: TaskID, version: int, snapshot_id: str
+    ) -> tuple[dict[str, Any], int]:
+        """Rebuild a stored version from its chain; cached data must not be mutated."""
+        hit = self._delta_cache.get(task_id, version, snapshot_id)
+        if hit is not None:
+            return hit
+        rows = await self._chain_rows(conn, task_id, version)
+        return self._materialize_chain(task_id, version, rows)
+
+    async def _rebase_dependents(
+        self, conn: aiosqlite.Connection, task_id: TaskID, version: int
+    ) -> None:
+        cursor = await conn.execute(_DEPENDENTS_SQL, (task_id, version))
+        for dependent, snapshot_id in await cursor.fetchall():
+            data, _depth = await self._materialize(conn, task_id, dependent, snapshot_id)
+            await conn.execute(_REENCODE_SQL, self._reencode_full(task_id, dependent, data))
 
     async def _save_impl(self, snapshot: StateSnapshot) -> None:
-        await self.execute(_SAVE_SQL, _snapshot_to_row(snapshot))
+        task_id, version = snapshot.task_id, snapshot.version
+        async with self.transaction() as conn:
+            await self._rebase_dependents(conn, task_id, version)
+            base = None
+            if self._delta_interval is not None and not snapshot.checkpoint:
+                cursor = await conn.execute(_PREDECESSOR_SQL, (task_id, version))
+                row = await cursor.fetchone()
+                if row is not None:
+                    base = (row[0], *await self._materialize(conn, task_id, row[0], row[1]))
+            params, entry = self._encode_save(snapshot, base)
+            await conn.execute(_SAVE_SQL, params)
+        self._cache_saved(snapshot, entry)
+
+    async def _fetch_row(
+        self, conn: aiosqlite.Connection, task_id: TaskID, version: int | None
+    ) -> tuple[Any, ...] | None:
+        if version is not None:
+            cursor = await conn.execute(_GET_BY_VERSION_SQL, (task_id, version))
+        else:
+            cursor = await conn.execute(_GET_LATEST_SQL, (task_id,))
+        row = await cursor.fetchone()
+        return tuple(row) if row is not None else None
 
     async def _get_impl(
         self,
         task_id: TaskID,
         version: int | None,
     ) -> StateSnapshot | None:
-        if version is not None:
-            row = await self.fetch_one(_GET_BY_VERSION_SQL, (task_id, version))
-        else:
-            row = await self.fetch_one(_GET_LATEST_SQL, (task_id,))
-        return _row_to_snapshot(row) if row is not None else None
+        async with self._connect(write=False) as conn:
+            row = await self._fetch_row(conn, task_id, version)
+            if row is None:
+                return None
+            if row[6] is None:
+                return _row_to_snapshot(row)
+            data, _depth = await self._materialize(conn, task_id, row[2], row[1])
+        return _row_to_snapshot(row, _copy_data(data))
+
+    async def _get_lazy_impl(self, task_id: TaskID, version: int | None) -> LazySnapshot | None:
+        async with self._connect(write=False) as conn:
+            row = await self._fetch_row(conn, task_id, version)
+            if row is None:
+                return None
+            chain = None if row[6] is None else await self._chain_rows(conn, task_id, row[2])
+        return self._lazy_snapshot(row, chain)
 
     async def _list_versions_impl(self, task_id: TaskID) -> list[int]:
         rows = await self.fetch_all(_LIST_VERSIONS_SQL, (task_id,))
         return [r[0] for r in rows]
 
+    async def _list_snapshots_impl(self, task_id: TaskID) -> list[SnapshotInfo]:
+        rows = await self.fetch_all(_LIST_SNAPSHOTS_SQL, (task_id,))
+        return [_row_to_info(r) for r in rows]
+
     async def _delete_impl(self, task_id: TaskID, version: int | None) -> bool:
         if version is not None:
-            affected = await self.execute(_DELETE_VERSION_SQL, (task_id, version))
+            async with self.transaction() as conn:
+                await self._rebase_dependents(conn, task_id, version)
+                cursor = await conn.execute(_DELETE_VERSION_SQL, (task_id, version))
+                affected = cursor.rowcount
+            self._delta_cache.discard(task_id, version)
         else:
             affected = await self.execute(_DELETE_TASK_SQL, (task_id,))
+            self._delta_cache.discard(task_id)
         return affected > 0
 
+    async def _compact_impl(self, task_id: TaskID | None) -> int:
+        if task_id is not None:
+            task_ids = [task_id]
+        else:
+            task_ids = [r[0] for r in await self.fetch_all(_SNAPSHOT_TASKS_SQL)]
+        changed = 0
+        for tid in task_ids:
+            async with self.transaction() as conn:
+                cursor = await conn.execute(_COMPACT_ROWS_SQL, (tid,))
+                updates = self._compact_updates(tid, list(await cursor.fetchall()))
+                await conn.executemany(_REENCODE_SQL, updates)
+            self._delta_cache.discard(tid)
+            changed += len(updates)
+        return changed
+
     async def initialize(self) -> None:
         """Create the snapshots table if it does not yet exist."""
         async with self._connect() as conn:
@@ -193,7 +789,11 @@ class _SQLiteSnapshotBackend(AsyncSqliteRepository):
 
 
 class SQLiteAsyncSnapshotStore(_SQLiteSnapshotBackend):
-    """SQLite :class:`~asap.state.snapshot.AsyncSnapshotStore` (``aiosqlite``)."""
+    """SQLite :class:`~asap.state.snapshot.AsyncSnapshotStore` (``aiosqlite``).
+
+    The store :func:`~asap.state.stores.create_snapshot_store` returns when
+    called from a running event loop.
+    """
 
     async def save(self, snapshot: StateSnapshot) -> None:
         """Persist a snapshot."""
@@ -215,13 +815,92 @@ class SQLiteAsyncSnapshotStore(_SQLiteSnapshotBackend):
         """Delete one version or all snapshots for ``task_id``."""
         return await _co_snapshot_delete(self, task_id, version)
 
+    async def get_lazy(
+        self,
+        task_id: TaskID,
+        version: int | None = None,
+    ) -> LazySnapshot | None:
+        """Like :meth:`get`, but ``data`` is decoded only when first accessed."""
+        return await self._get_lazy_impl(task_id, version)
+
+    async def list_snapshots(self, task_id: TaskID) -> list[SnapshotInfo]:
+        """List version metadata for ``task_id`` without reading any payload."""
+        return await self._list_snapshots_impl(task_id)
+
+    async def compact(self, task_id: TaskID | None = None) -> int:
+        """Re-encode stored versions under the store's settings; return rows rewritten."""
+        return await self._compact_impl(task_id)
 
-class SQLiteSnapshotStore(_SQLiteSnapshotBackend):
-    """SQLite :class:`~asap.state.snapshot.SnapshotStore`; sync methods use ``_run_sync``."""
+
+class SQLiteSnapshotStore(_SnapshotEncoding, SyncSqliteRepository):
+    """SQLite :class:`~asap.state.snapshot.SnapshotStore` on blocking ``sqlite3``.
+
+    Runs on the caller's thread: no event loop and no worker-thread hop per
+    call (earlier versions bridged to the aiosqlite backend through
+    ``_run_sync``). Same table, settings and encodings as
+    :class:`SQLiteAsyncSnapshotStore`, so both can share a file. The
+    ``*_async`` methods run the sync call via :func:`asyncio.to_thread`; async
+    code should prefer :class:`SQLiteAsyncSnapshotStore`.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = DEFAULT_DB_PATH,
+        *,
+        delta_interval: int | None = None,
+        delta_cache_size: int = DEFAULT_DELTA_CACHE_SIZE,
+        compression: str | None = None,
+    ) -> None:
+        super().__init__(db_path, schema_ddl=_SNAPSHOTS_DDL)
+        self._configure_encoding(delta_interval, delta_cache_size, compression)
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            _ensure_snapshots_schema_sync(conn)
+            self._initialized = True
+
+    def _chain_rows(self, conn: sqlite3.Connection, task_id: TaskID, version: int) -> list[Any]:
+        return conn.execute(_CHAIN_SQL, (task_id, version, task_id)).fetchall()
+
+    def _materialize(
+        self, conn: sqlite3.Connection, task_id: TaskID, version: int, snapshot_id: str
+    ) -> tuple[dict[str, Any], int]:
+        hit = self._delta_cache.get(task_id, version, snapshot_id)
+        if hit is not None:
+            return hit
+        return self._materialize_chain(task_id, version, self._chain_rows(conn, task_id, version))
+
+    def _rebase_dependents(self, conn: sqlite3.Connection, task_id: TaskID, version: int) -> None:
+        for dependent, snapshot_id in conn.execute(_DEPENDENTS_SQL, (task_id, version)).fetchall():
+            data, _depth = self._materialize(conn, task_id, dependent, snapshot_id)
+            conn.execute(_REENCODE_SQL, self._reencode_full(task_id, dependent, data))
+
+    def _fetch_row(
+        self, conn: sqlite3.Connection, task_id: TaskID, version: int | None
+    ) -> tuple[Any, ...] | None:
+        if version is not None:
+            row = conn.execute(_GET_BY_VERSION_SQL, (task_id, version)).fetchone()
+        else:
+            row = conn.execute(_GET_LATEST_SQL, (task_id,)).fetchone()
+        return tuple(row) if row is not None else None
 
     def save(self, snapshot: StateSnapshot) -> None:
         """Save a snapshot."""
-        _run_sync(_co_snapshot_save(self, snapshot))
+        task_id, version = snapshot.task_id, snapshot.version
+        with self.transaction() as conn:
+            self._rebase_dependents(conn, task_id, version)
+            base = None
+            if self._delta_interval is not None and not snapshot.checkpoint:
+                row = conn.execute(_PREDECESSOR_SQL, (task_id, version)).fetchone()
+                if row is not None:
+                    base = (row[0], *self._materialize(conn, task_id, row[0], row[1]))
+            params, entry = self._encode_save(snapshot, base)
+            conn.execute(_SAVE_SQL, params)
+        self._cache_saved(snapshot, entry)
 
     def get(
         self,
@@ -229,51 +908,134 @@ class SQLiteSnapshotStore(_SQLiteSnapshotBackend):
         version: int | None = None,
     ) -> StateSnapshot | None:
         """Get snapshot by task and optional version."""
-        return cast(
-            StateSnapshot | None,
-            _run_sync(_co_snapshot_get(self, task_id, version)),
-        )
+        with self._connect(write=False) as conn:
+            row = self._fetch_row(conn, task_id, version)
+            if row is None:
+                return None
+            if row[6] is None:
+                return _row_to_snapshot(row)
+            data, _depth = self._materialize(conn, task_id, row[2], row[1])
+        return _row_to_snapshot(row, _copy_data(data))
 
     def list_versions(self, task_id: TaskID) -> list[int]:
         """List versions for task."""
-        return cast(list[int], _run_sync(_co_snapshot_list_versions(self, task_id)))
+        return [r[0] for r in self.fetch_all(_LIST_VERSIONS_SQL, (task_id,))]
 
     def delete(self, task_id: TaskID, version: int | None = None) -> bool:
         """Delete snapshot(s) for task."""
-        return cast(bool, _run_sync(_co_snapshot_delete(self, task_id, version)))
+        if version is not None:
+            with self.transaction() as conn:
+                self._rebase_dependents(conn, task_id, version)
+                affected = conn.execute(_DELETE_VERSION_SQL, (task_id, version)).rowcount
+            self._delta_cache.discard(task_id, version)
+        else:
+            affected = self.execute(_DELETE_TASK_SQL, (task_id,))
+            self._delta_cache.discard(task_id)
+        return affected > 0
+
+    def get_lazy(
+        self,
+        task_id: TaskID,
+        version: int | None = None,
+    ) -> LazySnapshot | None:
+        """Get snapshot metadata now and ``data`` on first access."""
+        with self._connect(write=False) as conn:
+            row = self._fetch_row(conn, task_id, version)
+            if row is None:
+                return None
+            chain = None if row[6] is None else self._chain_rows(conn, task_id, row[2])
+        return self._lazy_snapshot(row, chain)
+
+    def list_snapshots(self, task_id: TaskID) -> list[SnapshotInfo]:
+        """List version metadata for task without reading any payload."""
+        return [_row_to_info(r) for r in self.fetch_all(_LIST_SNAPSHOTS_SQL, (task_id,))]
+
+    def compact(self, task_id: TaskID | None = None) -> int:
+        """Re-encode stored versions under the store's settings; return rows rewritten."""
+        if task_id is not None:
+            task_ids = [task_id]
+        else:
+            task_ids = [r[0] for r in self.fetch_all(_SNAPSHOT_TASKS_SQL)]
+        changed = 0
+        for tid in task_ids:
+            with self.transaction() as conn:
+                rows = conn.execute(_COMPACT_ROWS_SQL, (tid,)).fetchall()
+                updates = self._compact_updates(tid, rows)
+                conn.executemany(_REENCODE_SQL, updates)
+            self._delta_cache.discard(tid)
+            changed += len(updates)
+        return changed
+
+    def initialize(self) -> None:
+        """Create the snapshots table if it does not yet exist."""
+        with self._connect():
+            pass
 
     async def save_async(self, snapshot: StateSnapshot) -> None:
-        await _co_snapshot_save(self, snapshot)
+        await asyncio.to_thread(self.save, snapshot)
 
     async def get_async(
         self,
         task_id: TaskID,
         version: int | None = None,
     ) -> StateSnapshot | None:
-        return await _co_snapshot_get(self, task_id, version)
+        return await asyncio.to_thread(self.get, task_id, version)
 
     async def list_versions_async(self, task_id: TaskID) -> list[int]:
-        return await _co_snapshot_list_versions(self, task_id)
+        return await asyncio.to_thread(self.list_versions, task_id)
 
     async def delete_async(
         self,
         task_id: TaskID,
         version: int | None = None,
     ) -> bool:
-        return await _co_snapshot_delete(self, task_id, version)
+        return await asyncio.to_thread(self.delete, task_id, version)
+
+    async def get_lazy_async(
+        self,
+        task_id: TaskID,
+        version: int | None = None,
+    ) -> LazySnapshot | None:
+        return await asyncio.to_thread(self.get_lazy, task_id, version)
 
+    async def list_snapshots_async(self, task_id: TaskID) -> list[SnapshotInfo]:
+        return await asyncio.to_thread(self.list_snapshots, task_id)
 
-class SQLiteMeteringStore(AsyncSqliteRepository):
+    async def compact_async(self, task_id: TaskID | None = None) -> int:
+        return await asyncio.to_thread(self.compact, task_id)
+
+
+class SQLiteMeteringStore(_UsageEventsRepository):
     """SQLite-backed MeteringStore; usage events persist across restarts.
 
-    ``schema_ddl=_USAGE_EVENTS_DDL`` makes the base's ``_ensure_schema`` install both
+    ``_UsageEventsRepository`` makes the base's ``_ensure_schema`` install both
     indexes (agent + consumer) once per instance — preserving the S0 fix where the
     state store must not omit the consumer index. ``_ensure_usage_table`` delegates
     to the base so the DDL never runs twice on one instance.
+
+    Concurrent :meth:`record` calls are group-committed: rows are inserted with
+    one ``executemany`` per transaction (see :class:`GroupCommitWriter`).
+    ``record`` still returns only once its row is committed; call :meth:`flush`
+    on shutdown to drain rows recorded by tasks that are not awaited.
+
+    :meth:`aggregate` reads the agent's all-time totals from the day rollups.
     """
 
-    def __init__(self, db_path: str | Path = DEFAULT_DB_PATH) -> None:
-        super().__init__(db_path, schema_ddl=_USAGE_EVENTS_DDL)
+    def __init__(
+        self,
+        db_path: str | Path = DEFAULT_DB_PATH,
+        *,
+        commit_batch_size: int = DEFAULT_GROUP_COMMIT_MAX_BATCH,
+        commit_delay_seconds: float = DEFAULT_GROUP_COMMIT_DELAY,
+    ) -> None:
+        super().__init__(db_path)
+        self._writer: GroupCommitWriter[tuple[Any, ...], None] = GroupCommitWriter(
+            self,
+            _insert_event_rows,
+            name="usage_events",
+            max_batch_size=commit_batch_size,
+            max_delay_seconds=commit_delay_seconds,
+        )
 
     async def _ensure_usage_table(self, conn: aiosqlite.Connection) -> None:
         await self._ensure_schema(conn)
@@ -281,7 +1043,7 @@ class SQLiteMeteringStore(AsyncSqliteRepository):
     async def _record_impl(self, event: UsageEvent) -> None:
         event_id = f"evt_{generate_id()}"
         row = _event_to_row(event, event_id)
-        await self.execute(_INSERT_EVENT_SQL, row)
+        await self._writer.submit(row)
 
     async def _query_impl(
         self,
@@ -302,6 +1064,27 @@ class SQLiteMeteringStore(AsyncSqliteRepository):
         rows = await self.fetch_all(query, tuple(params))
         return [_row_to_event(r) for r in rows]
 
+    async def _query_page_impl(
+        self,
+        agent_id: str,
+        start: datetime,
+        end: datetime,
+        limit: int | None,
+        cursor: str | None,
+    ) -> Page[UsageEvent]:
+        # An empty key sorts before every (timestamp, id), so page one needs no
+        # separate statement.
+        after = decode_cursor(cursor, str, str) if cursor is not None else ("", "")
+        params = (
+            agent_id,
+            start.isoformat(),
+            end.isoformat(),
+            *after,
+            -1 if limit is None else limit + 1,
+        )
+        rows = await self.fetch_all(_QUERY_EVENTS_PAGE_SQL, params)
+        return page_from_rows(rows, limit, key=lambda r: (r[5], r[0]), to_item=_row_to_event)
+
     async def _aggregate_impl(self, agent_id: str, period: str) -> UsageAggregate:
         row = await self.fetch_one(_AGGREGATE_SQL, (agent_id,))
         if row is None or (row[0] is None and row[1] is None):
@@ -332,10 +1115,29 @@ class SQLiteMeteringStore(AsyncSqliteRepository):
             raise ValueError("offset must be non-negative")
         return await self._query_impl(agent_id, start, end, limit, offset)
 
+    async def query_page(
+        self,
+        agent_id: str,
+        start: datetime,
+        end: datetime,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Page[UsageEvent]:
+        """Query one page of events in range; pass ``next_cursor`` back as ``cursor``.
+
+        Pages resume after the ``(timestamp, id)`` of the previous page's last
+        event, so reading deep into history does not walk an ``OFFSET``.
+        """
+        return await self._query_page_impl(agent_id, start, end, limit, cursor)
+
     async def aggregate(self, agent_id: str, period: str) -> UsageAggregate:
         """Aggregate usage for agent."""
         return await self._aggregate_impl(agent_id, period)
 
+    async def flush(self) -> None:
+        """Wait until every event recorded so far is committed."""
+        await self._writer.flush()
+
     async def initialize(self) -> None:
         """Create usage_events table if not exists."""
         async with self._connect() as conn:
@@ -348,5 +1150,10 @@ __all__ = [
     "SQLiteMeteringStore",
     "SQLiteSnapshotStore",
     "_USAGE_EVENTS_DDL",
+    "_USAGE_ROLLUP_GRANULARITIES",
+    "_UsageEventsRepository",
     "_ensure_usage_events_schema",
+    "_insert_event_rows",
+    "_migrate_usage_events_columns",
+    "_migrate_usage_rollups",
 ]
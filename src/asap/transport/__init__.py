@@ -56,6 +56,7 @@ from asap.transport.client import (
 from asap.transport.compression import (
     COMPRESSION_THRESHOLD,
     CompressionAlgorithm,
+    ResponseCompressionPolicy,
     compress_payload,
     decompress_payload,
     get_accept_encoding_header,
@@ -109,6 +110,7 @@ __all__ = [
     # Compression
     "COMPRESSION_THRESHOLD",
     "CompressionAlgorithm",
+    "ResponseCompressionPolicy",
     "compress_payload",
     "decompress_payload",
     "get_accept_encoding_header",
@@ -10,6 +10,7 @@ from fastapi.responses import JSONResponse
 from asap.auth.agent_jwt import (
     HOST_REVOKED_ERROR,
     JwtVerifyResult,
+    VerifiedTokenCache,
     verify_host_jwt,
 )
 from asap.auth.identity import HostStore
@@ -20,6 +21,20 @@ from asap.auth.jti_replay_cache import JtiReplayCacheProtocol
 # so the helper stays decoupled from the server factory.
 _HOST_STORE_ATTR = "identity_host_store"
 _JWT_AUDIENCE_ATTR = "identity_jwt_audience"
+_VERIFIED_CACHE_ATTR = "identity_verified_token_cache"
+
+
+def verified_token_cache(request: Request) -> VerifiedTokenCache | None:
+    """Return the app's optional verified-JWT cache (absent on hand-built apps)."""
+    cache: VerifiedTokenCache | None = getattr(request.app.state, _VERIFIED_CACHE_ATTR, None)
+    return cache
+
+
+def invalidate_verified_agent(request: Request, agent_id: str) -> None:
+    """Drop cached Agent JWT verifications after ``agent_id`` is revoked or changed."""
+    cache = verified_token_cache(request)
+    if cache is not None:
+        cache.invalidate_agent(agent_id)
 
 
 def bearer_token_from_request(request: Request) -> str | None:
@@ -73,6 +88,7 @@ async def verify_host_bearer(
         expected_audience=expected_audience,
         jti_replay_cache=jti_replay_cache,
         record_jti=record_jti,
+        verified_cache=verified_token_cache(request),
     )
     if not result.ok:
         # ``verify_host_jwt`` short-circuits revoked hosts to ``ok=False`` with
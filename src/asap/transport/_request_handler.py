@@ -11,10 +11,14 @@ from ``_server`` at call time; other observability helpers are imported directly
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 import traceback
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import AbstractContextManager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any, TypeVar, Union
 
 from fastapi import HTTPException, Request
@@ -41,14 +45,17 @@ from asap.observability.tracing import (
 from asap.utils.sanitization import sanitize_nonce
 from asap.transport.middleware import AuthenticationMiddleware
 from asap.observability.metrics import MetricsCollector
+from asap.observability.profiling import NULL_STAGE, RequestProfiler, current_profile
 from asap.transport.handlers import HandlerNotFoundError
 from asap.transport.jsonrpc import (
     ASAP_METHOD,
+    DEFAULT_MAX_BATCH_CONCURRENCY,
     INTERNAL_ERROR,
     INVALID_PARAMS,
     INVALID_REQUEST,
     METHOD_NOT_FOUND,
     PARSE_ERROR,
+    AsapSendRequest,
     JsonRpcError,
     JsonRpcErrorResponse,
     JsonRpcRequest,
@@ -56,7 +63,18 @@ from asap.transport.jsonrpc import (
 )
 from asap.transport import lambda_codec
 from asap.transport.lambda_codec import LAMBDA_CONTENT_TYPE
-from asap.transport.compression import decompress_payload, get_supported_encodings
+from asap.transport.lambda_dictionary import LambdaDictionary
+from asap.transport.compression import (
+    CompressionAlgorithm,
+    DecompressedSizeExceeded,
+    IncrementalDecompressor,
+    ResponseCompressionPolicy,
+    StreamingCompressor,
+    compress_payload,
+    decompress_payload,
+    get_supported_encodings,
+    select_best_encoding,
+)
 from asap.transport.validators import (
     NonceStore,
     validate_envelope_nonce,
@@ -73,6 +91,10 @@ T = TypeVar("T")
 HandlerResult = tuple[T | None, JSONResponse | None]
 EnvelopeOrError = Union[JSONResponse, tuple[Envelope, str]]
 
+# Set while a batch is being processed so response builders skip per-item
+# rendering; the batch engine serializes all sub-responses in one pass.
+_batch_item_mode: ContextVar[bool] = ContextVar("asap_batch_item_mode", default=False)
+
 __all__ = [
     "ASAPRequestHandler",
     "_audit_log_operation",
@@ -107,6 +129,32 @@ def json_safe_validation_errors(exc: ValidationError) -> list[dict[str, Any]]:
     return loaded
 
 
+class _BatchItemResponse(JSONResponse):
+    """``JSONResponse`` that keeps its content unrendered (JSON-RPC batch sub-response)."""
+
+    content: Any
+
+    def render(self, content: Any) -> bytes:
+        self.content = content
+        return b""
+
+
+@dataclass(frozen=True)
+class _AuthOutcome:
+    """Authentication result resolved once and shared by every item of a batch."""
+
+    agent_id: str | None
+    error: HTTPException | None = None
+
+
+def _batch_item_content(response: Response) -> Any:
+    """Return the JSON content of a batch sub-response without re-parsing when possible."""
+    if isinstance(response, _BatchItemResponse):
+        return response.content
+    raw = response.body
+    return json.loads(bytes(raw) if isinstance(raw, memoryview) else raw)
+
+
 def _fallback_context(start_time: float) -> RequestContext:
     """Build a minimal :class:`RequestContext` for error handling before preparation.
 
@@ -123,6 +171,18 @@ def _fallback_context(start_time: float) -> RequestContext:
     )
 
 
+def _append_chunk(body: bytes | bytearray, chunk: bytes) -> bytes | bytearray:
+    """Append *chunk* to *body*, copying only once a second chunk arrives."""
+    if not chunk:
+        return body
+    if not body:
+        return chunk
+    if isinstance(body, bytes):
+        body = bytearray(body)
+    body += chunk
+    return body
+
+
 async def _audit_log_operation(
     app_state: Any,
     operation: str,
@@ -167,6 +227,13 @@ class ASAPRequestHandler:
         registry: Handler registry for payload dispatch
         manifest: Agent manifest for context
         auth_middleware: Optional authentication middleware
+        fast_ingest: When True, well-formed ``asap.send`` bodies are validated
+            straight from bytes (wrapper + envelope in one pass); malformed
+            bodies fall back to the regular path for canonical error responses
+        response_compression: Policy for gzip/brotli encoding of JSON-RPC and
+            SSE responses negotiated from ``Accept-Encoding``; None disables it
+        request_profiler: Optional per-stage profiler for ``POST /asap``
+            requests; None (default) disables stage timing
 
     Example:
         >>> handler = ASAPRequestHandler(RegistryHolder(registry), manifest, auth_middleware)
@@ -180,18 +247,41 @@ class ASAPRequestHandler:
         auth_middleware: AuthenticationMiddleware | None = None,
         max_request_size: int = MAX_REQUEST_SIZE,
         nonce_store: NonceStore | None = None,
+        fast_ingest: bool = False,
+        response_compression: ResponseCompressionPolicy | None = None,
+        request_profiler: RequestProfiler | None = None,
     ) -> None:
         self.registry_holder = registry_holder
         self.manifest = manifest
         self.auth_middleware = auth_middleware
         self.max_request_size = max_request_size
         self.nonce_store = nonce_store
+        self.fast_ingest = fast_ingest
+        self.response_compression = response_compression
+        self.request_profiler = request_profiler
+
+    def _stage(self, name: str) -> AbstractContextManager[None]:
+        """Time pipeline stage *name* when request profiling is enabled."""
+        if self.request_profiler is None:
+            return NULL_STAGE
+        return self.request_profiler.stage(name)
 
     def _normalize_payload_type_for_metrics(self, payload_type: str) -> str:
         if self.registry_holder.registry.has_handler(payload_type):
             return payload_type
         return "other"
 
+    def _json_response(
+        self,
+        content: Any,
+        *,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> JSONResponse:
+        """Build a JSON response; unrendered while a batch is being processed."""
+        response_class = _BatchItemResponse if _batch_item_mode.get() else JSONResponse
+        return response_class(status_code=status_code, content=content, headers=headers)
+
     def build_error_response(
         self,
         code: int,
@@ -202,7 +292,7 @@ class ASAPRequestHandler:
             error=JsonRpcError.from_code(code, data=data),
             id=request_id,
         )
-        return JSONResponse(status_code=200, content=error_response.model_dump())
+        return self._json_response(error_response.model_dump())
 
     def build_jsonrpc_error_for_asap_exception(
         self,
@@ -226,10 +316,8 @@ class ASAPRequestHandler:
             id=request_id,
         )
         if extra_headers:
-            return JSONResponse(
-                status_code=200, content=payload.model_dump(), headers=extra_headers
-            )
-        return JSONResponse(status_code=200, content=payload.model_dump())
+            return self._json_response(payload.model_dump(), headers=extra_headers)
+        return self._json_response(payload.model_dump())
 
     def record_error_metrics(
         self,
@@ -296,6 +384,9 @@ class ASAPRequestHandler:
 
         # Extract envelope from params
         envelope_data = rpc_request.params.get("envelope")
+        if isinstance(envelope_data, Envelope):
+            # Already validated from the raw body by the fast ingest path.
+            return envelope_data, envelope_data.payload_type
         if envelope_data is None:
             _server.logger.warning("asap.request.missing_envelope")
             error_response = self.build_error_response(
@@ -392,7 +483,7 @@ class ASAPRequestHandler:
                 ctx.metrics, payload_type, "thread_pool_exhausted", duration_seconds
             )
             # Return HTTP 503 Service Unavailable (not JSON-RPC error)
-            return JSONResponse(
+            return self._json_response(
                 status_code=503,
                 content={
                     "error": "Service Temporarily Unavailable",
@@ -427,34 +518,54 @@ class ASAPRequestHandler:
         self,
         request: Request,
         ctx: RequestContext,
+        outcome: _AuthOutcome | None = None,
     ) -> HandlerResult[str]:
         if self.auth_middleware is None:
             return None, None
 
+        if outcome is not None:
+            # Batch items reuse the result resolved once for the HTTP request.
+            if outcome.error is not None:
+                return None, self._auth_error_response(outcome.error, ctx)
+            return outcome.agent_id, None
+
         try:
             authenticated_agent_id = await self.auth_middleware.verify_authentication(request)
             return authenticated_agent_id, None
         except HTTPException as e:
-            # Authentication failed - return JSON-RPC error
-            _server.logger.warning(
-                "asap.request.auth_failed",
-                status_code=e.status_code,
-                detail=e.detail,
-            )
-            # Map HTTP status to JSON-RPC error code
-            error_code = INVALID_REQUEST if e.status_code == 401 else INVALID_PARAMS
-            error_response = self.build_error_response(
-                error_code,
-                data={"error": str(e.detail), "status_code": e.status_code},
-                request_id=ctx.request_id,
-            )
-            self.record_error_metrics(
-                ctx.metrics,
-                "unknown",
-                "auth_failed",
-                time.perf_counter() - ctx.start_time,
-            )
-            return None, error_response
+            return None, self._auth_error_response(e, ctx)
+
+    def _auth_error_response(self, e: HTTPException, ctx: RequestContext) -> JSONResponse:
+        # Authentication failed - return JSON-RPC error
+        _server.logger.warning(
+            "asap.request.auth_failed",
+            status_code=e.status_code,
+            detail=e.detail,
+        )
+        # Map HTTP status to JSON-RPC error code
+        error_code = INVALID_REQUEST if e.status_code == 401 else INVALID_PARAMS
+        error_response = self.build_error_response(
+            error_code,
+            data={"error": str(e.detail), "status_code": e.status_code},
+            request_id=ctx.request_id,
+        )
+        self.record_error_metrics(
+            ctx.metrics,
+            "unknown",
+            "auth_failed",
+            time.perf_counter() - ctx.start_time,
+        )
+        return error_response
+
+    async def _resolve_batch_auth(self, request: Request) -> _AuthOutcome:
+        """Authenticate the HTTP request once on behalf of all batch items."""
+        if self.auth_middleware is None:
+            return _AuthOutcome(agent_id=None)
+        try:
+            agent_id = await self.auth_middleware.verify_authentication(request)
+        except HTTPException as e:
+            return _AuthOutcome(agent_id=None, error=e)
+        return _AuthOutcome(agent_id=agent_id)
 
     def _verify_sender_matches_auth(
         self,
@@ -493,6 +604,7 @@ class ASAPRequestHandler:
         ctx: RequestContext,
         payload_type: str,
         accept_lambda: bool = False,
+        lambda_dictionary: LambdaDictionary | None = None,
     ) -> Response:
         response_envelope = inject_envelope_trace_context(response_envelope)
         duration_seconds = time.perf_counter() - ctx.start_time
@@ -536,16 +648,26 @@ class ASAPRequestHandler:
 
         if accept_lambda and lambda_codec.is_available():
             try:
-                encoded_body = lambda_codec.encode(rpc_response.model_dump_json(by_alias=True))
+                json_body = rpc_response.model_dump_json(by_alias=True)
+                if lambda_dictionary is not None:
+                    encoded_body = lambda_codec.encode_v2(json_body, lambda_dictionary)
+                else:
+                    encoded_body = lambda_codec.encode(json_body)
+                media_type = (
+                    lambda_codec.content_type_for(lambda_dictionary)
+                    if encoded_body.startswith("λ2:")
+                    else LAMBDA_CONTENT_TYPE
+                )
                 _server.logger.debug(
                     "asap.server.lambda_response",
                     envelope_id=response_envelope.id,
                     encoded_size=len(encoded_body),
+                    media_type=media_type,
                 )
                 return Response(
                     status_code=200,
                     content=encoded_body,
-                    media_type=LAMBDA_CONTENT_TYPE,
+                    media_type=media_type,
                 )
             except Exception as e:
                 _server.logger.warning(
@@ -556,11 +678,96 @@ class ASAPRequestHandler:
                 )
                 # Fall through to JSON response
 
-        return JSONResponse(
-            status_code=200,
-            content=rpc_response.model_dump(),
+        return self._json_response(rpc_response.model_dump())
+
+    def _record_compression_metrics(
+        self,
+        metrics: MetricsCollector,
+        algorithm: CompressionAlgorithm,
+        endpoint: str,
+        original_size: int,
+        compressed_size: int,
+        cpu_seconds: float,
+    ) -> None:
+        labels = {"encoding": algorithm.value, "endpoint": endpoint}
+        metrics.increment_counter("asap_response_uncompressed_bytes_total", labels, original_size)
+        metrics.increment_counter("asap_response_compressed_bytes_total", labels, compressed_size)
+        if original_size:
+            metrics.observe_histogram(
+                "asap_response_compression_ratio", compressed_size / original_size, labels
+            )
+        metrics.observe_histogram("asap_response_compression_cpu_seconds", cpu_seconds, labels)
+
+    def _compress_response(
+        self,
+        response: Response,
+        accept_encoding: str | None,
+        metrics: MetricsCollector,
+        payload_type: str | None = None,
+    ) -> Response:
+        """Return *response* gzip/brotli encoded when policy and client allow it.
+
+        Only rendered JSON responses are compressed. The size threshold comes
+        from the policy entry for *payload_type* (the policy default when None);
+        bodies that do not shrink are returned unchanged.
+        """
+        policy = self.response_compression
+        if policy is None or not accept_encoding or type(response) is not JSONResponse:
+            return response
+        threshold = policy.threshold if payload_type is None else policy.threshold_for(payload_type)
+        if threshold is None or len(response.body) < threshold:
+            return response
+        algorithm = select_best_encoding(accept_encoding)
+        if algorithm == CompressionAlgorithm.IDENTITY:
+            return response
+
+        body = bytes(response.body)
+        started = time.thread_time()
+        compressed, used = compress_payload(body, algorithm, threshold=threshold)
+        cpu_seconds = time.thread_time() - started
+        if used == CompressionAlgorithm.IDENTITY:
+            return response
+        self._record_compression_metrics(
+            metrics, used, "/asap", len(body), len(compressed), cpu_seconds
+        )
+        return Response(
+            status_code=response.status_code,
+            content=compressed,
+            media_type=response.media_type,
+            headers={"Content-Encoding": used.value, "Vary": "Accept-Encoding"},
         )
 
+    def _stream_encoding(self, accept_encoding: str | None) -> CompressionAlgorithm:
+        policy = self.response_compression
+        if policy is None or not policy.compress_streams:
+            return CompressionAlgorithm.IDENTITY
+        return select_best_encoding(accept_encoding)
+
+    async def _compress_stream(
+        self,
+        events: AsyncIterator[bytes],
+        algorithm: CompressionAlgorithm,
+        metrics: MetricsCollector,
+    ) -> AsyncIterator[bytes]:
+        """Compress an SSE byte stream, flushing after every event."""
+        compressor = StreamingCompressor(algorithm)
+        try:
+            async for chunk in events:
+                yield compressor.compress(chunk)
+            yield compressor.finish()
+        finally:
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            self._record_compression_metrics(
+                metrics,
+                algorithm,
+                "/asap/stream",
+                compressor.input_size,
+                compressor.output_size,
+                compressor.cpu_seconds,
+            )
+
     def _handle_internal_error(
         self,
         error: Exception,
@@ -595,16 +802,13 @@ class ASAPRequestHandler:
             error=JsonRpcError.from_code(INTERNAL_ERROR, data=error_data),
             id=ctx.request_id,
         )
-        return JSONResponse(
-            status_code=200,
-            content=internal_error.model_dump(),
-        )
+        return self._json_response(internal_error.model_dump())
 
     def _log_request_debug(self, rpc_request: JsonRpcRequest) -> None:
         """Log full JSON-RPC request when ASAP_DEBUG_LOG is enabled (structured JSON)."""
         if not _server.is_debug_log_mode():
             return
-        request_dict: dict[str, Any] = rpc_request.model_dump()
+        request_dict: dict[str, Any] = rpc_request.model_dump(mode="json")
         if not is_debug_mode():
             request_dict = sanitize_for_logging(request_dict)
         _server.logger.info("asap.request.debug_request", request_json=request_dict)
@@ -613,14 +817,21 @@ class ASAPRequestHandler:
         """Log full response when ASAP_DEBUG_LOG is enabled (structured JSON)."""
         if not _server.is_debug_log_mode():
             return
-        try:
-            body_bytes = response.body
-            # Handle both bytes and memoryview
-            if isinstance(body_bytes, memoryview):
-                body_bytes = body_bytes.tobytes()
-            response_dict: dict[str, Any] = json.loads(body_bytes.decode("utf-8"))
-        except (ValueError, AttributeError):
-            response_dict = {"_raw": "(unable to decode response body)"}
+        response_dict: dict[str, Any]
+        if isinstance(response, _BatchItemResponse):
+            response_dict = response.content
+        else:
+            try:
+                body_bytes = response.body
+                # Handle both bytes and memoryview
+                if isinstance(body_bytes, memoryview):
+                    body_bytes = body_bytes.tobytes()
+                content_encoding = response.headers.get("content-encoding")
+                if content_encoding:
+                    body_bytes = decompress_payload(body_bytes, content_encoding)
+                response_dict = json.loads(body_bytes.decode("utf-8"))
+            except (ValueError, OSError, AttributeError):
+                response_dict = {"_raw": "(unable to decode response body)"}
         if not is_debug_mode():
             response_dict = sanitize_for_logging(response_dict)
         _server.logger.info(
@@ -635,13 +846,20 @@ class ASAPRequestHandler:
     ) -> HandlerResult[JsonRpcRequest]:
         # Parse JSON body
         try:
-            body = await self.parse_json_body(request)
+            if self.fast_ingest:
+                body_bytes = await self.read_body_bytes(request)
+                fast_request = self._fast_validate_jsonrpc_request(body_bytes)
+                if fast_request is not None:
+                    return fast_request, None
+                body = self._decode_json_body(body_bytes)
+            else:
+                body = await self.parse_json_body(request)
         except HTTPException as e:
             # HTTPException (e.g., 413 Payload Too Large) should be returned directly
             # Don't convert to JSON-RPC error response
-            return None, JSONResponse(
+            return None, self._json_response(
+                {"detail": e.detail},
                 status_code=e.status_code,
-                content={"detail": e.detail},
                 headers=e.headers if hasattr(e, "headers") else None,
             )
         except ValueError as e:
@@ -656,6 +874,10 @@ class ASAPRequestHandler:
             self.record_error_metrics(temp_metrics, "unknown", "parse_error", 0.0)
             return None, error_response
 
+        return self._validate_parsed_body(body)
+
+    def _validate_parsed_body(self, body: Any) -> HandlerResult[JsonRpcRequest]:
+        """Validate an already-decoded JSON-RPC body (single request or batch item)."""
         if not isinstance(body, dict):
             error_response = self.build_error_response(
                 INVALID_REQUEST,
@@ -739,6 +961,27 @@ class ASAPRequestHandler:
             HTTPException: If Content-Encoding is unsupported (415)
             ValueError: If JSON is invalid
         """
+        body_bytes = await self.read_body_bytes(request)
+        return self._decode_json_body(body_bytes)
+
+    async def read_body_bytes(self, request: Request) -> bytes | bytearray:
+        """Read the raw request body with size validation and decompression.
+
+        Shared by :meth:`parse_json_body` and the fast ingest path, which
+        validates the returned bytes directly instead of building a dict first.
+
+        Args:
+            request: FastAPI request object
+
+        Returns:
+            Body bytes after Content-Encoding decompression (a ``bytearray``
+            when the body arrived in several chunks or was decompressed)
+
+        Raises:
+            HTTPException: If request size exceeds maximum (413)
+            HTTPException: If Content-Encoding is unsupported (415)
+            HTTPException: If the compressed body cannot be decoded (400)
+        """
         content_encoding = request.headers.get("content-encoding", "").lower().strip()
         supported_encodings = get_supported_encodings() + ["identity", ""]
         if content_encoding and content_encoding not in supported_encodings:
@@ -752,74 +995,85 @@ class ASAPRequestHandler:
                 detail=f"Unsupported Content-Encoding: {content_encoding}. Supported: {', '.join(get_supported_encodings())}",
             )
 
+        # A single-chunk body (the common case) is returned as-is without copying;
+        # further chunks are appended to one growable buffer. Compressed bodies
+        # are inflated chunk by chunk and abort as soon as the limit is crossed.
+        decompressor: IncrementalDecompressor | None = None
+        body: bytes | bytearray = b""
+        received_size = 0
         try:
-            body_bytes = bytearray()
+            if content_encoding not in ("identity", ""):
+                decompressor = IncrementalDecompressor(content_encoding, self.max_request_size)
             async for chunk in request.stream():
-                body_bytes.extend(chunk)
-                if len(body_bytes) > self.max_request_size:
+                received_size += len(chunk)
+                if received_size > self.max_request_size:
                     _server.logger.warning(
                         "asap.request.size_exceeded",
-                        actual_size=len(body_bytes),
+                        actual_size=received_size,
                         max_size=self.max_request_size,
                     )
                     raise HTTPException(
                         status_code=413,
-                        detail=f"Request size ({len(body_bytes)} bytes) exceeds maximum ({self.max_request_size} bytes)",
+                        detail=f"Request size ({received_size} bytes) exceeds maximum ({self.max_request_size} bytes)",
                     )
+                if decompressor is not None:
+                    chunk = decompressor.decompress(chunk)
+                body = _append_chunk(body, chunk)
+            if decompressor is not None:
+                body = _append_chunk(body, decompressor.finish())
+        except DecompressedSizeExceeded as e:
+            compressed_size = decompressor.compressed_size if decompressor is not None else 0
+            compression_ratio = e.decompressed_size / compressed_size if compressed_size > 0 else 0
+            _server.logger.warning(
+                "asap.request.decompressed_size_exceeded",
+                decompressed_size=e.decompressed_size,
+                original_compressed_size=compressed_size,
+                compression_ratio=round(compression_ratio, 2),
+                max_size=self.max_request_size,
+            )
+            raise HTTPException(
+                status_code=413,
+                detail=f"Decompressed request size (at least {e.decompressed_size} bytes) exceeds maximum ({self.max_request_size} bytes)",
+            ) from e
+        except ValueError as e:
+            # Decompression failed (invalid compressed data or unsupported encoding)
+            _server.logger.warning(
+                "asap.request.decompression_failed",
+                content_encoding=content_encoding,
+                error=str(e),
+            )
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to decompress request: {e}",
+            ) from e
+        except (OSError, EOFError) as e:
+            # Invalid gzip/brotli data (OSError) or truncated data (EOFError)
+            _server.logger.warning(
+                "asap.request.invalid_compressed_data",
+                content_encoding=content_encoding,
+                error=str(e),
+            )
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid compressed data: {e}",
+            ) from e
 
-            # Decompress if Content-Encoding is specified
-            if content_encoding and content_encoding not in ("identity", ""):
-                try:
-                    compressed_size = len(body_bytes)
-                    body_bytes = bytearray(decompress_payload(bytes(body_bytes), content_encoding))
-                    decompressed_size = len(body_bytes)
-
-                    _server.logger.debug(
-                        "asap.request.decompressed",
-                        content_encoding=content_encoding,
-                        compressed_size=compressed_size,
-                        decompressed_size=decompressed_size,
-                    )
+        if decompressor is not None:
+            _server.logger.debug(
+                "asap.request.decompressed",
+                content_encoding=content_encoding,
+                compressed_size=decompressor.compressed_size,
+                decompressed_size=decompressor.decompressed_size,
+            )
+        return body
 
-                    if decompressed_size > self.max_request_size:
-                        compression_ratio = (
-                            decompressed_size / compressed_size if compressed_size > 0 else 0
-                        )
-                        _server.logger.warning(
-                            "asap.request.decompressed_size_exceeded",
-                            decompressed_size=decompressed_size,
-                            original_compressed_size=compressed_size,
-                            compression_ratio=round(compression_ratio, 2),
-                            max_size=self.max_request_size,
-                        )
-                        raise HTTPException(
-                            status_code=413,
-                            detail=f"Decompressed request size ({decompressed_size} bytes) exceeds maximum ({self.max_request_size} bytes)",
-                        )
-                except ValueError as e:
-                    # Decompression failed (invalid compressed data or unsupported encoding)
-                    _server.logger.warning(
-                        "asap.request.decompression_failed",
-                        content_encoding=content_encoding,
-                        error=str(e),
-                    )
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Failed to decompress request: {e}",
-                    ) from e
-                except (OSError, EOFError) as e:
-                    # Invalid gzip/brotli data (OSError) or truncated data (EOFError)
-                    _server.logger.warning(
-                        "asap.request.invalid_compressed_data",
-                        content_encoding=content_encoding,
-                        error=str(e),
-                    )
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid compressed data: {e}",
-                    ) from e
+    def _decode_json_body(self, body_bytes: bytes | bytearray) -> dict[str, Any]:
+        """Decode UTF-8 JSON *body_bytes*; raise ``ValueError`` on invalid input.
 
-            # Parse JSON from bytes
+        Invalid UTF-8 is reported separately from malformed JSON. Bodies that
+        pass ``_fast_validate_jsonrpc_request`` never reach this slower path.
+        """
+        try:
             body: dict[str, Any] = json.loads(body_bytes.decode("utf-8"))
             return body
         except UnicodeDecodeError as e:
@@ -829,6 +1083,22 @@ class ASAPRequestHandler:
             _server.logger.warning("asap.request.invalid_json", error=str(e))
             raise ValueError(f"Invalid JSON: {e}") from e
 
+    def _fast_validate_jsonrpc_request(
+        self, body_bytes: bytes | bytearray
+    ) -> JsonRpcRequest | None:
+        """Validate an ``asap.send`` request and its envelope straight from bytes.
+
+        Returns a :class:`JsonRpcRequest` whose ``params["envelope"]`` is the
+        validated :class:`Envelope`, or None when the body does not validate so
+        the caller can run the regular dict-based path (which builds the
+        canonical JSON-RPC error and ``validation_errors``).
+        """
+        try:
+            fast_request = AsapSendRequest.model_validate_json(body_bytes)
+        except ValidationError:
+            return None
+        return fast_request.to_jsonrpc_request()
+
     def validate_jsonrpc_request(
         self, body: dict[str, Any]
     ) -> tuple[JsonRpcRequest | None, JSONResponse | None]:
@@ -907,11 +1177,152 @@ class ASAPRequestHandler:
             >>> response = await handler.handle_message(request)
         """
         start_time = time.perf_counter()
+
+        async def prepare() -> PreparedRequest | Response:
+            return await self._prepare_request(request, start_time)
+
+        accept_header = request.headers.get("accept", "")
+        accept_lambda = LAMBDA_CONTENT_TYPE in accept_header
+        return await self._process_message(
+            request,
+            start_time,
+            prepare,
+            accept_lambda=accept_lambda,
+            lambda_dictionary=(
+                lambda_codec.select_dictionary(accept_header) if accept_lambda else None
+            ),
+            accept_encoding=request.headers.get("accept-encoding"),
+        )
+
+    async def handle_batch(
+        self,
+        request: Request,
+        items: list[Any],
+        *,
+        max_concurrency: int = DEFAULT_MAX_BATCH_CONCURRENCY,
+    ) -> Response:
+        """Process already-parsed JSON-RPC batch items and return one array response.
+
+        Authentication runs once for the HTTP request and its result is shared
+        by every item. Items go through the same validation, dispatch, metrics
+        and audit steps as :meth:`handle_message`, at most *max_concurrency* at
+        a time; sub-responses are kept unrendered and the combined array is
+        serialized in a single pass (and compressed as a whole when the
+        response compression policy allows). Item failures never abort the batch.
+
+        Args:
+            request: FastAPI request carrying the batch (headers, app state)
+            items: Decoded batch array (callers enforce empty/size limits)
+            max_concurrency: Maximum number of items dispatched concurrently
+
+        Returns:
+            JSON array of JSON-RPC responses, in item order
+        """
+        auth_outcome = await self._resolve_batch_auth(request)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_item(item: Any) -> Any:
+            async with semaphore:
+                return await self._handle_batch_item(request, item, auth_outcome)
+
+        token = _batch_item_mode.set(True)
+        try:
+            results = await asyncio.gather(*(run_item(item) for item in items))
+        finally:
+            _batch_item_mode.reset(token)
+        return self._compress_response(
+            JSONResponse(status_code=200, content=results),
+            request.headers.get("accept-encoding"),
+            get_metrics(),
+        )
+
+    async def _handle_batch_item(
+        self,
+        request: Request,
+        item: Any,
+        auth_outcome: _AuthOutcome,
+    ) -> Any:
+        """Run one batch item through the message pipeline; return its JSON content."""
+        if not isinstance(item, dict):
+            invalid_item = JsonRpcErrorResponse(
+                error=JsonRpcError.from_code(INVALID_REQUEST),
+                id=None,
+            )
+            return invalid_item.model_dump()
+
+        start_time = time.perf_counter()
+
+        async def prepare() -> PreparedRequest | Response:
+            with self._stage("parse"):
+                rpc_request, validation_error = self._validate_parsed_body(item)
+            if validation_error is not None:
+                self._log_response_debug(validation_error)
+                return validation_error
+            if rpc_request is None:
+                raise RuntimeError("Internal error: rpc_request is None after validation")
+            return await self._prepare_rpc_request(
+                request, rpc_request, start_time, auth_outcome=auth_outcome
+            )
+
+        response = await self._process_message(request, start_time, prepare, accept_lambda=False)
+        return _batch_item_content(response)
+
+    async def _process_message(
+        self,
+        request: Request,
+        start_time: float,
+        prepare: Callable[[], Awaitable[PreparedRequest | Response]],
+        *,
+        accept_lambda: bool,
+        lambda_dictionary: LambdaDictionary | None = None,
+        accept_encoding: str | None = None,
+    ) -> Response:
+        """Prepare, dispatch, audit and wrap one JSON-RPC request.
+
+        Shared by :meth:`handle_message` and the batch engine; *prepare* runs
+        the parse/validation/auth gate and returns a :class:`PreparedRequest`
+        or an error ``Response``. Success responses are compressed for
+        *accept_encoding* according to the handler's compression policy.
+        """
+        profiler = self.request_profiler
+        if profiler is None:
+            return await self._run_message(
+                request,
+                start_time,
+                prepare,
+                accept_lambda=accept_lambda,
+                lambda_dictionary=lambda_dictionary,
+                accept_encoding=accept_encoding,
+            )
+        profile, token = profiler.start()
+        try:
+            return await self._run_message(
+                request,
+                start_time,
+                prepare,
+                accept_lambda=accept_lambda,
+                lambda_dictionary=lambda_dictionary,
+                accept_encoding=accept_encoding,
+            )
+        finally:
+            profiler.finish(profile, token)
+
+    async def _run_message(
+        self,
+        request: Request,
+        start_time: float,
+        prepare: Callable[[], Awaitable[PreparedRequest | Response]],
+        *,
+        accept_lambda: bool,
+        lambda_dictionary: LambdaDictionary | None,
+        accept_encoding: str | None,
+    ) -> Response:
+        """Body of :meth:`_process_message`, run inside the active request profile."""
         payload_type = "unknown"
         ctx: RequestContext | None = None
 
         try:
-            prepared = await self._prepare_request(request, start_time)
+            prepared = await prepare()
             if isinstance(prepared, Response):
                 self._log_response_debug(prepared)
                 return prepared
@@ -920,33 +1331,43 @@ class ASAPRequestHandler:
             payload_type = envelope.payload_type
 
             try:
-                dispatch_result = await self._dispatch_to_handler(envelope, ctx)
+                with self._stage("dispatch"):
+                    dispatch_result = await self._dispatch_to_handler(envelope, ctx)
                 if isinstance(dispatch_result, JSONResponse):
                     self._log_response_debug(dispatch_result)
                     return dispatch_result
                 response_envelope, payload_type = dispatch_result
 
-                accept_header = request.headers.get("accept", "")
-                accept_lambda = LAMBDA_CONTENT_TYPE in accept_header
-
                 try:
-                    await _audit_log_operation(
-                        request.app.state,
-                        operation=payload_type,
-                        agent_urn=envelope.sender,
-                        details={
-                            "envelope_id": envelope.id,
-                            "response_id": response_envelope.id,
-                        },
-                    )
+                    with self._stage("audit"):
+                        await _audit_log_operation(
+                            request.app.state,
+                            operation=payload_type,
+                            agent_urn=envelope.sender,
+                            details={
+                                "envelope_id": envelope.id,
+                                "response_id": response_envelope.id,
+                            },
+                        )
                 except Exception:
                     _server.logger.warning("asap.audit.log_failed", exc_info=True)
 
-                success_resp = self._build_success_response(
-                    response_envelope, ctx, payload_type, accept_lambda=accept_lambda
-                )
+                with self._stage("serialize"):
+                    success_resp = self._build_success_response(
+                        response_envelope,
+                        ctx,
+                        payload_type,
+                        accept_lambda=accept_lambda,
+                        lambda_dictionary=lambda_dictionary,
+                    )
                 self._log_response_debug(success_resp)
-                return success_resp
+                with self._stage("compress"):
+                    return self._compress_response(
+                        success_resp,
+                        accept_encoding,
+                        ctx.metrics,
+                        response_envelope.payload_type,
+                    )
             finally:
                 self._detach_trace(prepared.trace_token)
 
@@ -1003,9 +1424,8 @@ class ASAPRequestHandler:
         Returns:
             ``PreparedRequest`` on success, or a JSON-RPC error ``Response``.
         """
-        metrics = get_metrics()
-
-        parse_result = await self._parse_and_validate_request(request)
+        with self._stage("parse"):
+            parse_result = await self._parse_and_validate_request(request)
         rpc_request, parse_error = parse_result
         if parse_error is not None:
             self._log_response_debug(parse_error)
@@ -1013,6 +1433,25 @@ class ASAPRequestHandler:
         if rpc_request is None:
             raise RuntimeError("Internal error: rpc_request is None after validation")
 
+        return await self._prepare_rpc_request(
+            request, rpc_request, start_time, received_log_event=received_log_event
+        )
+
+    async def _prepare_rpc_request(
+        self,
+        request: Request,
+        rpc_request: JsonRpcRequest,
+        start_time: float,
+        *,
+        received_log_event: str = "asap.request.received",
+        auth_outcome: _AuthOutcome | None = None,
+    ) -> PreparedRequest | Response:
+        """Run the post-parse part of :meth:`_prepare_request` for a validated request.
+
+        *auth_outcome*, when given, replaces the per-request call to the auth
+        middleware (the batch engine authenticates the HTTP request once).
+        """
+        metrics = get_metrics()
         self._log_request_debug(rpc_request)
 
         ctx = RequestContext(
@@ -1022,34 +1461,46 @@ class ASAPRequestHandler:
             rpc_request=rpc_request,
         )
 
-        auth_result = await self._authenticate_request(request, ctx)
+        profile = current_profile()
+        if profile is not None:
+            profile.request_id = rpc_request.id
+
+        with self._stage("auth"):
+            auth_result = await self._authenticate_request(request, ctx, auth_outcome)
         authenticated_agent_id, auth_error = auth_result
         if auth_error is not None:
             self._log_response_debug(auth_error)
             return auth_error
 
-        envelope_result = self._validate_envelope(ctx)
+        with self._stage("envelope"):
+            envelope_result = self._validate_envelope(ctx)
         if isinstance(envelope_result, JSONResponse):
             self._log_response_debug(envelope_result)
             return envelope_result
         envelope, payload_type = envelope_result
-
-        trace_token = extract_and_activate_envelope_trace_context(envelope)
-        sender_error = self._verify_sender_matches_auth(
-            authenticated_agent_id, envelope, ctx, payload_type
-        )
+        if profile is not None:
+            profile.payload_type = payload_type
+
+        with self._stage("trace"):
+            trace_token = extract_and_activate_envelope_trace_context(envelope)
+        with self._stage("sender"):
+            sender_error = self._verify_sender_matches_auth(
+                authenticated_agent_id, envelope, ctx, payload_type
+            )
         if sender_error is not None:
             self._log_response_debug(sender_error)
             self._detach_trace(trace_token)
             return sender_error
 
-        timestamp_error = self._validate_timestamp(envelope, ctx, payload_type)
+        with self._stage("timestamp"):
+            timestamp_error = self._validate_timestamp(envelope, ctx, payload_type)
         if timestamp_error is not None:
             self._log_response_debug(timestamp_error)
             self._detach_trace(trace_token)
             return timestamp_error
 
-        nonce_error = self._validate_nonce(envelope, ctx, payload_type)
+        with self._stage("nonce"):
+            nonce_error = self._validate_nonce(envelope, ctx, payload_type)
         if nonce_error is not None:
             self._log_response_debug(nonce_error)
             self._detach_trace(trace_token)
@@ -1172,6 +1623,7 @@ class ASAPRequestHandler:
         """Handle ASAP streaming: JSON-RPC body, SSE ``text/event-stream`` response.
 
         Each event body is one ``Envelope`` (typically ``TaskStream``) as JSON on a ``data:`` line.
+        When the client accepts gzip/brotli the stream is compressed and flushed per event.
         """
         start_time = time.perf_counter()
         payload_type = "unknown"
@@ -1219,13 +1671,21 @@ class ASAPRequestHandler:
                     if trace_token is not None:
                         context.detach(trace_token)
 
+            events: AsyncIterator[bytes] = sse_events()
+            headers = {
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+            }
+            encoding = self._stream_encoding(request.headers.get("accept-encoding"))
+            if encoding != CompressionAlgorithm.IDENTITY:
+                events = self._compress_stream(events, encoding, ctx.metrics)
+                headers["Content-Encoding"] = encoding.value
+                headers["Vary"] = "Accept-Encoding"
+
             return StreamingResponse(
-                sse_events(),
+                events,
                 media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                },
+                headers=headers,
             )
         except Exception as e:
             error_ctx = ctx if ctx is not None else _fallback_context(start_time)
@@ -51,7 +51,7 @@ from asap.auth.identity import (
 from asap.models.base import ASAPBaseModel
 from asap.models.ids import generate_id
 from asap.observability import get_logger
-from asap.transport._auth_helpers import verify_host_bearer
+from asap.transport._auth_helpers import invalidate_verified_agent, verify_host_bearer
 from asap.transport._state_deps import require_identity_limiter
 from asap.transport.capability_routes import _grant_to_dict
 from asap.transport.rate_limit import ASAPRateLimiter
@@ -643,6 +643,7 @@ async def _handle_agent_revoke(request: Request, body: AgentRevokeBody) -> JSONR
         )
 
     await agent_store.revoke(body.agent_id)
+    invalidate_verified_agent(request, body.agent_id)
     logger.info(
         "asap.identity.agent_revoke",
         action="revoke",
@@ -705,6 +706,7 @@ async def _handle_agent_rotate_key(request: Request, body: AgentRotateKeyBody) -
 
     rotated = session.model_copy(update={"public_key": new_pub})
     await agent_store.save(rotated)
+    invalidate_verified_agent(request, rotated.agent_id)
     logger.info(
         "asap.identity.agent_rotate_key",
         action="rotate_key",
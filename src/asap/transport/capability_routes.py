@@ -20,7 +20,12 @@ from asap.auth.capabilities import CapabilityGrant, CapabilityRegistry
 from asap.auth.identity import AgentStore, HostStore, reactivate_agent
 from asap.models.base import ASAPBaseModel
 from asap.observability import get_logger
-from asap.transport._auth_helpers import bearer_token_from_request, verify_host_bearer
+from asap.transport._auth_helpers import (
+    bearer_token_from_request,
+    invalidate_verified_agent,
+    verified_token_cache,
+    verify_host_bearer,
+)
 from asap.transport._state_deps import require_identity_limiter
 from asap.transport.rate_limit import ASAPRateLimiter
 
@@ -81,6 +86,7 @@ async def verify_agent_bearer(
         agent_store,
         expected_audience=audience,
         jti_replay_cache=jti_cache,
+        verified_cache=verified_token_cache(request),
     )
     if not result.ok:
         status = (
@@ -153,6 +159,7 @@ async def _handle_capability_list(
             host_store,
             agent_store,
             expected_audience=audience,
+            verified_cache=verified_token_cache(request),
         )
         if agent_result.ok and agent_result.agent:
             agent_id = agent_result.agent.agent_id
@@ -293,6 +300,7 @@ async def _handle_agent_reactivate(request: Request) -> JSONResponse:
         return JSONResponse(status_code=403, content={"detail": str(e)})
 
     await agent_store.save(reactivated)
+    invalidate_verified_agent(request, reactivated.agent_id)
 
     # Capability decay: reset grants to host defaults
     registry = _registry(request)
@@ -43,6 +43,7 @@ from asap.transport.client._helpers import (
 )
 from asap.transport.client._send import _SendMixin
 from asap.transport.lambda_codec import LAMBDA_CONTENT_TYPE  # noqa: F401 (re-exported surface)
+from asap.transport.lambda_dictionary import LambdaDictionary
 from asap.transport.compression import COMPRESSION_THRESHOLD
 from asap.transport.errors import ProtocolCorrelationError, assert_correlation_binds
 from asap.transport.jsonrpc import ASAP_METHOD
@@ -129,6 +130,11 @@ class ASAPClient(_SendMixin, _DiscoveryMixin):
         1KB. Supports gzip (standard) and brotli (optional, requires brotli package).
         Brotli provides ~20% better compression than gzip for JSON payloads.
 
+    Lambda codec:
+        With lambda_codec_enabled=True the client accepts Lambda-encoded responses.
+        It offers the ``λ2:`` format with lambda_dictionary (default: the packaged
+        dictionary) and still accepts ``λ1:`` and JSON from older servers.
+
     Example:
         >>> async with ASAPClient("http://localhost:8000") as client:
         ...     response = await client.send(envelope)
@@ -171,6 +177,7 @@ class ASAPClient(_SendMixin, _DiscoveryMixin):
         circuit_breaker_threshold: int | None = None,
         circuit_breaker_timeout: float | None = None,
         lambda_codec_enabled: bool = False,
+        lambda_dictionary: LambdaDictionary | None = None,
         manifest_cache_size: int | None = None,
         verify_signatures: bool = False,
         trusted_manifest_keys: Optional[Mapping[str, str]] = None,
@@ -295,6 +302,7 @@ class ASAPClient(_SendMixin, _DiscoveryMixin):
         self._compression = compression
         self._compression_threshold = compression_threshold
         self._lambda_codec_enabled = lambda_codec_enabled
+        self._lambda_dictionary = lambda_dictionary
         self._on_message = on_message
         self._client: httpx.AsyncClient | None = None
         self._ws_transport: WebSocketTransport | None = None
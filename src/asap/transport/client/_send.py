@@ -42,6 +42,7 @@ from asap.transport.client._helpers import (
 )
 from asap.transport import lambda_codec
 from asap.transport.lambda_codec import LAMBDA_CONTENT_TYPE
+from asap.transport.lambda_dictionary import LambdaDictionary
 from asap.transport.compression import (
     CompressionAlgorithm,
     compress_payload,
@@ -75,6 +76,7 @@ class _SendMixin:
     _compression: bool
     _compression_threshold: int
     _lambda_codec_enabled: bool
+    _lambda_dictionary: LambdaDictionary | None
     _auth_token: str | None
     _asap_version_header_value: str
     # --------------------------------------------------------------------------
@@ -302,7 +304,7 @@ class _SendMixin:
         """Build the per-attempt HTTP headers for a ``/asap`` POST."""
         accept_value = "application/json"
         if self._lambda_codec_enabled and lambda_codec.is_available():
-            accept_value = f"{LAMBDA_CONTENT_TYPE}, application/json;q=0.9"
+            accept_value = lambda_codec.build_accept_header(self._lambda_dictionary)
         headers: dict[str, str] = {
             "Content-Type": "application/json",
             "Accept": accept_value,
@@ -21,12 +21,26 @@ Example:
     >>>
     >>> # Decompress received payload
     >>> original = decompress_payload(compressed, encoding)
+
+Request bodies are decompressed chunk by chunk with
+:class:`IncrementalDecompressor`, which stops as soon as the output crosses the
+size limit instead of inflating the whole payload first.
+
+Server responses are compressed according to a :class:`ResponseCompressionPolicy`;
+SSE streams use :class:`StreamingCompressor`, which flushes after every event so
+clients can decode each event as soon as it arrives.
 """
 
 from __future__ import annotations
 
 import gzip
+import time
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
+from typing import Any
 
 from asap.observability import get_logger
 
@@ -39,6 +53,13 @@ COMPRESSION_THRESHOLD = 1024  # 1KB
 # Gzip compression level (1-9, higher = better compression but slower)
 GZIP_COMPRESSION_LEVEL = 6
 
+# Payload types whose responses are never compressed (small acknowledgements).
+# Keys are normalized payload types (lowercase, alphanumeric only).
+DEFAULT_PAYLOAD_TYPE_THRESHOLDS: Mapping[str, int | None] = MappingProxyType({"messageack": None})
+
+# zlib window bits selecting the gzip container (header + CRC trailer)
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
 
 class CompressionAlgorithm(str, Enum):
     """Supported compression algorithms."""
@@ -330,3 +351,230 @@ def select_best_encoding(accept_encoding: str | None) -> CompressionAlgorithm:
     if best_encoding == "gzip":
         return CompressionAlgorithm.GZIP
     return CompressionAlgorithm.IDENTITY
+
+
+class DecompressedSizeExceeded(ValueError):
+    """Raised when incremental decompression output crosses the size limit.
+
+    Attributes:
+        decompressed_size: Bytes produced before decompression stopped (> max_size)
+        max_size: Configured maximum decompressed size in bytes
+    """
+
+    def __init__(self, decompressed_size: int, max_size: int) -> None:
+        super().__init__(
+            f"Decompressed size ({decompressed_size} bytes) exceeds maximum ({max_size} bytes)"
+        )
+        self.decompressed_size = decompressed_size
+        self.max_size = max_size
+
+
+class IncrementalDecompressor:
+    """Chunk-at-a-time gzip/brotli decompressor with an output size limit.
+
+    Each :meth:`decompress` call inflates at most ``max_output_size + 1`` bytes
+    in total (zlib ``max_length`` / brotli ``output_buffer_limit``), so a
+    decompression bomb is rejected after producing just over the limit rather
+    than after being fully inflated.
+
+    Error types match :func:`decompress_payload`: ``ValueError`` for an
+    unsupported encoding, ``OSError`` for corrupt data, ``EOFError`` for a
+    truncated gzip stream, and :class:`DecompressedSizeExceeded` on overflow.
+
+    Example:
+        >>> decompressor = IncrementalDecompressor("gzip", max_output_size=1024)
+        >>> body = decompressor.decompress(gzip.compress(b"{}")) + decompressor.finish()
+        >>> body
+        b'{}'
+    """
+
+    def __init__(self, encoding: str, max_output_size: int) -> None:
+        self.encoding = encoding.lower().strip()
+        self.max_output_size = max_output_size
+        self.compressed_size = 0
+        self.decompressed_size = 0
+        self._zlib: zlib._Decompress | None = None
+        self._brotli: Any = None
+        if self.encoding == "gzip":
+            self._zlib = zlib.decompressobj(_GZIP_WBITS)
+        elif self.encoding == "br":
+            if not is_brotli_available():
+                raise ValueError(
+                    "Brotli decompression requested but brotli package is not installed. "
+                    "Install with: pip install brotli"
+                )
+            import brotli
+
+            self._brotli = brotli.Decompressor()
+        else:
+            raise ValueError(
+                f"Unsupported Content-Encoding: {encoding}. Supported: gzip, br, identity"
+            )
+
+    def _limit(self) -> int:
+        return self.max_output_size - self.decompressed_size + 1
+
+    def _account(self, out: bytes) -> bytes:
+        self.decompressed_size += len(out)
+        if self.decompressed_size > self.max_output_size:
+            raise DecompressedSizeExceeded(self.decompressed_size, self.max_output_size)
+        return out
+
+    def decompress(self, chunk: bytes) -> bytes:
+        """Feed one compressed *chunk*; return the output it produced."""
+        self.compressed_size += len(chunk)
+        if self._zlib is not None:
+            return self._decompress_gzip(chunk)
+        return self._decompress_brotli(chunk)
+
+    def _decompress_gzip(self, data: bytes) -> bytes:
+        parts: list[bytes] = []
+        while data:
+            decompressor = self._zlib
+            if decompressor is None or decompressor.eof:
+                # Next gzip member, or trailing zero padding (ignored like gzip.decompress).
+                if not data.strip(b"\x00"):
+                    break
+                decompressor = self._zlib = zlib.decompressobj(_GZIP_WBITS)
+            try:
+                out = decompressor.decompress(data, self._limit())
+            except zlib.error as e:
+                raise OSError(f"Invalid gzip data: {e}") from e
+            parts.append(self._account(out))
+            data = decompressor.unconsumed_tail or (
+                decompressor.unused_data if decompressor.eof else b""
+            )
+        return b"".join(parts)
+
+    def _decompress_brotli(self, data: bytes) -> bytes:
+        import brotli
+
+        decompressor = self._brotli
+        try:
+            parts = [self._account(decompressor.process(data, output_buffer_limit=self._limit()))]
+            while not decompressor.can_accept_more_data():
+                parts.append(
+                    self._account(decompressor.process(b"", output_buffer_limit=self._limit()))
+                )
+        except brotli.error as e:
+            raise OSError(f"Brotli decompression failed: {e}") from e
+        return b"".join(parts)
+
+    def finish(self) -> bytes:
+        """Flush remaining output and verify the stream was complete."""
+        if self._zlib is not None:
+            if self.compressed_size == 0:
+                return b""
+            if not self._zlib.eof:
+                raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+            return self._account(self._zlib.flush())
+        if not self._brotli.is_finished():
+            raise OSError("Brotli decompression failed: truncated input")
+        return b""
+
+
+def _normalize_payload_type(payload_type: str) -> str:
+    return "".join(c for c in payload_type.lower() if c.isalnum())
+
+
+@dataclass(frozen=True)
+class ResponseCompressionPolicy:
+    """Server-side compression policy for ``/asap`` and ``/asap/stream`` responses.
+
+    The encoding is negotiated from the client's ``Accept-Encoding`` header with
+    :func:`select_best_encoding`; clients that do not advertise gzip or brotli
+    always get identity responses.
+
+    Attributes:
+        threshold: Minimum rendered JSON-RPC response size (bytes) to compress.
+        payload_type_thresholds: Per payload type overrides of *threshold*.
+            ``None`` disables compression for that payload type. Keys are
+            matched case- and separator-insensitively (``"task.response"`` and
+            ``"TaskResponse"`` are the same key).
+        compress_streams: Compress SSE streams (flushed after every event).
+
+    Example:
+        >>> policy = ResponseCompressionPolicy(
+        ...     threshold=4096,
+        ...     payload_type_thresholds={"task.response": 512, "message.ack": None},
+        ... )
+        >>> policy.threshold_for("TaskResponse")
+        512
+    """
+
+    threshold: int = COMPRESSION_THRESHOLD
+    payload_type_thresholds: Mapping[str, int | None] = field(
+        default_factory=lambda: DEFAULT_PAYLOAD_TYPE_THRESHOLDS
+    )
+    compress_streams: bool = True
+
+    def __post_init__(self) -> None:
+        normalized = {
+            _normalize_payload_type(key): value
+            for key, value in self.payload_type_thresholds.items()
+        }
+        object.__setattr__(self, "payload_type_thresholds", MappingProxyType(normalized))
+
+    def threshold_for(self, payload_type: str) -> int | None:
+        """Return the size threshold for *payload_type*, or None to never compress."""
+        key = _normalize_payload_type(payload_type)
+        if key in self.payload_type_thresholds:
+            return self.payload_type_thresholds[key]
+        return self.threshold
+
+
+# Policy used by create_app() unless the caller passes its own (or None).
+DEFAULT_RESPONSE_COMPRESSION = ResponseCompressionPolicy()
+
+
+class StreamingCompressor:
+    """Incremental gzip/brotli compressor for event streams.
+
+    Every :meth:`compress` call flushes the compressor (``Z_SYNC_FLUSH`` for
+    gzip, ``flush()`` for brotli), so the bytes returned for one event can be
+    decoded by the client without waiting for the next one; the compression
+    window is still shared across events. Input/output sizes and the CPU time
+    spent compressing are accumulated for metrics.
+
+    Example:
+        >>> compressor = StreamingCompressor(CompressionAlgorithm.GZIP)
+        >>> body = compressor.compress(b"data: {}\\n\\n") + compressor.finish()
+        >>> gzip.decompress(body)
+        b'data: {}\\n\\n'
+    """
+
+    def __init__(self, algorithm: CompressionAlgorithm) -> None:
+        self.algorithm = algorithm
+        self.input_size = 0
+        self.output_size = 0
+        self.cpu_seconds = 0.0
+        self._zlib: zlib._Compress | None = None
+        self._brotli: Any = None
+        if algorithm == CompressionAlgorithm.GZIP:
+            self._zlib = zlib.compressobj(GZIP_COMPRESSION_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+        elif algorithm == CompressionAlgorithm.BROTLI:
+            import brotli
+
+            self._brotli = brotli.Compressor(quality=4)
+        else:
+            raise ValueError(f"Streaming compression requires gzip or br, got {algorithm.value}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Compress *chunk* and flush; return the bytes to send for it."""
+        started = time.thread_time()
+        if self._zlib is not None:
+            out = self._zlib.compress(chunk) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+        else:
+            out = self._brotli.process(chunk) + self._brotli.flush()
+        self.cpu_seconds += time.thread_time() - started
+        self.input_size += len(chunk)
+        self.output_size += len(out)
+        return out
+
+    def finish(self) -> bytes:
+        """End the compressed stream; return the trailing bytes."""
+        started = time.thread_time()
+        out = self._zlib.flush() if self._zlib is not None else self._brotli.finish()
+        self.cpu_seconds += time.thread_time() - started
+        self.output_size += len(out)
+        return bytes(out)
@@ -39,9 +39,10 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from asap.models.base import ASAPBaseModel
+from asap.models.envelope import Envelope
 
 # JSON-RPC 2.0 Standard Error Codes
 PARSE_ERROR = -32700
@@ -58,6 +59,9 @@ ASAP_METHOD = "asap.send"
 # Maximum number of sub-requests in a single JSON-RPC batch array.
 DEFAULT_MAX_BATCH_SIZE = 50
 
+# Maximum number of batch sub-requests dispatched concurrently.
+DEFAULT_MAX_BATCH_CONCURRENCY = 10
+
 # Error code descriptions
 ERROR_MESSAGES: dict[int, str] = {
     PARSE_ERROR: "Parse error",
@@ -196,3 +200,55 @@ class JsonRpcErrorResponse(ASAPBaseModel):
     )
     error: JsonRpcError = Field(description="Error object")
     id: str | int | None = Field(description="Request identifier (or null)")
+
+
+class AsapSendParams(BaseModel):
+    """``params`` of an ``asap.send`` request with the envelope validated eagerly.
+
+    Additional keys next to ``envelope`` are kept (``JsonRpcRequest.params`` is a
+    free-form object), so they are exposed through ``model_extra``.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="allow")
+
+    envelope: Envelope = Field(description="ASAP envelope carried by the request")
+
+
+class AsapSendRequest(ASAPBaseModel):
+    """Typed ``asap.send`` request used by the fast ingest path.
+
+    Validated straight from the raw body with ``model_validate_json`` so the
+    JSON-RPC wrapper and the nested :class:`~asap.models.envelope.Envelope` are
+    built in a single pydantic-core pass. It is at least as strict as
+    :class:`JsonRpcRequest` plus envelope validation; any input it rejects is
+    re-validated through the regular path to produce the canonical error.
+
+    Example:
+        >>> body = b'{"jsonrpc": "2.0", "method": "asap.send", "params": {}, "id": 1}'
+        >>> AsapSendRequest.model_validate_json(body)
+        Traceback (most recent call last):
+        ...
+        pydantic_core._pydantic_core.ValidationError: ...
+    """
+
+    jsonrpc: Literal["2.0"] = Field(
+        default="2.0", description="JSON-RPC protocol version (always '2.0')"
+    )
+    # Must match ASAP_METHOD; other methods fall back to METHOD_NOT_FOUND handling.
+    method: Literal["asap.send"] = Field(description="RPC method name")
+    params: AsapSendParams = Field(description="Request parameters with typed envelope")
+    id: str | int = Field(description="Request identifier for correlation")
+
+    def to_jsonrpc_request(self) -> JsonRpcRequest:
+        """Return the equivalent :class:`JsonRpcRequest` without re-validating.
+
+        ``params["envelope"]`` holds the validated :class:`Envelope` instance
+        rather than a dict, which the request handler uses to skip the second
+        envelope validation.
+        """
+        params: dict[str, Any] = {"envelope": self.params.envelope}
+        if self.params.model_extra:
+            params.update(self.params.model_extra)
+        return JsonRpcRequest.model_construct(
+            jsonrpc=self.jsonrpc, method=self.method, params=params, id=self.id
+        )
@@ -17,6 +17,13 @@ the original JSON string.
 
 Content-Type: application/vnd.asap+lambda
 
+Format ``λ2:`` (:func:`encode_v2`) replaces tokens from a trained, versioned
+:class:`~asap.transport.lambda_dictionary.LambdaDictionary` with one character
+each and carries the dictionary id in the prefix (``λ2:<id>:``). Clients opt in
+with ``Accept: application/vnd.asap+lambda;v=2;dict=<id>``; servers answer in
+``λ2:`` only when that dictionary is registered here, otherwise in ``λ1:``.
+:func:`decode` accepts both formats.
+
 Example:
     >>> import json
     >>> from asap.transport.lambda_codec import encode, decode
@@ -29,8 +36,14 @@ Example:
 from __future__ import annotations
 
 import re
+import threading
 
 from asap.observability import get_logger
+from asap.transport.lambda_dictionary import (
+    PRIVATE_USE_PATTERN,
+    LambdaDictionary,
+    default_dictionary,
+)
 
 logger = get_logger(__name__)
 
@@ -40,6 +53,13 @@ LAMBDA_CONTENT_TYPE = "application/vnd.asap+lambda"
 # Version prefix for the encoded format (allows future format changes)
 _VERSION_PREFIX = "λ1:"
 
+# Prefix of the dictionary-based format; followed by "<dictionary id>:"
+_V2_PREFIX = "λ2:"
+
+# Dictionaries usable for λ2 encoding/decoding in this process, keyed by id
+_dictionaries: dict[str, LambdaDictionary] = {}
+_dictionaries_lock = threading.Lock()
+
 # Substitution table: JSON string tokens -> Lambda atoms
 # Each entry maps a literal JSON substring to a short Lambda atom token.
 # The atoms are wrapped in a unique delimiter (§…§) that cannot appear in
@@ -148,17 +168,19 @@ def encode(json_str: str) -> str:
 def decode(encoded: str) -> str:
     """Decode a Lambda-compressed string back to a JSON string.
 
-    Reverses the Lambda atom substitution and returns the resulting
-    JSON string. The caller is responsible for parsing the JSON.
+    Reverses the Lambda atom (``λ1:``) or dictionary (``λ2:``) substitution
+    and returns the resulting JSON string. The caller is responsible for
+    parsing the JSON.
 
     Args:
-        encoded: Lambda-encoded string (must start with version prefix)
+        encoded: Lambda-encoded string (must start with ``λ1:`` or ``λ2:<id>:``)
 
     Returns:
         Original JSON string
 
     Raises:
-        ValueError: If the encoded string has an invalid format or version
+        ValueError: If the encoded string has an invalid format or version, or
+            names a ``λ2:`` dictionary that is not registered
 
     Example:
         >>> import json
@@ -166,6 +188,8 @@ def decode(encoded: str) -> str:
         >>> decoded_str = decode(encode(json.dumps(data)))
         >>> assert json.loads(decoded_str) == data
     """
+    if encoded.startswith(_V2_PREFIX):
+        return _decode_v2(encoded)
     if not encoded.startswith(_VERSION_PREFIX):
         raise ValueError(
             f"Invalid Lambda codec format: missing version prefix. "
@@ -182,3 +206,136 @@ def decode(encoded: str) -> str:
     )
 
     return json_str
+
+
+def register_dictionary(dictionary: LambdaDictionary) -> LambdaDictionary:
+    """Make *dictionary* available for ``λ2:`` negotiation and decoding.
+
+    Registering a different token list under an id that is already registered
+    raises ``ValueError``: ids must change whenever the tokens do.
+
+    Returns:
+        The registered dictionary (the existing one if already registered).
+    """
+    with _dictionaries_lock:
+        existing = _dictionaries.get(dictionary.id)
+        if existing is not None:
+            if existing.tokens != dictionary.tokens:
+                raise ValueError(
+                    f"Lambda dictionary {dictionary.id!r} is already registered "
+                    "with different tokens"
+                )
+            return existing
+        _dictionaries[dictionary.id] = dictionary
+        return dictionary
+
+
+def get_dictionary(dictionary_id: str) -> LambdaDictionary | None:
+    """Return the registered dictionary with *dictionary_id* (the default is always known)."""
+    dictionary = _dictionaries.get(dictionary_id)
+    if dictionary is None:
+        default = default_dictionary()
+        if dictionary_id == default.id:
+            dictionary = register_dictionary(default)
+    return dictionary
+
+
+def content_type_for(dictionary: LambdaDictionary | None = None) -> str:
+    """Return the Content-Type of a ``λ2:`` body for *dictionary* (``λ1:`` when None)."""
+    if dictionary is None:
+        return LAMBDA_CONTENT_TYPE
+    return f"{LAMBDA_CONTENT_TYPE};v=2;dict={dictionary.id}"
+
+
+def build_accept_header(dictionary: LambdaDictionary | None = None) -> str:
+    """Return the Accept header for a client that can decode ``λ2:`` with *dictionary*.
+
+    ``λ1:`` and plain JSON stay acceptable so older servers keep working.
+    """
+    dictionary = dictionary if dictionary is not None else default_dictionary()
+    register_dictionary(dictionary)
+    return f"{content_type_for(dictionary)}, {LAMBDA_CONTENT_TYPE};q=0.95, application/json;q=0.9"
+
+
+def select_dictionary(accept_header: str) -> LambdaDictionary | None:
+    """Pick the ``λ2:`` dictionary offered in *accept_header*, if any is registered.
+
+    Only ``application/vnd.asap+lambda`` ranges with ``v=2``, a ``dict``
+    parameter and a non-zero quality are considered; the highest quality wins.
+    """
+    best: LambdaDictionary | None = None
+    best_quality = 0.0
+    for media_range in accept_header.split(","):
+        media_type, *raw_params = (part.strip() for part in media_range.split(";"))
+        if media_type.lower() != LAMBDA_CONTENT_TYPE:
+            continue
+        params = {
+            key.strip().lower(): value.strip().strip('"')
+            for key, sep, value in (param.partition("=") for param in raw_params)
+            if sep
+        }
+        if params.get("v") != "2" or "dict" not in params:
+            continue
+        try:
+            quality = float(params.get("q", "1"))
+        except ValueError:
+            quality = 1.0
+        if quality <= best_quality:
+            continue
+        dictionary = get_dictionary(params["dict"])
+        if dictionary is not None:
+            best, best_quality = dictionary, quality
+    return best
+
+
+def encode_v2(json_str: str, dictionary: LambdaDictionary | None = None) -> str:
+    """Encode a pre-serialized JSON string in the ``λ2:`` dictionary format.
+
+    Falls back to :func:`encode` (``λ1:``) when *json_str* contains
+    private-use characters, which the ``λ2:`` codes occupy.
+
+    Args:
+        json_str: Pre-serialized JSON string (e.g. from model_dump_json())
+        dictionary: Dictionary to encode with (default: the packaged dictionary)
+
+    Returns:
+        String prefixed with ``λ2:<dictionary id>:`` (or ``λ1:`` on fallback)
+
+    Example:
+        >>> encode_v2('{"jsonrpc":"2.0"}').startswith("λ2:asap-default-1:")
+        True
+    """
+    dictionary = dictionary if dictionary is not None else default_dictionary()
+    if PRIVATE_USE_PATTERN.search(json_str):
+        return encode(json_str)
+    register_dictionary(dictionary)
+    encoded = f"{_V2_PREFIX}{dictionary.id}:{dictionary.encode(json_str)}"
+
+    logger.debug(
+        "asap.lambda_codec.encoded",
+        dictionary_id=dictionary.id,
+        original_size=len(json_str),
+        encoded_size=len(encoded),
+    )
+
+    return encoded
+
+
+def _decode_v2(encoded: str) -> str:
+    dictionary_id, sep, body = encoded[len(_V2_PREFIX) :].partition(":")
+    dictionary = get_dictionary(dictionary_id) if sep else None
+    if dictionary is None:
+        raise ValueError(
+            f"Unknown Lambda dictionary {dictionary_id!r}. "
+            "Register it with register_dictionary() before decoding."
+        )
+    json_str = dictionary.decode(body)
+
+    logger.debug(
+        "asap.lambda_codec.decoded",
+        dictionary_id=dictionary_id,
+        encoded_size=len(encoded),
+        decoded_size=len(json_str),
+    )
+
+    return json_str
@@ -0,0 +1,268 @@
+"""Trained substitution dictionaries for the Lambda codec ``λ2:`` format.
+
+A :class:`LambdaDictionary` is an ordered list of JSON substrings (object keys
+with their colon, short string values, URN prefixes) learned from captured
+traffic. Token *n* is replaced by the single private-use character
+``U+E000 + n``, so every substitution costs one character on the wire.
+
+Encoding splits the input with one trie-shaped regex (shared prefixes are
+factored, so matching walks an automaton rather than trying each token) and
+maps the matched tokens with ``dict.__getitem__``; decoding is a single
+``str.translate``. Neither direction runs a Python callback per match.
+
+Dictionaries are versioned artifacts: a JSON document with a stable ``id``
+that travels in the ``λ2:<id>:`` prefix and in the negotiated content type.
+Train one from a JSONL capture with ``asap lambda train``.
+
+Example:
+    >>> from asap.transport.lambda_dictionary import LambdaDictionary
+    >>> dictionary = LambdaDictionary("example-1", ['"jsonrpc":', '"2.0"'])
+    >>> body = dictionary.encode('{"jsonrpc":"2.0"}')
+    >>> len(body)
+    4
+    >>> dictionary.decode(body)
+    '{"jsonrpc":"2.0"}'
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import Any
+
+# Artifact format marker and version written by to_json()
+DICTIONARY_FORMAT = "asap-lambda-dictionary"
+DICTIONARY_FORMAT_VERSION = 1
+
+# Identifier of the dictionary shipped with the package
+DEFAULT_DICTIONARY_ID = "asap-default-1"
+
+# Token codes live in the BMP private-use area (U+E000..U+F8FF)
+_CODE_BASE = 0xE000
+MAX_DICTIONARY_TOKENS = 0xF8FF - _CODE_BASE + 1
+
+# Inputs containing any private-use character cannot be encoded reversibly
+PRIVATE_USE_PATTERN = re.compile("[\ue000-\uf8ff]")
+
+_DICTIONARY_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+# A private-use code is 3 bytes of UTF-8; shorter tokens never pay off
+_CODE_UTF8_SIZE = 3
+
+
+def _trie_pattern(tokens: Sequence[str]) -> str:
+    """Build a regex alternation with shared prefixes factored into a trie.
+
+    Optional suffixes are greedy, so the longest token along a path wins.
+    """
+    trie: dict[str, Any] = {}
+    for token in tokens:
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class LambdaDictionary:
+    """Versioned token dictionary used by the ``λ2:`` Lambda codec format.
+
+    Args:
+        dictionary_id: Stable identifier (``[A-Za-z0-9._-]``, at most 64 chars);
+            bump it whenever the token list changes.
+        tokens: JSON substrings to substitute, at most ``MAX_DICTIONARY_TOKENS``.
+
+    Raises:
+        ValueError: If the id is malformed or a token is empty, duplicated or
+            contains a private-use character.
+    """
+
+    __slots__ = ("id", "tokens", "_pattern", "_encode_map", "_decode_table")
+
+    def __init__(self, dictionary_id: str, tokens: Iterable[str]) -> None:
+        if not _DICTIONARY_ID_PATTERN.match(dictionary_id):
+            raise ValueError(
+                f"Invalid Lambda dictionary id: {dictionary_id!r}. "
+                "Use 1-64 characters from [A-Za-z0-9._-]."
+            )
+        token_list = tuple(tokens)
+        if len(token_list) > MAX_DICTIONARY_TOKENS:
+            raise ValueError(
+                f"Lambda dictionary has {len(token_list)} tokens (maximum {MAX_DICTIONARY_TOKENS})"
+            )
+        if len(set(token_list)) != len(token_list):
+            raise ValueError("Lambda dictionary tokens must be unique")
+        for token in token_list:
+            if not token or PRIVATE_USE_PATTERN.search(token):
+                raise ValueError(f"Invalid Lambda dictionary token: {token!r}")
+
+        self.id = dictionary_id
+        self.tokens = token_list
+        self._encode_map = {token: chr(_CODE_BASE + i) for i, token in enumerate(token_list)}
+        self._decode_table = {_CODE_BASE + i: token for i, token in enumerate(token_list)}
+        self._pattern = re.compile(f"({_trie_pattern(token_list)})") if token_list else None
+
+    def __repr__(self) -> str:
+        return f"LambdaDictionary(id={self.id!r}, tokens={len(self.tokens)})"
+
+    def encode(self, text: str) -> str:
+        """Replace every dictionary token in *text* with its one-character code.
+
+        The caller must ensure *text* has no private-use characters
+        (see ``PRIVATE_USE_PATTERN``), otherwise decoding is ambiguous.
+        """
+        if self._pattern is None:
+            return text
+        parts = self._pattern.split(text)
+        parts[1::2] = map(self._encode_map.__getitem__, parts[1::2])
+        return "".join(parts)
+
+    def decode(self, text: str) -> str:
+        """Expand the one-character codes in *text* back to their tokens."""
+        return text.translate(self._decode_table)
+
+    def to_json(self) -> str:
+        """Serialize the dictionary as a versioned JSON artifact."""
+        return json.dumps(
+            {
+                "format": DICTIONARY_FORMAT,
+                "version": DICTIONARY_FORMAT_VERSION,
+                "id": self.id,
+                "tokens": list(self.tokens),
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> LambdaDictionary:
+        """Load a dictionary from its JSON artifact.
+
+        Raises:
+            ValueError: If the document is not a supported dictionary artifact.
+        """
+        document = json.loads(data)
+        if not isinstance(document, dict) or document.get("format") != DICTIONARY_FORMAT:
+            raise ValueError(
+                f"Not a Lambda dictionary artifact (expected format {DICTIONARY_FORMAT!r})"
+            )
+        if document.get("version") != DICTIONARY_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported Lambda dictionary version: {document.get('version')!r} "
+                f"(supported: {DICTIONARY_FORMAT_VERSION})"
+            )
+        tokens = document.get("tokens")
+        if not isinstance(tokens, list) or not all(isinstance(t, str) for t in tokens):
+            raise ValueError("Lambda dictionary 'tokens' must be a list of strings")
+        return cls(str(document.get("id", "")), tokens)
+
+
+def load_dictionary(path: str | Path) -> LambdaDictionary:
+    """Load a dictionary artifact from *path*."""
+    return LambdaDictionary.from_json(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=1)
+def default_dictionary() -> LambdaDictionary:
+    """Return the dictionary shipped with the package (``DEFAULT_DICTIONARY_ID``)."""
+    artifact = resources.files("asap.transport").joinpath(
+        "lambda_dictionaries", f"{DEFAULT_DICTIONARY_ID}.json"
+    )
+    return LambdaDictionary.from_json(artifact.read_bytes())
+
+
+def _json_string(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _walk_candidates(value: Any, max_value_length: int) -> Iterator[str]:
+    """Yield the candidate tokens found in one decoded JSON value."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for key, child in item.items():
+                yield _json_string(str(key)) + ":"
+                stack.append(child)
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, str):
+            if len(item) <= max_value_length:
+                yield _json_string(item)
+            if item.startswith("urn:"):
+                prefix = item[: item.rfind(":") + 1]
+                if len(prefix) > len("urn:"):
+                    # Opening quote plus the prefix, e.g. '"urn:asap:agent:'
+                    yield _json_string(prefix)[:-1]
+
+
+def train_dictionary(
+    messages: Iterable[Any],
+    dictionary_id: str,
+    *,
+    max_tokens: int = 1024,
+    min_count: int = 2,
+    max_value_length: int = 64,
+) -> LambdaDictionary:
+    """Learn a dictionary from decoded JSON messages (e.g. captured JSON-RPC bodies).
+
+    Candidates are object keys (``"key":``), string values up to
+    *max_value_length* characters and URN prefixes (``"urn:asap:agent:``).
+    They are ranked by estimated bytes saved (``count * (utf8_len - 3)``) and
+    the best *max_tokens* with at least *min_count* occurrences are kept.
+
+    Args:
+        messages: Decoded JSON documents.
+        dictionary_id: Id for the resulting dictionary.
+        max_tokens: Maximum number of tokens (capped at ``MAX_DICTIONARY_TOKENS``).
+        min_count: Minimum occurrences for a candidate to be kept.
+        max_value_length: Longest string value considered as a token.
+
+    Returns:
+        Trained dictionary; tokens are ordered by estimated savings.
+    """
+    counts: Counter[str] = Counter()
+    for message in messages:
+        counts.update(_walk_candidates(message, max_value_length))
+
+    scored: list[tuple[int, str]] = []
+    for token, count in counts.items():
+        if count < min_count or PRIVATE_USE_PATTERN.search(token):
+            continue
+        savings = count * (len(token.encode("utf-8")) - _CODE_UTF8_SIZE)
+        if savings > 0:
+            scored.append((savings, token))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    limit = min(max_tokens, MAX_DICTIONARY_TOKENS)
+    return LambdaDictionary(dictionary_id, [token for _, token in scored[:limit]])
+
+
+def read_jsonl_capture(path: str | Path) -> Iterator[Any]:
+    """Yield decoded JSON documents from a JSONL capture, skipping blank lines.
+
+    Raises:
+        ValueError: If a line is not valid JSON (message includes the line number).
+    """
+    with Path(path).open(encoding="utf-8") as capture:
+        for line_number, line in enumerate(capture, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON: {e.msg}") from e
@@ -42,12 +42,13 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from typing import Any, Awaitable, Callable, Protocol
+from typing import Awaitable, Callable, Protocol
 
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from asap.models.constants import (
     ASAP_DEFAULT_TRANSPORT_VERSION,
@@ -470,7 +471,7 @@ class AuthenticationMiddleware:
             )
 
         token = credentials.credentials
-        if self.validator is None:
+        if self.validator is None or self._async_validator is None:
             raise RuntimeError(
                 "Token validator is None but authentication is required. "
                 "This should not happen if middleware was initialized correctly."
@@ -548,7 +549,7 @@ class AuthenticationMiddleware:
         )
 
 
-class SizeLimitMiddleware(BaseHTTPMiddleware):
+class SizeLimitMiddleware:
     """Middleware to validate request size before routing.
 
     This middleware checks the Content-Length header and rejects requests
@@ -559,6 +560,9 @@ class SizeLimitMiddleware(BaseHTTPMiddleware):
     size validation during parsing (with streaming) is handled in the
     route handler to prevent OOM attacks.
 
+    Implemented as plain ASGI middleware: accepted requests are forwarded with
+    the original ``receive``/``send`` so streaming responses are not buffered.
+
     Attributes:
         max_size: Maximum allowed request size in bytes
 
@@ -567,47 +571,50 @@ class SizeLimitMiddleware(BaseHTTPMiddleware):
         >>> app.add_middleware(SizeLimitMiddleware, max_size=10 * 1024 * 1024)
     """
 
-    def __init__(self, app: Any, max_size: int) -> None:
+    def __init__(self, app: ASGIApp, max_size: int) -> None:
         if max_size < 1:
             raise ValueError(f"max_size must be >= 1, got {max_size}")
-        super().__init__(app)
+        self.app = app
         self.max_size = max_size
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Any]]
-    ) -> Any:
-        """Process request and validate size before routing.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Reject oversized HTTP requests with 413 before routing.
 
         Args:
-            request: FastAPI request object
-            call_next: Next middleware or route handler
-
-        Returns:
-            Response from next handler or error response if size exceeded
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        content_length = request.headers.get("content-length")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
         if content_length:
             try:
                 size = int(content_length)
+            except ValueError:
+                logger.debug(
+                    "asap.middleware.invalid_content_length", content_length=content_length
+                )
+            else:
                 if size > self.max_size:
                     logger.warning(
                         "asap.request.size_exceeded",
                         content_length=size,
                         max_size=self.max_size,
                     )
-                    return JSONResponse(
+                    response = JSONResponse(
                         status_code=413,
                         content={
                             "detail": f"Request size ({size} bytes) exceeds maximum ({self.max_size} bytes)"
                         },
                     )
-            except ValueError:
-                logger.debug(
-                    "asap.middleware.invalid_content_length", content_length=content_length
-                )
+                    await response(scope, receive, send)
+                    return
 
         # Continue to next middleware or route handler
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 _ASAP_VERSION_NEGOTIATION_PATHS = frozenset({"/asap", "/asap/stream"})
@@ -622,30 +629,39 @@ def _first_supported_transport_version(header_value: str) -> str | None:
     return None
 
 
-class ASAPVersionMiddleware(BaseHTTPMiddleware):
+class ASAPVersionMiddleware:
     """Validate ``ASAP-Version`` on JSON-RPC HTTP endpoints and echo it on all responses.
 
     If the header is omitted, the server assumes
     ``ASAP_DEFAULT_TRANSPORT_VERSION``. If the header is set to a value outside
     ``ASAP_SUPPORTED_TRANSPORT_VERSIONS``, the server returns a JSON-RPC error
     with code ``VERSION_INCOMPATIBLE`` (-32000) without invoking the handler.
+
+    The header is added to the ``http.response.start`` message as it passes
+    through, so streamed bodies (``/asap/stream``) are forwarded unbuffered.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Any]]
-    ) -> Any:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         default_version = ASAP_DEFAULT_TRANSPORT_VERSION
         response_version = default_version
 
-        if request.method == "POST" and request.url.path in _ASAP_VERSION_NEGOTIATION_PATHS:
-            raw = request.headers.get(ASAP_VERSION_HEADER.lower())
+        path = scope["path"]
+        if scope["method"] == "POST" and path in _ASAP_VERSION_NEGOTIATION_PATHS:
+            raw = Headers(scope=scope).get(ASAP_VERSION_HEADER.lower())
             if raw is not None and raw.strip() != "":
                 stripped = raw.strip()
                 negotiated = _first_supported_transport_version(stripped)
                 if negotiated is None:
                     logger.warning(
                         "asap.version.incompatible",
-                        path=request.url.path,
+                        path=path,
                         requested=stripped,
                     )
                     err = JsonRpcErrorResponse(
@@ -661,12 +677,16 @@ class ASAPVersionMiddleware(BaseHTTPMiddleware):
                     )
                     resp = JSONResponse(status_code=200, content=err.model_dump())
                     resp.headers[ASAP_VERSION_HEADER] = default_version
-                    return resp
+                    await resp(scope, receive, send)
+                    return
                 response_version = negotiated
 
-        response = await call_next(request)
-        response.headers[ASAP_VERSION_HEADER] = response_version
-        return response
+        async def send_with_version(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[ASAP_VERSION_HEADER] = response_version
+            await send(message)
+
+        await self.app(scope, receive, send_with_version)
 
 
 # Export rate limiting components
@@ -15,7 +15,8 @@ from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
 
 from asap.auth.scopes import SCOPE_ADMIN, require_scope
-from asap.economics.audit import AuditStore
+from asap.economics.audit import AuditStore, query_audit_page
+from asap.state.stores import InvalidCursor
 
 
 def create_audit_router(*, require_auth: bool = False) -> APIRouter:
@@ -37,8 +38,9 @@ def create_audit_router(*, require_auth: bool = False) -> APIRouter:
         end: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> JSONResponse:
-        """Query the tamper-evident audit log."""
+        """Query the tamper-evident audit log (``cursor`` continues from ``next_cursor``)."""
         store: AuditStore | None = getattr(request.app.state, "audit_store", None)
         if store is None:
             return JSONResponse(status_code=404, content={"detail": "audit not configured"})
@@ -58,18 +60,24 @@ def create_audit_router(*, require_auth: bool = False) -> APIRouter:
                 content={"detail": "Invalid date format. Use ISO 8601 (e.g. 2026-01-01T00:00:00)"},
             )
 
-        entries = await store.query(
-            agent_urn=urn,
-            start=start_dt,
-            end=end_dt,
-            limit=min(limit, 1000),
-            offset=offset,
-        )
+        try:
+            page = await query_audit_page(
+                store,
+                agent_urn=urn,
+                start=start_dt,
+                end=end_dt,
+                limit=min(limit, 1000),
+                offset=offset,
+                cursor=cursor,
+            )
+        except InvalidCursor:
+            return JSONResponse(status_code=400, content={"detail": "invalid cursor"})
         return JSONResponse(
             status_code=200,
             content={
-                "entries": [e.model_dump(mode="json") for e in entries],
-                "count": len(entries),
+                "entries": [e.model_dump(mode="json") for e in page.items],
+                "count": len(page.items),
+                "next_cursor": page.next_cursor,
             },
         )
 
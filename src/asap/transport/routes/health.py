@@ -44,9 +44,10 @@ def create_health_router() -> APIRouter:
 
     @router.get(wellknown.WELLKNOWN_MANIFEST_PATH)
     async def get_manifest(request: Request) -> Response:
-        """Return the agent's manifest for discovery."""
+        """Return the agent's manifest for discovery (served from the response cache)."""
         manifest: Manifest = request.app.state.manifest
-        return await wellknown.get_manifest_response(manifest, request)
+        cache = getattr(request.app.state, "manifest_response_cache", None)
+        return await wellknown.get_manifest_response(manifest, request, cache)
 
     @router.get(discovery_health.WELLKNOWN_HEALTH_PATH)
     async def get_wellknown_health(request: Request) -> JSONResponse:
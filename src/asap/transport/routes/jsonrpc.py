@@ -7,15 +7,15 @@ read from ``request.app.state.request_handler`` (set by ``create_app``).
 
 from __future__ import annotations
 
-import asyncio
 import json
+import re
 from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse, Response
-from starlette.responses import StreamingResponse
 
 from asap.transport.jsonrpc import (
+    DEFAULT_MAX_BATCH_CONCURRENCY,
     DEFAULT_MAX_BATCH_SIZE,
     INVALID_REQUEST,
     JsonRpcError,
@@ -26,18 +26,8 @@ if TYPE_CHECKING:
     from asap.transport.server import ASAPRequestHandler
 
 
-def _make_body_receive(body: bytes) -> Any:
-    """Create an ASGI receive callable that returns the given body bytes."""
-    sent = False
-
-    async def receive() -> dict[str, Any]:
-        nonlocal sent
-        if not sent:
-            sent = True
-            return {"type": "http.request", "body": body, "more_body": False}
-        return {"type": "http.disconnect"}
-
-    return receive
+# A JSON array (batch) body: optional UTF-8 BOM and JSON whitespace, then ``[``.
+_BATCH_PREFIX = re.compile(rb"(?:\xef\xbb\xbf)?[ \t\n\r]*\[")
 
 
 def _batch_error_response(reason: str) -> JSONResponse:
@@ -57,11 +47,13 @@ async def _handle_batch(
     request: Request,
     items: list[Any],
     handler: ASAPRequestHandler,
-) -> JSONResponse:
+) -> Response:
     """Process a JSON-RPC batch request (array of requests).
 
     Empty batches and oversized batches return a single JSON-RPC error.
-    Each sub-request is processed independently; failures do not abort the batch.
+    Otherwise the already-parsed items are handed to
+    :meth:`ASAPRequestHandler.handle_batch`, which authenticates once and
+    dispatches them with bounded concurrency; failures do not abort the batch.
     """
     if len(items) == 0:
         return _batch_error_response("empty batch")
@@ -72,33 +64,10 @@ async def _handle_batch(
 
     request.app.state.limiter.check_n(request, len(items))
 
-    async def _process_one(item: Any) -> dict[str, Any]:
-        if not isinstance(item, dict):
-            invalid_item = JsonRpcErrorResponse(
-                error=JsonRpcError.from_code(INVALID_REQUEST),
-                id=None,
-            )
-            return invalid_item.model_dump()
-        sub_body = json.dumps(item).encode("utf-8")
-        scope = dict(request.scope)
-        sub_request = Request(scope, receive=_make_body_receive(sub_body))
-        sub_response = await handler.handle_message(sub_request)
-        if isinstance(sub_response, JSONResponse):
-            raw = sub_response.body
-            result: dict[str, Any] = json.loads(bytes(raw) if isinstance(raw, memoryview) else raw)
-            return result
-        if isinstance(sub_response, StreamingResponse):
-            parts: list[bytes] = []
-            async for chunk in sub_response.body_iterator:
-                parts.append(chunk if isinstance(chunk, bytes) else str(chunk).encode())
-            streamed: dict[str, Any] = json.loads(b"".join(parts))
-            return streamed
-        raw2 = sub_response.body
-        fallback: dict[str, Any] = json.loads(bytes(raw2) if isinstance(raw2, memoryview) else raw2)
-        return fallback
-
-    results = await asyncio.gather(*[_process_one(item) for item in items])
-    return JSONResponse(status_code=200, content=list(results))
+    max_concurrency: int = getattr(
+        request.app.state, "max_batch_concurrency", DEFAULT_MAX_BATCH_CONCURRENCY
+    )
+    return await handler.handle_batch(request, items, max_concurrency=max_concurrency)
 
 
 def create_jsonrpc_router() -> APIRouter:
@@ -111,18 +80,20 @@ def create_jsonrpc_router() -> APIRouter:
 
         Uses ``request.body()`` (which Starlette caches) so that
         ``parse_json_body`` inside ``handle_message`` can re-read via
-        ``request.stream()`` — Starlette yields the cached bytes.
+        ``request.stream()`` — Starlette yields the cached bytes. Batch
+        detection only peeks at the first significant byte.
         """
         handler: ASAPRequestHandler = request.app.state.request_handler
         body = await request.body()
-        try:
-            parsed = json.loads(body)
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            request.app.state.limiter.check(request)
-            return await handler.handle_message(request)
-
-        if isinstance(parsed, list):
-            return await _handle_batch(request, parsed, handler)
+        # Only array bodies are decoded here; single requests are parsed once,
+        # inside ``handle_message``.
+        if _BATCH_PREFIX.match(body):
+            try:
+                parsed = json.loads(body)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                parsed = None
+            if isinstance(parsed, list):
+                return await _handle_batch(request, parsed, handler)
 
         request.app.state.limiter.check(request)
         return await handler.handle_message(request)
@@ -11,6 +11,7 @@ from fastapi import APIRouter, WebSocket
 
 from asap.auth import OAuth2Middleware
 from asap.transport.websocket import (
+    DEFAULT_WS_DISPATCH_WINDOW,
     WS_CLOSE_GOING_AWAY,
     WS_CLOSE_REASON_SHUTDOWN,
     handle_websocket_connection,
@@ -29,6 +30,10 @@ def create_websocket_router() -> APIRouter:
         ws_rate_limit: float | None = getattr(app_state, "websocket_message_rate_limit", 10.0)
         sla_subscribers: set[WebSocket] | None = getattr(app_state, "sla_breach_subscribers", None)
         oauth2_middleware: OAuth2Middleware | None = getattr(app_state, "oauth2_middleware", None)
+        dispatch_window: int = getattr(
+            app_state, "websocket_dispatch_window", DEFAULT_WS_DISPATCH_WINDOW
+        )
+        ordered_dispatch: bool = getattr(app_state, "websocket_ordered_dispatch", False)
         await handle_websocket_connection(
             websocket,
             handler,
@@ -36,6 +41,8 @@ def create_websocket_router() -> APIRouter:
             ws_message_rate_limit=ws_rate_limit,
             sla_breach_subscribers=sla_subscribers,
             oauth2_middleware=oauth2_middleware,
+            dispatch_window=dispatch_window,
+            ordered_dispatch=ordered_dispatch,
         )
 
     return router
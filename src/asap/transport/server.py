@@ -71,7 +71,7 @@ from asap.observability import is_debug_log_mode as is_debug_log_mode
 from asap.observability.tracing import configure_tracing
 from asap.auth import JWKSValidator, OAuth2Config, OAuth2Middleware
 from asap.auth.middleware import OPERATOR_API_PATH_PREFIXES
-from asap.auth.agent_jwt import JtiReplayCache
+from asap.auth.agent_jwt import JtiReplayCache, VerifiedTokenCache
 from asap.auth.jti_replay_cache import JtiReplayCacheProtocol
 from asap.auth.approval import A2HApprovalChannel, ApprovalStore, InMemoryApprovalStore
 from asap.auth.self_auth import (
@@ -99,11 +99,21 @@ from asap.transport.rate_limit import (
     create_registration_rate_limiter,
 )
 from asap.observability.metrics import MetricsCollector
+from asap.observability.profiling import RequestProfiler
+from asap.transport.compression import (
+    DEFAULT_RESPONSE_COMPRESSION,
+    ResponseCompressionPolicy,
+)
 from asap.transport.executors import BoundedExecutor
 from asap.transport.handlers import HandlerRegistry, create_default_registry
-from asap.transport.jsonrpc import DEFAULT_MAX_BATCH_SIZE, JsonRpcRequest
+from asap.transport.jsonrpc import (
+    DEFAULT_MAX_BATCH_CONCURRENCY,
+    DEFAULT_MAX_BATCH_SIZE,
+    JsonRpcRequest,
+)
 from asap.state.metering import MeteringStore
 from asap.state.snapshot import SnapshotStore
+from asap.discovery.wellknown import ManifestResponseCache
 from asap.economics.audit import AuditStore
 from asap.economics.sla_storage import SLAStorage
 from asap.economics.storage import MeteringStorage
@@ -120,9 +130,13 @@ from asap.transport.routes import (
     create_jsonrpc_router,
     create_websocket_router,
 )
-from asap.state.stores import create_snapshot_store
+from asap.state.stores import close_connection_pools, create_snapshot_store
 from asap.transport.validators import InMemoryNonceStore, NonceStore
-from asap.transport.websocket import WS_CLOSE_GOING_AWAY, WS_CLOSE_REASON_SHUTDOWN
+from asap.transport.websocket import (
+    DEFAULT_WS_DISPATCH_WINDOW,
+    WS_CLOSE_GOING_AWAY,
+    WS_CLOSE_REASON_SHUTDOWN,
+)
 from asap.transport.mtls import MTLSConfig
 
 if TYPE_CHECKING:
@@ -140,17 +154,25 @@ class RegistryHolder:
 
     When hot reload is enabled, a background thread watches handlers.py and
     replaces the registry on file change so new handler code is used without
-    restarting the server.
+    restarting the server. Replacing the registry also invalidates the cached
+    well-known manifest response, if one is attached.
     """
 
-    def __init__(self, registry: HandlerRegistry) -> None:
+    def __init__(
+        self,
+        registry: HandlerRegistry,
+        manifest_cache: ManifestResponseCache | None = None,
+    ) -> None:
         self.registry = registry
+        self.manifest_cache = manifest_cache
         self._executor: BoundedExecutor | None = None
 
     def replace_registry(self, new_registry: HandlerRegistry) -> None:
         if self._executor is not None:
             new_registry._executor = self._executor
         self.registry = new_registry
+        if self.manifest_cache is not None:
+            self.manifest_cache.invalidate()
 
 
 _HOT_RELOAD_RETRY_DELAY_SECONDS = 5.0
@@ -310,6 +332,9 @@ def _build_server_components(
     identity_jti_cache: JtiReplayCacheProtocol | None,
     identity_jwt_audience: str | list[str] | None,
     identity_approval_store: ApprovalStore | None,
+    fast_ingest: bool = False,
+    response_compression: ResponseCompressionPolicy | None = None,
+    request_profiler: RequestProfiler | None = None,
 ) -> ServerComponents:
     """Resolve the registry, handler, auth, identity stores, and config defaults.
 
@@ -344,7 +369,7 @@ def _build_server_components(
     if executor is not None:
         registry._executor = executor
 
-    registry_holder = RegistryHolder(registry)
+    registry_holder = RegistryHolder(registry, manifest_cache=ManifestResponseCache())
     if executor is not None:
         registry_holder._executor = executor
 
@@ -389,7 +414,7 @@ def _build_server_components(
     )
 
     if snapshot_store is None:
-        snapshot_store = create_snapshot_store()
+        snapshot_store = create_snapshot_store(asynchronous=False)
         logger.info(
             "asap.server.snapshot_store_from_env",
             manifest_id=manifest.id,
@@ -397,7 +422,14 @@ def _build_server_components(
         )
 
     handler = ASAPRequestHandler(
-        registry_holder, manifest, auth_middleware, max_request_size, nonce_store
+        registry_holder,
+        manifest,
+        auth_middleware,
+        max_request_size,
+        nonce_store,
+        fast_ingest=fast_ingest,
+        response_compression=response_compression,
+        request_profiler=request_profiler,
     )
 
     if hot_reload and use_default_registry:
@@ -475,6 +507,7 @@ def _create_fastapi_app(manifest: Manifest, components: ServerComponents) -> Fas
                     code=WS_CLOSE_GOING_AWAY,
                     reason=WS_CLOSE_REASON_SHUTDOWN,
                 )
+        await close_connection_pools()
 
     app = FastAPI(
         title="ASAP Protocol Server",
@@ -491,6 +524,7 @@ def _create_fastapi_app(manifest: Manifest, components: ServerComponents) -> Fas
     # Core handler + manifest + start timestamp for the route-group routers.
     app.state.request_handler = components.handler
     app.state.manifest = manifest
+    app.state.manifest_response_cache = components.registry_holder.manifest_cache
     app.state.server_started_at = time.monotonic()
     return app
 
@@ -502,12 +536,16 @@ def _populate_app_state(
     manifest: Manifest,
     max_request_size: int,
     max_batch_size: int,
+    max_batch_concurrency: int,
     snapshot_store: SnapshotStore,
     metering_store: MeteringStore | None,
     audit_store: AuditStore | None,
     websocket_message_rate_limit: float | None,
+    websocket_dispatch_window: int,
+    websocket_ordered_dispatch: bool,
     mtls_config: MTLSConfig | None,
     identity_host_supports_ciba: bool,
+    identity_verified_token_cache: VerifiedTokenCache | None,
     identity_approval_a2h_channel: A2HApprovalChannel | None,
     identity_fresh_session_config: FreshSessionConfig | None,
     identity_webauthn_verifier: WebAuthnVerifier | None,
@@ -515,6 +553,8 @@ def _populate_app_state(
 ) -> None:
     """Populate ``app.state`` with identity, snapshot, and feature config."""
     app.state.websocket_message_rate_limit = websocket_message_rate_limit
+    app.state.websocket_dispatch_window = websocket_dispatch_window
+    app.state.websocket_ordered_dispatch = websocket_ordered_dispatch
     app.state.mtls_config = mtls_config
     app.state.identity_host_store = components.identity_host_store
     app.state.identity_agent_store = components.identity_agent_store
@@ -522,6 +562,7 @@ def _populate_app_state(
     app.state.identity_jwt_audience = components.identity_jwt_audience
     app.state.identity_approval_store = components.identity_approval_store
     app.state.identity_host_supports_ciba = identity_host_supports_ciba
+    app.state.identity_verified_token_cache = identity_verified_token_cache
     if identity_approval_a2h_channel is not None:
         app.state.identity_approval_a2h_channel = identity_approval_a2h_channel
     if identity_fresh_session_config is not None:
@@ -535,6 +576,7 @@ def _populate_app_state(
     app.state.identity_limiter = create_limiter([identity_rl])
     app.state.max_request_size = max_request_size
     app.state.max_batch_size = max_batch_size
+    app.state.max_batch_concurrency = max_batch_concurrency
     app.state.snapshot_store = snapshot_store
     app.state.metering_store = metering_store
     app.state.audit_store = audit_store
@@ -648,7 +690,11 @@ def _wire_middleware(
     manifest: Manifest,
     require_operator_auth: bool = False,
 ) -> None:
-    """Add the size-limit, OAuth2, ASAP-version, and WWW-Authenticate middlewares."""
+    """Add the size-limit, OAuth2, ASAP-version, and WWW-Authenticate middlewares.
+
+    The first three are plain ASGI middlewares, so they add no per-request task
+    or response buffering and do not interfere with ``/asap/stream``.
+    """
     # Size limit runs before routing.
     app.add_middleware(SizeLimitMiddleware, max_size=max_request_size)
 
@@ -776,6 +822,8 @@ def create_app(
     metering_store: MeteringStore | None = None,
     metering_storage: object | None = None,
     websocket_message_rate_limit: float | None = 10.0,
+    websocket_dispatch_window: int = DEFAULT_WS_DISPATCH_WINDOW,
+    websocket_ordered_dispatch: bool = False,
     mtls_config: MTLSConfig | None = None,
     delegation_key_store: Callable[[str], Any] | None = None,
     delegation_storage: object | None = None,
@@ -788,10 +836,12 @@ def create_app(
     identity_rate_limit: str | None = None,
     identity_approval_store: ApprovalStore | None = None,
     identity_host_supports_ciba: bool = True,
+    identity_verified_token_cache: VerifiedTokenCache | None = None,
     identity_approval_a2h_channel: A2HApprovalChannel | None = None,
     identity_fresh_session_config: FreshSessionConfig | None = None,
     identity_webauthn_verifier: WebAuthnVerifier | None = None,
     max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    max_batch_concurrency: int = DEFAULT_MAX_BATCH_CONCURRENCY,
     registry_auto_registration: AutoRegistrationConfig | None = None,
     asap_challenge_enabled: bool = True,
     asap_challenge_discovery_url: str | None = None,
@@ -800,6 +850,9 @@ def create_app(
         "/asap/agent",
     ),
     require_operator_auth: bool = False,
+    fast_ingest: bool = False,
+    response_compression: ResponseCompressionPolicy | None = DEFAULT_RESPONSE_COMPRESSION,
+    request_profiler: RequestProfiler | None = None,
 ) -> FastAPI:
     """Create and configure a FastAPI application for ASAP protocol.
 
@@ -849,6 +902,11 @@ def create_app(
         websocket_message_rate_limit: Max messages per second per WebSocket connection.
             When set (default 10.0), connections exceeding this are sent an error frame
             and closed. Set to None to disable WebSocket message rate limiting.
+        websocket_dispatch_window: Max envelopes dispatched concurrently per WebSocket
+            connection (default ``DEFAULT_WS_DISPATCH_WINDOW``). When the window is full
+            the server stops reading frames from that socket until a slot frees up.
+        websocket_ordered_dispatch: If True, envelopes sharing a ``correlation_id`` on a
+            WebSocket connection are dispatched one at a time in arrival order.
         mtls_config: Optional mTLS config for server. When provided, store on app.state.mtls_config.
             Use asap.transport.mtls.mtls_config_to_uvicorn_kwargs() when running uvicorn.
         delegation_key_store: Optional callable (delegator_urn: str) -> Ed25519PrivateKey for
@@ -882,6 +940,12 @@ def create_app(
             Defaults to an in-memory store per process.
         identity_host_supports_ciba: When True and the host has ``user_id``, CIBA may be
             selected over Device Authorization.
+        identity_verified_token_cache: Optional
+            :class:`~asap.auth.agent_jwt.VerifiedTokenCache` so repeated Host/Agent JWTs
+            skip signature checks and host lookups (``jti`` checks still apply; Agent
+            JWTs on ``jti``-checked routes such as execute are not cached). The
+            revoke, rotate-key and reactivate routes invalidate it; code that mutates
+            the identity stores directly must call its ``invalidate_*`` methods.
         identity_approval_a2h_channel: Optional channel that resolves pending approvals
             via A2H in a background task after register.
         identity_fresh_session_config: When set, registration requiring approval and
@@ -891,6 +955,10 @@ def create_app(
             :func:`asap.auth.self_auth.default_webauthn_verifier` is used (real verification
             only if the ``webauthn`` extra is installed and ``ASAP_WEBAUTHN_RP_ID`` plus
             ``ASAP_WEBAUTHN_ORIGIN`` are set; otherwise the placeholder verifier applies).
+        max_batch_size: Maximum number of sub-requests accepted in one JSON-RPC batch
+            array (``app.state.max_batch_size``). Larger batches get a single error.
+        max_batch_concurrency: Maximum number of batch sub-requests dispatched
+            concurrently (``app.state.max_batch_concurrency``). Must be >= 1.
         registry_auto_registration: When set, mounts ``POST /registry/agents`` for Lite Registry
             self-service registration. Requires OAuth2 JWT validation on this path: set
             ``oauth2_config.path_prefix`` to ``"/"`` (or a prefix covering ``/registry``) so
@@ -900,13 +968,30 @@ def create_app(
             ``asap:admin`` on ``/usage``, ``/sla``, and ``/audit``. Requires
             ``oauth2_config``. Default False preserves local/operator open access
             (startup warnings remain when those APIs are enabled without auth).
+        fast_ingest: When True, ``POST /asap`` (and WebSocket frames) validate the
+            JSON-RPC wrapper and envelope straight from the raw body bytes with
+            pydantic-core in a single pass. Malformed requests fall back to the
+            regular path, so error codes and ``validation_errors`` are unchanged.
+        response_compression: Compression policy for ``POST /asap`` success and batch
+            responses and ``/asap/stream`` SSE streams, negotiated from the client's
+            ``Accept-Encoding``. The default compresses bodies of at least
+            ``COMPRESSION_THRESHOLD`` bytes (never ``MessageAck``) and flushes SSE
+            streams per event. Ratio and CPU time are exported as
+            ``asap_response_compression_ratio`` / ``asap_response_compression_cpu_seconds``.
+            Set to None to always send identity responses.
+        request_profiler: Opt-in :class:`~asap.observability.profiling.RequestProfiler`
+            that times each ``POST /asap`` pipeline stage (parse, auth, envelope, trace,
+            sender, timestamp, nonce, dispatch, audit, serialize, compress), exports
+            ``asap_request_stage_duration_seconds{stage=...}`` and runs its hooks.
+            Default None: no per-stage timing.
 
     Returns:
         Configured FastAPI application ready to run
 
     Raises:
         ValueError: If manifest requires authentication but no token_validator provided,
-            or if ``require_operator_auth`` is True without ``oauth2_config``.
+            if ``require_operator_auth`` is True without ``oauth2_config``, or if
+            ``max_batch_concurrency`` is less than 1.
 
     Example:
         >>> from asap.models.entities import Manifest, Capability, Endpoint, Skill, AuthScheme, SLADefinition
@@ -949,6 +1034,10 @@ def create_app(
             "require_operator_auth=True requires oauth2_config so /usage, /sla, and "
             "/audit can validate Bearer JWTs with scope asap:admin"
         )
+    if max_batch_concurrency < 1:
+        raise ValueError(f"max_batch_concurrency must be >= 1, got {max_batch_concurrency}")
+    if websocket_dispatch_window < 1:
+        raise ValueError(f"websocket_dispatch_window must be >= 1, got {websocket_dispatch_window}")
 
     components = _build_server_components(
         manifest=manifest,
@@ -966,6 +1055,9 @@ def create_app(
         identity_jti_cache=identity_jti_cache,
         identity_jwt_audience=identity_jwt_audience,
         identity_approval_store=identity_approval_store,
+        fast_ingest=fast_ingest,
+        response_compression=response_compression,
+        request_profiler=request_profiler,
     )
     # Re-bind resolved values so the wiring below uses env-defaulted config.
     max_request_size = components.max_request_size
@@ -978,12 +1070,16 @@ def create_app(
         manifest=manifest,
         max_request_size=max_request_size,
         max_batch_size=max_batch_size,
+        max_batch_concurrency=max_batch_concurrency,
         snapshot_store=snapshot_store,
         metering_store=metering_store,
         audit_store=audit_store,
         websocket_message_rate_limit=websocket_message_rate_limit,
+        websocket_dispatch_window=websocket_dispatch_window,
+        websocket_ordered_dispatch=websocket_ordered_dispatch,
         mtls_config=mtls_config,
         identity_host_supports_ciba=identity_host_supports_ciba,
+        identity_verified_token_cache=identity_verified_token_cache,
         identity_approval_a2h_channel=identity_approval_a2h_channel,
         identity_fresh_session_config=identity_fresh_session_config,
         identity_webauthn_verifier=identity_webauthn_verifier,
@@ -22,8 +22,13 @@ from asap.economics.sla import (
     evaluate_breach_conditions,
     rolling_window_bounds,
 )
-from asap.economics.sla_storage import SLAStorage
+from asap.economics.sla_storage import (
+    SLAStorage,
+    query_sla_breaches_page,
+    query_sla_metrics_page,
+)
 from asap.models.entities import Manifest
+from asap.state.stores import InvalidCursor
 from asap.transport._state_deps import rate_limiter, require_state
 
 
@@ -148,16 +153,25 @@ def create_sla_router(*, require_auth: bool = False) -> APIRouter:
         end: datetime | None = Query(default=None, description="End of time range"),
         limit: int | None = Query(default=100, ge=1, le=1000, description="Max records"),
         offset: int = Query(default=0, ge=0, description="Records to skip"),
+        cursor: str | None = Query(
+            default=None,
+            description="next_cursor from the previous page (replaces offset)",
+        ),
         storage: SLAStorage = Depends(get_sla_storage),
     ) -> JSONResponse:
-        """Historical SLA metrics with pagination."""
-        metrics = await storage.query_metrics(
-            agent_id=agent_id,
-            start=start,
-            end=end,
-            limit=limit,
-            offset=offset,
-        )
+        """Historical SLA metrics with offset or cursor pagination."""
+        try:
+            page = await query_sla_metrics_page(
+                storage,
+                agent_id=agent_id,
+                start=start,
+                end=end,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+            )
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         total = await storage.count_metrics(
             agent_id=agent_id,
             start=start,
@@ -165,11 +179,12 @@ def create_sla_router(*, require_auth: bool = False) -> APIRouter:
         )
         return JSONResponse(
             content={
-                "data": [m.model_dump(mode="json") for m in metrics],
-                "count": len(metrics),
+                "data": [m.model_dump(mode="json") for m in page.items],
+                "count": len(page.items),
                 "total": total,
                 "offset": offset,
                 "limit": limit or 100,
+                "next_cursor": page.next_cursor,
             }
         )
 
@@ -182,25 +197,36 @@ def create_sla_router(*, require_auth: bool = False) -> APIRouter:
         ),
         start: datetime | None = Query(default=None, description="Start of time range"),
         end: datetime | None = Query(default=None, description="End of time range"),
+        limit: int | None = Query(default=None, ge=1, le=1000, description="Max records"),
+        cursor: str | None = Query(
+            default=None,
+            description="next_cursor from the previous page",
+        ),
         storage: SLAStorage = Depends(get_sla_storage),
     ) -> JSONResponse:
-        """List SLA breaches with optional filters."""
+        """List SLA breaches with optional filters and cursor pagination."""
         if severity is not None and severity not in ("warning", "critical"):
             raise HTTPException(
                 status_code=400,
                 detail="severity must be one of: warning, critical",
             )
-        breaches = await storage.query_breaches(
-            agent_id=agent_id,
-            start=start,
-            end=end,
-        )
-        if severity is not None:
-            breaches = [b for b in breaches if b.severity == severity]
+        try:
+            page = await query_sla_breaches_page(
+                storage,
+                agent_id=agent_id,
+                start=start,
+                end=end,
+                severity=severity,
+                limit=limit,
+                cursor=cursor,
+            )
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         return JSONResponse(
             content={
-                "data": [b.model_dump(mode="json") for b in breaches],
-                "count": len(breaches),
+                "data": [b.model_dump(mode="json") for b in page.items],
+                "count": len(page.items),
+                "next_cursor": page.next_cursor,
             }
         )
 
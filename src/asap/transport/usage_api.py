@@ -9,16 +9,18 @@ from __future__ import annotations
 
 import csv
 import io
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Literal, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import ValidationError
 
 from asap.auth.scopes import SCOPE_ADMIN, require_scope
 from asap.economics import BatchUsageRequest, MeteringQuery, UsageMetrics
-from asap.economics.storage import MeteringStorage
+from asap.economics.storage import MeteringStorage, iter_usage_events, query_usage_page
+from asap.state.stores import InvalidCursor
 from asap.transport._state_deps import rate_limiter, require_state
 
 
@@ -34,6 +36,75 @@ def _rate_limit_usage(request: Request) -> None:
         limiter.check(request)
 
 
+# Rows serialized per streamed chunk of a usage export.
+_EXPORT_CHUNK_ROWS = 500
+
+_EXPORT_CSV_HEADER = (
+    "task_id",
+    "agent_id",
+    "consumer_id",
+    "tokens_in",
+    "tokens_out",
+    "duration_ms",
+    "api_calls",
+    "timestamp",
+)
+
+# export_format -> (media type, file extension)
+_EXPORT_MEDIA: dict[str, tuple[str, str]] = {
+    "json": ("application/json", "json"),
+    "csv": ("text/csv", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+
+
+async def _export_chunks(
+    events: AsyncIterator[UsageMetrics],
+    export_format: str,
+) -> AsyncIterator[str]:
+    """Serialize streamed events into text chunks of ``_EXPORT_CHUNK_ROWS`` rows.
+
+    ``json`` keeps the historic ``{"data": [...]}`` envelope, written
+    incrementally; ``jsonl``/``ndjson`` emit one object per line.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    rows = 0
+    if export_format == "csv":
+        writer.writerow(_EXPORT_CSV_HEADER)
+    elif export_format == "json":
+        buf.write('{"data":[')
+    async for e in events:
+        if export_format == "csv":
+            writer.writerow(
+                [
+                    e.task_id,
+                    e.agent_id,
+                    e.consumer_id,
+                    e.tokens_in,
+                    e.tokens_out,
+                    e.duration_ms,
+                    e.api_calls,
+                    e.timestamp.isoformat(),
+                ]
+            )
+        elif export_format == "json":
+            buf.write(("," if rows else "") + e.model_dump_json())
+        else:
+            buf.write(e.model_dump_json() + "\n")
+        rows += 1
+        if rows % _EXPORT_CHUNK_ROWS == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    if export_format == "json":
+        buf.write("]}")
+    tail = buf.getvalue()
+    if tail:
+        yield tail
+
+
 def get_metering_storage(request: Request) -> MeteringStorage:
     storage = require_state(
         request,
@@ -70,6 +141,10 @@ def create_usage_router(*, require_auth: bool = False) -> APIRouter:
         end: datetime | None = Query(default=None, description="End of time range"),
         limit: int | None = Query(default=None, ge=1, le=1000, description="Max events"),
         offset: int = Query(default=0, ge=0, description="Events to skip"),
+        cursor: str | None = Query(
+            default=None,
+            description="next_cursor from the previous page (replaces offset)",
+        ),
         storage: MeteringStorage = Depends(get_metering_storage),
     ) -> JSONResponse:
         filters = MeteringQuery(
@@ -81,11 +156,15 @@ def create_usage_router(*, require_auth: bool = False) -> APIRouter:
             limit=limit,
             offset=offset,
         )
-        events = await storage.query(filters)
+        try:
+            page = await query_usage_page(storage, filters, cursor)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         return JSONResponse(
             content={
-                "data": [e.model_dump(mode="json") for e in events],
-                "count": len(events),
+                "data": [e.model_dump(mode="json") for e in page.items],
+                "count": len(page.items),
+                "next_cursor": page.next_cursor,
             }
         )
 
@@ -264,17 +343,17 @@ def create_usage_router(*, require_auth: bool = False) -> APIRouter:
 
     @router.get("/export")
     async def export_usage(
-        export_format: Literal["json", "csv"] = Query(
+        export_format: Literal["json", "csv", "jsonl", "ndjson"] = Query(
             default="json",
-            description="Export format: json or csv",
+            description="Export format: json, csv, jsonl or ndjson",
         ),
         agent_id: str | None = Query(default=None),
         consumer_id: str | None = Query(default=None),
         start: datetime | None = Query(default=None),
         end: datetime | None = Query(default=None),
-        limit: int | None = Query(default=10000, ge=1, le=100000),
+        limit: int | None = Query(default=None, ge=1, description="Max events (default: all)"),
         storage: MeteringStorage = Depends(get_metering_storage),
-    ) -> Response:
+    ) -> StreamingResponse:
         filters = MeteringQuery(
             agent_id=agent_id,
             consumer_id=consumer_id,
@@ -282,43 +361,13 @@ def create_usage_router(*, require_auth: bool = False) -> APIRouter:
             end=end,
             limit=limit,
         )
-        events = await storage.query(filters)
-        if export_format == "csv":
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(
-                [
-                    "task_id",
-                    "agent_id",
-                    "consumer_id",
-                    "tokens_in",
-                    "tokens_out",
-                    "duration_ms",
-                    "api_calls",
-                    "timestamp",
-                ]
-            )
-            for e in events:
-                writer.writerow(
-                    [
-                        e.task_id,
-                        e.agent_id,
-                        e.consumer_id,
-                        e.tokens_in,
-                        e.tokens_out,
-                        e.duration_ms,
-                        e.api_calls,
-                        e.timestamp.isoformat(),
-                    ]
-                )
-            return PlainTextResponse(
-                content=output.getvalue(),
-                media_type="text/csv",
-                headers={"Content-Disposition": "attachment; filename=usage_export.csv"},
-            )
-        return JSONResponse(
-            content={"data": [e.model_dump(mode="json") for e in events]},
-            headers={"Content-Disposition": "attachment; filename=usage_export.json"},
+        media_type, extension = _EXPORT_MEDIA[export_format]
+        return StreamingResponse(
+            _export_chunks(iter_usage_events(storage, filters), export_format),
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f"attachment; filename=usage_export.{extension}",
+            },
         )
 
     return router
@@ -7,7 +7,6 @@ nonce validation for duplicate detection.
 
 from __future__ import annotations
 
-import secrets
 import threading
 import time
 from datetime import datetime, timezone
@@ -20,6 +19,7 @@ from asap.models.constants import (
     NONCE_TTL_SECONDS,
 )
 from asap.models.envelope import Envelope
+from asap.utils.expiry import ExpiringKeySet
 
 
 def validate_envelope_timestamp(envelope: Envelope) -> None:
@@ -139,44 +139,29 @@ class NonceStore(Protocol):
         ...
 
 
-# Run cleanup on ~5% of requests (was 1%); reduces memory drift under high throughput.
-_CLEANUP_PROBABILITY = 0.05
-# Hard cap: always run cleanup when store exceeds this size.
-_MAX_NONCE_STORE_SIZE = 50_000
-
-
 class InMemoryNonceStore:
     """In-memory nonce store with TTL-based expiration.
 
-    Expired nonces are cleaned up probabilistically to avoid O(N) on every request.
+    Expiries are kept in an :class:`~asap.utils.expiry.ExpiringKeySet`, so each
+    call prunes only the nonces that have expired (O(log n) each) instead of
+    scanning the whole store.
 
     Attributes:
-        _store: Dictionary mapping nonce to expiration timestamp
+        _store: Nonces and their expiration timestamps
         _lock: Thread lock for thread-safe operations
     """
 
     def __init__(self) -> None:
-        self._store: dict[str, float] = {}
+        self._store: ExpiringKeySet[str] = ExpiringKeySet()
         self._lock = threading.RLock()
 
-    def _cleanup_expired(self) -> None:
-        # Always cleanup when over cap; otherwise run with probability to bound memory.
-        if (
-            len(self._store) <= _MAX_NONCE_STORE_SIZE
-            and secrets.SystemRandom().random() >= _CLEANUP_PROBABILITY
-        ):
-            return
-        now = time.time()
-        expired = [nonce for nonce, expiry in self._store.items() if expiry < now]
-        for nonce in expired:
-            self._store.pop(nonce, None)
-
     def check_and_mark(self, nonce: str, ttl_seconds: int) -> bool:
+        now = time.time()
         with self._lock:
-            self._cleanup_expired()
-            if nonce in self._store and self._store[nonce] >= time.time():
+            self._store.prune(now)
+            if self._store.live(nonce, now):
                 return True  # Already used
-            self._store[nonce] = time.time() + ttl_seconds
+            self._store.add(nonce, now + ttl_seconds)
             return False  # Newly marked
 
 
@@ -26,8 +26,9 @@ from asap.transport.ws.codecs import (  # noqa: F401 - Re-exported for test patc
     encode_envelope_frame,
 )
 
-# Deprecated alias retained for import compatibility; binary framing is no
-# longer supported. Scoped to the shim, not re-exported from ``ws/``.
+# Deprecated alias retained for import compatibility; binary framing is now
+# negotiated via ``FRAME_ENCODING_MSGPACK``. Scoped to the shim, not re-exported
+# from ``ws/``.
 FRAME_ENCODING_BINARY: Literal["binary"] = "binary"
 
 # --- Public surface re-exported from the ws package ----------------------------
@@ -37,10 +38,14 @@ from asap.transport.ws import (  # noqa: E402,F401 — bound after patchable nam
     DEFAULT_MAX_ACK_RETRIES,
     DEFAULT_POOL_IDLE_TIMEOUT,
     DEFAULT_POOL_MAX_SIZE,
+    DEFAULT_WS_DISPATCH_WINDOW,
     DEFAULT_WS_RECEIVE_TIMEOUT,
     FRAME_ENCODING_JSON,
+    FRAME_ENCODING_MSGPACK,
+    FrameCodec,
     HEARTBEAT_FRAME_TYPE_PING,
     HEARTBEAT_FRAME_TYPE_PONG,
+    JSON_FRAME_CODEC,
     OnMessageCallback,
     PendingAck,
     RECONNECT_INITIAL_BACKOFF,
@@ -54,6 +59,8 @@ from asap.transport.ws import (  # noqa: E402,F401 — bound after patchable nam
     WS_CLOSE_GOING_AWAY,
     WS_CLOSE_POLICY_VIOLATION,
     WS_CLOSE_REASON_SHUTDOWN,
+    WS_SUBPROTOCOL_JSON,
+    WS_SUBPROTOCOL_MSGPACK,
     WebSocketConnectionPool,
     WebSocketRemoteError,
     WebSocketTransport,
@@ -64,7 +71,10 @@ from asap.transport.ws import (  # noqa: E402,F401 — bound after patchable nam
     _reconnect_delay,
     broadcast_sla_breach,
     decode_frame_to_json,
+    get_frame_codec,
     handle_websocket_connection,
+    negotiate_frame_codec,
+    register_frame_codec,
 )
 
 __all__ = [
@@ -74,12 +84,16 @@ __all__ = [
     "DEFAULT_MAX_ACK_RETRIES",
     "DEFAULT_POOL_IDLE_TIMEOUT",
     "DEFAULT_POOL_MAX_SIZE",
+    "DEFAULT_WS_DISPATCH_WINDOW",
     "DEFAULT_WS_RECEIVE_TIMEOUT",
     "FRAME_ENCODING_BINARY",
     "FRAME_ENCODING_JSON",
+    "FRAME_ENCODING_MSGPACK",
+    "FrameCodec",
     "HEARTBEAT_FRAME_TYPE_PING",
     "HEARTBEAT_FRAME_TYPE_PONG",
     "HEARTBEAT_PING_INTERVAL",
+    "JSON_FRAME_CODEC",
     "OnMessageCallback",
     "PAYLOAD_TYPES_REQUIRING_ACK",
     "PendingAck",
@@ -94,6 +108,8 @@ __all__ = [
     "WS_CLOSE_GOING_AWAY",
     "WS_CLOSE_POLICY_VIOLATION",
     "WS_CLOSE_REASON_SHUTDOWN",
+    "WS_SUBPROTOCOL_JSON",
+    "WS_SUBPROTOCOL_MSGPACK",
     "WebSocketConnectionPool",
     "WebSocketRemoteError",
     "WebSocketTransport",
@@ -105,6 +121,9 @@ __all__ = [
     "broadcast_sla_breach",
     "decode_frame_to_json",
     "encode_envelope_frame",
+    "get_frame_codec",
     "handle_websocket_connection",
+    "negotiate_frame_codec",
+    "register_frame_codec",
     "websockets",
 ]
@@ -33,11 +33,14 @@ from asap.transport.ws.codecs import (
     DEFAULT_MAX_ACK_RETRIES,
     DEFAULT_POOL_IDLE_TIMEOUT,
     DEFAULT_POOL_MAX_SIZE,
+    DEFAULT_WS_DISPATCH_WINDOW,
     DEFAULT_WS_RECEIVE_TIMEOUT,
     FRAME_ENCODING_JSON,
+    FRAME_ENCODING_MSGPACK,
     HEARTBEAT_FRAME_TYPE_PING,
     HEARTBEAT_FRAME_TYPE_PONG,
     HEARTBEAT_PING_INTERVAL,
+    JSON_FRAME_CODEC,
     PAYLOAD_TYPES_REQUIRING_ACK,
     RECONNECT_INITIAL_BACKOFF,
     RECONNECT_MAX_BACKOFF,
@@ -49,10 +52,16 @@ from asap.transport.ws.codecs import (
     WS_CLOSE_GOING_AWAY,
     WS_CLOSE_POLICY_VIOLATION,
     WS_CLOSE_REASON_SHUTDOWN,
+    WS_SUBPROTOCOL_JSON,
+    WS_SUBPROTOCOL_MSGPACK,
+    FrameCodec,
     _build_ack_notification_frame,
     _is_heartbeat_pong,
     decode_frame_to_json,
     encode_envelope_frame,
+    get_frame_codec,
+    negotiate_frame_codec,
+    register_frame_codec,
 )
 from asap.transport.ws.pool import WebSocketConnectionPool
 from asap.transport.ws.server import (
@@ -69,11 +78,15 @@ __all__ = [
     "DEFAULT_MAX_ACK_RETRIES",
     "DEFAULT_POOL_IDLE_TIMEOUT",
     "DEFAULT_POOL_MAX_SIZE",
+    "DEFAULT_WS_DISPATCH_WINDOW",
     "DEFAULT_WS_RECEIVE_TIMEOUT",
     "FRAME_ENCODING_JSON",
+    "FRAME_ENCODING_MSGPACK",
+    "FrameCodec",
     "HEARTBEAT_FRAME_TYPE_PING",
     "HEARTBEAT_FRAME_TYPE_PONG",
     "HEARTBEAT_PING_INTERVAL",
+    "JSON_FRAME_CODEC",
     "OnMessageCallback",
     "PAYLOAD_TYPES_REQUIRING_ACK",
     "PendingAck",
@@ -88,6 +101,8 @@ __all__ = [
     "WS_CLOSE_GOING_AWAY",
     "WS_CLOSE_POLICY_VIOLATION",
     "WS_CLOSE_REASON_SHUTDOWN",
+    "WS_SUBPROTOCOL_JSON",
+    "WS_SUBPROTOCOL_MSGPACK",
     "WebSocketConnectionPool",
     "WebSocketRemoteError",
     "WebSocketTransport",
@@ -99,5 +114,8 @@ __all__ = [
     "broadcast_sla_breach",
     "decode_frame_to_json",
     "encode_envelope_frame",
+    "get_frame_codec",
     "handle_websocket_connection",
+    "negotiate_frame_codec",
+    "register_frame_codec",
 ]
@@ -2,11 +2,13 @@
 
 WebSocket frames are prepared through the shared request pipeline and then
 dispatched through the handler registry. The helpers in this module send
-JSON-RPC result, error, ack, and streaming frames back over the WebSocket.
+JSON-RPC result, error, ack, and streaming frames back over the WebSocket,
+encoded with the connection's negotiated :class:`FrameCodec`.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from typing import TYPE_CHECKING, Any, cast
@@ -28,7 +30,7 @@ from asap.transport.jsonrpc import (
 )
 from asap.transport.rate_limit import WebSocketTokenBucket
 from asap.transport.ws._actions import WSCloseAction
-from asap.transport.ws.codecs import _build_ack_notification_frame
+from asap.transport.ws.codecs import JSON_FRAME_CODEC, FrameCodec, _build_ack_notification
 from fastapi.responses import JSONResponse
 from opentelemetry import context
 
@@ -37,6 +39,59 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# ``websocket.scope`` key holding the FrameCodec negotiated at accept time.
+WS_FRAME_CODEC_SCOPE_KEY = "asap.frame_codec"
+# ``websocket.scope`` key holding the lock that serializes sends on one connection.
+WS_SEND_LOCK_SCOPE_KEY = "asap.send_lock"
+
+
+def _ws_frame_codec(websocket: WebSocket) -> FrameCodec:
+    """Return the codec negotiated for *websocket* (JSON when none was negotiated)."""
+    scope = getattr(websocket, "scope", None)
+    codec = scope.get(WS_FRAME_CODEC_SCOPE_KEY) if isinstance(scope, dict) else None
+    return codec if isinstance(codec, FrameCodec) else JSON_FRAME_CODEC
+
+
+def _ws_send_lock(websocket: WebSocket) -> asyncio.Lock:
+    """Return the per-connection send lock, creating it on first use.
+
+    Concurrent dispatch tasks, the heartbeat and SLA broadcasts all write to the
+    same socket; each frame is sent under this lock so writes never interleave.
+    """
+    scope = getattr(websocket, "scope", None)
+    if not isinstance(scope, dict):
+        return asyncio.Lock()
+    lock = scope.get(WS_SEND_LOCK_SCOPE_KEY)
+    if not isinstance(lock, asyncio.Lock):
+        lock = scope[WS_SEND_LOCK_SCOPE_KEY] = asyncio.Lock()
+    return lock
+
+
+async def _send_ws_raw(websocket: WebSocket, frame: str | bytes) -> None:
+    """Send an already-encoded frame (``bytes`` as binary, ``str`` as text) under the send lock."""
+    async with _ws_send_lock(websocket):
+        if isinstance(frame, bytes):
+            await websocket.send_bytes(frame)
+        else:
+            await websocket.send_text(frame)
+
+
+async def _send_ws_frame(websocket: WebSocket, payload: dict[str, Any]) -> None:
+    """Encode *payload* with the connection codec and send it as a text or binary frame."""
+    await _send_ws_raw(websocket, _ws_frame_codec(websocket).encode(payload))
+
+
+async def _send_ws_json_body(websocket: WebSocket, body: bytes | memoryview | str) -> None:
+    """Forward an already-rendered JSON body (e.g. a JSONResponse) as one frame.
+
+    JSON connections get the body verbatim; binary codecs re-encode the object.
+    """
+    text = bytes(body).decode("utf-8") if isinstance(body, bytes | memoryview) else str(body)
+    if not _ws_frame_codec(websocket).binary:
+        await _send_ws_raw(websocket, text)
+        return
+    await _send_ws_frame(websocket, json.loads(text))
+
 
 def _is_prepared_request(prepared: Any) -> bool:
     """Structural check distinguishing a ``PreparedRequest`` from an error ``Response``.
@@ -59,15 +114,17 @@ def _registry_has_streaming_for_payload(registry: Any, payload_type: str) -> boo
     return fn(payload_type) is True
 
 
-async def _synthesize_ws_request(body: str, websocket: WebSocket) -> Request:
+async def _synthesize_ws_request(body: str | bytes, websocket: WebSocket) -> Request:
     """Build a minimal Starlette ``Request`` carrying *body* for the shared pipeline.
 
     The shared :meth:`ASAPRequestHandler._prepare_request` pipeline reads the
     JSON-RPC body via ``request.stream()``, so the WS path provides a ``Request``.
     The scope mirrors the WS handshake (headers, path, server) so auth and
-    content-length checks behave like the HTTP path.
+    content-length checks behave like the HTTP path. The frame is handed to the
+    streaming body reader as a single chunk: ``bytes`` frames are not copied and
+    text frames are encoded once.
     """
-    body_bytes = body.encode("utf-8")
+    body_bytes = body.encode("utf-8") if isinstance(body, str) else body
     headers = list(websocket.scope.get("headers", []))
     headers.append((b"content-length", str(len(body_bytes)).encode()))
     scope: dict[str, Any] = {
@@ -107,17 +164,16 @@ async def _send_rate_limit_error(
         client=websocket.client,
         limit_per_sec=bucket.rate,
     )
-    await websocket.send_text(
-        json.dumps(
-            {
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32001,
-                    "message": "Rate limit exceeded; too many messages per second",
-                },
-                "id": data.get("id"),
-            }
-        )
+    await _send_ws_frame(
+        websocket,
+        {
+            "jsonrpc": "2.0",
+            "error": {
+                "code": -32001,
+                "message": "Rate limit exceeded; too many messages per second",
+            },
+            "id": data.get("id"),
+        },
     )
 
 
@@ -138,20 +194,57 @@ async def _maybe_send_received_ack(websocket: WebSocket, envelope_for_ack: Envel
     """Send a ``received`` ack frame when *envelope_for_ack* requires one."""
     if envelope_for_ack is None or not envelope_for_ack.requires_ack or not envelope_for_ack.id:
         return
-    ack_frame = _build_ack_notification_frame(
+    ack_frame = _build_ack_notification(
         original_envelope_id=envelope_for_ack.id,
         status="received",
         sender=envelope_for_ack.recipient,
         recipient=envelope_for_ack.sender,
         asap_version=envelope_for_ack.asap_version,
     )
-    await websocket.send_text(ack_frame)
+    await _send_ws_frame(websocket, ack_frame)
+
+
+async def _prepare_ws_request(
+    websocket: WebSocket,
+    request_handler: "ASAPRequestHandler",
+    raw: str | bytes,
+    data: dict[str, Any],
+) -> Any:
+    """Run the shared preparation pipeline for one frame.
+
+    Text frames go through :meth:`ASAPRequestHandler._prepare_request` with a
+    synthesized request body, exactly like ``POST /asap``. Binary frames were
+    already decoded by the connection codec, so *data* is validated directly
+    (no JSON round-trip); the size limit is applied to the encoded frame.
+    """
+    start_time = time.perf_counter()
+    if isinstance(raw, str):
+        request = await _synthesize_ws_request(raw, websocket)
+        return await request_handler._prepare_request(  # noqa: SLF001 — public dispatch seam
+            request, start_time, received_log_event="asap.request.ws_received"
+        )
+    max_size = request_handler.max_request_size
+    if len(raw) > max_size:
+        logger.warning("asap.request.size_exceeded", content_length=len(raw), max_size=max_size)
+        return request_handler._json_response(  # noqa: SLF001
+            {"detail": f"Request size ({len(raw)} bytes) exceeds maximum ({max_size} bytes)"},
+            status_code=413,
+        )
+    rpc_request, parse_error = request_handler._validate_parsed_body(data)  # noqa: SLF001
+    if parse_error is not None:
+        return parse_error
+    if rpc_request is None:
+        raise RuntimeError("Internal error: rpc_request is None after validation")
+    request = await _synthesize_ws_request("", websocket)
+    return await request_handler._prepare_rpc_request(  # noqa: SLF001
+        request, rpc_request, start_time, received_log_event="asap.request.ws_received"
+    )
 
 
 async def _dispatch_ws_envelope(
     websocket: WebSocket,
     request_handler: "ASAPRequestHandler",
-    raw: str,
+    raw: str | bytes,
     data: dict[str, Any],
     envelope_for_ack: Envelope | None,
 ) -> WSCloseAction:
@@ -168,18 +261,14 @@ async def _dispatch_ws_envelope(
     response_id: str | int = jsonrpc_id if jsonrpc_id is not None else ""
     prepared: Any = None
     try:
-        request = await _synthesize_ws_request(raw, websocket)
-        prepared = await request_handler._prepare_request(  # noqa: SLF001 — public dispatch seam
-            request, time.perf_counter(), received_log_event="asap.request.ws_received"
-        )
+        prepared = await _prepare_ws_request(websocket, request_handler, raw, data)
         if _is_prepared_request(prepared):
             await _run_ws_dispatch(
                 websocket, request_handler, cast("PreparedRequest", prepared), response_id
             )
             return WSCloseAction.CONTINUE
         # Preparation failed: forward the JSON-RPC error response body over WS.
-        body = cast("Response", prepared).body
-        await websocket.send_text(body.decode("utf-8") if isinstance(body, bytes) else str(body))
+        await _send_ws_json_body(websocket, cast("Response", prepared).body)
         return WSCloseAction.CONTINUE
     except ASAPError as e:
         ctx = cast("PreparedRequest", prepared).ctx if _is_prepared_request(prepared) else None
@@ -340,8 +429,7 @@ def _ws_app_state(websocket: WebSocket) -> Any:
 
 async def _send_ws_response_frame(websocket: WebSocket, response: JSONResponse) -> None:
     """Forward an HTTP ``JSONResponse`` (already a JSON-RPC error/503 body) as a WS frame."""
-    body = response.body
-    await websocket.send_text(body.decode("utf-8") if isinstance(body, bytes) else str(body))
+    await _send_ws_json_body(websocket, response.body)
 
 
 async def _send_ws_recoverable_error_frame(
@@ -374,7 +462,7 @@ async def _send_ws_recoverable_error_frame(
         error=JsonRpcError(code=rpc_code, message=message, data=data),
         id=response_id,
     )
-    await websocket.send_text(json.dumps(frame.model_dump(mode="json")))
+    await _send_ws_frame(websocket, frame.model_dump(mode="json"))
 
 
 async def _send_ws_asap_error_frame(
@@ -403,7 +491,7 @@ async def _send_ws_result_frame(
     """Wrap *response_envelope* in a JSON-RPC result frame and send it over WS."""
     injected = inject_envelope_trace_context(response_envelope)
     frame = JsonRpcResponse(result={"envelope": injected.model_dump(mode="json")}, id=response_id)
-    await websocket.send_text(json.dumps(frame.model_dump()))
+    await _send_ws_frame(websocket, frame.model_dump())
 
 
 async def _send_ws_dispatch_failure(
@@ -412,7 +500,7 @@ async def _send_ws_dispatch_failure(
     """Send a ``rejected`` ack frame when WS dispatch raises, if ack is required."""
     if envelope_for_ack is None or not envelope_for_ack.requires_ack or not envelope_for_ack.id:
         return
-    reject_frame = _build_ack_notification_frame(
+    reject_frame = _build_ack_notification(
         original_envelope_id=envelope_for_ack.id,
         status="rejected",
         sender=envelope_for_ack.recipient,
@@ -420,7 +508,7 @@ async def _send_ws_dispatch_failure(
         asap_version=envelope_for_ack.asap_version,
         error=str(error),
     )
-    await websocket.send_text(reject_frame)
+    await _send_ws_frame(websocket, reject_frame)
 
 
 async def _send_internal_error_frame(
@@ -479,7 +567,7 @@ async def _send_internal_error_frame(
         "id": response_id,
     }
     try:
-        await websocket.send_text(json.dumps(error_payload))
+        await _send_ws_frame(websocket, error_payload)
     except Exception as send_error:  # noqa: BLE001 — send failure breaks the loop
         logger.debug("asap.websocket.error_payload_failed", error=str(send_error))
         return WSCloseAction.CLOSE_FATAL
@@ -487,10 +575,13 @@ async def _send_internal_error_frame(
 
 
 __all__ = [
+    "WS_FRAME_CODEC_SCOPE_KEY",
     "_dispatch_ws_envelope",
     "_extract_envelope_for_ack",
     "_maybe_send_received_ack",
     "_registry_has_streaming_for_payload",
     "_send_rate_limit_error",
+    "_send_ws_frame",
     "_synthesize_ws_request",
+    "_ws_frame_codec",
 ]
@@ -9,7 +9,6 @@ requests.
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Any
 
 from asap.models.envelope import Envelope
@@ -21,6 +20,7 @@ from asap.transport.ws.codecs import (
     ASAP_ACK_METHOD,
     HEARTBEAT_FRAME_TYPE_PING,
     HEARTBEAT_FRAME_TYPE_PONG,
+    FrameCodec,
     decode_frame_to_json,
 )
 
@@ -30,11 +30,13 @@ logger = get_logger(__name__)
 class _RecvDispatch:
     """Mixin: inbound WS frame loop and per-frame routing for the client transport.
 
-    The host class must initialize ``_ws``, ``_pending``, ``_pending_request_ids``,
-    ``_pending_acks`` and ``_on_message`` before calling :meth:`_recv_loop`.
+    The host class must initialize ``_ws``, ``_frame_codec``, ``_pending``,
+    ``_pending_request_ids``, ``_pending_acks`` and ``_on_message`` before
+    calling :meth:`_recv_loop`.
     """
 
     _ws: Any
+    _frame_codec: FrameCodec
     _pending: dict[str, asyncio.Future[Envelope]]
     _pending_request_ids: dict[str, str]
     _pending_acks: dict[str, Any]
@@ -47,16 +49,16 @@ class _RecvDispatch:
         try:
             while self._ws is not None:
                 raw = await self._ws.recv()
-                if isinstance(raw, bytes):
-                    raw = raw.decode("utf-8")
                 try:
-                    data = decode_frame_to_json(raw)
+                    data = decode_frame_to_json(raw, self._frame_codec.encoding)
                 except ValueError as e:
                     logger.warning("asap.websocket.recv_loop_parse_error", error=str(e))
                     continue
                 if self._is_client_heartbeat_ping(data):
                     if self._ws is not None:
-                        await self._ws.send(json.dumps({"type": HEARTBEAT_FRAME_TYPE_PONG}))
+                        await self._ws.send(
+                            self._frame_codec.encode({"type": HEARTBEAT_FRAME_TYPE_PONG})
+                        )
                     continue
                 if data.get("method") == ASAP_ACK_METHOD and "params" in data:
                     self._consume_ack_frame(data)
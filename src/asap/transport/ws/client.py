@@ -25,11 +25,15 @@ from asap.transport.ws._errors import WebSocketRemoteError
 from asap.transport.ws._recv import _RecvDispatch
 from asap.transport.ws.codecs import (
     DEFAULT_WS_RECEIVE_TIMEOUT,
+    FRAME_ENCODING_JSON,
+    JSON_FRAME_CODEC,
     RECONNECT_INITIAL_BACKOFF,
     RECONNECT_MAX_BACKOFF,
     ASAP_ACK_METHOD,
+    FrameCodec,
     _is_heartbeat_pong,
     decode_frame_to_json,
+    get_frame_codec,
 )
 
 if TYPE_CHECKING:
@@ -63,8 +67,12 @@ class WebSocketTransport(_RecvDispatch, _AckRetransmit):
     the collapsed send preamble (:meth:`_send_frame`), and public send/receive
     methods.
 
+    ``frame_encoding`` requests a registered frame codec (e.g. ``"msgpack"``)
+    through the WebSocket subprotocol; if the server does not accept it the
+    connection falls back to JSON text frames (see :attr:`frame_encoding`).
+
     Example:
-        >>> async with WebSocketTransport() as t:
+        >>> async with WebSocketTransport(frame_encoding="msgpack") as t:
         ...     await t.connect("ws://localhost:8080/asap/ws")
         ...     await t.send(envelope)
     """
@@ -85,8 +93,12 @@ class WebSocketTransport(_RecvDispatch, _AckRetransmit):
         ack_check_interval: float = 5.0,
         ssl_context: ssl.SSLContext | None = None,
         extra_headers: dict[str, str] | None = None,
+        frame_encoding: str = FRAME_ENCODING_JSON,
     ) -> None:
         self._ws: WebSocketClientProtocol | None = None
+        # Resolved eagerly so a missing optional codec fails at construction.
+        self._requested_codec = get_frame_codec(frame_encoding)
+        self._frame_codec = JSON_FRAME_CODEC
         self._receive_timeout = receive_timeout
         self._on_message = on_message
         self._ping_interval = ping_interval
@@ -136,7 +148,13 @@ class WebSocketTransport(_RecvDispatch, _AckRetransmit):
             connect_kwargs["ssl"] = self._ssl_context
         if self._extra_headers:
             connect_kwargs["extra_headers"] = self._extra_headers
+        if self._requested_codec is not JSON_FRAME_CODEC:
+            connect_kwargs["subprotocols"] = [
+                self._requested_codec.subprotocol,
+                JSON_FRAME_CODEC.subprotocol,
+            ]
         self._ws = cast(Any, await _shim.websockets.connect(url, **connect_kwargs))
+        self._frame_codec = self._negotiated_codec()
         if self._closed:
             await self._close_ws()
             return
@@ -145,6 +163,25 @@ class WebSocketTransport(_RecvDispatch, _AckRetransmit):
         self._connected_event.set()
         logger.info("asap.websocket.client_connected", url=url)
 
+    def _negotiated_codec(self) -> FrameCodec:
+        """Codec selected by the server's subprotocol reply (JSON when it declined)."""
+        requested = self._requested_codec
+        if requested is JSON_FRAME_CODEC:
+            return JSON_FRAME_CODEC
+        if getattr(self._ws, "subprotocol", None) == requested.subprotocol:
+            return requested
+        logger.info(
+            "asap.websocket.frame_codec_fallback",
+            requested=requested.encoding,
+            using=JSON_FRAME_CODEC.encoding,
+        )
+        return JSON_FRAME_CODEC
+
+    @property
+    def frame_encoding(self) -> str:
+        """Frame encoding in use on the current connection (``"json"`` until negotiated)."""
+        return self._frame_codec.encoding
+
     async def _cancel_ack_check_task(self) -> None:
         if self._ack_check_task is None:
             return
@@ -269,7 +306,7 @@ class WebSocketTransport(_RecvDispatch, _AckRetransmit):
         return dump
 
     async def _send_frame(self, envelope: Envelope, *, register_ack: bool) -> str:
-        """Encode *envelope* and send one JSON-RPC text frame; return the request id.
+        """Encode *envelope* and send one JSON-RPC frame; return the request id.
 
         Shared by ``send``, ``send_and_receive``, ``send_and_receive_stream``,
         and the retransmit path. Reads ``encode_envelope_frame`` off the shim so
@@ -278,11 +315,21 @@ class WebSocketTransport(_RecvDispatch, _AckRetransmit):
         if self._ws is None:
             raise RuntimeError("WebSocket not connected; call connect(url) first")
         request_id = self._next_request_id()
-        frame = _shim.encode_envelope_frame(
-            self._envelope_dict_for_send(envelope), request_id=request_id
-        )
-        if not isinstance(frame, str):
-            raise TypeError(f"Expected text frame (str), got {type(frame).__name__}")
+        codec = self._frame_codec
+        if codec is JSON_FRAME_CODEC:
+            frame = _shim.encode_envelope_frame(
+                self._envelope_dict_for_send(envelope), request_id=request_id
+            )
+            if not isinstance(frame, str):
+                raise TypeError(f"Expected text frame (str), got {type(frame).__name__}")
+        else:
+            frame = _shim.encode_envelope_frame(
+                self._envelope_dict_for_send(envelope),
+                request_id=request_id,
+                encoding=codec.encoding,
+            )
+            if not isinstance(frame, bytes):
+                raise TypeError(f"Expected binary frame (bytes), got {type(frame).__name__}")
         await self._ws.send(frame)
         if register_ack:
             self._register_pending_ack(envelope)
@@ -317,9 +364,7 @@ class WebSocketTransport(_RecvDispatch, _AckRetransmit):
         assert ws is not None  # _send_frame raises if not connected
         while True:
             raw = await asyncio.wait_for(ws.recv(), timeout=self._receive_timeout)
-            if isinstance(raw, bytes):
-                raw = raw.decode("utf-8")
-            data = decode_frame_to_json(raw)
+            data = decode_frame_to_json(raw, self._frame_codec.encoding)
             if _is_heartbeat_pong(data) or data.get("method") == ASAP_ACK_METHOD:
                 continue
             if "error" in data:
@@ -347,9 +392,7 @@ class WebSocketTransport(_RecvDispatch, _AckRetransmit):
         if self._ws is None:
             raise RuntimeError("WebSocket not connected; call connect(url) first")
         raw = await asyncio.wait_for(self._ws.recv(), timeout=self._receive_timeout)
-        if isinstance(raw, bytes):
-            raw = raw.decode("utf-8")
-        data = decode_frame_to_json(raw)
+        data = decode_frame_to_json(raw, self._frame_codec.encoding)
         if "error" in data:
             err = data["error"]
             raise WebSocketRemoteError(
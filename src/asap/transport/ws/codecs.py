@@ -1,9 +1,12 @@
-"""Frame codecs and constants for ASAP WebSocket JSON-RPC 2.0 text frames.
+"""Frame codecs and constants for ASAP WebSocket JSON-RPC 2.0 frames.
 
-One WebSocket text frame carries one JSON-RPC 2.0 request, response, or
-notification. This module defines the framing primitives shared by the WS client
-and server:
+One WebSocket frame carries one JSON-RPC 2.0 request, response, or
+notification. JSON text frames are the default; a binary encoding (MessagePack)
+can be negotiated per connection through the WebSocket subprotocol. This module
+defines the framing primitives shared by the WS client and server:
 
+- :class:`FrameCodec` and the codec registry (:func:`register_frame_codec`,
+  :func:`get_frame_codec`, :func:`negotiate_frame_codec`).
 - :func:`encode_envelope_frame` / :func:`decode_frame_to_json` — JSON-RPC wire framing.
 - :func:`_build_ack_notification_frame` — server-side ``asap.ack`` push (ADR-16).
 - :func:`_is_heartbeat_pong` — application-level heartbeat discrimination.
@@ -16,20 +19,33 @@ patching through ``asap.transport.websocket``.
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from asap.models.envelope import Envelope
 from asap.models.payloads import MessageAck
 from asap.transport.jsonrpc import ASAP_METHOD
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    msgpack = None
+
 if TYPE_CHECKING:
     pass
 
 # JSON-RPC method for server push of MessageAck (ADR-16).
 ASAP_ACK_METHOD: Literal["asap.ack"] = "asap.ack"
 
-# Frame encoding is JSON text only.
+# Frame encodings: JSON text (default, always available) and MessagePack binary
+# (requires the optional ``msgpack`` extra).
 FRAME_ENCODING_JSON: Literal["json"] = "json"
+FRAME_ENCODING_MSGPACK: Literal["msgpack"] = "msgpack"
+
+# WebSocket subprotocols advertising each frame encoding in the handshake.
+WS_SUBPROTOCOL_JSON: str = "asap.json"
+WS_SUBPROTOCOL_MSGPACK: str = "asap.msgpack"
 
 # Default timeout for WebSocket receive (seconds).
 DEFAULT_WS_RECEIVE_TIMEOUT: float = 60.0
@@ -46,6 +62,9 @@ HEARTBEAT_FRAME_TYPE_PONG: Literal["pong"] = "pong"
 RECONNECT_INITIAL_BACKOFF: float = 1.0
 RECONNECT_MAX_BACKOFF: float = 30.0
 
+# Server-side dispatch window: max envelopes dispatched concurrently per connection.
+DEFAULT_WS_DISPATCH_WINDOW: int = 16
+
 # Connection pool sizing.
 DEFAULT_POOL_MAX_SIZE: int = 10
 DEFAULT_POOL_IDLE_TIMEOUT: float = 60.0
@@ -84,49 +103,155 @@ SLA_UNSUBSCRIBE_METHOD: str = "sla.unsubscribe"
 SLA_BREACH_NOTIFICATION_METHOD: str = "sla.breach"
 
 
+@dataclass(frozen=True)
+class FrameCodec:
+    """Wire encoding for JSON-RPC objects carried in WebSocket frames.
+
+    Attributes:
+        encoding: Short name used by callers (``"json"``, ``"msgpack"``).
+        subprotocol: WebSocket subprotocol that selects this codec in the handshake.
+        binary: True when frames are sent as binary (``bytes``) rather than text.
+        encode: Serialize a JSON-RPC object to a frame.
+        decode: Parse a frame back into a JSON-RPC object; raises ``ValueError``
+            on malformed input.
+    """
+
+    encoding: str
+    subprotocol: str
+    binary: bool
+    encode: Callable[[Any], str | bytes]
+    decode: Callable[[str | bytes], Any]
+
+
+def _json_decode(raw: str | bytes) -> Any:
+    return json.loads(raw)
+
+
+def _msgpack_encode(obj: Any) -> bytes:
+    return cast(bytes, msgpack.packb(obj, use_bin_type=True))
+
+
+def _msgpack_decode(raw: str | bytes) -> Any:
+    if isinstance(raw, str):
+        raise ValueError("MessagePack frames must be binary")
+    try:
+        return msgpack.unpackb(raw, raw=False)
+    except ValueError:
+        raise
+    except Exception as e:  # msgpack raises a few non-ValueError types on bad input
+        raise ValueError(f"Invalid MessagePack frame: {e}") from e
+
+
+JSON_FRAME_CODEC = FrameCodec(
+    encoding=FRAME_ENCODING_JSON,
+    subprotocol=WS_SUBPROTOCOL_JSON,
+    binary=False,
+    encode=json.dumps,
+    decode=_json_decode,
+)
+
+_FRAME_CODECS: dict[str, FrameCodec] = {FRAME_ENCODING_JSON: JSON_FRAME_CODEC}
+
+if msgpack is not None:
+    _FRAME_CODECS[FRAME_ENCODING_MSGPACK] = FrameCodec(
+        encoding=FRAME_ENCODING_MSGPACK,
+        subprotocol=WS_SUBPROTOCOL_MSGPACK,
+        binary=True,
+        encode=_msgpack_encode,
+        decode=_msgpack_decode,
+    )
+
+
+def register_frame_codec(codec: FrameCodec) -> None:
+    """Register (or replace) the codec for ``codec.encoding``.
+
+    Registered codecs can be requested by clients and are offered by the
+    server during subprotocol negotiation.
+    """
+    _FRAME_CODECS[codec.encoding] = codec
+
+
+def get_frame_codec(encoding: str = FRAME_ENCODING_JSON) -> FrameCodec:
+    """Return the registered codec for *encoding*.
+
+    Raises:
+        ImportError: If *encoding* is ``"msgpack"`` and the extra is not installed.
+        ValueError: If no codec is registered for *encoding*.
+    """
+    codec = _FRAME_CODECS.get(encoding)
+    if codec is not None:
+        return codec
+    if encoding == FRAME_ENCODING_MSGPACK:
+        raise ImportError(
+            "MessagePack WebSocket frames require the 'msgpack' package. "
+            "Install it with: pip install 'asap-protocol[msgpack]'"
+        )
+    raise ValueError(
+        f"Unknown WebSocket frame encoding {encoding!r}; registered: {sorted(_FRAME_CODECS)}"
+    )
+
+
+def negotiate_frame_codec(offered: Iterable[str]) -> FrameCodec | None:
+    """Pick the first subprotocol in *offered* (client preference order) we can serve.
+
+    Returns ``None`` when nothing matches; the connection then uses JSON text
+    frames without a subprotocol, as before negotiation existed.
+    """
+    by_subprotocol = {codec.subprotocol: codec for codec in _FRAME_CODECS.values()}
+    for subprotocol in offered:
+        codec = by_subprotocol.get(subprotocol)
+        if codec is not None:
+            return codec
+    return None
+
+
 def encode_envelope_frame(
     envelope: dict[str, Any],
     request_id: str | int = "",
-    encoding: Literal["json"] = FRAME_ENCODING_JSON,
-) -> str:
-    """Serialize an ASAP envelope as a JSON-RPC 2.0 request text frame.
+    encoding: str = FRAME_ENCODING_JSON,
+) -> str | bytes:
+    """Serialize an ASAP envelope as a JSON-RPC 2.0 request frame.
 
     Args:
         envelope: The envelope dict to carry in ``params.envelope``.
         request_id: JSON-RPC ``id`` for the request (correlated with the response).
-        encoding: Frame encoding; only ``"json"`` is supported (binary path removed).
+        encoding: Frame encoding (``"json"`` text or a registered binary codec).
 
     Returns:
-        A JSON string ready to send as a WebSocket text frame.
+        A JSON string (text frame) or ``bytes`` (binary frame) for *encoding*.
 
     Example:
         >>> frame = encode_envelope_frame({"sender": "a", ...}, request_id="r1")
         >>> isinstance(frame, str)
         True
     """
-    del encoding  # Only JSON is supported; kept for signature compatibility.
     payload = {
         "jsonrpc": "2.0",
         "method": ASAP_METHOD,
         "params": {"envelope": envelope},
         "id": request_id,
     }
-    return json.dumps(payload)
+    if encoding == FRAME_ENCODING_JSON:
+        return json.dumps(payload)
+    return get_frame_codec(encoding).encode(payload)
 
 
-def decode_frame_to_json(raw: str) -> dict[str, Any]:
-    """Parse a WebSocket text frame into its JSON-RPC dict.
+def decode_frame_to_json(raw: str | bytes, encoding: str = FRAME_ENCODING_JSON) -> dict[str, Any]:
+    """Parse a WebSocket frame into its JSON-RPC dict.
 
     Args:
-        raw: The received frame text.
+        raw: The received frame (text, or bytes for binary encodings).
+        encoding: Frame encoding negotiated for the connection.
 
     Returns:
         The parsed JSON-RPC object.
 
     Raises:
-        ValueError: If *raw* is not valid JSON.
+        ValueError: If *raw* is not a valid frame for *encoding*.
     """
-    return cast(dict[str, Any], json.loads(raw))
+    if encoding == FRAME_ENCODING_JSON:
+        return cast(dict[str, Any], json.loads(raw))
+    return cast(dict[str, Any], get_frame_codec(encoding).decode(raw))
 
 
 def _is_heartbeat_pong(data: dict[str, Any]) -> bool:
@@ -155,6 +280,22 @@ def _build_ack_notification_frame(
     Returns:
         A JSON string ready to send as a WebSocket text frame.
     """
+    return json.dumps(
+        _build_ack_notification(
+            original_envelope_id, status, sender, recipient, asap_version, error
+        )
+    )
+
+
+def _build_ack_notification(
+    original_envelope_id: str,
+    status: Literal["received", "processed", "rejected"],
+    sender: str,
+    recipient: str,
+    asap_version: str = "0.1",
+    error: str | None = None,
+) -> dict[str, Any]:
+    """Build the ``asap.ack`` notification object; see :func:`_build_ack_notification_frame`."""
     ack_payload = MessageAck(
         original_envelope_id=original_envelope_id,
         status=status,
@@ -167,13 +308,11 @@ def _build_ack_notification_frame(
         payload_type="MessageAck",
         payload=ack_payload.model_dump(),
     )
-    return json.dumps(
-        {
-            "jsonrpc": "2.0",
-            "method": ASAP_ACK_METHOD,
-            "params": {"envelope": ack_envelope.model_dump(mode="json")},
-        }
-    )
+    return {
+        "jsonrpc": "2.0",
+        "method": ASAP_ACK_METHOD,
+        "params": {"envelope": ack_envelope.model_dump(mode="json")},
+    }
 
 
 __all__ = [
@@ -183,8 +322,12 @@ __all__ = [
     "DEFAULT_MAX_ACK_RETRIES",
     "DEFAULT_POOL_IDLE_TIMEOUT",
     "DEFAULT_POOL_MAX_SIZE",
+    "DEFAULT_WS_DISPATCH_WINDOW",
     "DEFAULT_WS_RECEIVE_TIMEOUT",
     "FRAME_ENCODING_JSON",
+    "FRAME_ENCODING_MSGPACK",
+    "FrameCodec",
+    "JSON_FRAME_CODEC",
     "HEARTBEAT_FRAME_TYPE_PING",
     "HEARTBEAT_FRAME_TYPE_PONG",
     "HEARTBEAT_PING_INTERVAL",
@@ -199,8 +342,14 @@ __all__ = [
     "WS_CLOSE_GOING_AWAY",
     "WS_CLOSE_POLICY_VIOLATION",
     "WS_CLOSE_REASON_SHUTDOWN",
+    "WS_SUBPROTOCOL_JSON",
+    "WS_SUBPROTOCOL_MSGPACK",
+    "_build_ack_notification",
     "_build_ack_notification_frame",
     "_is_heartbeat_pong",
     "decode_frame_to_json",
     "encode_envelope_frame",
+    "get_frame_codec",
+    "negotiate_frame_codec",
+    "register_frame_codec",
 ]
@@ -1,8 +1,9 @@
 """Server-side WebSocket handling for ASAP JSON-RPC 2.0 traffic.
 
-This module accepts WebSocket connections, enforces optional OAuth2 bearer
-authentication, runs heartbeat and stale-connection checks, applies per-connection
-rate limiting, dispatches ASAP envelopes, and broadcasts SLA breach notifications.
+This module accepts WebSocket connections, negotiates the frame codec from the
+offered subprotocols, enforces optional OAuth2 bearer authentication, runs
+heartbeat and stale-connection checks, applies per-connection rate limiting,
+dispatches ASAP envelopes, and broadcasts SLA breach notifications.
 
 ``_heartbeat_loop`` reads ``HEARTBEAT_PING_INTERVAL`` from the compatibility shim
 at call time so tests can patch ``asap.transport.websocket.HEARTBEAT_PING_INTERVAL``.
@@ -13,31 +14,41 @@ from __future__ import annotations
 import asyncio
 import json
 import time
+from collections.abc import Awaitable, Callable
 from contextlib import suppress
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from fastapi import WebSocket
 
-from asap.observability import get_logger
+from asap.models.envelope import Envelope
+from asap.observability import get_logger, get_metrics
 from asap.transport.rate_limit import (
     DEFAULT_WS_MESSAGES_PER_SECOND,
     WebSocketTokenBucket,
 )
 from asap.transport.ws._actions import WSCloseAction, _ws_close_code
 from asap.transport.ws._dispatch import (
+    WS_FRAME_CODEC_SCOPE_KEY,
     _dispatch_ws_envelope,
     _extract_envelope_for_ack,
     _maybe_send_received_ack,
     _send_rate_limit_error,
+    _send_ws_raw,
+    _send_ws_frame,
+    _ws_frame_codec,
 )
 from asap.transport.ws.codecs import (
+    DEFAULT_WS_DISPATCH_WINDOW,
     HEARTBEAT_FRAME_TYPE_PING,
     SLA_BREACH_NOTIFICATION_METHOD,
     SLA_SUBSCRIBE_METHOD,
     SLA_UNSUBSCRIBE_METHOD,
     STALE_CONNECTION_TIMEOUT,
     WS_CLOSE_AUTH_REQUIRED,
+    FrameCodec,
     _is_heartbeat_pong,
+    negotiate_frame_codec,
 )
 
 # Shim alias used for test patching. The compatibility module binds the names
@@ -115,7 +126,7 @@ async def _heartbeat_loop(
                 logger.info("asap.websocket.stale_connection", idle_seconds=now - last_received[0])
                 closed.set()
                 return
-            await websocket.send_text(json.dumps({"type": HEARTBEAT_FRAME_TYPE_PING}))
+            await _send_ws_frame(websocket, {"type": HEARTBEAT_FRAME_TYPE_PING})
         except asyncio.CancelledError:
             return
         except (SystemExit, KeyboardInterrupt):
@@ -153,14 +164,14 @@ class _WSSubscriptionDispatch:
 
     async def _handle_subscribe(self, websocket: WebSocket, request_id: Any) -> None:
         self._subscribers.add(websocket)
-        await websocket.send_text(
-            json.dumps({"jsonrpc": "2.0", "result": {"subscribed": True}, "id": request_id})
+        await _send_ws_frame(
+            websocket, {"jsonrpc": "2.0", "result": {"subscribed": True}, "id": request_id}
         )
 
     async def _handle_unsubscribe(self, websocket: WebSocket, request_id: Any) -> None:
         self._subscribers.discard(websocket)
-        await websocket.send_text(
-            json.dumps({"jsonrpc": "2.0", "result": {"unsubscribed": True}, "id": request_id})
+        await _send_ws_frame(
+            websocket, {"jsonrpc": "2.0", "result": {"unsubscribed": True}, "id": request_id}
         )
 
 
@@ -184,10 +195,19 @@ async def broadcast_sla_breach(
         "params": {"breach": breach.model_dump(mode="json")},
     }
     text = json.dumps(payload, default=str)
+    # Encode once per codec in use rather than once per subscriber.
+    encoded: dict[str, str | bytes] = {}
 
     async def _safe_send(ws: WebSocket) -> None:
+        codec = _ws_frame_codec(ws)
         try:
-            await ws.send_text(text)
+            if not codec.binary:
+                await _send_ws_raw(ws, text)
+                return
+            frame = encoded.get(codec.encoding)
+            if frame is None:
+                frame = encoded[codec.encoding] = codec.encode(json.loads(text))
+            await _send_ws_raw(ws, frame)
         except (RuntimeError, OSError) as e:
             logger.debug("asap.websocket.sla_breach_send_error", error=str(e))
             subscribers.discard(ws)
@@ -195,39 +215,170 @@ async def broadcast_sla_breach(
     await asyncio.gather(*(_safe_send(ws) for ws in list(subscribers)))
 
 
-async def _process_ws_message(
-    raw: str,
+class _WSDispatchWindow:
+    """Bounded set of in-flight envelope dispatches for one WebSocket connection.
+
+    The receive loop hands each admitted envelope to :meth:`submit`, which runs
+    it as a task so a slow handler no longer stalls the frames behind it. At most
+    ``size`` dispatches run at once; when the window is full :meth:`submit`
+    blocks, which stops the loop from reading further frames (backpressure on the
+    socket). Responses carry the JSON-RPC ``id``, so the client
+    (``WebSocketTransport._pending``) correlates them regardless of order.
+
+    With ``ordered=True`` dispatches sharing an envelope ``correlation_id`` run
+    one after another in arrival order; unrelated traffic still overlaps. A
+    dispatch queued behind its predecessor takes a window slot only once it can
+    run, so a burst on one ``correlation_id`` cannot fill the window; at most
+    ``size`` such dispatches wait at once, beyond which :meth:`submit` blocks too.
+    """
+
+    def __init__(self, size: int, *, ordered: bool = False) -> None:
+        self.size = size
+        self.ordered = ordered
+        self.close_action = WSCloseAction.CONTINUE
+        # Set together with close_action so the receive loop stops without waiting for a frame.
+        self.closing = asyncio.Event()
+        self._slots = asyncio.Semaphore(size)
+        self._queued = asyncio.Semaphore(size)
+        self._tasks: set[asyncio.Task[WSCloseAction]] = set()
+        self._tails: dict[str, asyncio.Task[WSCloseAction]] = {}
+        self._labels = {"window": str(size)}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    async def submit(
+        self,
+        dispatch: Callable[[], Awaitable[WSCloseAction]],
+        order_key: str | None = None,
+    ) -> None:
+        """Start *dispatch* once a slot is free (blocks the caller while the window is full)."""
+        metrics = get_metrics()
+        previous = self._tails.get(order_key) if self.ordered and order_key else None
+        # Queued behind a predecessor: _run takes the window slot once it may start.
+        admission = self._slots if previous is None else self._queued
+        if admission.locked():
+            metrics.increment_counter("asap_websocket_dispatch_backpressure_total", self._labels)
+            wait_start = time.perf_counter()
+            await admission.acquire()
+            metrics.observe_histogram(
+                "asap_websocket_dispatch_wait_seconds",
+                time.perf_counter() - wait_start,
+                self._labels,
+            )
+        else:
+            await admission.acquire()
+        metrics.increment_counter("asap_websocket_dispatch_total", self._labels)
+        task = asyncio.create_task(self._run(dispatch, previous))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+        if self.ordered and order_key:
+            self._tails[order_key] = task
+            task.add_done_callback(lambda t: self._release_tail(order_key, t))
+
+    async def _run(
+        self,
+        dispatch: Callable[[], Awaitable[WSCloseAction]],
+        previous: asyncio.Task[WSCloseAction] | None,
+    ) -> WSCloseAction:
+        if previous is not None:
+            try:
+                # Only wait for completion; the predecessor's outcome is handled by _on_done.
+                await asyncio.wait((previous,))
+            finally:
+                self._queued.release()
+            await self._slots.acquire()
+        try:
+            return await dispatch()
+        finally:
+            self._slots.release()
+
+    def _on_done(self, task: asyncio.Task[WSCloseAction]) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning("asap.websocket.dispatch_error", error=str(error))
+            action = WSCloseAction.CLOSE_FATAL
+        else:
+            action = task.result()
+        if action is not WSCloseAction.CONTINUE and self.close_action is WSCloseAction.CONTINUE:
+            self.close_action = action
+            self.closing.set()
+
+    def _release_tail(self, order_key: str, task: asyncio.Task[WSCloseAction]) -> None:
+        if self._tails.get(order_key) is task:
+            del self._tails[order_key]
+
+    async def drain(self) -> None:
+        """Wait for every in-flight dispatch to finish (frames already read are still answered)."""
+        while self._tasks:
+            await asyncio.wait(list(self._tasks))
+
+    async def aclose(self) -> None:
+        """Cancel whatever is still in flight (error or cancellation path) and wait for it."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _admit_ws_message(
+    raw: str | bytes,
     websocket: WebSocket,
-    request_handler: "ASAPRequestHandler",
     bucket: WebSocketTokenBucket | None,
     subscriptions: _WSSubscriptionDispatch | None,
-) -> WSCloseAction:
-    """Handle one inbound WS text frame and return the close action for the loop.
-
-    Parses the frame, routes SLA subscribe/unsubscribe through *subscriptions*
-    enforces the per-connection rate limit, sends the ``received`` ack when
-    required, and dispatches the envelope. Returns ``CLOSE_RATE_LIMITED`` when
-    the bucket is empty, ``CLOSE_FATAL`` on a fatal send failure, else
-    ``CONTINUE``.
+) -> tuple[WSCloseAction, dict[str, Any] | None, Envelope | None]:
+    """Run the inline part of frame handling, up to (not including) envelope dispatch.
+
+    Parses the frame with the connection codec, routes SLA subscribe/unsubscribe through *subscriptions*,
+    enforces the per-connection rate limit and sends the ``received`` ack when
+    required. Returns the close action plus, for frames that still need
+    dispatching, the decoded JSON-RPC object and the envelope used for acks
+    (``None`` data means the frame was fully handled here).
     """
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        return WSCloseAction.CONTINUE
+        data = json.loads(raw) if isinstance(raw, str) else _ws_frame_codec(websocket).decode(raw)
+    except ValueError:
+        return WSCloseAction.CONTINUE, None, None
     if _is_heartbeat_pong(data):
-        return WSCloseAction.CONTINUE
+        return WSCloseAction.CONTINUE, None, None
     if (
         isinstance(data, dict)
         and subscriptions is not None
         and subscriptions.handles(data.get("method"))
     ):
         await subscriptions.dispatch(websocket, data)
-        return WSCloseAction.CONTINUE
+        return WSCloseAction.CONTINUE, None, None
     if bucket is not None and not bucket.consume(1):
         await _send_rate_limit_error(websocket, bucket, data)
-        return WSCloseAction.CLOSE_RATE_LIMITED
+        return WSCloseAction.CLOSE_RATE_LIMITED, None, None
     envelope_for_ack = _extract_envelope_for_ack(data)
     await _maybe_send_received_ack(websocket, envelope_for_ack)
+    return WSCloseAction.CONTINUE, data, envelope_for_ack
+
+
+async def _process_ws_message(
+    raw: str | bytes,
+    websocket: WebSocket,
+    request_handler: "ASAPRequestHandler",
+    bucket: WebSocketTokenBucket | None,
+    subscriptions: _WSSubscriptionDispatch | None,
+) -> WSCloseAction:
+    """Handle one inbound WS text frame and return the close action for the loop.
+
+    Parses the frame, routes SLA subscribe/unsubscribe through *subscriptions*
+    enforces the per-connection rate limit, sends the ``received`` ack when
+    required, and dispatches the envelope. Returns ``CLOSE_RATE_LIMITED`` when
+    the bucket is empty, ``CLOSE_FATAL`` on a fatal send failure, else
+    ``CONTINUE``.
+    """
+    action, data, envelope_for_ack = await _admit_ws_message(raw, websocket, bucket, subscriptions)
+    if data is None:
+        return action
     return await _dispatch_ws_envelope(websocket, request_handler, raw, data, envelope_for_ack)
 
 
@@ -238,6 +389,8 @@ async def handle_websocket_connection(
     ws_message_rate_limit: float | None = DEFAULT_WS_MESSAGES_PER_SECOND,
     sla_breach_subscribers: set[WebSocket] | None = None,
     oauth2_middleware: "OAuth2Middleware | None" = None,
+    dispatch_window: int = DEFAULT_WS_DISPATCH_WINDOW,
+    ordered_dispatch: bool = False,
 ) -> None:
     """Serve one WebSocket connection: auth, heartbeat, rate-limited envelope dispatch.
 
@@ -246,8 +399,21 @@ async def handle_websocket_connection(
     validates the IdP JWT explicitly at acceptance. When ``manifest.auth`` is
     the active auth path, ``oauth2_middleware`` is None and the
     request-preparation pipeline handles auth via ``_prepare_request``.
+
+    The frame codec is picked from the subprotocols offered in the handshake
+    (:func:`negotiate_frame_codec`); without a match the connection uses JSON
+    text frames and no subprotocol is echoed.
+
+    Up to ``dispatch_window`` envelopes are dispatched concurrently (see
+    :class:`_WSDispatchWindow`); ``ordered_dispatch`` keeps envelopes that share
+    a ``correlation_id`` in arrival order.
     """
-    await websocket.accept()
+    codec = _negotiate_ws_codec(websocket)
+    if codec is None:
+        await websocket.accept()
+    else:
+        websocket.scope[WS_FRAME_CODEC_SCOPE_KEY] = codec
+        await websocket.accept(subprotocol=codec.subprotocol)
     if oauth2_middleware is not None and not await _enforce_ws_oauth2(websocket, oauth2_middleware):
         return
     if active_connections is not None:
@@ -265,18 +431,21 @@ async def handle_websocket_connection(
         if sla_breach_subscribers is not None
         else None
     )
+    window = _WSDispatchWindow(dispatch_window, ordered=ordered_dispatch)
     close_action = WSCloseAction.CLOSE_FATAL
     heartbeat_task: asyncio.Task[None] | None = None
     try:
         heartbeat_task = asyncio.create_task(_heartbeat_loop(websocket, last_received, closed))
         close_action = await _ws_receive_loop(
-            websocket, request_handler, closed, last_received, bucket, subscriptions
+            websocket, request_handler, closed, last_received, bucket, subscriptions, window
         )
+        await window.drain()
     except (SystemExit, KeyboardInterrupt):
         raise
     except Exception as e:
         logger.warning("asap.websocket.connection_error", error=str(e))
     finally:
+        await window.aclose()
         await _teardown_ws_connection(
             closed, heartbeat_task, active_connections, sla_breach_subscribers, websocket
         )
@@ -287,6 +456,15 @@ async def handle_websocket_connection(
         logger.info("asap.websocket.closed", client=websocket.client)
 
 
+def _negotiate_ws_codec(websocket: WebSocket) -> FrameCodec | None:
+    """Return the codec for the client's offered subprotocols, if any matches."""
+    scope = websocket.scope
+    offered = scope.get("subprotocols") if isinstance(scope, dict) else None
+    if not offered or not isinstance(offered, list | tuple):
+        return None
+    return negotiate_frame_codec(offered)
+
+
 async def _teardown_ws_connection(
     closed: asyncio.Event,
     heartbeat_task: asyncio.Task[None] | None,
@@ -313,23 +491,56 @@ async def _ws_receive_loop(
     last_received: list[float],
     bucket: WebSocketTokenBucket | None,
     subscriptions: _WSSubscriptionDispatch | None,
+    window: _WSDispatchWindow,
 ) -> WSCloseAction:
-    """Drive the receive loop until close; return the terminal close action."""
+    """Drive the receive loop until close; return the terminal close action.
+
+    Admission (parse, rate limit, ``received`` ack) stays inline so rate-limit
+    closes and ack ordering are unchanged; envelope dispatch goes through
+    *window*. Each receive races ``window.closing``, so a fatal outcome from a
+    dispatch task ends the loop immediately instead of on the next frame.
+    """
     action = WSCloseAction.CONTINUE
-    while not closed.is_set():
-        try:
-            raw = await websocket.receive_text()
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except Exception as e:
-            logger.warning("asap.websocket.receive_error", error=str(e))
-            return WSCloseAction.CLOSE_FATAL
-        last_received[0] = time.monotonic()
-        action = await _process_ws_message(raw, websocket, request_handler, bucket, subscriptions)
-        if action is WSCloseAction.CONTINUE:
-            continue
+    receive = (
+        websocket.receive_bytes if _ws_frame_codec(websocket).binary else websocket.receive_text
+    )
+    closing = asyncio.create_task(window.closing.wait())
+    receiving: asyncio.Future[str | bytes] | None = None
+    try:
+        while not closed.is_set():
+            receiving = asyncio.ensure_future(receive())
+            await asyncio.wait((receiving, closing), return_when=asyncio.FIRST_COMPLETED)
+            if not receiving.done():
+                return window.close_action
+            try:
+                raw = receiving.result()
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except Exception as e:
+                logger.warning("asap.websocket.receive_error", error=str(e))
+                return WSCloseAction.CLOSE_FATAL
+            last_received[0] = time.monotonic()
+            if window.close_action is not WSCloseAction.CONTINUE:
+                return window.close_action
+            action, data, envelope_for_ack = await _admit_ws_message(
+                raw, websocket, bucket, subscriptions
+            )
+            if action is not WSCloseAction.CONTINUE:
+                return action
+            if data is None:
+                continue
+            order_key = envelope_for_ack.correlation_id if envelope_for_ack is not None else None
+            await window.submit(
+                partial(
+                    _dispatch_ws_envelope, websocket, request_handler, raw, data, envelope_for_ack
+                ),
+                order_key,
+            )
         return action
-    return action
+    finally:
+        closing.cancel()
+        if receiving is not None:
+            receiving.cancel()
 
 
 __all__ = [
@@ -0,0 +1,104 @@
+"""Keys with expiry times, pruned through a min-heap.
+
+Replay guards (``JtiReplayCache``, ``InMemoryNonceStore``) record each key with
+an absolute expiry and must forget it afterwards. Scanning every key to find the
+expired ones made each request O(n) in the number of live keys; here a heap
+ordered by expiry yields them in O(log n) each, so pruning costs only the
+entries that actually expired and capacity eviction pops the earliest expiry
+directly.
+
+The dict is the source of truth: re-adding a key pushes a new heap entry and
+leaves the old one behind, and a popped entry only removes its key when the
+key's current expiry has passed. Stale entries are therefore harmless and are
+dropped as they surface.
+
+Not thread-safe; owners guard calls with their own lock. Time is passed in
+(``now``) so each owner keeps its own clock, which tests patch per module.
+
+Example:
+    >>> keys = ExpiringKeySet()
+    >>> keys.add("jti-1", expires_at=100.0)
+    >>> keys.live("jti-1", now=50.0)
+    True
+    >>> keys.prune(now=100.0)
+    1
+    >>> "jti-1" in keys
+    False
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class ExpiringKeySet(Generic[K]):
+    """Mapping of key to absolute expiry with O(log n) expiry and eviction."""
+
+    __slots__ = ("_expiry", "_heap", "_seq")
+
+    def __init__(self) -> None:
+        self._expiry: dict[K, float] = {}
+        # (expires_at, seq, key): seq keeps keys out of comparisons on ties.
+        self._heap: list[tuple[float, int, K]] = []
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._expiry
+
+    def __getitem__(self, key: K) -> float:
+        """Expiry recorded for ``key``."""
+        return self._expiry[key]
+
+    def live(self, key: K, now: float) -> bool:
+        """Return whether ``key`` is recorded and expires after ``now``."""
+        expires_at = self._expiry.get(key)
+        return expires_at is not None and expires_at > now
+
+    def add(self, key: K, expires_at: float) -> None:
+        """Record (or overwrite) ``key`` with ``expires_at``."""
+        self._expiry[key] = expires_at
+        heapq.heappush(self._heap, (expires_at, next(self._seq), key))
+
+    def _pop(self) -> tuple[float, K] | None:
+        """Pop the earliest heap entry still matching its key's expiry."""
+        heap = self._heap
+        while heap:
+            expires_at, _, key = heapq.heappop(heap)
+            if self._expiry.get(key) == expires_at:
+                return expires_at, key
+        return None
+
+    def prune(self, now: float) -> int:
+        """Remove keys with ``expires_at <= now``; return how many were removed."""
+        heap = self._heap
+        removed = 0
+        while heap and heap[0][0] <= now:
+            _, _, key = heapq.heappop(heap)
+            # The key may have been re-added since; only its current expiry decides.
+            expires_at = self._expiry.get(key)
+            if expires_at is not None and expires_at <= now:
+                del self._expiry[key]
+                removed += 1
+        return removed
+
+    def evict_to(self, max_size: int) -> int:
+        """Remove earliest-expiring keys until at most ``max_size`` remain."""
+        removed = 0
+        while len(self._expiry) > max_size:
+            popped = self._pop()
+            if popped is None:
+                break
+            del self._expiry[popped[1]]
+            removed += 1
+        return removed
+
+
+__all__ = ["ExpiringKeySet"]
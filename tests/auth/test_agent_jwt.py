@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import base64
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import pytest
@@ -22,6 +23,7 @@ from asap.auth.agent_jwt import (
     JWT_ALGS_SIGN,
     JWT_ALGS_VERIFY,
     JtiReplayCache,
+    VerifiedTokenCache,
     create_agent_jwt,
     create_host_jwt,
     verify_agent_jwt,
@@ -576,6 +578,16 @@ def test_jti_replay_cache_max_size_evicts_oldest_expiry_first() -> None:
     assert len(cache._expiry_by_key) == 2
     assert cache.check_and_record("p", "c")
     assert len(cache._expiry_by_key) == 2
+    assert not cache.contains("p", "a")
+    assert cache.contains("p", "c")
+
+
+def test_jti_replay_cache_concurrent_first_use_wins_once() -> None:
+    """Threads racing on the same ``jti`` see exactly one first use."""
+    cache = JtiReplayCache()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: cache.check_and_record("p", "race"), range(64)))
+    assert results.count(True) == 1
 
 
 @pytest.mark.filterwarnings("ignore:EdDSA is deprecated:UserWarning")
@@ -1191,3 +1203,186 @@ async def test_verify_agent_jwt_iat_too_far_future(monkeypatch: pytest.MonkeyPat
     res = await verify_agent_jwt(token, hosts, agents)
     assert not res.ok
     assert res.error == "invalid iat (too far in the future)"
+
+
+# --- Verified-token cache ---
+
+
+class _CountingAgentStore(InMemoryAgentStore):
+    """Agent store that counts ``get`` calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+
+    async def get(self, agent_id: str) -> AgentSession | None:
+        self.gets += 1
+        return await super().get(agent_id)
+
+
+async def _registered_agent(
+    **session: Any,
+) -> tuple[InMemoryHostStore, _CountingAgentStore, Ed25519PrivateKey, Ed25519PrivateKey]:
+    now = datetime.now(timezone.utc)
+    host_sk = Ed25519PrivateKey.generate()
+    agent_sk = Ed25519PrivateKey.generate()
+    hosts = InMemoryHostStore()
+    agents = _CountingAgentStore()
+    await hosts.save(
+        HostIdentity(
+            host_id="h1",
+            public_key=_public_jwk_dict(host_sk),
+            status="active",
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    await agents.save(
+        AgentSession(
+            agent_id="a1",
+            host_id="h1",
+            public_key=_public_jwk_dict(agent_sk),
+            mode="delegated",
+            status="active",
+            created_at=now,
+            **session,
+        )
+    )
+    return hosts, agents, host_sk, agent_sk
+
+
+def _agent_token(host_sk: Ed25519PrivateKey, agent_sk: Ed25519PrivateKey) -> str:
+    host_tp = jwk_thumbprint_sha256(_public_jwk_dict(host_sk))
+    return create_agent_jwt(agent_sk, host_thumbprint=host_tp, agent_id="a1", aud="aud")
+
+
+@pytest.mark.filterwarnings("ignore:EdDSA is deprecated:UserWarning")
+async def test_verified_cache_reuses_agent_verification() -> None:
+    """A repeated Agent JWT skips the signature check and returns the same claims."""
+    hosts, agents, host_sk, agent_sk = await _registered_agent()
+    cache = VerifiedTokenCache()
+    token = _agent_token(host_sk, agent_sk)
+
+    first = await verify_agent_jwt(
+        token, hosts, agents, expected_audience="aud", verified_cache=cache
+    )
+    second = await verify_agent_jwt(
+        token, hosts, agents, expected_audience="aud", verified_cache=cache
+    )
+
+    assert first.ok and second.ok
+    assert len(cache) == 1
+    # The agent row is re-read on a hit; only signature, claims and host are reused.
+    assert agents.gets == 2
+    assert second.claims == first.claims
+    assert second.agent is not None and second.agent.last_used_at is not None
+    # A different expected audience is a different cache entry.
+    other = await verify_agent_jwt(
+        token, hosts, agents, expected_audience="x", verified_cache=cache
+    )
+    assert other.error == "audience mismatch"
+
+
+@pytest.mark.filterwarnings("ignore:EdDSA is deprecated:UserWarning")
+async def test_verified_cache_keeps_jti_single_use() -> None:
+    """With a ``jti`` replay cache the token is single-use, so it is not cached."""
+    hosts, agents, host_sk, agent_sk = await _registered_agent()
+    cache = VerifiedTokenCache()
+    jti_cache = JtiReplayCache()
+    token = _agent_token(host_sk, agent_sk)
+
+    first = await verify_agent_jwt(
+        token, hosts, agents, jti_replay_cache=jti_cache, verified_cache=cache
+    )
+    replay = await verify_agent_jwt(
+        token, hosts, agents, jti_replay_cache=jti_cache, verified_cache=cache
+    )
+
+    assert first.ok
+    assert replay.error == "jti replay detected"
+    assert len(cache) == 0
+
+
+@pytest.mark.filterwarnings("ignore:EdDSA is deprecated:UserWarning")
+async def test_verified_cache_hit_sees_revocation() -> None:
+    """A cache hit re-reads the agent row, so a revoked agent is rejected at once."""
+    hosts, agents, host_sk, agent_sk = await _registered_agent()
+    cache = VerifiedTokenCache()
+    token = _agent_token(host_sk, agent_sk)
+    assert (await verify_agent_jwt(token, hosts, agents, verified_cache=cache)).ok
+
+    await agents.revoke("a1")
+    res = await verify_agent_jwt(token, hosts, agents, verified_cache=cache)
+    assert res.error == "agent session not usable: revoked"
+
+    cache.invalidate_agent("a1")
+    assert len(cache) == 0
+
+
+@pytest.mark.filterwarnings("ignore:EdDSA is deprecated:UserWarning")
+async def test_verified_cache_checks_session_ttl_against_persisted_row(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A hit checks ``session_ttl`` against the ``last_used_at`` saved by the previous call."""
+    now = datetime.now(timezone.utc)
+    hosts, agents, host_sk, agent_sk = await _registered_agent(
+        session_ttl=timedelta(seconds=2), last_used_at=now - timedelta(seconds=1.5)
+    )
+    cache = VerifiedTokenCache()
+    token = _agent_token(host_sk, agent_sk)
+
+    first = await verify_agent_jwt(token, hosts, agents, verified_cache=cache)
+    assert first.ok and first.agent is not None
+    await agents.save(first.agent)
+
+    # 2.5 s after the original ``last_used_at`` but 1 s after the extended one.
+    later = now + timedelta(seconds=1)
+    monkeypatch.setattr("asap.auth.identity._utc_now", lambda: later)
+    second = await verify_agent_jwt(token, hosts, agents, verified_cache=cache)
+    assert second.ok, second.error
+    assert agents.gets == 2
+
+
+@pytest.mark.filterwarnings("ignore:EdDSA is deprecated:UserWarning")
+async def test_verified_cache_entry_expires_with_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Entries are not served past the token's ``exp``."""
+    hosts, agents, host_sk, agent_sk = await _registered_agent()
+    cache = VerifiedTokenCache()
+    token = _agent_token(host_sk, agent_sk)
+    assert (await verify_agent_jwt(token, hosts, agents, verified_cache=cache)).ok
+
+    later = time.time() + AGENT_JWT_TTL_SECONDS + 1
+    monkeypatch.setattr("time.time", lambda: later)
+    res = await verify_agent_jwt(token, hosts, agents, verified_cache=cache)
+    assert res.error == "token expired or missing exp"
+    assert agents.gets == 2
+
+
+@pytest.mark.filterwarnings("ignore:EdDSA is deprecated:UserWarning")
+async def test_verified_cache_host_jwt_only_for_stored_hosts() -> None:
+    """Host JWTs of unregistered hosts are not cached; registered ones are, per host."""
+    now = datetime.now(timezone.utc)
+    sk = Ed25519PrivateKey.generate()
+    hosts = InMemoryHostStore()
+    cache = VerifiedTokenCache(max_size=1)
+    token = create_host_jwt(sk, aud="aud")
+
+    assert (await verify_host_jwt(token, hosts, verified_cache=cache)).host is None
+    assert len(cache) == 0
+
+    await hosts.save(
+        HostIdentity(
+            host_id="h1",
+            public_key=_public_jwk_dict(sk),
+            status="active",
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    assert (await verify_host_jwt(token, hosts, verified_cache=cache)).host is not None
+    assert len(cache) == 1
+    # LRU bound: a second token evicts the first.
+    assert (await verify_host_jwt(create_host_jwt(sk, aud="aud"), hosts, verified_cache=cache)).ok
+    assert len(cache) == 1
+    cache.invalidate_host("h1")
+    assert len(cache) == 0
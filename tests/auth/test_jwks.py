@@ -1,5 +1,6 @@
 """Unit tests for JWKS validation and JWT signature verification."""
 
+import asyncio
 import base64
 import json
 import time
@@ -16,7 +17,7 @@ from joserfc.errors import (
     MissingClaimError,
 )
 
-from asap.auth.jwks import JWKSValidator, fetch_keys, validate_jwt
+from asap.auth.jwks import JWKSCache, JWKSValidator, KeySetFetcher, fetch_keys, validate_jwt
 
 
 def _make_jwks_response(public_key: jwk.RSAKey) -> dict:
@@ -418,3 +419,140 @@ async def test_jwks_validator_validate_token_accepts_matching_iss_aud() -> None:
     claims = await validator.validate_token(token)
 
     assert claims["sub"] == "urn:asap:agent:test"
+
+
+def _counting_fetcher(*key_sets: jwk.KeySet | Exception) -> tuple[KeySetFetcher, list[str]]:
+    """Fetcher returning ``key_sets`` in order (last one repeats); records requested URIs."""
+    calls: list[str] = []
+
+    async def fetcher(uri: str) -> jwk.KeySet:
+        calls.append(uri)
+        result = key_sets[min(len(calls), len(key_sets)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fetcher, calls
+
+
+def _key_set(key: jwk.RSAKey) -> jwk.KeySet:
+    return jwk.KeySet.import_key_set(_make_jwks_response(key))
+
+
+async def test_jwks_cache_single_flight_for_concurrent_fetches() -> None:
+    """Verify concurrent fetch_keys() calls on a cold cache share one fetch."""
+    key_set = _key_set(jwk.RSAKey.generate_key(2048, private=True))
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_fetcher(uri: str) -> jwk.KeySet:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return key_set
+
+    validator = JWKSValidator("https://auth.example.com/jwks.json", fetcher=slow_fetcher)
+    pending = asyncio.gather(*(validator.fetch_keys() for _ in range(10)))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert all(result is key_set for result in await pending)
+    assert calls == 1
+
+
+async def test_jwks_cache_serves_stale_keys_while_refreshing() -> None:
+    """Verify stale keys are returned immediately and replaced by a background refresh."""
+    old = _key_set(jwk.RSAKey.generate_key(2048, private=True))
+    new = _key_set(jwk.RSAKey.generate_key(2048, private=True))
+    fetcher, calls = _counting_fetcher(old, new)
+    uri = "https://auth.example.com/jwks.json"
+    cache = JWKSCache(refresh_after_seconds=0)
+
+    assert await cache.get(uri, fetcher) is old
+    assert await cache.get(uri, fetcher) is old
+    await cache._inflight[uri]
+
+    assert len(calls) == 2
+    assert cache._entries[uri].key_set is new
+
+
+async def test_jwks_cache_background_refresh_failure_keeps_stale_keys() -> None:
+    """Verify a failed background refresh keeps serving the cached keys."""
+    old = _key_set(jwk.RSAKey.generate_key(2048, private=True))
+    fetcher, calls = _counting_fetcher(old, httpx.ConnectError("IdP down"))
+    uri = "https://auth.example.com/jwks.json"
+    cache = JWKSCache(refresh_after_seconds=0)
+
+    assert await cache.get(uri, fetcher) is old
+    assert await cache.get(uri, fetcher) is old
+    with pytest.raises(httpx.ConnectError):
+        await cache._inflight[uri]
+
+    assert len(calls) == 2
+    assert cache._entries[uri].key_set is old
+
+
+async def test_jwks_cache_failed_refresh_backs_off() -> None:
+    """Verify requests after a failed refresh do not refetch until the backoff ends."""
+    old = _key_set(jwk.RSAKey.generate_key(2048, private=True))
+    fetcher, calls = _counting_fetcher(old, httpx.ConnectError("IdP down"))
+    uri = "https://auth.example.com/jwks.json"
+    cache = JWKSCache(refresh_after_seconds=0)
+
+    assert await cache.get(uri, fetcher) is old
+    assert await cache.get(uri, fetcher) is old
+    with pytest.raises(httpx.ConnectError):
+        await cache._inflight[uri]
+    for _ in range(20):
+        assert await cache.get(uri, fetcher) is old
+        await asyncio.sleep(0)
+
+    # One initial fetch and one failed refresh.
+    assert len(calls) == 2
+    assert uri not in cache._inflight
+
+
+async def test_jwks_validator_forced_refresh_is_rate_limited() -> None:
+    """Verify repeated unknown-key tokens trigger at most one refetch per interval."""
+    key = jwk.RSAKey.generate_key(2048, private=True)
+    fetcher, calls = _counting_fetcher(_key_set(jwk.RSAKey.generate_key(2048, private=True)))
+    validator = JWKSValidator("https://auth.example.com/jwks.json", fetcher=fetcher)
+    token = jose_jwt.encode({"alg": "RS256"}, {"sub": "test", "exp": int(time.time()) + 3600}, key)
+
+    for _ in range(3):
+        with pytest.raises(JoseError):
+            await validator.validate_token(token)
+
+    assert len(calls) == 2
+
+
+async def test_jwks_validator_claim_error_does_not_refetch() -> None:
+    """Verify an expired token (keys were fine) does not refetch the JWKS."""
+    key = jwk.RSAKey.generate_key(2048, private=True)
+    fetcher, calls = _counting_fetcher(_key_set(key))
+    validator = JWKSValidator("https://auth.example.com/jwks.json", fetcher=fetcher)
+    token = jose_jwt.encode({"alg": "RS256"}, {"sub": "test", "exp": int(time.time()) - 60}, key)
+
+    with pytest.raises(ExpiredTokenError):
+        await validator.validate_token(token)
+
+    assert len(calls) == 1
+
+
+async def test_jwks_cache_shared_across_validators_and_uris() -> None:
+    """Verify one JWKSCache keys several jwks_uris and is reused by validators."""
+    key_a = jwk.RSAKey.generate_key(2048, private=True)
+    fetcher, calls = _counting_fetcher(_key_set(key_a))
+    cache = JWKSCache()
+    uri_a = "https://a.example.com/jwks.json"
+    uri_b = "https://b.example.com/jwks.json"
+
+    await JWKSValidator(uri_a, fetcher=fetcher, cache=cache).fetch_keys()
+    await JWKSValidator(uri_b, fetcher=fetcher, cache=cache).fetch_keys()
+    token = jose_jwt.encode(
+        {"alg": "RS256"}, {"sub": "test", "exp": int(time.time()) + 3600}, key_a
+    )
+    claims = await JWKSValidator(uri_a, fetcher=fetcher, cache=cache).validate_token(token)
+
+    assert claims["sub"] == "test"
+    assert calls == [uri_a, uri_b]
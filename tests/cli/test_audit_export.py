@@ -341,6 +341,29 @@ def test_audit_export_filter_by_urn_returns_matching_entries(sqlite_audit_db: Pa
     assert all(row["agent_urn"] == "urn:asap:agent:cli-fixture" for row in data)
 
 
+def test_audit_export_jsonl_one_entry_per_line(sqlite_audit_db: Path) -> None:
+    """JSONL format: one compact JSON object per line, chain order preserved."""
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "audit",
+            "export",
+            "--store",
+            "sqlite",
+            "--db",
+            str(sqlite_audit_db),
+            "--format",
+            "jsonl",
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["operation"] for r in rows] == [f"fixture.op.{i}" for i in range(3)]
+    _assert_json_chain_valid(rows)
+
+
 def test_audit_export_csv_uses_unix_line_endings(sqlite_audit_db: Path) -> None:
     """CSV output is deterministic on Linux/mac CI — no embedded CRLF."""
     runner = CliRunner()
@@ -0,0 +1,75 @@
+"""Tests for `asap lambda train` CLI."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from asap.cli import app
+from asap.transport.lambda_dictionary import load_dictionary
+
+
+def _write_capture(path: Path, count: int = 5) -> None:
+    lines = [
+        json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "asap.send",
+                "params": {
+                    "envelope": {
+                        "sender": "urn:asap:agent:orchestrator",
+                        "recipient": f"urn:asap:agent:worker-{i}",
+                        "payload_type": "task.request",
+                        "payload": {"skill_id": "summarize", "input": {"doc": f"d{i}"}},
+                    }
+                },
+                "id": f"req-{i}",
+            }
+        )
+        for i in range(count)
+    ]
+    path.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+
+
+def test_lambda_train_writes_loadable_dictionary(tmp_path: Path) -> None:
+    capture = tmp_path / "capture.jsonl"
+    out = tmp_path / "dicts" / "acme-1.json"
+    _write_capture(capture)
+
+    result = CliRunner().invoke(
+        app, ["lambda", "train", str(capture), "--id", "acme-1", "-o", str(out)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "acme-1" in result.output
+    dictionary = load_dictionary(out)
+    assert dictionary.id == "acme-1"
+    assert '"payload_type":' in dictionary.tokens
+    assert '"urn:asap:agent:' in dictionary.tokens
+    assert '"summarize"' in dictionary.tokens
+
+
+def test_lambda_train_rejects_invalid_jsonl(tmp_path: Path) -> None:
+    capture = tmp_path / "capture.jsonl"
+    capture.write_text('{"jsonrpc": "2.0"}\nnot json\n', encoding="utf-8")
+
+    result = CliRunner().invoke(
+        app, ["lambda", "train", str(capture), "--id", "bad-1", "-o", str(tmp_path / "o.json")]
+    )
+
+    assert result.exit_code == 1
+    assert ":2: invalid JSON" in result.output
+
+
+def test_lambda_train_rejects_invalid_id(tmp_path: Path) -> None:
+    capture = tmp_path / "capture.jsonl"
+    _write_capture(capture)
+
+    result = CliRunner().invoke(
+        app, ["lambda", "train", str(capture), "--id", "bad id", "-o", str(tmp_path / "o.json")]
+    )
+
+    assert result.exit_code == 1
+    assert "Invalid Lambda dictionary id" in result.output
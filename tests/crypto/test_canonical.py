@@ -0,0 +1,73 @@
+"""Unit tests for the fast JCS canonicalizer against the reference ``jcs`` package."""
+
+from typing import Any
+
+import pytest
+
+from asap.crypto import signing
+from asap.crypto.canonical import canonical_json, reference_canonical_json
+from asap.models.entities import Capability, Endpoint, Manifest, Skill
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"b": 1, "a": [True, False, None], "c": {"z": "", "y": "é"}},
+        {"n": [0, -0.0, 1.0, -2.0, 0.5, 1e-4, 123.456, 0.1 + 0.2, 9007199254740992]},
+        {"s": '\u0000\x1f\x7f"\\\b\f\n\r\t\u2028'},
+        {"\ue000": 1, "\U0001f600": 2, "a": 3},
+        {"small": 1e-7, "tiny": 5e-324, "large": 1e21, "int": 2**53 + 1, "big": 10**22},
+        ("tuple", 1),
+        [],
+        {},
+    ],
+    ids=[
+        "nested",
+        "numbers",
+        "escapes",
+        "non-bmp-keys",
+        "reference-fallback",
+        "tuple",
+        "empty-list",
+        "empty-object",
+    ],
+)
+def test_matches_reference(value: Any) -> None:
+    assert canonical_json(value) == reference_canonical_json(value)
+
+
+def test_integral_floats_print_as_integers() -> None:
+    assert canonical_json({"a": 1.0, "b": -0.0}) == b'{"a":1,"b":0}'
+
+
+def test_keys_sorted_by_utf16_code_units() -> None:
+    # U+E000 sorts after U+1F600 in UTF-16 (surrogates 0xD83D...) but before it by code point.
+    expected = '{"\U0001f600":2,"\ue000":1}'.encode()
+    assert canonical_json({"\ue000": 1, "\U0001f600": 2}) == expected
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), object()])
+def test_errors_match_reference(value: Any) -> None:
+    with pytest.raises((ValueError, TypeError)) as expected:
+        reference_canonical_json(value)
+    with pytest.raises(expected.type):
+        canonical_json(value)
+
+
+def test_signing_canonicalizer_selectable(monkeypatch: pytest.MonkeyPatch) -> None:
+    manifest = Manifest(
+        id="urn:asap:agent:canonical",
+        name="Canonical Agent",
+        version="1.0.0",
+        description="Agent for canonicalizer tests",
+        capabilities=Capability(
+            asap_version="0.1",
+            skills=[Skill(id="echo", description="Echo", input_schema={"maximum": 1.0})],
+            state_persistence=False,
+        ),
+        endpoints=Endpoint(asap="https://example.com/asap"),
+    )
+    fast = signing.canonicalize(manifest)
+    monkeypatch.setattr(signing, "CANONICALIZER", "jcs")
+    assert signing.canonicalize(manifest) == fast
+    assert b'"maximum":1}' in fast
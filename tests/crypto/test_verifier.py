@@ -0,0 +1,154 @@
+"""Unit tests for ManifestVerifier caches and batch verification."""
+
+import pytest
+
+from asap.crypto.keys import generate_keypair, public_key_to_base64
+from asap.crypto.models import SignatureBlock, SignedManifest
+from asap.crypto.signing import canonicalize, sign_manifest, verify_manifest
+from asap.crypto.trust import sign_with_ca
+from asap.crypto.verifier import ManifestVerifier
+from asap.errors import SignatureVerificationError
+from asap.models.entities import (
+    Capability,
+    Endpoint,
+    InferenceCapability,
+    LocalModelInfo,
+    Manifest,
+    Skill,
+)
+
+
+def _sample_manifest(agent_id: str = "test-verifier", description: str = "Echo") -> Manifest:
+    return Manifest(
+        id=f"urn:asap:agent:{agent_id}",
+        name="Test Agent",
+        version="1.0.0",
+        description="Agent for verifier tests",
+        capabilities=Capability(
+            asap_version="0.1",
+            skills=[Skill(id="echo", description=description)],
+            state_persistence=False,
+        ),
+        endpoints=Endpoint(asap="https://example.com/asap"),
+    )
+
+
+def test_verify_matches_verify_manifest() -> None:
+    private_key, public_key = generate_keypair()
+    signed = sign_manifest(_sample_manifest(), private_key)
+    verifier = ManifestVerifier()
+    assert verify_manifest(signed) is True
+    assert verifier.verify(signed) is True
+    assert verifier.verify(signed, public_key=public_key) is True
+
+
+def test_canonical_bytes_cached_by_content() -> None:
+    verifier = ManifestVerifier()
+    first = verifier.canonical_bytes(_sample_manifest())
+    assert first == canonicalize(_sample_manifest())
+    assert verifier.canonical_bytes(_sample_manifest()) is first
+    changed = verifier.canonical_bytes(_sample_manifest(description="Changed"))
+    assert changed == canonicalize(_sample_manifest(description="Changed"))
+    assert changed != first
+
+
+def test_tampered_manifest_rejected_after_cache_warm() -> None:
+    private_key, _ = generate_keypair()
+    signed = sign_manifest(_sample_manifest(), private_key)
+    verifier = ManifestVerifier()
+    assert verifier.verify(signed)
+    tampered = SignedManifest(
+        manifest=_sample_manifest(description="Tampered"),
+        signature=signed.signature,
+        public_key=signed.public_key,
+    )
+    with pytest.raises(SignatureVerificationError, match="tampered"):
+        verifier.verify(tampered)
+
+
+def test_non_finite_float_does_not_reuse_cached_payload() -> None:
+    """inf and None serialize to the same JSON; the cache must still tell them apart."""
+
+    def with_throughput(value: float | None) -> Manifest:
+        inference = InferenceCapability(
+            local_models=[LocalModelInfo(id="m", throughput_tokens_per_second=value)]
+        )
+        manifest = _sample_manifest()
+        return manifest.model_copy(
+            update={
+                "capabilities": manifest.capabilities.model_copy(update={"inference": inference})
+            }
+        )
+
+    private_key, _ = generate_keypair()
+    signed = sign_manifest(with_throughput(None), private_key)
+    verifier = ManifestVerifier()
+    assert verifier.verify(signed)
+    infinite = SignedManifest(
+        manifest=with_throughput(float("inf")),
+        signature=signed.signature,
+        public_key=signed.public_key,
+    )
+
+    with pytest.raises(ValueError, match="inf"):
+        verify_manifest(infinite)
+    with pytest.raises(ValueError, match="inf"):
+        verifier.verify(infinite)
+
+
+def test_public_key_parsed_once() -> None:
+    _, public_key = generate_keypair()
+    b64 = public_key_to_base64(public_key)
+    verifier = ManifestVerifier()
+    assert verifier.public_key(b64) is verifier.public_key(b64)
+    with pytest.raises(SignatureVerificationError, match="no public_key"):
+        verifier.public_key(None)
+    with pytest.raises(SignatureVerificationError, match="Invalid public_key"):
+        verifier.public_key("AAAA")
+
+
+def test_caches_are_bounded() -> None:
+    verifier = ManifestVerifier(max_cached_payloads=2)
+    for i in range(5):
+        verifier.canonical_bytes(_sample_manifest(agent_id=f"a{i}"))
+    assert len(verifier._payloads) == 2
+
+
+@pytest.mark.parametrize("parallel_threshold", [1_000, 1], ids=["serial", "threaded"])
+def test_verify_many_reports_each_failure(parallel_threshold: int) -> None:
+    private_key, _ = generate_keypair()
+    other_key, _ = generate_keypair()
+    batch = [sign_manifest(_sample_manifest(agent_id=f"a{i}"), private_key) for i in range(6)]
+    batch[2] = SignedManifest(
+        manifest=_sample_manifest(agent_id="forged"),
+        signature=batch[2].signature,
+        public_key=batch[2].public_key,
+    )
+    batch[4] = SignedManifest(
+        manifest=batch[4].manifest,
+        signature=SignatureBlock(alg="ed25519", signature="AAAA"),
+        public_key=batch[4].public_key,
+    )
+    batch.append(sign_manifest(_sample_manifest(), other_key))
+
+    verifier = ManifestVerifier(parallel_threshold=parallel_threshold, max_workers=4)
+    errors = verifier.verify_many(batch)
+
+    assert len(errors) == len(batch)
+    assert [i for i, e in enumerate(errors) if e is not None] == [2, 4]
+    assert all(isinstance(errors[i], SignatureVerificationError) for i in (2, 4))
+
+
+def test_verify_ca_uses_known_cas() -> None:
+    agent_key, _ = generate_keypair()
+    ca_key, ca_public = generate_keypair()
+    other_ca, _ = generate_keypair()
+    signed = sign_with_ca(_sample_manifest(), agent_key, ca_key)
+
+    assert ManifestVerifier(known_cas=[ca_public]).verify_ca(signed) is True
+    assert ManifestVerifier(known_cas=[public_key_to_base64(ca_public)]).verify_ca(signed)
+    with pytest.raises(SignatureVerificationError, match="unknown CA"):
+        ManifestVerifier(known_cas=[other_ca.public_key()]).verify_ca(signed)
+    self_signed = sign_manifest(_sample_manifest(), agent_key)
+    with pytest.raises(SignatureVerificationError, match="trust_level=verified"):
+        ManifestVerifier(known_cas=[ca_public]).verify_ca(self_signed)
@@ -205,3 +205,110 @@ class TestWellKnownEndpointViaApp:
         data = response.json()
         assert data["capabilities"]["hardware"]["class"] == "edge_accelerator"
         assert data["capabilities"]["inference"]["modes"] == ["local_npu"]
+
+
+def _large_manifest() -> Manifest:
+    """Manifest whose serialized body exceeds the compression threshold."""
+    return Manifest(
+        id="urn:asap:agent:large-manifest",
+        name="Large",
+        version="1.0.0",
+        description="Agent with many skills",
+        capabilities=Capability(
+            asap_version="2.1.0",
+            skills=[
+                Skill(id=f"skill-{i}", description=f"Skill number {i} for discovery")
+                for i in range(40)
+            ],
+        ),
+        endpoints=Endpoint(asap="https://large.example/asap"),
+    )
+
+
+class TestManifestResponseCache:
+    """Tests for the per-version cached manifest body, variants and ETag."""
+
+    def test_entry_reused_until_manifest_changes(self, sample_manifest: Manifest) -> None:
+        """Same document reuses the entry; a new document rebuilds it."""
+        cache = wellknown.ManifestResponseCache()
+        entry = cache.get(sample_manifest)
+        assert cache.get(sample_manifest) is entry
+
+        other = _large_manifest()
+        rebuilt = cache.get(other)
+        assert rebuilt is not entry
+        assert rebuilt.etag_header == f'"{wellknown.compute_manifest_etag(other)}"'
+
+    def test_invalidate_drops_entry(self, sample_manifest: Manifest) -> None:
+        """invalidate() forces re-serialization on the next lookup."""
+        cache = wellknown.ManifestResponseCache()
+        entry = cache.get(sample_manifest)
+        cache.invalidate()
+        assert cache.get(sample_manifest) is not entry
+
+    def test_body_and_etag_match_uncached_rendering(self, sample_manifest: Manifest) -> None:
+        """Cached body equals JSONResponse rendering; ETag equals compute_manifest_etag."""
+        from fastapi.responses import JSONResponse
+
+        entry = wellknown.ManifestResponseCache().get(sample_manifest)
+        expected = JSONResponse(content=wellknown.get_manifest_json(sample_manifest)).body
+        assert entry.body == expected
+        assert entry.etag_header == f'"{wellknown.compute_manifest_etag(sample_manifest)}"'
+
+    def test_compressed_variant_built_once(self) -> None:
+        """gzip variant is computed on first use and then served from the entry."""
+        import gzip
+
+        entry = wellknown.ManifestResponseCache().get(_large_manifest())
+        body, encoding = entry.body_for("gzip")
+        assert encoding == "gzip"
+        assert gzip.decompress(body) == entry.body
+        assert entry.body_for("gzip")[0] is body
+        assert entry.body_for(None) == (entry.body, None)
+
+    def test_replace_registry_invalidates_cache(self, sample_manifest: Manifest) -> None:
+        """Hot reload (RegistryHolder.replace_registry) drops the cached response."""
+        from asap.transport.handlers import HandlerRegistry
+        from asap.transport.server import RegistryHolder
+
+        cache = wellknown.ManifestResponseCache()
+        holder = RegistryHolder(HandlerRegistry(), manifest_cache=cache)
+        entry = cache.get(sample_manifest)
+        holder.replace_registry(HandlerRegistry())
+        assert cache.get(sample_manifest) is not entry
+
+    def test_gzip_served_over_http(self) -> None:
+        """Clients sending Accept-Encoding: gzip receive the compressed variant."""
+        app = create_app(_large_manifest(), rate_limit="999999/minute")
+        client = TestClient(app)
+        response = client.get(
+            wellknown.WELLKNOWN_MANIFEST_PATH, headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert response.json()["id"] == "urn:asap:agent:large-manifest"
+
+    def test_encoded_variants_have_distinct_etags(self) -> None:
+        """gzip body gets its own strong ETag; any variant's ETag validates (weakly too)."""
+        app = create_app(_large_manifest(), rate_limit="999999/minute")
+        client = TestClient(app)
+        path = wellknown.WELLKNOWN_MANIFEST_PATH
+        identity = client.get(path, headers={"Accept-Encoding": "identity"}).headers["etag"]
+        gzipped = client.get(path, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+        assert gzipped == identity[:-1] + '-gzip"'
+
+        for if_none_match in (gzipped, identity, f"W/{gzipped}", "*"):
+            response = client.get(
+                path, headers={"Accept-Encoding": "gzip", "If-None-Match": if_none_match}
+            )
+            assert response.status_code == 304, if_none_match
+            assert response.headers["etag"] == gzipped
+
+    def test_reassigned_manifest_changes_etag(self, app: "FastAPI", client: TestClient) -> None:
+        """Replacing app.state.manifest is picked up without explicit invalidation."""
+        first = client.get(wellknown.WELLKNOWN_MANIFEST_PATH).headers["etag"]
+        app.state.manifest = _large_manifest()
+        second = client.get(wellknown.WELLKNOWN_MANIFEST_PATH)
+        assert second.headers["etag"] != first
+        assert second.json()["id"] == "urn:asap:agent:large-manifest"
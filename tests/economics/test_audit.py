@@ -293,6 +293,30 @@ class TestSQLiteAuditStore:
         assert len(page) == 3
         assert page[0].operation == "op.2"
 
+    async def test_query_page_cursor_walk(self, sqlite_audit_store: SQLiteAuditStore) -> None:
+        for i in range(10):
+            await sqlite_audit_store.append(
+                AuditEntry(
+                    timestamp=datetime.now(timezone.utc),
+                    operation=f"op.{i}",
+                    agent_urn=f"urn:asap:agent:{i % 2}",
+                )
+            )
+        operations: list[str] = []
+        cursor: str | None = None
+        while True:
+            page = await sqlite_audit_store.query_page(
+                agent_urn="urn:asap:agent:1", limit=2, cursor=cursor
+            )
+            operations.extend(e.operation for e in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert operations == ["op.1", "op.3", "op.5", "op.7", "op.9"]
+
+        with pytest.raises(ValueError, match="invalid cursor"):
+            await sqlite_audit_store.query_page(cursor="garbage")
+
     async def test_empty_chain_is_valid(self, sqlite_audit_store: SQLiteAuditStore) -> None:
         assert await sqlite_audit_store.verify_chain() is True
 
@@ -391,6 +415,28 @@ class TestSQLiteAuditStore:
 
         assert await sqlite_audit_store.verify_chain() is False
 
+    async def test_iter_entries_pages_in_insertion_order(
+        self, sqlite_audit_store: SQLiteAuditStore
+    ) -> None:
+        for i in range(7):
+            await sqlite_audit_store.append(
+                AuditEntry(
+                    timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                    operation=f"op.{i}",
+                    agent_urn=f"urn:asap:agent:{i % 2}",
+                )
+            )
+        streamed = [e async for e in sqlite_audit_store.iter_entries(page_size=3)]
+        assert streamed == await sqlite_audit_store.query(limit=100)
+
+        filtered = [
+            e.operation
+            async for e in sqlite_audit_store.iter_entries(
+                agent_urn="urn:asap:agent:0", limit=3, page_size=2
+            )
+        ]
+        assert filtered == ["op.0", "op.2", "op.4"]
+
 
 class TestSQLiteAuditStoreMemoryDefault:
     """Tests that the default :memory: constructor works correctly."""
@@ -328,6 +328,12 @@ class TestSLAAPIGetHistory:
         assert data["total"] == 5
         assert data["offset"] == 1
         assert data["limit"] == 2
+        assert data["next_cursor"] is not None
+
+        rest = client.get("/sla/history", params={"limit": 2, "cursor": data["next_cursor"]})
+        assert rest.status_code == 200
+        assert rest.json()["count"] == 2
+        assert rest.json()["next_cursor"] is None
 
 
 class TestSLAAPIGetBreaches:
@@ -408,6 +414,35 @@ class TestSLAAPIGetBreaches:
         assert len(data["data"]) == 1
         assert data["data"][0]["severity"] == "critical"
 
+    def test_get_sla_breaches_cursor_pagination(
+        self,
+        sample_manifest: Manifest,
+        sla_storage: InMemorySLAStorage,
+    ) -> None:
+        for i in range(5):
+            _run(sla_storage.record_breach(_breach(breach_id=f"b{i}", severity="critical")))
+        _run(sla_storage.record_breach(_breach(breach_id="w", severity="warning")))
+        app = create_app(
+            sample_manifest,
+            sla_storage=sla_storage,
+            rate_limit="999999/minute",
+        )
+        client = TestClient(app)
+        params = {"severity": "critical", "limit": 2}
+        first = client.get("/sla/breaches", params=params).json()
+        assert first["count"] == 2
+        assert first["next_cursor"] is not None
+        ids = [b["id"] for b in first["data"]]
+        cursor = first["next_cursor"]
+        while cursor is not None:
+            page = client.get("/sla/breaches", params={**params, "cursor": cursor}).json()
+            ids.extend(b["id"] for b in page["data"])
+            cursor = page["next_cursor"]
+        assert sorted(ids) == [f"b{i}" for i in range(5)]
+
+        bad = client.get("/sla/breaches", params={"cursor": "garbage"})
+        assert bad.status_code == 400
+
     def test_get_sla_breaches_invalid_severity_returns_400(
         self,
         sample_manifest: Manifest,
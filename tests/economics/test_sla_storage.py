@@ -15,7 +15,13 @@ from asap.economics import (
     SLAStorage,
     SQLiteSLAStorage,
 )
-from asap.economics.sla_storage import _parse_iso
+from asap.economics.sla_storage import (
+    SLAStorageBase,
+    _parse_iso,
+    query_sla_breaches_page,
+    query_sla_metrics_page,
+)
+from asap.state.stores import encode_cursor
 
 
 def _metrics(
@@ -312,6 +318,109 @@ class TestSQLiteSLAStorage:
             await sqlite_sla_storage.record_metrics(_metrics())
 
 
+@pytest.fixture(params=["memory", "sqlite"])
+def any_sla_storage(request: pytest.FixtureRequest, tmp_path: Path) -> SLAStorageBase:
+    """Each SLAStorageBase implementation (cursor pagination contract)."""
+    if request.param == "memory":
+        return InMemorySLAStorage()
+    return SQLiteSLAStorage(db_path=str(tmp_path / "sla.db"))
+
+
+class TestSLAStorageCursorPages:
+    """query_metrics_page / query_breaches_page walk every row exactly once."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_pages_cover_ties(self, any_sla_storage: SLAStorageBase) -> None:
+        """Rows sharing a period_start are neither skipped nor repeated across pages."""
+        start = datetime(2026, 2, 17, 12, 0, tzinfo=timezone.utc)
+        for i in range(7):
+            await any_sla_storage.record_metrics(
+                _metrics(
+                    agent_id=f"urn:asap:agent:{i}", period_start=start + timedelta(hours=i // 3)
+                )
+            )
+
+        seen: list[str] = []
+        cursor: str | None = None
+        while True:
+            page = await any_sla_storage.query_metrics_page(limit=2, cursor=cursor)
+            seen.extend(m.agent_id for m in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(f"urn:asap:agent:{i}" for i in range(7))
+        assert len(seen) == 7
+
+    @pytest.mark.asyncio
+    async def test_metrics_page_offset_and_last_page(self, any_sla_storage: SLAStorageBase) -> None:
+        now = datetime.now(timezone.utc)
+        for i in range(4):
+            await any_sla_storage.record_metrics(
+                _metrics(period_start=now - timedelta(hours=4 - i))
+            )
+
+        page = await any_sla_storage.query_metrics_page(limit=2, offset=1)
+        rest = await any_sla_storage.query_metrics_page(limit=2, cursor=page.next_cursor)
+
+        assert len(page.items) == 2
+        assert page.next_cursor is not None
+        assert len(rest.items) == 1
+        assert rest.next_cursor is None
+        assert rest.items[0].period_start > page.items[-1].period_start
+
+    @pytest.mark.asyncio
+    async def test_breaches_pages_filter_severity(self, any_sla_storage: SLAStorageBase) -> None:
+        detected = datetime(2026, 2, 17, 12, 0, tzinfo=timezone.utc)
+        for i in range(6):
+            breach = _breach(breach_id=f"b{i}", detected_at=detected)
+            if i % 2:
+                breach = breach.model_copy(update={"severity": "critical"})
+            await any_sla_storage.record_breach(breach)
+
+        first = await any_sla_storage.query_breaches_page(severity="critical", limit=2)
+        second = await any_sla_storage.query_breaches_page(
+            severity="critical", limit=2, cursor=first.next_cursor
+        )
+
+        ids = [b.id for b in first.items + second.items]
+        assert sorted(ids) == ["b1", "b3", "b5"]
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises(self, any_sla_storage: SLAStorageBase) -> None:
+        with pytest.raises(ValueError, match="invalid cursor"):
+            await any_sla_storage.query_metrics_page(limit=2, cursor="garbage")
+        with pytest.raises(ValueError, match="invalid cursor"):
+            await any_sla_storage.query_breaches_page(limit=2, cursor=encode_cursor(-1))
+
+    @pytest.mark.asyncio
+    async def test_protocol_only_storage_falls_back_to_offsets(self) -> None:
+        """Helpers page a storage that implements only the SLAStorage protocol."""
+        inner = InMemorySLAStorage()
+
+        class _ProtocolOnly:
+            def __getattr__(self, name: str) -> object:
+                return getattr(inner, name)
+
+        for i in range(3):
+            await inner.record_metrics(_metrics(agent_id=f"urn:asap:agent:{i}"))
+            await inner.record_breach(_breach(breach_id=f"b{i}"))
+        storage = _ProtocolOnly()
+
+        metrics = await query_sla_metrics_page(storage, limit=2)
+        breaches = await query_sla_breaches_page(storage, limit=2)
+        more = await query_sla_breaches_page(
+            storage,
+            limit=2,
+            cursor=breaches.next_cursor,
+        )
+
+        assert len(metrics.items) == 2
+        assert metrics.next_cursor is not None
+        assert [b.id for b in breaches.items + more.items] == ["b0", "b1", "b2"]
+
+
 # ---------------------------------------------------------------------------
 # SQLiteSLAStorage — additional coverage (filter paths)
 # ---------------------------------------------------------------------------
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import sqlite3
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -846,7 +848,7 @@ class TestSQLiteMeteringStorageCoverage:
     async def test_aggregate_without_filters_consumer(
         self, sqlite_storage: SQLiteMeteringStorage
     ) -> None:
-        """aggregate('consumer') without filters uses full-table scan path."""
+        """aggregate('consumer') without filters groups every row in SQL."""
         await sqlite_storage.record(_metric(consumer_id="c1"))
         await sqlite_storage.record(
             _metric(task_id="t2", consumer_id="c2", tokens_in=5, tokens_out=5)
@@ -947,3 +949,309 @@ class TestSQLiteMeteringStorageCoverage:
         monkeypatch.setattr(SQLiteMeteringStorage, "_ALLOWED_QUERY_FRAGMENTS", frozenset())
         with pytest.raises(ValueError, match="unexpected WHERE fragment"):
             await sqlite_storage.query(MeteringQuery(agent_id="agent_01"))
+
+
+# ---------------------------------------------------------------------------
+# Columnar usage_events (typed metric columns, SQL-side aggregation)
+# ---------------------------------------------------------------------------
+
+
+class TestSQLiteMeteringStorageColumnar:
+    """GROUP BY aggregation over typed columns, and migration of legacy tables."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("group_by", ["agent", "consumer", "day", "week"])
+    async def test_aggregate_matches_in_memory(
+        self,
+        sqlite_storage: SQLiteMeteringStorage,
+        in_memory_storage: InMemoryMeteringStorage,
+        group_by: str,
+    ) -> None:
+        """SQL aggregation returns the same rows as the in-memory reference path."""
+        # Spans an ISO year boundary (2026-01-01 is in 2026-W01, 2025-12-28 in 2025-W52).
+        base = datetime(2025, 12, 27, 18, 0, 0, tzinfo=timezone.utc)
+        for i in range(40):
+            m = _metric(
+                task_id=f"t{i}",
+                agent_id=f"a{i % 3}",
+                consumer_id=f"c{i % 4}",
+                timestamp=base + timedelta(hours=7 * i),
+                tokens_in=i,
+                tokens_out=2 * i,
+                duration_ms=10 * i,
+                api_calls=i % 5,
+            )
+            await sqlite_storage.record(m)
+            await in_memory_storage.record(m)
+        filters = MeteringQuery(consumer_id="c1")
+        assert await sqlite_storage.aggregate(group_by) == await in_memory_storage.aggregate(
+            group_by
+        )
+        assert await sqlite_storage.aggregate(
+            group_by, filters
+        ) == await in_memory_storage.aggregate(group_by, filters)
+        assert await sqlite_storage.summary() == await in_memory_storage.summary()
+        assert await sqlite_storage.summary(filters) == await in_memory_storage.summary(filters)
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_table_is_migrated_and_backfilled(self, tmp_path) -> None:
+        """A pre-columnar usage_events table gains typed columns filled from the JSON."""
+        db_path = tmp_path / "legacy_usage.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE usage_events (id TEXT PRIMARY KEY, task_id TEXT NOT NULL, "
+            "agent_id TEXT NOT NULL, consumer_id TEXT NOT NULL, metrics TEXT NOT NULL, "
+            "timestamp TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO usage_events VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                "evt_legacy",
+                "t1",
+                "a1",
+                "c1",
+                json.dumps({"tokens_in": 7, "tokens_out": 3, "duration_ms": 50}),
+                datetime(2026, 2, 17, 12, 0, 0, tzinfo=timezone.utc).isoformat(),
+            ),
+        )
+        conn.commit()
+        conn.close()
+
+        storage = SQLiteMeteringStorage(db_path=str(db_path))
+        await storage.record(_metric(task_id="t2"))
+        summary = await storage.summary()
+        assert summary.total_tasks == 2
+        assert summary.total_tokens == 10 + 30
+        assert summary.total_duration_ms == 50 + 100
+        assert summary.total_api_calls == 0 + 1
+        events = await storage.query(MeteringQuery(task_id="t1"))
+        assert events[0].tokens_in == 7
+        assert events[0].api_calls == 0
+
+
+class TestSQLiteMeteringStorageRollups:
+    """usage_rollups maintenance, range decomposition and retention."""
+
+    @pytest.mark.asyncio
+    async def test_unaligned_ranges_match_in_memory(
+        self,
+        sqlite_storage: SQLiteMeteringStorage,
+        in_memory_storage: InMemoryMeteringStorage,
+    ) -> None:
+        """Ranges split into day/hour/minute rollups plus raw edges match a raw scan."""
+        base = datetime(2026, 3, 1, 22, 17, 31, 250000, tzinfo=timezone.utc)
+        for i in range(60):
+            m = _metric(
+                task_id=f"t{i}",
+                agent_id=f"a{i % 2}",
+                consumer_id=f"c{i % 3}",
+                timestamp=base + timedelta(minutes=97 * i, seconds=i),
+                tokens_in=i,
+                api_calls=i % 3,
+            )
+            await sqlite_storage.record(m)
+            await in_memory_storage.record(m)
+        ranges = [
+            (base + timedelta(hours=5, seconds=13), base + timedelta(days=2, minutes=41)),
+            (None, base + timedelta(days=1, microseconds=7)),
+            (base + timedelta(minutes=3), None),
+            # Exactly one event's timestamp: inclusive on both ends.
+            (base + timedelta(minutes=485, seconds=5), base + timedelta(minutes=485, seconds=5)),
+        ]
+        for start, end in ranges:
+            filters = MeteringQuery(start=start, end=end)
+            for group_by in ("agent", "day", "week"):
+                assert await sqlite_storage.aggregate(
+                    group_by, filters
+                ) == await in_memory_storage.aggregate(group_by, filters)
+            assert await sqlite_storage.summary(filters) == await in_memory_storage.summary(filters)
+
+    @pytest.mark.asyncio
+    async def test_purge_keeps_rollups(self, tmp_path) -> None:
+        """Purging raw events leaves aggregates over the purged period intact."""
+        store = SQLiteMeteringStorage(
+            db_path=str(tmp_path / "rollups.db"),
+            retention_ttl_seconds=7 * 86400,
+        )
+        now = datetime.now(timezone.utc)
+        await store.record(_metric(task_id="old", timestamp=now - timedelta(days=30)))
+        await store.record(_metric(task_id="new", timestamp=now - timedelta(hours=1)))
+        assert await store.purge_expired() == 1
+        assert (await store.stats()).total_events == 1
+        summary = await store.summary()
+        assert summary.total_tasks == 2
+        assert summary.total_tokens == 60
+        assert await store.query(MeteringQuery(task_id="old")) == []
+
+    @pytest.mark.asyncio
+    async def test_rollup_retention_drops_old_buckets(self, tmp_path) -> None:
+        """rollup_retention_ttl_seconds bounds how long rollups outlive raw events."""
+        store = SQLiteMeteringStorage(
+            db_path=str(tmp_path / "rollups_ttl.db"),
+            retention_ttl_seconds=86400,
+            rollup_retention_ttl_seconds=10 * 86400,
+        )
+        now = datetime.now(timezone.utc)
+        await store.record(_metric(task_id="ancient", timestamp=now - timedelta(days=30)))
+        await store.record(_metric(task_id="older", timestamp=now - timedelta(days=3)))
+        assert await store.purge_expired() == 2
+        summary = await store.summary()
+        assert summary.total_tasks == 1
+
+
+class TestInMemoryMeteringStorageIndex:
+    """Indexed queries and running-total aggregates against the SQLite store."""
+
+    @pytest.mark.asyncio
+    async def test_filters_and_groupings_match_sqlite(
+        self,
+        sqlite_storage: SQLiteMeteringStorage,
+        in_memory_storage: InMemoryMeteringStorage,
+    ) -> None:
+        """Counter fast paths and index scans agree with SQL for every filter shape."""
+        base = datetime(2026, 3, 1, 20, 0, tzinfo=timezone.utc)
+        # Interleaved offsets so some events arrive out of timestamp order.
+        for i in range(40):
+            m = _metric(
+                task_id=f"t{i % 7}",
+                agent_id=f"a{i % 3}",
+                consumer_id=f"c{i % 4}",
+                timestamp=base + timedelta(hours=5 * ((i * 7) % 40)),
+                tokens_in=i,
+                api_calls=i % 2,
+            )
+            await sqlite_storage.record(m)
+            await in_memory_storage.record(m)
+        window = {"start": base + timedelta(days=2), "end": base + timedelta(days=6)}
+        filter_sets = [
+            {},
+            {"agent_id": "a1"},
+            {"consumer_id": "c2"},
+            {"agent_id": "a0", "consumer_id": "c0"},
+            {"task_id": "t3"},
+            window,
+            {"agent_id": "a2", **window},
+        ]
+        for kwargs in filter_sets:
+            filters = MeteringQuery(**kwargs)
+            assert [e.task_id for e in await in_memory_storage.query(filters)] == [
+                e.task_id for e in await sqlite_storage.query(filters)
+            ]
+            for group_by in ("agent", "consumer", "day", "week"):
+                assert await in_memory_storage.aggregate(
+                    group_by, filters
+                ) == await sqlite_storage.aggregate(group_by, filters)
+            assert await in_memory_storage.summary(filters) == await sqlite_storage.summary(filters)
+
+    @pytest.mark.asyncio
+    async def test_purge_updates_totals_and_stats(self) -> None:
+        """Purged events leave the running totals, stats and aggregates."""
+        store = InMemoryMeteringStorage(retention_ttl_seconds=86400)
+        now = datetime.now(timezone.utc)
+        await store.record(_metric(task_id="old", agent_id="a1", timestamp=now - timedelta(days=3)))
+        await store.record(_metric(task_id="new", agent_id="a2", timestamp=now))
+
+        assert await store.purge_expired() == 1
+
+        stats = await store.stats()
+        assert stats.total_events == 1
+        assert stats.oldest_timestamp == now
+        assert [a.agent_id for a in await store.aggregate("agent")] == ["a2"]
+        summary = await store.summary()
+        assert summary.total_tasks == 1
+        assert summary.unique_agents == 1
+
+
+class TestMeteringStorageIterEvents:
+    """iter_events streams pages in (timestamp, id) order."""
+
+    @pytest.mark.asyncio
+    async def test_sqlite_keyset_pages_cover_every_event_once(
+        self, sqlite_storage: SQLiteMeteringStorage
+    ) -> None:
+        """Ties on timestamp are broken by id, so page boundaries never skip or repeat."""
+        ts = datetime(2026, 2, 17, 12, 0, 0, tzinfo=timezone.utc)
+        for i in range(7):
+            await sqlite_storage.record(_metric(task_id=f"t{i}", timestamp=ts))
+        await sqlite_storage.record(_metric(task_id="late", timestamp=ts + timedelta(seconds=1)))
+        streamed = [e async for e in sqlite_storage.iter_events(MeteringQuery(), page_size=3)]
+        assert len(streamed) == 8
+        assert {e.task_id for e in streamed} == {f"t{i}" for i in range(7)} | {"late"}
+        assert streamed[-1].task_id == "late"
+
+    @pytest.mark.asyncio
+    async def test_iter_events_honours_filters_and_limit(
+        self,
+        sqlite_storage: SQLiteMeteringStorage,
+        in_memory_storage: InMemoryMeteringStorage,
+    ) -> None:
+        base = datetime(2026, 2, 17, 12, 0, 0, tzinfo=timezone.utc)
+        for storage in (sqlite_storage, in_memory_storage):
+            for i in range(10):
+                await storage.record(
+                    _metric(
+                        task_id=f"t{i}",
+                        agent_id=f"a{i % 2}",
+                        timestamp=base + timedelta(minutes=i),
+                    )
+                )
+            filters = MeteringQuery(agent_id="a1", limit=4)
+            streamed = [e.task_id async for e in storage.iter_events(filters, page_size=3)]
+            assert streamed == ["t1", "t3", "t5", "t7"]
+
+
+class TestMeteringStorageQueryPage:
+    """query_page returns one page plus an opaque cursor for the next one."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_walk_covers_every_event_once(
+        self,
+        sqlite_storage: SQLiteMeteringStorage,
+        in_memory_storage: InMemoryMeteringStorage,
+    ) -> None:
+        ts = datetime(2026, 2, 17, 12, 0, 0, tzinfo=timezone.utc)
+        for storage in (sqlite_storage, in_memory_storage):
+            for i in range(7):
+                await storage.record(_metric(task_id=f"t{i}", timestamp=ts))
+            await storage.record(_metric(task_id="late", timestamp=ts + timedelta(seconds=1)))
+
+            seen: list[str] = []
+            cursor: str | None = None
+            while True:
+                page = await storage.query_page(MeteringQuery(limit=3), cursor)
+                seen.extend(e.task_id for e in page.items)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+            assert len(seen) == 8
+            assert set(seen) == {f"t{i}" for i in range(7)} | {"late"}
+            assert seen[-1] == "late"
+
+    @pytest.mark.asyncio
+    async def test_offset_applies_to_first_page_only(
+        self, sqlite_storage: SQLiteMeteringStorage
+    ) -> None:
+        base = datetime(2026, 2, 17, 12, 0, 0, tzinfo=timezone.utc)
+        for i in range(5):
+            await sqlite_storage.record(
+                _metric(task_id=f"t{i}", timestamp=base + timedelta(minutes=i))
+            )
+        filters = MeteringQuery(limit=2, offset=1)
+
+        first = await sqlite_storage.query_page(filters)
+        second = await sqlite_storage.query_page(filters, first.next_cursor)
+
+        assert [e.task_id for e in first.items] == ["t1", "t2"]
+        assert [e.task_id for e in second.items] == ["t3", "t4"]
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_unbounded_page_and_invalid_cursor(
+        self, sqlite_storage: SQLiteMeteringStorage
+    ) -> None:
+        await sqlite_storage.record(_metric(task_id="t0"))
+        page = await sqlite_storage.query_page(MeteringQuery())
+        assert len(page.items) == 1
+        assert page.next_cursor is None
+        with pytest.raises(ValueError, match="invalid cursor"):
+            await sqlite_storage.query_page(MeteringQuery(limit=1), "garbage")
@@ -1,13 +1,14 @@
 """Integration tests for usage metering REST API (GET /usage, etc.)."""
 
 import asyncio
+import json
 from datetime import datetime, timezone
 from typing import Any, Coroutine, TypeVar
 
 import pytest
 from fastapi.testclient import TestClient
 
-from asap.economics import InMemoryMeteringStorage, UsageMetrics
+from asap.economics import InMemoryMeteringStorage, SQLiteMeteringStorage, UsageMetrics
 from asap.models.entities import Capability, Endpoint, Manifest, Skill
 from asap.transport.server import create_app
 
@@ -180,6 +181,49 @@ class TestUsageAPIGetUsage:
         assert len(resp.json()["data"]) == 1
         assert resp.json()["data"][0]["task_id"] == "t1"
 
+    def test_get_usage_cursor_pagination(self, sample_manifest: Manifest, tmp_path) -> None:
+        """GET /usage follows next_cursor through every page (SQLite keyset)."""
+        storage = SQLiteMeteringStorage(db_path=str(tmp_path / "usage.db"))
+        for i in range(5):
+            _run(
+                storage.record(
+                    UsageMetrics(
+                        task_id=f"t{i}",
+                        agent_id="a1",
+                        consumer_id="c1",
+                        timestamp=datetime(2026, 2, 17, 12, i, 0, tzinfo=timezone.utc),
+                    )
+                )
+            )
+        app = create_app(sample_manifest, metering_storage=storage, rate_limit="999999/minute")
+        client = TestClient(app)
+
+        task_ids: list[str] = []
+        params: dict[str, Any] = {"limit": 2}
+        while True:
+            resp = client.get("/usage", params=params)
+            assert resp.status_code == 200
+            body = resp.json()
+            task_ids.extend(e["task_id"] for e in body["data"])
+            if body["next_cursor"] is None:
+                break
+            params["cursor"] = body["next_cursor"]
+        assert task_ids == ["t0", "t1", "t2", "t3", "t4"]
+
+    def test_get_usage_invalid_cursor_returns_400(
+        self,
+        sample_manifest: Manifest,
+        metering_storage: InMemoryMeteringStorage,
+    ) -> None:
+        app = create_app(
+            sample_manifest,
+            metering_storage=metering_storage,
+            rate_limit="999999/minute",
+        )
+        client = TestClient(app)
+        resp = client.get("/usage", params={"limit": 2, "cursor": "garbage"})
+        assert resp.status_code == 400
+
 
 class TestUsageAPIGetAggregate:
     """Test GET /usage/aggregate endpoint."""
@@ -818,6 +862,40 @@ class TestUsageAPIExport:
         assert "tokens_in,tokens_out" in content
         assert "t1,a1,c1,10,20" in content
 
+    @pytest.mark.parametrize("export_format", ["jsonl", "ndjson"])
+    def test_export_line_delimited_streams_every_event(
+        self,
+        sample_manifest: Manifest,
+        metering_storage: InMemoryMeteringStorage,
+        export_format: str,
+    ) -> None:
+        """GET /usage/export streams one JSON object per line, with no default cap."""
+        base = datetime(2026, 2, 17, 12, 0, 0, tzinfo=timezone.utc)
+        for i in range(1200):
+            _run(
+                metering_storage.record(
+                    UsageMetrics(
+                        task_id=f"t{i}",
+                        agent_id="a1",
+                        consumer_id="c1",
+                        timestamp=base,
+                    )
+                )
+            )
+        app = create_app(
+            sample_manifest,
+            metering_storage=metering_storage,
+            rate_limit="999999/minute",
+        )
+        client = TestClient(app)
+        resp = client.get("/usage/export", params={"export_format": export_format})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        assert f"usage_export.{export_format}" in resp.headers["content-disposition"]
+        lines = resp.text.splitlines()
+        assert len(lines) == 1200
+        assert json.loads(lines[-1])["task_id"] == "t1199"
+
 
 class TestUsageAPIConfiguration:
     """Test configuration edge cases."""
@@ -0,0 +1,152 @@
+"""Tests for the opt-in request stage profiler."""
+
+import asyncio
+
+import pytest
+
+from asap.observability.metrics import MetricsCollector
+from asap.observability.profiling import (
+    STAGE_DURATION_METRIC,
+    RequestProfile,
+    RequestProfiler,
+    RequestStageHook,
+    SlowRequestHook,
+    current_profile,
+)
+
+
+class _RecordingHook(RequestStageHook):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+        self.finished: list[RequestProfile] = []
+
+    def before_stage(self, stage: str, profile: RequestProfile) -> None:
+        self.events.append(("before", stage))
+
+    def after_stage(self, stage: str, profile: RequestProfile, duration_ns: int) -> None:
+        assert duration_ns >= 0
+        self.events.append(("after", stage))
+
+    def on_request_end(self, profile: RequestProfile) -> None:
+        self.finished.append(profile)
+
+
+class _FailingHook(RequestStageHook):
+    def after_stage(self, stage: str, profile: RequestProfile, duration_ns: int) -> None:
+        raise RuntimeError("hook failure")
+
+
+class TestRequestProfiler:
+    """Tests for RequestProfiler stage timing, metrics and hooks."""
+
+    def test_stage_without_active_profile_is_noop(self) -> None:
+        """Stages outside start()/finish() record nothing."""
+        metrics = MetricsCollector()
+        hook = _RecordingHook()
+        profiler = RequestProfiler(hooks=[hook], metrics=metrics)
+
+        with profiler.stage("parse"):
+            pass
+
+        assert hook.events == []
+        assert metrics.get_histogram_count(STAGE_DURATION_METRIC, {"stage": "parse"}) == 0
+
+    def test_stages_recorded_in_profile_metrics_and_hooks(self) -> None:
+        """Each stage is timed, exported with a stage label and reported to hooks."""
+        metrics = MetricsCollector()
+        hook = _RecordingHook()
+        profiler = RequestProfiler(hooks=[hook], metrics=metrics)
+
+        profile, token = profiler.start()
+        assert current_profile() is profile
+        with profiler.stage("parse"):
+            pass
+        with profiler.stage("dispatch"):
+            pass
+        profiler.finish(profile, token)
+
+        assert current_profile() is None
+        assert list(profile.stages) == ["parse", "dispatch"]
+        assert profile.finished_ns is not None
+        assert profile.total_ns >= sum(profile.stages.values())
+        assert hook.events == [
+            ("before", "parse"),
+            ("after", "parse"),
+            ("before", "dispatch"),
+            ("after", "dispatch"),
+        ]
+        assert hook.finished == [profile]
+        assert metrics.get_histogram_count(STAGE_DURATION_METRIC, {"stage": "parse"}) == 1
+        assert metrics.get_histogram_count(STAGE_DURATION_METRIC, {"stage": "dispatch"}) == 1
+
+    def test_stage_recorded_when_body_raises(self) -> None:
+        """A stage that raises is still timed."""
+        metrics = MetricsCollector()
+        profiler = RequestProfiler(metrics=metrics)
+        profile, token = profiler.start()
+
+        with pytest.raises(ValueError), profiler.stage("auth"):
+            raise ValueError("boom")
+        profiler.finish(profile, token)
+
+        assert "auth" in profile.stages
+        assert metrics.get_histogram_count(STAGE_DURATION_METRIC, {"stage": "auth"}) == 1
+
+    def test_record_metrics_disabled(self) -> None:
+        """record_metrics=False keeps timings in the profile only."""
+        metrics = MetricsCollector()
+        profiler = RequestProfiler(metrics=metrics, record_metrics=False)
+        profile, token = profiler.start()
+        with profiler.stage("nonce"):
+            pass
+        profiler.finish(profile, token)
+
+        assert "nonce" in profile.stages
+        assert metrics.get_histogram_count(STAGE_DURATION_METRIC, {"stage": "nonce"}) == 0
+
+    def test_failing_hook_does_not_propagate(self) -> None:
+        """Hook exceptions are logged and later hooks still run."""
+        recording = _RecordingHook()
+        profiler = RequestProfiler(hooks=[_FailingHook(), recording], metrics=MetricsCollector())
+        profile, token = profiler.start()
+        with profiler.stage("serialize"):
+            pass
+        profiler.finish(profile, token)
+
+        assert ("after", "serialize") in recording.events
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_have_isolated_profiles(self) -> None:
+        """Profiles are per task, so concurrent requests do not share timings."""
+        profiler = RequestProfiler(metrics=MetricsCollector())
+
+        async def run(stage: str) -> RequestProfile:
+            profile, token = profiler.start()
+            with profiler.stage(stage):
+                await asyncio.sleep(0)
+            profiler.finish(profile, token)
+            return profile
+
+        first, second = await asyncio.gather(run("auth"), run("nonce"))
+
+        assert list(first.stages) == ["auth"]
+        assert list(second.stages) == ["nonce"]
+
+
+class TestSlowRequestHook:
+    """Tests for SlowRequestHook."""
+
+    def test_reports_only_slow_requests(self) -> None:
+        slow: list[RequestProfile] = []
+        hook = SlowRequestHook(1.0, slow.append)
+
+        fast_profile = RequestProfile()
+        fast_profile.finished_ns = fast_profile.started_ns + 1_000
+        slow_profile = RequestProfile()
+        slow_profile.finished_ns = slow_profile.started_ns + 2_000_000_000
+
+        hook.on_request_end(fast_profile)
+        hook.on_request_end(slow_profile)
+
+        assert slow == [slow_profile]
+        assert slow_profile.total_seconds == pytest.approx(2.0)
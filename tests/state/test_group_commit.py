@@ -0,0 +1,174 @@
+"""Unit tests for :class:`GroupCommitWriter` (batched single-row inserts).
+
+Covers:
+- concurrent submits share one transaction and resolve once committed;
+- a full queue flushes without waiting for the delay;
+- ``flush`` drains queued rows;
+- a failing row fails only its own caller;
+- a submit inside another repository's transaction on the file joins it;
+- queue depth / flush latency histograms are recorded per writer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from asap.observability.metrics import MetricsCollector
+from asap.state.stores import AsyncSqliteRepository, GroupCommitWriter
+from asap.state.stores._group_commit import FLUSH_DURATION_METRIC, QUEUE_DEPTH_METRIC
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS sample (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+)
+"""
+
+
+async def _insert(conn: aiosqlite.Connection, rows: list[tuple[int, str]]) -> list[int]:
+    await conn.executemany("INSERT INTO sample(id, name) VALUES (?, ?)", rows)
+    return [row_id for row_id, _ in rows]
+
+
+def _writer(
+    repo: AsyncSqliteRepository,
+    metrics: MetricsCollector,
+    *,
+    max_batch_size: int = 256,
+    max_delay_seconds: float = 0.002,
+) -> GroupCommitWriter[tuple[int, str], int]:
+    return GroupCommitWriter(
+        repo,
+        _insert,
+        name="sample",
+        max_batch_size=max_batch_size,
+        max_delay_seconds=max_delay_seconds,
+        metrics=metrics,
+    )
+
+
+async def test_concurrent_submits_share_one_transaction(tmp_path: Path) -> None:
+    repo = AsyncSqliteRepository(tmp_path / "gc.db", schema_ddl=_DDL)
+    metrics = MetricsCollector()
+    writer = _writer(repo, metrics)
+
+    results = await asyncio.gather(*(writer.submit((i, f"n{i}")) for i in range(50)))
+
+    assert results == list(range(50))
+    assert await repo.fetch_one("SELECT COUNT(*) FROM sample") == (50,)
+    labels = {"writer": "sample"}
+    assert metrics.get_histogram_count(QUEUE_DEPTH_METRIC, labels) == 1
+    assert metrics.get_histogram_count(FLUSH_DURATION_METRIC, labels) == 1
+
+
+async def test_full_queue_flushes_before_delay() -> None:
+    repo = AsyncSqliteRepository(":memory:", schema_ddl=_DDL)
+    metrics = MetricsCollector()
+    writer = _writer(repo, metrics, max_batch_size=4, max_delay_seconds=60.0)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(writer.submit((i, "x")) for i in range(8))), timeout=5.0
+    )
+
+    assert sorted(results) == list(range(8))
+    assert metrics.get_histogram_count(QUEUE_DEPTH_METRIC, {"writer": "sample"}) == 2
+
+
+async def test_flush_drains_queued_rows() -> None:
+    repo = AsyncSqliteRepository(":memory:", schema_ddl=_DDL)
+    writer = _writer(repo, MetricsCollector(), max_delay_seconds=60.0)
+
+    pending = [asyncio.create_task(writer.submit((i, "x"))) for i in range(3)]
+    await asyncio.sleep(0)
+    assert writer.queue_depth == 3
+
+    await asyncio.wait_for(writer.flush(), timeout=5.0)
+
+    assert writer.queue_depth == 0
+    assert all(task.done() for task in pending)
+    assert await repo.fetch_one("SELECT COUNT(*) FROM sample") == (3,)
+
+
+async def test_failing_row_only_fails_its_caller() -> None:
+    repo = AsyncSqliteRepository(":memory:", schema_ddl=_DDL)
+    await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (2, "taken"))
+    writer = _writer(repo, MetricsCollector())
+
+    results = await asyncio.gather(
+        *(writer.submit((i, "x")) for i in range(1, 4)), return_exceptions=True
+    )
+
+    assert results[0] == 1
+    assert isinstance(results[1], sqlite3.IntegrityError)
+    assert results[2] == 3
+    rows = await repo.fetch_all("SELECT id, name FROM sample ORDER BY id")
+    assert rows == [(1, "x"), (2, "taken"), (3, "x")]
+
+
+async def test_cancelled_flusher_releases_waiting_callers() -> None:
+    repo = AsyncSqliteRepository(":memory:", schema_ddl=_DDL)
+    started = asyncio.Event()
+
+    async def _stalled(conn: aiosqlite.Connection, rows: list[tuple[int, str]]) -> list[int]:
+        started.set()
+        await asyncio.Event().wait()
+        return []
+
+    writer: GroupCommitWriter[tuple[int, str], int] = GroupCommitWriter(
+        repo, _stalled, name="sample", max_batch_size=1, metrics=MetricsCollector()
+    )
+    in_flight = asyncio.create_task(writer.submit((1, "a")))
+    await started.wait()
+    queued = asyncio.create_task(writer.submit((2, "b")))
+    await asyncio.sleep(0)
+    assert writer._flusher is not None  # noqa: SLF001
+    writer._flusher.cancel()  # noqa: SLF001
+
+    results = await asyncio.wait_for(
+        asyncio.gather(in_flight, queued, return_exceptions=True), timeout=5.0
+    )
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert writer.queue_depth == 0
+    assert await repo.fetch_one("SELECT COUNT(*) FROM sample") == (0,)
+
+
+async def test_submit_inside_enclosing_transaction_writes_inline(tmp_path: Path) -> None:
+    db = tmp_path / "gc.db"
+    repo = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    other = AsyncSqliteRepository(db, schema_ddl="CREATE TABLE IF NOT EXISTS other (v TEXT)")
+    writer = _writer(repo, MetricsCollector())
+
+    async with other.transaction() as conn:
+        await conn.execute("INSERT INTO other(v) VALUES ('a')")
+        # Queued first: the flusher takes the writer's instance lock, then waits
+        # for the file's writer connection that this task holds.
+        queued = asyncio.create_task(writer.submit((1, "queued")))
+        await asyncio.sleep(0.01)
+        # Not wait_for(): it would submit from a new task, which holds no writer.
+        async with asyncio.timeout(5.0):
+            assert await writer.submit((2, "inline")) == 2
+        assert not queued.done()
+
+    assert await asyncio.wait_for(queued, timeout=5.0) == 1
+    rows = await repo.fetch_all("SELECT id, name FROM sample ORDER BY id")
+    assert rows == [(1, "queued"), (2, "inline")]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async with other.transaction():
+            await writer.submit((3, "rolled back"))
+            raise RuntimeError("boom")
+    assert await repo.fetch_one("SELECT COUNT(*) FROM sample") == (2,)
+
+
+def test_rejects_invalid_limits() -> None:
+    repo = AsyncSqliteRepository(":memory:", schema_ddl=_DDL)
+    with pytest.raises(ValueError, match="max_batch_size"):
+        _writer(repo, MetricsCollector(), max_batch_size=0)
+    with pytest.raises(ValueError, match="max_delay_seconds"):
+        _writer(repo, MetricsCollector(), max_delay_seconds=-1.0)
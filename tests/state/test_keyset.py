@@ -0,0 +1,60 @@
+"""Unit tests for the keyset pagination cursor helpers.
+
+Covers:
+- cursors round-trip their sort key and are URL-safe;
+- malformed or foreign-shaped cursors raise ``ValueError``;
+- ``page_from_rows`` trims the look-ahead row and only then emits a cursor.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from asap.state.stores import InvalidCursor, Page, decode_cursor, encode_cursor
+from asap.state.stores._keyset import cursor_offset, page_from_rows
+
+
+def test_cursor_round_trips_sort_key() -> None:
+    cursor = encode_cursor("2026-02-17T12:00:00+00:00", "evt_01")
+
+    assert decode_cursor(cursor, str, str) == ("2026-02-17T12:00:00+00:00", "evt_01")
+    assert "=" not in cursor
+    assert "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not base64!",
+        "é",
+        encode_cursor("2026-02-17T12:00:00+00:00"),
+        encode_cursor("2026-02-17T12:00:00+00:00", 7),
+        encode_cursor("2026-02-17T12:00:00+00:00", True),
+    ],
+)
+def test_decode_rejects_malformed_or_foreign_cursor(cursor: str) -> None:
+    with pytest.raises(InvalidCursor, match="invalid cursor"):
+        decode_cursor(cursor, str, str)
+
+
+def test_cursor_offset() -> None:
+    assert cursor_offset(None, 5) == 5
+    assert cursor_offset(encode_cursor(40)) == 40
+    with pytest.raises(InvalidCursor, match="invalid cursor"):
+        cursor_offset(encode_cursor(-1))
+
+
+def test_page_from_rows_uses_look_ahead_row() -> None:
+    rows = [("t1", "a"), ("t2", "b"), ("t3", "c")]
+
+    more = page_from_rows(rows, 2, key=lambda r: r, to_item=lambda r: r[1])
+    last = page_from_rows(rows[:2], 2, key=lambda r: r, to_item=lambda r: r[1])
+    everything = page_from_rows(rows, None, key=lambda r: r, to_item=lambda r: r[1])
+
+    assert more.items == ["a", "b"]
+    assert more.next_cursor is not None
+    assert decode_cursor(more.next_cursor, str, str) == ("t2", "b")
+    assert last == Page(["a", "b"])
+    assert everything == Page(["a", "b", "c"])
+    assert page_from_rows(rows, 0, key=lambda r: r, to_item=lambda r: r) == Page()
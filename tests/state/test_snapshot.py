@@ -755,6 +755,56 @@ class TestInMemorySnapshotStore:
         assert snapshot_store.get(task_id_2).data["task"] == 2
 
 
+class TestInMemorySnapshotStoreDeltaMode:
+    """InMemorySnapshotStore(delta_interval=K) keeps patches between full copies."""
+
+    @staticmethod
+    def _snapshot(version: int, *, checkpoint: bool = False) -> StateSnapshot:
+        return StateSnapshot(
+            id=f"snap_delta_{version}",
+            task_id="task_delta",
+            version=version,
+            data={"step": version, "ctx": {"seen": list(range(version % 3)), "model": "m"}},
+            checkpoint=checkpoint,
+            created_at=datetime.now(timezone.utc),
+        )
+
+    def test_every_version_reconstructs(self) -> None:
+        store = InMemorySnapshotStore(delta_interval=3)
+        for version in range(1, 11):
+            store.save(self._snapshot(version, checkpoint=version == 5))
+
+        assert sorted(store._deltas["task_delta"]) == [2, 3, 6, 7, 9, 10]
+        for version in range(1, 11):
+            got = store.get("task_delta", version)
+            assert got is not None
+            assert got.id == f"snap_delta_{version}"
+            assert got.data == self._snapshot(version).data
+        assert store.get("task_delta").version == 10
+
+    def test_delete_base_keeps_dependents_readable(self) -> None:
+        store = InMemorySnapshotStore(delta_interval=10)
+        for version in range(1, 5):
+            store.save(self._snapshot(version))
+
+        assert store.delete("task_delta", 2) is True
+        store.save(self._snapshot(3).model_copy(update={"data": {"rewritten": True}}))
+
+        assert store.get("task_delta", 3).data == {"rewritten": True}
+        assert store.get("task_delta", 4).data == self._snapshot(4).data
+
+    def test_compact_restores_chain_cadence(self) -> None:
+        store = InMemorySnapshotStore()
+        for version in range(1, 8):
+            store.save(self._snapshot(version))
+
+        store._delta_interval = 3
+        assert store.compact() == 4
+        assert store.compact("task_delta") == 0
+        for version in range(1, 8):
+            assert store.get("task_delta", version).data == self._snapshot(version).data
+
+
 class TestSnapshotStoreThreadSafety:
     """Tests for thread safety of InMemorySnapshotStore."""
 
@@ -0,0 +1,104 @@
+"""Unit tests for the snapshot delta codec.
+
+Covers:
+- ``diff``/``apply_patch`` round-trip nested objects, escaped keys and JSON types;
+- ``apply_patch`` leaves its input untouched;
+- ``encode_version`` stores full copies for checkpoints and every K-th link;
+- ``materialize`` rebuilds chains and stops at cached versions.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from asap.state.stores._delta import (
+    MaterializedCache,
+    apply_patch,
+    check_delta_interval,
+    diff,
+    encode_version,
+    materialize,
+)
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ({}, {"a": 1}),
+        ({"a": 1, "b": [1, 2]}, {"a": 1, "b": [1, 2, 3]}),
+        ({"ctx": {"x": {"y": 1}, "z": 2}}, {"ctx": {"x": {"y": 2}}}),
+        ({"a/b": 1, "c~d": 2}, {"a/b": 3, "c~d": 2, "e/~": 4}),
+        ({"flag": 1}, {"flag": True}),
+        ({"items": [1]}, {"items": [1.0]}),
+        ({"ctx": {"a": 1}}, {"ctx": "flattened"}),
+    ],
+)
+def test_diff_apply_round_trip(old: dict, new: dict) -> None:
+    rebuilt = apply_patch(old, diff(old, new))
+
+    assert json.dumps(rebuilt, sort_keys=True) == json.dumps(new, sort_keys=True)
+
+
+def test_diff_of_equal_documents_is_empty() -> None:
+    assert diff({"a": {"b": [1, 2]}}, {"a": {"b": [1, 2]}}) == []
+
+
+def test_apply_patch_does_not_mutate_input() -> None:
+    doc = {"ctx": {"a": 1, "keep": {"deep": True}}, "step": 1}
+    rebuilt = apply_patch(doc, diff(doc, {"ctx": {"a": 2, "keep": {"deep": True}}, "step": 2}))
+
+    assert doc == {"ctx": {"a": 1, "keep": {"deep": True}}, "step": 1}
+    assert rebuilt["ctx"]["keep"] is doc["ctx"]["keep"]
+
+
+def test_encode_version_chain_policy() -> None:
+    base = (4, {"step": 4}, 1)
+
+    assert encode_version(None, {"step": 5}, False, base) == (None, {"step": 5}, 0)
+    assert encode_version(3, {"step": 5}, True, base) == (None, {"step": 5}, 0)
+    assert encode_version(3, {"step": 5}, False, None) == (None, {"step": 5}, 0)
+    assert encode_version(3, {"step": 5}, False, base) == (
+        4,
+        [{"op": "replace", "path": "/step", "value": 5}],
+        2,
+    )
+    assert encode_version(3, {"step": 5}, False, (4, {"step": 4}, 2))[0] is None
+
+
+def test_check_delta_interval_rejects_non_positive() -> None:
+    assert check_delta_interval(None) is None
+    with pytest.raises(ValueError, match="delta_interval"):
+        check_delta_interval(0)
+
+
+def test_materialize_walks_chain_and_uses_cache() -> None:
+    stored = {
+        1: ("s1", None, {"n": 1}),
+        2: ("s2", 1, [{"op": "replace", "path": "/n", "value": 2}]),
+        3: ("s3", 2, [{"op": "add", "path": "/m", "value": 0}]),
+    }
+    loaded: list[int] = []
+
+    def load(version: int) -> tuple[str, int | None, object]:
+        loaded.append(version)
+        return stored[version]
+
+    cache = MaterializedCache(maxsize=2)
+    assert materialize(cache, "t", 3, load) == ({"n": 2, "m": 0}, 2)
+
+    stored[4] = ("s4", 3, [{"op": "remove", "path": "/m"}])
+    loaded.clear()
+    assert materialize(cache, "t", 4, load) == ({"n": 2}, 3)
+    assert 1 not in loaded
+
+
+def test_cache_misses_when_snapshot_id_changes() -> None:
+    cache = MaterializedCache(maxsize=1)
+    cache.put("t", 1, "s1", {"n": 1}, 0)
+
+    assert cache.get("t", 1, "s1") == ({"n": 1}, 0)
+    assert cache.get("t", 1, "other") is None
+    cache.put("t", 2, "s2", {"n": 2}, 0)
+    assert cache.get("t", 1, "s1") is None
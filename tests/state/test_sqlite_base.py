@@ -4,7 +4,9 @@ Covers the four contract guarantees the migrations depend on:
 - ``execute`` / ``fetch_all`` / ``fetch_one`` round-trip;
 - ``transaction`` commits on success and rolls back on exception;
 - ``parse_iso`` handles valid/invalid/None uniformly;
-- ``build_where`` rejects unknown filter keys (allow-list guard).
+- ``build_where`` rejects unknown filter keys (allow-list guard);
+- file-backed repositories share one pooled writer + bounded readers per path,
+  whose connections are stopped once the pool is garbage-collected.
 
 Tests use ``:memory:`` so no temp files are needed and runs are deterministic.
 """
@@ -12,6 +14,9 @@ Tests use ``:memory:`` so no temp files are needed and runs are deterministic.
 from __future__ import annotations
 
 import asyncio
+import gc
+import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -19,10 +24,13 @@ import aiosqlite
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
+from asap.state.stores import _sqlite_base
 from asap.state.stores._sqlite_base import (
     AsyncSqliteRepository,
+    SyncSqliteRepository,
     _build_sql_in_placeholders,
     build_where,
+    get_connection_pool,
     parse_iso,
 )
 
@@ -353,6 +361,234 @@ async def test_file_backed_execute_serializes_concurrent_same_repo_writes(
     assert events.index("execute:first") < events.index("execute:second")
 
 
+# ---------------------------------------------------------------------------
+# Shared connection pool (one writer + bounded readers per file)
+# ---------------------------------------------------------------------------
+
+
+def _count_connects(monkeypatch: MonkeyPatch) -> list[object]:
+    opened: list[object] = []
+    original_connect = aiosqlite.connect
+
+    def _counting_connect(*args: object, **kwargs: object) -> aiosqlite.Connection:
+        conn = original_connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(aiosqlite, "connect", _counting_connect)
+    return opened
+
+
+async def test_repos_on_same_file_share_one_pool(tmp_path: Path) -> None:
+    db = tmp_path / "pooled.db"
+    repo_a = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    repo_b = AsyncSqliteRepository(str(db), schema_ddl=_DDL)
+    other = AsyncSqliteRepository(tmp_path / "other.db", schema_ddl=_DDL)
+
+    assert repo_a._connection_pool() is repo_b._connection_pool()  # noqa: SLF001
+    assert repo_a._connection_pool() is get_connection_pool(db)  # noqa: SLF001
+    assert other._connection_pool() is not repo_a._connection_pool()  # noqa: SLF001
+
+
+async def test_pool_reuses_connections_across_calls(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Writes reuse the writer and sequential reads reuse one reader."""
+    opened = _count_connects(monkeypatch)
+    repo = AsyncSqliteRepository(tmp_path / "reuse.db", schema_ddl=_DDL)
+
+    for i in range(5):
+        await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (i, f"n{i}"))
+    for i in range(5):
+        assert await repo.fetch_one("SELECT name FROM sample WHERE id = ?", (i,)) == (f"n{i}",)
+    assert len(await repo.fetch_all("SELECT id FROM sample")) == 5
+
+    assert len(opened) == 2
+
+
+async def test_pool_bounds_concurrent_readers(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    opened = _count_connects(monkeypatch)
+    db = tmp_path / "bounded.db"
+    pool = get_connection_pool(db, max_readers=2)
+    repo = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+
+    results = await asyncio.gather(
+        *(repo.fetch_one("SELECT name FROM sample WHERE id = ?", (1,)) for _ in range(10))
+    )
+
+    assert results == [("a",)] * 10
+    assert pool.max_readers == 2
+    assert len(opened) <= 1 + 2
+
+
+async def test_failed_write_leaves_no_open_transaction(tmp_path: Path) -> None:
+    """A failed statement on the shared writer does not keep the file locked."""
+    db = tmp_path / "failed_write.db"
+    repo = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+
+    with pytest.raises(sqlite3.IntegrityError):
+        await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "dup"))
+
+    async with aiosqlite.connect(db, timeout=1.0) as external:
+        await external.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (2, "b"))
+        await external.commit()
+    assert await repo.fetch_all("SELECT id FROM sample ORDER BY id") == [(1,), (2,)]
+
+
+async def test_pool_replaces_dead_writer_connection(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(_sqlite_base, "_POOL_HEALTH_CHECK_INTERVAL", -1.0)
+    db = tmp_path / "dead_writer.db"
+    repo = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+    pool = repo._connection_pool()  # noqa: SLF001
+    assert pool._writer is not None  # noqa: SLF001
+    await pool._writer.close()  # noqa: SLF001
+
+    await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (2, "b"))
+
+    assert await repo.fetch_all("SELECT id FROM sample ORDER BY id") == [(1,), (2,)]
+
+
+async def test_closed_pool_is_replaced_on_next_use(tmp_path: Path) -> None:
+    db = tmp_path / "closed_pool.db"
+    repo = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+    first_pool = repo._connection_pool()  # noqa: SLF001
+
+    await _sqlite_base.close_connection_pools()
+
+    assert await repo.fetch_one("SELECT name FROM sample WHERE id = ?", (1,)) == ("a",)
+    assert repo._connection_pool() is not first_pool  # noqa: SLF001
+
+
+async def test_collected_pool_stops_its_connections(tmp_path: Path) -> None:
+    """Dropping the last repository on a file ends its pooled connection threads."""
+    db = tmp_path / "collected.db"
+    repo = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+    assert await repo.fetch_one("SELECT name FROM sample") == ("a",)
+    threads = [
+        getattr(conn, "_thread", conn)
+        for conn in repo._connection_pool()._connections  # noqa: SLF001
+    ]
+    assert len(threads) == 2
+    assert all(isinstance(thread, threading.Thread) for thread in threads)
+
+    del repo
+    gc.collect()
+
+    for thread in threads:
+        await asyncio.to_thread(thread.join, 5.0)
+        assert not thread.is_alive()
+
+
+async def test_transaction_can_call_other_repo_on_same_file(tmp_path: Path) -> None:
+    """Another repository used inside a transaction shares the writer instead of waiting."""
+    db = tmp_path / "nested.db"
+    repo_a = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    repo_b = AsyncSqliteRepository(
+        db, schema_ddl="CREATE TABLE IF NOT EXISTS other (id INTEGER PRIMARY KEY)"
+    )
+    await repo_a.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+
+    async def _nested() -> None:
+        async with repo_a.transaction() as conn:
+            await conn.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (2, "b"))
+            assert await repo_b.fetch_one("SELECT COUNT(*) FROM other") == (0,)
+            await repo_b.execute("INSERT INTO other(id) VALUES (?)", (1,))
+            async with repo_b.transaction() as inner:
+                await inner.execute("INSERT INTO other(id) VALUES (?)", (2,))
+            assert await repo_b.fetch_all("SELECT id FROM other ORDER BY id") == [(1,), (2,)]
+
+    await asyncio.wait_for(_nested(), timeout=5.0)
+
+    assert await repo_a.fetch_all("SELECT id FROM sample ORDER BY id") == [(1,), (2,)]
+    assert await repo_b.fetch_all("SELECT id FROM other ORDER BY id") == [(1,), (2,)]
+
+
+async def test_nested_work_rolls_back_with_outer_transaction(tmp_path: Path) -> None:
+    db = tmp_path / "nested_rollback.db"
+    repo_a = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    repo_b = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    await repo_a.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async with repo_a.transaction():
+            await repo_b.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (2, "b"))
+            raise RuntimeError("boom")
+
+    assert await repo_b.fetch_all("SELECT id FROM sample ORDER BY id") == [(1,)]
+
+
+async def test_failed_nested_transaction_rolls_back_to_savepoint(tmp_path: Path) -> None:
+    db = tmp_path / "savepoint.db"
+    repo_a = AsyncSqliteRepository(db, schema_ddl=_DDL)
+    repo_b = AsyncSqliteRepository(db, schema_ddl=_DDL)
+
+    async with repo_a.transaction() as conn:
+        await conn.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "kept"))
+        with pytest.raises(RuntimeError, match="boom"):
+            async with repo_b.transaction() as inner:
+                await inner.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (2, "gone"))
+                raise RuntimeError("boom")
+
+    assert await repo_a.fetch_all("SELECT name FROM sample ORDER BY id") == [("kept",)]
+
+
+async def test_same_repo_write_inside_transaction_raises(tmp_path: Path) -> None:
+    """Re-entering the per-instance write lock fails fast instead of deadlocking."""
+    repo = AsyncSqliteRepository(tmp_path / "reentry.db", schema_ddl=_DDL)
+
+    async def _reenter() -> None:
+        async with repo.transaction():
+            await repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+
+    with pytest.raises(RuntimeError, match="re-entered"):
+        await asyncio.wait_for(_reenter(), timeout=5.0)
+    assert await repo.fetch_all("SELECT id FROM sample") == []
+
+
+async def test_async_wal_setup_waits_for_lock_held_by_sync_opener(tmp_path: Path) -> None:
+    """Blocking and async openers serialize journal_mode=WAL on one per-path lock."""
+    db = tmp_path / "shared_lock.db"
+    repo = AsyncSqliteRepository(db, schema_ddl=_DDL)
+
+    with _sqlite_base._wal_setup_lock(str(db.resolve())):  # noqa: SLF001
+        pending = asyncio.ensure_future(
+            repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+        )
+        await asyncio.sleep(0.1)
+        assert not pending.done()
+
+    assert await asyncio.wait_for(pending, timeout=5.0) == 1
+
+
+def test_sync_reader_is_closed_when_its_thread_exits(tmp_path: Path) -> None:
+    repo = SyncSqliteRepository(tmp_path / "sync_readers.db", schema_ddl=_DDL)
+    repo.execute("INSERT INTO sample(id, name) VALUES (?, ?)", (1, "a"))
+    rows: list[tuple[object, ...] | None] = []
+
+    for _ in range(3):
+        worker = threading.Thread(
+            target=lambda: rows.append(repo.fetch_one("SELECT name FROM sample"))
+        )
+        worker.start()
+        worker.join()
+
+    assert rows == [("a",)] * 3
+    assert len(repo._opened) == 1  # noqa: SLF001 - only the writer is left open
+    assert repo.fetch_one("SELECT COUNT(*) FROM sample") == (1,)
+
+
 # ---------------------------------------------------------------------------
 # parse_iso — boundary coverage
 # ---------------------------------------------------------------------------
@@ -2,9 +2,12 @@
 
 import asyncio
 import inspect
+import json
+import sqlite3
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import aiosqlite
 import pytest
@@ -20,6 +23,7 @@ from asap.state.metering import (
 from asap.economics.storage import SQLiteMeteringStorage
 from asap.economics.metering import UsageMetrics as EconomicsUsageMetrics
 from asap.state.snapshot import AsyncSnapshotStore, SnapshotStore
+from asap.state.stores import sqlite as sqlite_module
 from asap.state.stores.sqlite import (
     SQLiteAsyncSnapshotStore,
     SQLiteMeteringStore,
@@ -311,6 +315,63 @@ async def test_sqlite_wal_mode_creates_wal_and_shm_files(db_path: Path) -> None:
         await conn.close()
 
 
+class TestSQLiteSnapshotStoreDirectSync:
+    """SQLiteSnapshotStore runs on blocking sqlite3, without an event loop."""
+
+    @pytest.mark.asyncio
+    async def test_sync_call_inside_running_loop_uses_no_bridge(
+        self,
+        sqlite_snapshot_store: SQLiteSnapshotStore,
+        sample_snapshot: StateSnapshot,
+    ) -> None:
+        with patch("asyncio.run", side_effect=AssertionError("bridged")):
+            sqlite_snapshot_store.save(sample_snapshot)
+            retrieved = sqlite_snapshot_store.get(sample_snapshot.task_id)
+        assert retrieved is not None and retrieved.id == sample_snapshot.id
+
+    def test_concurrent_threads_share_store(self, db_path: Path) -> None:
+        store = SQLiteSnapshotStore(db_path=db_path)
+        errors: list[BaseException] = []
+
+        def work(worker: int) -> None:
+            try:
+                for version in range(1, 11):
+                    store.save(_versioned(f"task_t{worker}", version))
+                    assert store.get(f"task_t{worker}", version) is not None
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert all(store.list_versions(f"task_t{i}") == list(range(1, 11)) for i in range(4))
+        store.close()
+
+    def test_shares_file_with_async_store(self, db_path: Path) -> None:
+        sync_store = SQLiteSnapshotStore(db_path=db_path, delta_interval=4)
+        for version in (1, 2, 3):
+            sync_store.save(_versioned("task_s", version))
+
+        async_store = SQLiteAsyncSnapshotStore(db_path=db_path)
+        got = asyncio.run(async_store.get("task_s", 3))
+        assert got is not None and got.data == _versioned("task_s", 3).data
+        asyncio.run(async_store.delete("task_s", 1))
+        assert sync_store.list_versions("task_s") == [2, 3]
+        assert sync_store.get("task_s", 3).data == _versioned("task_s", 3).data
+
+    def test_in_memory_database(self, sample_snapshot: StateSnapshot) -> None:
+        store = SQLiteSnapshotStore(db_path=":memory:")
+        store.save(sample_snapshot)
+
+        assert store.list_versions(sample_snapshot.task_id) == [sample_snapshot.version]
+        store.close()
+        assert store.list_versions(sample_snapshot.task_id) == []
+
+
 class TestSQLiteSnapshotStorePersistence:
     """Data persists across store re-creation (same db file)."""
 
@@ -329,6 +390,215 @@ class TestSQLiteSnapshotStorePersistence:
         assert retrieved.data == sample_snapshot.data
 
 
+def _versioned(task_id: str, version: int, *, checkpoint: bool = False) -> StateSnapshot:
+    return StateSnapshot(
+        id=f"snap_{task_id}_{version}",
+        task_id=task_id,
+        version=version,
+        data={"step": version, "ctx": {"history": list(range(version % 4)), "fixed": "x" * 64}},
+        checkpoint=checkpoint,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def _base_versions(db_path: Path, task_id: str) -> dict[int, int | None]:
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT version, base_version FROM snapshots WHERE task_id = ?", (task_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return dict(rows)
+
+
+class TestSQLiteSnapshotDeltaMode:
+    """delta_interval stores JSON patches between full copies."""
+
+    def test_versions_round_trip_through_deltas(self, db_path: Path) -> None:
+        store = SQLiteSnapshotStore(db_path=db_path, delta_interval=4)
+        for version in range(1, 11):
+            store.save(_versioned("task_d", version, checkpoint=version == 6))
+
+        assert _base_versions(db_path, "task_d") == {
+            1: None, 2: 1, 3: 2, 4: 3, 5: None, 6: None, 7: 6, 8: 7, 9: 8, 10: None,
+        }  # fmt: skip
+        reader = SQLiteSnapshotStore(db_path=db_path)
+        for version in range(1, 11):
+            got = reader.get("task_d", version)
+            assert got is not None
+            assert got.data == _versioned("task_d", version).data
+        latest = reader.get("task_d")
+        assert latest is not None and latest.version == 10
+
+    def test_returned_data_is_independent_of_cache(self, db_path: Path) -> None:
+        store = SQLiteSnapshotStore(db_path=db_path, delta_interval=4)
+        for version in (1, 2):
+            store.save(_versioned("task_d", version))
+
+        first = store.get("task_d", 2)
+        assert first is not None
+        first.data["ctx"]["fixed"] = "mutated"
+        again = store.get("task_d", 2)
+        assert again is not None and again.data == _versioned("task_d", 2).data
+
+    def test_delete_and_overwrite_rebase_dependents(self, db_path: Path) -> None:
+        store = SQLiteSnapshotStore(db_path=db_path, delta_interval=10)
+        for version in range(1, 6):
+            store.save(_versioned("task_d", version))
+
+        assert store.delete("task_d", 2) is True
+        replacement = _versioned("task_d", 4).model_copy(
+            update={"id": "snap_replaced", "data": {"replaced": True}}
+        )
+        store.save(replacement)
+
+        bases = _base_versions(db_path, "task_d")
+        assert bases[3] is None
+        assert bases[5] is None
+        assert store.get("task_d", 3).data == _versioned("task_d", 3).data
+        assert store.get("task_d", 4).data == {"replaced": True}
+        assert store.get("task_d", 5).data == _versioned("task_d", 5).data
+
+    def test_compact_reencodes_existing_versions(self, db_path: Path) -> None:
+        full = SQLiteSnapshotStore(db_path=db_path)
+        for version in range(1, 9):
+            full.save(_versioned("task_d", version))
+
+        delta = SQLiteSnapshotStore(db_path=db_path, delta_interval=4)
+        assert delta.compact("task_d") == 6
+        assert delta.compact() == 0
+        assert sum(b is not None for b in _base_versions(db_path, "task_d").values()) == 6
+
+        assert full.compact() == 6
+        assert set(_base_versions(db_path, "task_d").values()) == {None}
+        for version in range(1, 9):
+            assert full.get("task_d", version).data == _versioned("task_d", version).data
+
+    def test_legacy_table_gains_base_version(self, db_path: Path) -> None:
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE snapshots (task_id TEXT NOT NULL, id TEXT NOT NULL, "
+            "version INTEGER NOT NULL, data TEXT NOT NULL, checkpoint INTEGER NOT NULL, "
+            "created_at TEXT NOT NULL, PRIMARY KEY (task_id, version))"
+        )
+        conn.execute(
+            "INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?)",
+            ("task_l", "snap_l", 1, '{"legacy": true}', 0, "2026-01-01T00:00:00+00:00"),
+        )
+        conn.commit()
+        conn.close()
+
+        store = SQLiteSnapshotStore(db_path=db_path, delta_interval=4)
+        store.save(_versioned("task_l", 2))
+
+        assert store.get("task_l", 1).data == {"legacy": True}
+        assert _base_versions(db_path, "task_l") == {1: None, 2: 1}
+        assert store.list_snapshots("task_l")[0].size == len('{"legacy": true}')
+
+    def test_rejects_non_positive_interval(self, db_path: Path) -> None:
+        with pytest.raises(ValueError, match="delta_interval"):
+            SQLiteAsyncSnapshotStore(db_path=db_path, delta_interval=0)
+
+
+def _large(task_id: str, version: int, *, checkpoint: bool = False) -> StateSnapshot:
+    snapshot = _versioned(task_id, version, checkpoint=checkpoint)
+    return snapshot.model_copy(
+        update={"data": {**snapshot.data, "rows": [{"id": i, "state": "ok"} for i in range(50)]}}
+    )
+
+
+def _encodings(db_path: Path, task_id: str) -> dict[int, tuple[str | None, str]]:
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT version, encoding, typeof(data) FROM snapshots WHERE task_id = ?", (task_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return {version: (encoding, kind) for version, encoding, kind in rows}
+
+
+class TestSQLiteSnapshotCompression:
+    """compression stores large payloads as BLOBs; metadata reads skip them."""
+
+    def test_large_payloads_are_compressed_blobs(self, db_path: Path) -> None:
+        store = SQLiteSnapshotStore(db_path=db_path, compression="br")
+        store.save(_large("task_c", 1))
+        store.save(_versioned("task_c", 2))
+
+        assert _encodings(db_path, "task_c") == {1: ("br", "blob"), 2: (None, "text")}
+        reader = SQLiteSnapshotStore(db_path=db_path)
+        assert reader.get("task_c", 1).data == _large("task_c", 1).data
+        assert reader.get("task_c", 2).data == _versioned("task_c", 2).data
+
+    def test_compression_with_delta_chains(self, db_path: Path) -> None:
+        store = SQLiteSnapshotStore(db_path=db_path, delta_interval=4, compression="br")
+        for version in range(1, 7):
+            store.save(_large("task_c", version))
+
+        reader = SQLiteSnapshotStore(db_path=db_path)
+        for version in range(1, 7):
+            assert reader.get("task_c", version).data == _large("task_c", version).data
+
+    def test_list_snapshots_reports_metadata(self, db_path: Path) -> None:
+        store = SQLiteSnapshotStore(db_path=db_path, delta_interval=4, compression="br")
+        for version in (1, 2, 3):
+            store.save(_large("task_c", version, checkpoint=version == 3))
+
+        infos = store.list_snapshots("task_c")
+
+        assert [(i.version, i.id, i.checkpoint) for i in infos] == [
+            (1, "snap_task_c_1", False),
+            (2, "snap_task_c_2", False),
+            (3, "snap_task_c_3", True),
+        ]
+        assert all(i.size == len(json.dumps(_large("task_c", i.version).data)) for i in infos)
+        assert store.list_snapshots("missing") == []
+
+    def test_get_lazy_decodes_on_first_access(self, db_path: Path) -> None:
+        store = SQLiteSnapshotStore(db_path=db_path, delta_interval=4, compression="br")
+        for version in (1, 2):
+            store.save(_large("task_c", version))
+
+        with patch(
+            "asap.state.stores.sqlite.decode_payload", wraps=sqlite_module.decode_payload
+        ) as decode:
+            lazy = SQLiteSnapshotStore(db_path=db_path).get_lazy("task_c", 2)
+            assert lazy is not None and lazy.version == 2
+            assert decode.call_count == 0
+            assert lazy.data == _large("task_c", 2).data
+            assert lazy.data is lazy.data
+            assert decode.call_count > 0
+
+        latest = store.get_lazy("task_c")
+        assert latest is not None and latest.to_snapshot() == store.get("task_c")
+        assert store.get_lazy("missing") is None
+
+    def test_compact_applies_compression_setting(self, db_path: Path) -> None:
+        plain = SQLiteSnapshotStore(db_path=db_path)
+        for version in (1, 2):
+            plain.save(_large("task_c", version))
+
+        compressed = SQLiteSnapshotStore(db_path=db_path, compression="br")
+        assert compressed.compact() == 2
+        assert {e for e, _ in _encodings(db_path, "task_c").values()} == {"br"}
+        assert plain.compact() == 2
+        assert plain.get("task_c", 2).data == _large("task_c", 2).data
+
+    def test_rejects_unknown_codec(self, db_path: Path) -> None:
+        with pytest.raises(ValueError, match="compression"):
+            SQLiteAsyncSnapshotStore(db_path=db_path, compression="gzip")
+
+    def test_zstd_round_trip(self, db_path: Path) -> None:
+        pytest.importorskip("compression.zstd")
+        store = SQLiteSnapshotStore(db_path=db_path, compression="zstd")
+        store.save(_large("task_z", 1))
+
+        assert _encodings(db_path, "task_z") == {1: ("zstd", "blob")}
+        assert store.get("task_z", 1).data == _large("task_z", 1).data
+
+
 class TestSQLiteMeteringStore:
     """SQLiteMeteringStore conforms to MeteringStore and record/query/aggregate work."""
 
@@ -392,6 +662,37 @@ class TestSQLiteMeteringStore:
         assert len(page3) == 1
         assert page3[0].task_id == "t4"
 
+    @pytest.mark.asyncio
+    async def test_query_page_follows_cursor(
+        self,
+        sqlite_metering_store: SQLiteMeteringStore,
+    ) -> None:
+        """query_page resumes after the cursor, including across timestamp ties."""
+        for i in range(5):
+            await sqlite_metering_store.record(
+                UsageEvent(
+                    task_id=f"t{i}",
+                    agent_id="a1",
+                    consumer_id="c1",
+                    metrics=UsageMetrics(),
+                    timestamp=datetime(2025, 2, 8, 12, i // 2, 0, tzinfo=timezone.utc),
+                )
+            )
+        start = datetime(2025, 2, 8, 10, 0, 0, tzinfo=timezone.utc)
+        end = datetime(2025, 2, 8, 14, 0, 0, tzinfo=timezone.utc)
+
+        task_ids: list[str] = []
+        cursor: str | None = None
+        while True:
+            page = await sqlite_metering_store.query_page("a1", start, end, limit=2, cursor=cursor)
+            task_ids.extend(e.task_id for e in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert sorted(task_ids) == [f"t{i}" for i in range(5)]
+        assert len(task_ids) == 5
+
     @pytest.mark.asyncio
     async def test_aggregate_sums_metrics(
         self,
@@ -110,6 +110,44 @@ class TestCreateSnapshotStoreBackend:
                 os.environ["ASAP_STORAGE_PATH"] = env_path
 
 
+class TestCreateSnapshotStoreContext:
+    """Without ``asynchronous``, a running event loop selects the async store."""
+
+    @pytest.mark.asyncio
+    async def test_running_loop_returns_async_sqlite(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db_path = tmp_path / "context.db"
+        monkeypatch.setenv("ASAP_STORAGE_BACKEND", "sqlite")
+        monkeypatch.setenv("ASAP_STORAGE_PATH", str(db_path))
+
+        store = create_snapshot_store()
+        assert isinstance(store, SQLiteAsyncSnapshotStore)
+        assert store._db_path == db_path
+        assert isinstance(create_snapshot_store(asynchronous=False), SQLiteSnapshotStore)
+
+    @pytest.mark.asyncio
+    async def test_running_loop_returns_async_memory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ASAP_STORAGE_BACKEND", "memory")
+
+        assert isinstance(create_snapshot_store(), AsyncInMemorySnapshotStore)
+
+    def test_explicit_asynchronous_without_loop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ASAP_STORAGE_BACKEND", "memory")
+
+        assert isinstance(create_snapshot_store(asynchronous=True), AsyncInMemorySnapshotStore)
+        assert isinstance(create_snapshot_store(), InMemorySnapshotStore)
+
+    @pytest.mark.asyncio
+    async def test_invalid_backend_raises_in_async_context(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ASAP_STORAGE_BACKEND", "redis")
+
+        with pytest.raises(ValueError, match="ASAP_STORAGE_BACKEND"):
+            create_snapshot_store()
+
+
 class TestCreateAsyncSnapshotStore:
     def test_default_sqlite_returns_sqlite_async(self, tmp_path: Path) -> None:
         db_path = tmp_path / "async_factory.db"
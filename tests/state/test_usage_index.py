@@ -0,0 +1,99 @@
+"""Unit tests for the in-memory usage index.
+
+Covers:
+- ``select`` returns timestamp order (ties in arrival order) for late inserts;
+- time bounds are inclusive and agent/consumer filters intersect;
+- running totals track adds and evictions, dropping empty groups;
+- eviction compacts the dead prefix without losing live entries.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+from asap.state.stores._usage_index import UsageIndex
+
+BASE = datetime(2026, 3, 1, 23, 0, tzinfo=timezone.utc)
+
+
+class _Event(NamedTuple):
+    name: str
+    agent_id: str
+    consumer_id: str
+    timestamp: datetime
+    tokens: int = 10
+
+
+def _index(*events: _Event) -> UsageIndex[_Event]:
+    index: UsageIndex[_Event] = UsageIndex(lambda e: (e.tokens, 0, 1, 1))
+    for event in events:
+        index.add(event)
+    return index
+
+
+def _names(events: object) -> list[str]:
+    return [e.name for e in events]
+
+
+def test_select_orders_late_events_and_ties() -> None:
+    index = _index(
+        _Event("b", "a1", "c1", BASE + timedelta(minutes=2)),
+        _Event("c", "a1", "c1", BASE + timedelta(minutes=5)),
+        _Event("a", "a2", "c1", BASE),
+        _Event("b2", "a2", "c2", BASE + timedelta(minutes=2)),
+    )
+
+    assert _names(index.select()) == ["a", "b", "b2", "c"]
+    assert _names(index.select(agent_id="a2")) == ["a", "b2"]
+    assert _names(index.select(start=BASE + timedelta(minutes=2))) == ["b", "b2", "c"]
+    assert _names(index.select(end=BASE + timedelta(minutes=2))) == ["a", "b", "b2"]
+
+
+def test_select_intersects_agent_and_consumer() -> None:
+    index = _index(
+        _Event("x", "a1", "c1", BASE),
+        _Event("y", "a1", "c2", BASE),
+        _Event("z", "a2", "c1", BASE),
+    )
+
+    assert _names(index.select(agent_id="a1", consumer_id="c1")) == ["x"]
+    assert _names(index.select(agent_id="a1", consumer_id="missing")) == []
+    assert _names(index.select(agent_id="missing")) == []
+
+
+def test_totals_follow_adds_and_evictions() -> None:
+    index = _index(
+        _Event("old", "a1", "c1", BASE, tokens=5),
+        _Event("new", "a1", "c2", BASE + timedelta(hours=2), tokens=7),
+    )
+
+    assert index.totals("agent")["a1"].tokens == 12
+    assert set(index.totals("day")) == {"2026-03-01", "2026-03-02"}
+    assert index.overall().consumers == {"c1": 1, "c2": 1}
+
+    assert index.evict_before(BASE + timedelta(hours=1)) == 1
+
+    assert len(index) == 1
+    assert index.oldest() == BASE + timedelta(hours=2)
+    assert index.totals("agent")["a1"].tasks == 1
+    assert set(index.totals("consumer")) == {"c2"}
+    assert set(index.totals("day")) == {"2026-03-02"}
+    assert index.overall().consumers == {"c2": 1}
+    assert _names(index.select(consumer_id="c1")) == []
+
+
+def test_eviction_compacts_and_keeps_live_entries() -> None:
+    index = _index(
+        *(_Event(f"e{i}", f"a{i % 2}", "c1", BASE + timedelta(minutes=i)) for i in range(10))
+    )
+
+    assert index.evict_before(BASE + timedelta(minutes=3)) == 3
+    index.add(_Event("late", "a0", "c1", BASE + timedelta(minutes=4, seconds=30)))
+    assert index.evict_before(BASE + timedelta(minutes=6)) == 4
+
+    assert _names(index.select()) == ["e6", "e7", "e8", "e9"]
+    assert _names(index.select(agent_id="a0")) == ["e6", "e8"]
+    assert index.evict_before(BASE + timedelta(days=1)) == 4
+    assert len(index) == 0 and index.oldest() is None
+    assert index.totals("agent") == {} and index.overall().tasks == 0
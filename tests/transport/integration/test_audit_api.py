@@ -19,6 +19,35 @@ if TYPE_CHECKING:
     from asap.transport.rate_limit import ASAPRateLimiter
 
 
+class _QueryOnlyAuditStore:
+    """Audit store written against the protocol before ``query_page`` existed."""
+
+    def __init__(self, inner: InMemoryAuditStore, *, fail_with: Exception | None = None) -> None:
+        self._inner = inner
+        self._fail_with = fail_with
+
+    async def append(self, entry: AuditEntry) -> AuditEntry:
+        return await self._inner.append(entry)
+
+    async def query(
+        self,
+        agent_urn: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[AuditEntry]:
+        if self._fail_with is not None:
+            raise self._fail_with
+        return await self._inner.query(agent_urn, start, end, limit, offset)
+
+    async def verify_chain(self) -> bool:
+        return await self._inner.verify_chain()
+
+    async def count(self) -> int:
+        return await self._inner.count()
+
+
 @pytest.fixture
 def audit_store() -> InMemoryAuditStore:
     """Provide an isolated in-memory audit store."""
@@ -199,6 +228,71 @@ class TestAuditApiQuerySuccess(NoRateLimitTestBase):
         assert payload["count"] == 1
         assert payload["entries"][0]["agent_urn"] == "urn:asap:agent:beta"
 
+    async def test_cursor_pagination_follows_next_cursor(
+        self,
+        audit_app: FastAPI,
+        seeded_audit_store: InMemoryAuditStore,
+    ) -> None:
+        async with AsyncClient(
+            transport=ASGITransport(app=audit_app), base_url="http://test"
+        ) as client:
+            first = (await client.get("/audit", params={"limit": 2})).json()
+            second = (
+                await client.get("/audit", params={"limit": 2, "cursor": first["next_cursor"]})
+            ).json()
+            invalid = await client.get("/audit", params={"cursor": "garbage"})
+
+        assert first["count"] == 2
+        assert first["next_cursor"] is not None
+        assert second["count"] == 1
+        assert second["next_cursor"] is None
+        assert second["entries"][0]["hash"] != first["entries"][-1]["hash"]
+        assert invalid.status_code == 400
+        assert invalid.json()["detail"] == "invalid cursor"
+
+    async def test_store_without_query_page_is_paged_over_query(
+        self,
+        sample_manifest: Manifest,
+        disable_rate_limiting: "ASAPRateLimiter",
+        seeded_audit_store: InMemoryAuditStore,
+    ) -> None:
+        app = create_app(
+            sample_manifest,
+            rate_limit=TEST_RATE_LIMIT_DEFAULT,
+            audit_store=_QueryOnlyAuditStore(seeded_audit_store),
+        )
+        app.state.limiter = disable_rate_limiting
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = (await client.get("/audit", params={"limit": 2})).json()
+            second = (
+                await client.get("/audit", params={"limit": 2, "cursor": first["next_cursor"]})
+            ).json()
+
+        assert first["count"] == 2
+        assert second["count"] == 1
+        assert second["next_cursor"] is None
+        assert second["entries"][0]["hash"] != first["entries"][-1]["hash"]
+
+    async def test_store_value_error_is_not_reported_as_invalid_cursor(
+        self,
+        sample_manifest: Manifest,
+        disable_rate_limiting: "ASAPRateLimiter",
+    ) -> None:
+        app = create_app(
+            sample_manifest,
+            rate_limit=TEST_RATE_LIMIT_DEFAULT,
+            audit_store=_QueryOnlyAuditStore(
+                InMemoryAuditStore(), fail_with=ValueError("backend exploded")
+            ),
+        )
+        app.state.limiter = disable_rate_limiting
+        async with AsyncClient(
+            transport=ASGITransport(app=app, raise_app_exceptions=False), base_url="http://test"
+        ) as client:
+            response = await client.get("/audit")
+
+        assert response.status_code == 500
+
     async def test_empty_store_returns_empty_entries(
         self,
         sample_manifest: Manifest,
@@ -215,7 +309,7 @@ class TestAuditApiQuerySuccess(NoRateLimitTestBase):
             response = await client.get("/audit")
 
         assert response.status_code == 200
-        assert response.json() == {"entries": [], "count": 0}
+        assert response.json() == {"entries": [], "count": 0, "next_cursor": None}
 
     async def test_audit_not_configured_returns_404(
         self,
@@ -1,4 +1,4 @@
-"""Integration tests for server-side decompression.
+"""Integration tests for server-side decompression and response compression.
 
 Tests cover:
 - Decompression of gzip-encoded requests
@@ -7,6 +7,7 @@ Tests cover:
 - Error handling for unsupported encodings
 - Decompression bomb prevention
 - Edge cases: threshold boundary, decompression failure recovery
+- Response compression negotiated from Accept-Encoding
 """
 
 import gzip
@@ -21,14 +22,17 @@ if TYPE_CHECKING:
 
 from asap.models.entities import Manifest
 from asap.models.envelope import Envelope
+from asap.observability import get_metrics
 from asap.transport.compression import (
     COMPRESSION_THRESHOLD,
     CompressionAlgorithm,
+    ResponseCompressionPolicy,
     compress_payload,
     decompress_payload,
     is_brotli_available,
 )
 from asap.transport.handlers import HandlerRegistry, create_echo_handler
+from asap.transport.jsonrpc import PARSE_ERROR
 from asap.transport.server import create_app
 
 from ..conftest import NoRateLimitTestBase
@@ -273,6 +277,39 @@ class TestCompressionErrorHandling(NoRateLimitTestBase):
 
         assert response.status_code == 400
 
+    @pytest.mark.parametrize(
+        ("body", "message"),
+        [
+            (b"\xff{}", "Invalid UTF-8 encoding"),
+            (b"\xef\xbb\xbf{}", "Invalid JSON"),
+            (b"{not json", "Invalid JSON"),
+        ],
+        ids=["invalid-utf8", "bom", "malformed"],
+    )
+    def test_decompressed_body_parse_errors(
+        self, test_app: TestClient, body: bytes, message: str
+    ) -> None:
+        """Verify UTF-8 and JSON errors in an inflated body keep their JSON-RPC parse error text."""
+        response = test_app.post(
+            "/asap",
+            content=gzip.compress(body),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+
+        error = response.json()["error"]
+        assert error["code"] == PARSE_ERROR
+        assert error["data"]["error"].startswith(message)
+
+    def test_lone_surrogate_escape_is_not_a_parse_error(self, test_app: TestClient) -> None:
+        """Verify a ``\\ud800`` escape parses like json.loads (rejected later as a bad request)."""
+        response = test_app.post(
+            "/asap",
+            content=b'{"jsonrpc": "2.0", "method": "\\ud800", "id": 1}',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.json()["error"]["code"] != PARSE_ERROR
+
 
 class TestDecompressionBombPrevention(NoRateLimitTestBase):
     """Tests for decompression bomb prevention."""
@@ -326,6 +363,30 @@ class TestDecompressionBombPrevention(NoRateLimitTestBase):
         assert response.status_code == 413
         assert "Decompressed request size" in response.json()["detail"]
 
+    @pytest.mark.skipif(not is_brotli_available(), reason="brotli not installed")
+    def test_brotli_bomb_rejected_without_full_inflation(
+        self,
+        no_auth_manifest: Manifest,
+        test_registry: HandlerRegistry,
+    ) -> None:
+        """Verify a highly compressed brotli body is rejected with 413."""
+        app = create_app(no_auth_manifest, test_registry, max_request_size=1024)
+        client = TestClient(app)
+
+        compressed_body, _ = compress_payload(
+            b'{"data": "' + b"x" * (8 * 1024 * 1024) + b'"}', CompressionAlgorithm.BROTLI
+        )
+        assert len(compressed_body) < 1024
+
+        response = client.post(
+            "/asap",
+            content=compressed_body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "br"},
+        )
+
+        assert response.status_code == 413
+        assert "Decompressed request size" in response.json()["detail"]
+
 
 class TestCompressionRoundTrip(NoRateLimitTestBase):
     """End-to-end tests for compression round trip."""
@@ -640,3 +701,144 @@ class TestMixedCompressionScenarios(NoRateLimitTestBase):
             )
 
             assert response.status_code == 200, f"Failed for input {i}: {input_data}"
+
+
+def _large_echo_request(manifest: Manifest) -> dict[str, Any]:
+    envelope = Envelope(
+        asap_version="0.1",
+        sender="urn:asap:agent:client",
+        recipient=manifest.id,
+        payload_type="task.request",
+        payload={
+            "conversation_id": "conv_large_response",
+            "skill_id": "echo",
+            "input": {"artifact": "response artifact line\n" * 500},
+        },
+    )
+    return {
+        "jsonrpc": "2.0",
+        "method": "asap.send",
+        "params": {"envelope": envelope.model_dump(mode="json")},
+        "id": "large-response-001",
+    }
+
+
+class TestResponseCompression(NoRateLimitTestBase):
+    """Tests for gzip/brotli encoding of JSON-RPC responses."""
+
+    def test_large_response_gzip_encoded(
+        self,
+        test_app: TestClient,
+        no_auth_manifest: Manifest,
+    ) -> None:
+        """Verify large responses are compressed when the client accepts gzip."""
+        metrics = get_metrics()
+        labels = {"encoding": "gzip", "endpoint": "/asap"}
+        ratio_count_before = metrics.get_histogram_count("asap_response_compression_ratio", labels)
+
+        response = test_app.post(
+            "/asap",
+            json=_large_echo_request(no_auth_manifest),
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        echoed = response.json()["result"]["envelope"]["payload"]["result"]["echoed"]
+        assert echoed["artifact"].startswith("response artifact line")
+        assert (
+            metrics.get_histogram_count("asap_response_compression_ratio", labels)
+            == ratio_count_before + 1
+        )
+        assert metrics.get_counter("asap_response_compressed_bytes_total", labels) > 0
+
+    def test_small_response_not_compressed(
+        self,
+        test_app: TestClient,
+        sample_jsonrpc_request: dict[str, Any],
+    ) -> None:
+        """Verify responses below the threshold are sent as identity."""
+        response = test_app.post(
+            "/asap", json=sample_jsonrpc_request, headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    def test_identity_accept_encoding_not_compressed(
+        self,
+        test_app: TestClient,
+        no_auth_manifest: Manifest,
+    ) -> None:
+        """Verify clients that do not accept compression get identity responses."""
+        response = test_app.post(
+            "/asap",
+            json=_large_echo_request(no_auth_manifest),
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    def test_payload_type_policy_skips_compression(
+        self,
+        no_auth_manifest: Manifest,
+        test_registry: HandlerRegistry,
+        disable_rate_limiting: "ASAPRateLimiter",
+    ) -> None:
+        """Verify a None threshold for the response payload type disables compression."""
+        app = create_app(
+            no_auth_manifest,
+            test_registry,
+            response_compression=ResponseCompressionPolicy(
+                payload_type_thresholds={"task.response": None}
+            ),
+        )
+        app.state.limiter = disable_rate_limiting
+
+        response = TestClient(app).post(
+            "/asap",
+            json=_large_echo_request(no_auth_manifest),
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    def test_compression_disabled(
+        self,
+        no_auth_manifest: Manifest,
+        test_registry: HandlerRegistry,
+        disable_rate_limiting: "ASAPRateLimiter",
+    ) -> None:
+        """Verify response_compression=None always sends identity responses."""
+        app = create_app(no_auth_manifest, test_registry, response_compression=None)
+        app.state.limiter = disable_rate_limiting
+
+        response = TestClient(app).post(
+            "/asap",
+            json=_large_echo_request(no_auth_manifest),
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    def test_batch_response_compressed(
+        self,
+        test_app: TestClient,
+        no_auth_manifest: Manifest,
+    ) -> None:
+        """Verify a JSON-RPC batch array is compressed as a whole."""
+        batch = [_large_echo_request(no_auth_manifest), _large_echo_request(no_auth_manifest)]
+        batch[1]["id"] = "large-response-002"
+
+        response = test_app.post("/asap", json=batch, headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert [item["id"] for item in response.json()] == [
+            "large-response-001",
+            "large-response-002",
+        ]
@@ -16,7 +16,7 @@ from fastapi.testclient import TestClient
 from asap.models.entities import Capability, Endpoint, Manifest, Skill
 from asap.models.envelope import Envelope
 from asap.models.payloads import TaskRequest
-from asap.transport.lambda_codec import LAMBDA_CONTENT_TYPE, decode
+from asap.transport.lambda_codec import LAMBDA_CONTENT_TYPE, build_accept_header, decode
 from asap.transport.jsonrpc import JsonRpcRequest
 from asap.transport.server import create_app
 
@@ -111,6 +111,38 @@ class TestLambdaNegotiationHappyPath(NoRateLimitTestBase):
         assert "envelope" in lambda_data["result"]
 
 
+class TestLambdaV2Negotiation(NoRateLimitTestBase):
+    """Test negotiation of the dictionary-based λ2 format."""
+
+    def test_v2_response_when_dictionary_offered(self) -> None:
+        app = create_app(_test_manifest())
+        client = TestClient(app)
+        response = client.post(
+            "/asap",
+            json=_make_jsonrpc_body(),
+            headers={"Accept": build_accept_header()},
+        )
+        assert response.status_code == 200
+        assert "v=2" in response.headers["content-type"]
+        assert "dict=asap-default-1" in response.headers["content-type"]
+        assert response.text.startswith("λ2:asap-default-1:")
+        decoded = json.loads(decode(response.text))
+        assert "envelope" in decoded["result"]
+
+    def test_v1_response_when_dictionary_unknown(self) -> None:
+        app = create_app(_test_manifest())
+        client = TestClient(app)
+        response = client.post(
+            "/asap",
+            json=_make_jsonrpc_body(),
+            headers={"Accept": f"{LAMBDA_CONTENT_TYPE};v=2;dict=unknown-dict-9"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(LAMBDA_CONTENT_TYPE)
+        assert "v=2" not in response.headers["content-type"]
+        assert response.text.startswith("λ1:")
+
+
 class TestLambdaNegotiationFallback(NoRateLimitTestBase):
     """Test graceful fallback when Lambda is not requested."""
 
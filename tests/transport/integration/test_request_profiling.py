@@ -0,0 +1,162 @@
+"""Integration tests for opt-in per-stage request profiling on POST /asap."""
+
+from typing import TYPE_CHECKING, Any
+
+from fastapi.testclient import TestClient
+
+if TYPE_CHECKING:
+    from asap.transport.rate_limit import ASAPRateLimiter
+
+from asap.models.entities import Manifest
+from asap.models.envelope import Envelope
+from asap.observability import get_metrics
+from asap.observability.metrics import MetricsCollector
+from asap.observability.profiling import (
+    STAGE_DURATION_METRIC,
+    RequestProfile,
+    RequestProfiler,
+    RequestStageHook,
+)
+from asap.transport.handlers import HandlerRegistry, create_echo_handler
+from asap.transport.server import create_app
+
+from ..conftest import NoRateLimitTestBase
+
+
+class _CollectingHook(RequestStageHook):
+    def __init__(self) -> None:
+        self.profiles: list[RequestProfile] = []
+
+    def on_request_end(self, profile: RequestProfile) -> None:
+        self.profiles.append(profile)
+
+
+def _request(manifest: Manifest, request_id: str) -> dict[str, Any]:
+    envelope = Envelope(
+        asap_version="0.1",
+        sender="urn:asap:agent:client",
+        recipient=manifest.id,
+        payload_type="task.request",
+        payload={
+            "conversation_id": "conv_profile",
+            "skill_id": "echo",
+            "input": {"message": "profile me"},
+        },
+    )
+    return {
+        "jsonrpc": "2.0",
+        "method": "asap.send",
+        "params": {"envelope": envelope.model_dump(mode="json")},
+        "id": request_id,
+    }
+
+
+def _client(
+    manifest: Manifest,
+    limiter: "ASAPRateLimiter",
+    profiler: RequestProfiler | None,
+) -> TestClient:
+    registry = HandlerRegistry()
+    registry.register("task.request", create_echo_handler())
+    app = create_app(manifest, registry, request_profiler=profiler)
+    app.state.limiter = limiter
+    return TestClient(app)
+
+
+class TestRequestProfiling(NoRateLimitTestBase):
+    """Tests for the request_profiler option of create_app."""
+
+    def test_success_request_times_every_stage(
+        self,
+        no_auth_manifest: Manifest,
+        disable_rate_limiting: "ASAPRateLimiter",
+    ) -> None:
+        """A successful request reports every pipeline stage to metrics and hooks."""
+        metrics = MetricsCollector()
+        hook = _CollectingHook()
+        client = _client(
+            no_auth_manifest,
+            disable_rate_limiting,
+            RequestProfiler(hooks=[hook], metrics=metrics),
+        )
+
+        response = client.post("/asap", json=_request(no_auth_manifest, "profiled-1"))
+
+        assert response.status_code == 200
+        assert len(hook.profiles) == 1
+        profile = hook.profiles[0]
+        assert profile.request_id == "profiled-1"
+        assert profile.payload_type == "task.request"
+        assert list(profile.stages) == [
+            "parse",
+            "auth",
+            "envelope",
+            "trace",
+            "sender",
+            "timestamp",
+            "nonce",
+            "dispatch",
+            "audit",
+            "serialize",
+            "compress",
+        ]
+        for stage in profile.stages:
+            assert metrics.get_histogram_count(STAGE_DURATION_METRIC, {"stage": stage}) == 1
+
+    def test_rejected_request_stops_at_failing_stage(
+        self,
+        no_auth_manifest: Manifest,
+        disable_rate_limiting: "ASAPRateLimiter",
+    ) -> None:
+        """Requests rejected during preparation only report the stages that ran."""
+        hook = _CollectingHook()
+        client = _client(
+            no_auth_manifest,
+            disable_rate_limiting,
+            RequestProfiler(hooks=[hook], metrics=MetricsCollector()),
+        )
+        body = _request(no_auth_manifest, "profiled-2")
+        del body["params"]["envelope"]
+
+        response = client.post("/asap", json=body)
+
+        assert response.status_code == 200
+        assert "error" in response.json()
+        assert list(hook.profiles[0].stages) == ["parse", "auth", "envelope"]
+
+    def test_batch_items_profiled_individually(
+        self,
+        no_auth_manifest: Manifest,
+        disable_rate_limiting: "ASAPRateLimiter",
+    ) -> None:
+        """Each batch item gets its own profile."""
+        hook = _CollectingHook()
+        client = _client(
+            no_auth_manifest,
+            disable_rate_limiting,
+            RequestProfiler(hooks=[hook], metrics=MetricsCollector()),
+        )
+
+        response = client.post(
+            "/asap",
+            json=[_request(no_auth_manifest, "item-1"), _request(no_auth_manifest, "item-2")],
+        )
+
+        assert response.status_code == 200
+        assert sorted(str(p.request_id) for p in hook.profiles) == ["item-1", "item-2"]
+        assert all("dispatch" in p.stages for p in hook.profiles)
+
+    def test_profiling_disabled_by_default(
+        self,
+        no_auth_manifest: Manifest,
+        disable_rate_limiting: "ASAPRateLimiter",
+    ) -> None:
+        """Without a profiler no stage histogram is recorded."""
+        metrics = get_metrics()
+        before = metrics.get_histogram_count(STAGE_DURATION_METRIC, {"stage": "dispatch"})
+        client = _client(no_auth_manifest, disable_rate_limiting, None)
+
+        response = client.post("/asap", json=_request(no_auth_manifest, "plain-1"))
+
+        assert response.status_code == 200
+        assert metrics.get_histogram_count(STAGE_DURATION_METRIC, {"stage": "dispatch"}) == before
@@ -7,6 +7,7 @@ array body per JSON-RPC 2.0 batch specification.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import TYPE_CHECKING, Any
 
@@ -14,16 +15,21 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from asap.models.entities import Capability, Endpoint, Manifest, Skill
+from asap.models.enums import TaskStatus
 from asap.models.envelope import Envelope
-from asap.models.payloads import TaskRequest
+from asap.models.payloads import TaskRequest, TaskResponse
+from asap.transport.handlers import HandlerRegistry
 from asap.transport.jsonrpc import (
     ASAP_METHOD,
     INVALID_REQUEST,
+    METHOD_NOT_FOUND,
     PARSE_ERROR,
 )
 from asap.transport.rate_limit import create_test_limiter, get_remote_address
 from asap.transport.server import create_app
 
+from tests.factories import create_auth_manifest
+
 if TYPE_CHECKING:
     from asap.transport.rate_limit import ASAPRateLimiter
 
@@ -350,3 +356,125 @@ class TestBatchClient(NoRateLimitTestBase):
             # The forged JSON-RPC id appears as the expected request_id, proving
             # the unknown-id branch fired (no sent request had that id).
             assert repr("forged-id-not-in-batch") in str(exc_info.value)
+
+
+class TestBatchEngine(NoRateLimitTestBase):
+    """Native batch engine: shared auth, bounded concurrency, single serialization."""
+
+    @staticmethod
+    def _slow_registry(tracker: dict[str, int]) -> HandlerRegistry:
+        registry = HandlerRegistry()
+
+        async def slow_echo(envelope: Envelope, manifest: Manifest) -> Envelope:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+            await asyncio.sleep(0.01)
+            tracker["active"] -= 1
+            return Envelope(
+                asap_version="0.1",
+                sender=manifest.id,
+                recipient=envelope.sender,
+                payload_type="task.response",
+                payload=TaskResponse(
+                    task_id="task-batch",
+                    status=TaskStatus.COMPLETED,
+                    result={"echo": envelope.payload_dict.get("input", {})},
+                ).model_dump(),
+                correlation_id=envelope.id,
+            )
+
+        registry.register("task.request", slow_echo)
+        return registry
+
+    async def test_max_batch_concurrency_bounds_dispatch(
+        self, disable_rate_limiting: ASAPRateLimiter
+    ) -> None:
+        tracker = {"active": 0, "peak": 0}
+        app_instance = create_app(
+            _make_manifest(),
+            self._slow_registry(tracker),
+            rate_limit=TEST_RATE_LIMIT_DEFAULT,
+            max_batch_size=20,
+            max_batch_concurrency=3,
+        )
+        app_instance.state.limiter = disable_rate_limiting
+        batch_body = [_make_rpc_request(_make_envelope(), f"r{i}") for i in range(12)]
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app_instance), base_url="http://test"
+        ) as client:
+            resp = await client.post("/asap", content=json.dumps(batch_body))
+
+        data = resp.json()
+        assert app_instance.state.max_batch_concurrency == 3
+        assert [item["id"] for item in data] == [f"r{i}" for i in range(12)]
+        assert all("result" in item for item in data)
+        assert 1 <= tracker["peak"] <= 3
+
+    async def test_auth_runs_once_per_http_request(
+        self, disable_rate_limiting: ASAPRateLimiter
+    ) -> None:
+        calls: list[str] = []
+
+        def validator(token: str) -> str | None:
+            calls.append(token)
+            return "urn:asap:agent:client" if token == "valid-token" else None
+
+        app_instance = create_app(
+            create_auth_manifest(),
+            token_validator=validator,
+            rate_limit=TEST_RATE_LIMIT_DEFAULT,
+        )
+        app_instance.state.limiter = disable_rate_limiting
+        batch_body = [_make_rpc_request(_make_envelope(), f"r{i}") for i in range(4)]
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app_instance), base_url="http://test"
+        ) as client:
+            ok = await client.post(
+                "/asap",
+                content=json.dumps(batch_body),
+                headers={"Authorization": "Bearer valid-token"},
+            )
+            bad = await client.post(
+                "/asap",
+                content=json.dumps(batch_body),
+                headers={"Authorization": "Bearer wrong-token"},
+            )
+
+        assert calls == ["valid-token", "wrong-token"]
+        assert all("result" in item for item in ok.json())
+        bad_items = bad.json()
+        assert [item["id"] for item in bad_items] == [f"r{i}" for i in range(4)]
+        assert all(item["error"]["code"] == INVALID_REQUEST for item in bad_items)
+
+    async def test_items_are_not_reparsed(
+        self, disable_rate_limiting: ASAPRateLimiter, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        app_instance = create_app(_make_manifest(), rate_limit=TEST_RATE_LIMIT_DEFAULT)
+        app_instance.state.limiter = disable_rate_limiting
+        handler = app_instance.state.request_handler
+
+        async def fail_parse(*_: Any, **__: Any) -> Any:
+            raise AssertionError("batch items must not go through body parsing")
+
+        monkeypatch.setattr(handler, "parse_json_body", fail_parse)
+        monkeypatch.setattr(handler, "read_body_bytes", fail_parse)
+        batch_body = [
+            _make_rpc_request(_make_envelope(), "r1"),
+            {"jsonrpc": "2.0", "method": "unknown.method", "params": {}, "id": "r2"},
+        ]
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app_instance), base_url="http://test"
+        ) as client:
+            resp = await client.post("/asap", content=json.dumps(batch_body))
+
+        data = resp.json()
+        assert "result" in data[0]
+        assert data[1]["error"]["code"] == METHOD_NOT_FOUND
+        assert data[1]["id"] == "r2"
+
+    def test_invalid_max_batch_concurrency_rejected(self) -> None:
+        with pytest.raises(ValueError, match="max_batch_concurrency"):
+            create_app(_make_manifest(), max_batch_concurrency=0)
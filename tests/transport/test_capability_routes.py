@@ -6,6 +6,7 @@ Covers:
 - ``POST /asap/capability/execute``  — success, no grant, constraint violation, bad body
 - ``POST /asap/agent/reactivate``    — success, revoked, absolute exceeded, wrong host
 - ``POST /asap/agent/register``      — with capabilities (partial approval)
+- Verified-token cache invalidation by revoke / rotate-key
 """
 
 from __future__ import annotations
@@ -18,7 +19,7 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from asap.auth.agent_jwt import create_agent_jwt, create_host_jwt
+from asap.auth.agent_jwt import VerifiedTokenCache, create_agent_jwt, create_host_jwt
 from asap.auth.capabilities import CapabilityDefinition, CapabilityRegistry
 from asap.auth.identity import (
     HostIdentity,
@@ -59,6 +60,7 @@ def _setup(
     isolated_rate_limiter: ASAPRateLimiter | None,
     *,
     capabilities: list[CapabilityDefinition] | None = None,
+    verified_token_cache: VerifiedTokenCache | None = None,
 ) -> tuple[FastAPI, InMemoryAgentStore, InMemoryHostStore, CapabilityRegistry]:
     """Create app with identity stores and a capability registry."""
     agent_store = InMemoryAgentStore()
@@ -73,6 +75,7 @@ def _setup(
         identity_host_store=host_store,
         identity_agent_store=agent_store,
         identity_rate_limit="999999/minute",
+        identity_verified_token_cache=verified_token_cache,
     )
     app.state.capability_registry = registry
     if isolated_rate_limiter is not None:
@@ -823,6 +826,88 @@ class TestRegisterWithCapabilities:
         assert by_cap["nonexistent:cap"].reason
 
 
+# ---------------------------------------------------------------------------
+# identity_verified_token_cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.filterwarnings("ignore:EdDSA is deprecated:UserWarning")
+class TestVerifiedTokenCacheInvalidation:
+    """Cached Agent JWT verifications are dropped when the agent changes."""
+
+    async def _cached_agent(
+        self,
+        sample_manifest: Manifest,
+        isolated_rate_limiter: ASAPRateLimiter | None,
+    ) -> tuple[TestClient, VerifiedTokenCache, Ed25519PrivateKey, str, str]:
+        cache = VerifiedTokenCache()
+        app, agent_store, _, registry = _setup(
+            sample_manifest,
+            isolated_rate_limiter,
+            capabilities=_DEFAULT_CAPS,
+            verified_token_cache=cache,
+        )
+        client = TestClient(app)
+        host_sk = Ed25519PrivateKey.generate()
+        agent_sk = Ed25519PrivateKey.generate()
+        aid = await _register_and_activate(client, app, agent_store, host_sk, agent_sk)
+        registry.grant(aid, "file:read")
+        token = _agent_jwt(agent_sk, host_sk, aid)
+        assert _grant_status(client, token) == "active"
+        return client, cache, host_sk, aid, token
+
+    async def test_revoke_invalidates_cached_agent_token(
+        self,
+        sample_manifest: Manifest,
+        isolated_rate_limiter: ASAPRateLimiter | None,
+    ) -> None:
+        client, cache, host_sk, aid, token = await self._cached_agent(
+            sample_manifest, isolated_rate_limiter
+        )
+        cached = len(cache)
+        r = client.post(
+            "/asap/agent/revoke",
+            headers={"Authorization": f"Bearer {_host_jwt(host_sk)}"},
+            json={"agent_id": aid},
+        )
+        assert r.status_code == 200
+        # The route's own Host JWT is cached; the agent's entry is dropped.
+        assert len(cache) == cached
+        assert _grant_status(client, token) is None
+
+    async def test_rotate_key_invalidates_cached_agent_token(
+        self,
+        sample_manifest: Manifest,
+        isolated_rate_limiter: ASAPRateLimiter | None,
+    ) -> None:
+        client, cache, host_sk, aid, token = await self._cached_agent(
+            sample_manifest, isolated_rate_limiter
+        )
+        cached = len(cache)
+        r = client.post(
+            "/asap/agent/rotate-key",
+            headers={"Authorization": f"Bearer {_host_jwt(host_sk)}"},
+            json={
+                "agent_id": aid,
+                "new_public_key": ed25519_public_jwk(Ed25519PrivateKey.generate()),
+            },
+        )
+        assert r.status_code == 200
+        # The route's own Host JWT is cached; the agent's entry is dropped.
+        assert len(cache) == cached
+        # Signed with the old key: no longer verifies.
+        assert _grant_status(client, token) is None
+
+
+def _grant_status(client: TestClient, token: str) -> str | None:
+    """``file:read`` grant status as seen through ``/asap/capability/list``."""
+    r = client.get("/asap/capability/list", headers={"Authorization": f"Bearer {token}"})
+    assert r.status_code == 200
+    by_name = {c["name"]: c for c in r.json()["capabilities"]}
+    status: str | None = by_name["file:read"].get("grant_status")
+    return status
+
+
 # ---------------------------------------------------------------------------
 # Parity: missing identity_limiter surfaces a clean 503, not an AttributeError/500
 # (S2 #240 must-fix 1 — HTTP-side identity-route migration).
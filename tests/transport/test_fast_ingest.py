@@ -0,0 +1,153 @@
+"""Tests for the single-parse fast ingest path on ``POST /asap``.
+
+With ``create_app(fast_ingest=True)`` the JSON-RPC wrapper and envelope are
+validated straight from the raw body. Responses (including error codes and
+``validation_errors``) must match the regular dict-based path.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from asap.models.entities import Capability, Endpoint, Manifest, Skill
+from asap.models.envelope import Envelope
+from asap.models.payloads import TaskRequest
+from asap.transport.jsonrpc import ASAP_METHOD, AsapSendRequest
+from asap.transport.server import create_app
+
+if TYPE_CHECKING:
+    from asap.transport.rate_limit import ASAPRateLimiter
+
+from .conftest import NoRateLimitTestBase, TEST_RATE_LIMIT_DEFAULT
+
+
+def _make_manifest() -> Manifest:
+    return Manifest(
+        id="urn:asap:agent:fast-ingest",
+        name="Fast Ingest Agent",
+        version="1.0.0",
+        description="Agent for fast ingest tests",
+        capabilities=Capability(
+            asap_version="0.1",
+            skills=[Skill(id="echo", description="Echo input")],
+            state_persistence=False,
+        ),
+        endpoints=Endpoint(asap="http://localhost:8000/asap"),
+    )
+
+
+def _envelope_dict() -> dict[str, Any]:
+    return Envelope(
+        id="01HFASTINGEST000000000000",
+        asap_version="0.1",
+        timestamp=datetime.now(timezone.utc),
+        sender="urn:asap:agent:client",
+        recipient="urn:asap:agent:fast-ingest",
+        payload_type="task.request",
+        payload=TaskRequest(
+            conversation_id="conv-fast",
+            skill_id="echo",
+            input={"message": "hello"},
+        ).model_dump(),
+    ).model_dump(mode="json")
+
+
+def _rpc(envelope: Any = None, **overrides: Any) -> dict[str, Any]:
+    body: dict[str, Any] = {
+        "jsonrpc": "2.0",
+        "method": ASAP_METHOD,
+        "params": {"envelope": envelope if envelope is not None else _envelope_dict()},
+        "id": "req-1",
+    }
+    body.update(overrides)
+    return body
+
+
+_VOLATILE_KEYS = frozenset({"id", "timestamp", "task_id", "trace_id", "extensions"})
+
+
+def _strip_volatile(data: Any) -> Any:
+    """Drop generated ids/timestamps/trace context so responses from two apps compare equal."""
+    if isinstance(data, dict):
+        return {k: _strip_volatile(v) for k, v in data.items() if k not in _VOLATILE_KEYS}
+    if isinstance(data, list):
+        return [_strip_volatile(v) for v in data]
+    return data
+
+
+_BAD_ENVELOPE = {**_envelope_dict(), "sender": "not-a-urn"}
+
+_BODIES: dict[str, bytes] = {
+    "valid": json.dumps(_rpc()).encode(),
+    "extra_params": json.dumps(_rpc(params={"envelope": _envelope_dict(), "extra": 1})).encode(),
+    "bad_envelope": json.dumps(_rpc(_BAD_ENVELOPE)).encode(),
+    "missing_envelope": json.dumps(_rpc(params={})).encode(),
+    "envelope_not_object": json.dumps(_rpc(params={"envelope": "nope"})).encode(),
+    "params_not_object": json.dumps(_rpc(params=["not", "an", "object"])).encode(),
+    "unknown_method": json.dumps(_rpc(method="other.method")).encode(),
+    "wrong_version": json.dumps(_rpc(jsonrpc="1.0")).encode(),
+    "extra_field": json.dumps({**_rpc(), "unexpected": True}).encode(),
+    "missing_id": json.dumps({k: v for k, v in _rpc().items() if k != "id"}).encode(),
+    "not_object": json.dumps("just a string").encode(),
+    "broken_json": b"{broken json",
+    "bad_encoding": b"\xff\xfe{}",
+}
+
+
+class TestFastIngest(NoRateLimitTestBase):
+    """Fast ingest responses match the regular path byte-for-byte (minus generated ids)."""
+
+    @pytest.fixture()
+    def apps(self, disable_rate_limiting: ASAPRateLimiter) -> tuple[Any, Any]:
+        regular = create_app(_make_manifest(), rate_limit=TEST_RATE_LIMIT_DEFAULT)
+        fast = create_app(_make_manifest(), rate_limit=TEST_RATE_LIMIT_DEFAULT, fast_ingest=True)
+        regular.state.limiter = disable_rate_limiting
+        fast.state.limiter = disable_rate_limiting
+        return regular, fast
+
+    @pytest.mark.parametrize("body", list(_BODIES.values()), ids=list(_BODIES))
+    async def test_matches_regular_path(self, apps: tuple[Any, Any], body: bytes) -> None:
+        responses = []
+        for app in apps:
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                resp = await client.post(
+                    "/asap", content=body, headers={"content-type": "application/json"}
+                )
+            responses.append((resp.status_code, _strip_volatile(resp.json())))
+
+        assert responses[0] == responses[1]
+
+    async def test_success_uses_single_validation(self, apps: tuple[Any, Any]) -> None:
+        _, fast = apps
+        handler = fast.state.request_handler
+        rpc_request = handler._fast_validate_jsonrpc_request(json.dumps(_rpc()).encode())
+
+        assert rpc_request is not None
+        assert isinstance(rpc_request.params["envelope"], Envelope)
+        assert rpc_request.id == "req-1"
+
+
+class TestAsapSendRequest:
+    """Unit tests for the typed ``asap.send`` request model."""
+
+    def test_to_jsonrpc_request_keeps_extra_params(self) -> None:
+        body = json.dumps(_rpc(params={"envelope": _envelope_dict(), "hint": "x"}))
+        rpc_request = AsapSendRequest.model_validate_json(body).to_jsonrpc_request()
+
+        assert rpc_request.method == ASAP_METHOD
+        assert rpc_request.params["hint"] == "x"
+        assert rpc_request.params["envelope"].sender == "urn:asap:agent:client"
+
+    def test_envelope_matches_dict_validation(self) -> None:
+        envelope_data = _envelope_dict()
+        body = json.dumps(_rpc(envelope_data))
+        fast_envelope = AsapSendRequest.model_validate_json(body).params.envelope
+
+        assert fast_envelope == Envelope(**envelope_data)
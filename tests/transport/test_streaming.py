@@ -140,6 +140,52 @@ async def test_asap_stream_sse_endpoint(
     assert events[-1].payload_dict.get("status") == "completed"
 
 
+@pytest.mark.anyio
+async def test_asap_stream_gzip_encoded_per_event(
+    sample_manifest: Manifest,
+    isolated_rate_limiter: ASAPRateLimiter | None,
+) -> None:
+    registry = HandlerRegistry()
+    registry.register("task.request", create_echo_handler())
+    registry.register_streaming_handler("task.request", _word_stream_handler)
+    app = create_app(sample_manifest, registry, rate_limit="999999/minute")
+    if isolated_rate_limiter is not None:
+        app.state.limiter = isolated_rate_limiter
+
+    tr = TaskRequest(conversation_id="conv-gz", skill_id="echo", input={"text": "one two"})
+    env = Envelope(
+        asap_version="0.1",
+        sender="urn:asap:agent:client",
+        recipient=sample_manifest.id,
+        payload_type="task.request",
+        payload=tr.model_dump(),
+    )
+    rpc = {
+        "jsonrpc": "2.0",
+        "method": ASAP_METHOD,
+        "params": {"envelope": env.model_dump(mode="json")},
+        "id": 1,
+    }
+
+    transport = ASGITransport(app=app)
+    async with (
+        httpx.AsyncClient(transport=transport, base_url="http://test") as client,
+        client.stream(
+            "POST", "/asap/stream", json=rpc, headers={"Accept-Encoding": "gzip"}
+        ) as response,
+    ):
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        body = "".join([chunk async for chunk in response.aiter_text()])
+
+    events = [
+        Envelope.model_validate(json.loads(line[5:].strip()))
+        for line in body.split("\n")
+        if line.startswith("data:")
+    ]
+    assert [event.payload_dict.get("chunk") for event in events] == ["one ", "two"]
+
+
 @pytest.mark.anyio
 async def test_asap_stream_negotiates_first_supported_wire_version(
     sample_manifest: Manifest,
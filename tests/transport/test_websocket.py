@@ -6,6 +6,7 @@ import json
 import threading
 import time
 from contextlib import suppress
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -1366,6 +1367,26 @@ class TestWebSocketGracefulShutdown(NoRateLimitTestBase):
             reason=WS_CLOSE_REASON_SHUTDOWN,
         )
 
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_sqlite_connection_pools_on_shutdown(
+        self,
+        sample_manifest: Manifest,
+        tmp_path: Path,
+    ) -> None:
+        """App lifespan shutdown closes the shared SQLite connection pools."""
+        from asap.state.stores import get_connection_pool
+        from asap.transport.handlers import create_default_registry
+        from asap.transport.server import create_app
+
+        app = create_app(sample_manifest, create_default_registry())
+        async with LifespanManager(app):
+            pool = get_connection_pool(tmp_path / "lifespan.db")
+            async with pool.writer():
+                pass
+
+        assert pool._closed  # noqa: SLF001
+        assert pool._writer is None  # noqa: SLF001
+
     @pytest.mark.asyncio
     async def test_websocket_connection_tracked_in_app_state_set(self) -> None:
         """``handle_websocket_connection`` adds then removes the socket from the active set."""
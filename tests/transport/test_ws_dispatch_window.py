@@ -0,0 +1,308 @@
+"""Per-connection WebSocket dispatch window.
+
+The receive loop used to await each envelope dispatch before reading the next
+frame, so one slow handler stalled every request multiplexed on the socket.
+Dispatches now run concurrently up to ``websocket_dispatch_window``, with
+backpressure once the window is full and optional per-``correlation_id``
+ordering.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from asap.models.entities import Manifest
+from asap.models.enums import TaskStatus
+from asap.models.envelope import Envelope
+from asap.models.payloads import TaskRequest, TaskResponse
+from asap.observability import get_metrics
+from asap.transport.handlers import HandlerRegistry
+from asap.transport.jsonrpc import ASAP_METHOD
+from asap.transport.server import create_app
+from asap.transport.ws._actions import WSCloseAction
+from asap.transport.ws._dispatch import _send_ws_frame
+from asap.transport.ws.codecs import ASAP_ACK_METHOD
+from asap.transport.ws.server import _WSDispatchWindow, _ws_receive_loop
+
+from .conftest import TEST_RATE_LIMIT_DEFAULT, NoRateLimitTestBase
+
+if TYPE_CHECKING:
+    from asap.transport.rate_limit import ASAPRateLimiter
+
+
+async def _delayed_echo(envelope: Envelope, manifest: Manifest) -> Envelope:
+    delay = envelope.payload_dict.get("input", {}).get("delay", 0.0)
+    await asyncio.sleep(delay)
+    return Envelope(
+        asap_version="0.1",
+        sender=manifest.id,
+        recipient=envelope.sender,
+        payload_type="task.response",
+        payload=TaskResponse(task_id="task-ws", status=TaskStatus.COMPLETED).model_dump(),
+        correlation_id=envelope.id,
+    )
+
+
+def _frame(request_id: str, delay: float, correlation_id: str | None = None) -> str:
+    envelope = Envelope(
+        asap_version="0.1",
+        sender="urn:asap:agent:client",
+        recipient="urn:asap:agent:test-server",
+        payload_type="task.request",
+        payload=TaskRequest(
+            conversation_id="conv-ws-window",
+            skill_id="echo",
+            input={"delay": delay},
+        ).model_dump(),
+        correlation_id=correlation_id,
+    )
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "method": ASAP_METHOD,
+            "params": {"envelope": envelope.model_dump(mode="json")},
+            "id": request_id,
+        }
+    )
+
+
+def _result_ids(
+    sample_manifest: Manifest,
+    disable_rate_limiting: ASAPRateLimiter,
+    frames: list[str],
+    **app_kwargs: Any,
+) -> list[str]:
+    registry = HandlerRegistry()
+    registry.register("task.request", _delayed_echo)
+    app_instance = create_app(
+        sample_manifest, registry, rate_limit=TEST_RATE_LIMIT_DEFAULT, **app_kwargs
+    )
+    app_instance.state.limiter = disable_rate_limiting
+    ids: list[str] = []
+    with (
+        TestClient(app_instance) as ws_client,
+        ws_client.websocket_connect("/asap/ws") as websocket,
+    ):
+        for frame in frames:
+            websocket.send_text(frame)
+        while len(ids) < len(frames):
+            data = json.loads(websocket.receive_text())
+            if data.get("method") == ASAP_ACK_METHOD:
+                continue
+            assert "result" in data, data
+            ids.append(data["id"])
+    return ids
+
+
+class TestWSDispatchWindowServer(NoRateLimitTestBase):
+    """End-to-end behaviour over ``WS /asap/ws``."""
+
+    def test_slow_request_does_not_block_fast_one(
+        self, sample_manifest: Manifest, disable_rate_limiting: ASAPRateLimiter
+    ) -> None:
+        ids = _result_ids(
+            sample_manifest,
+            disable_rate_limiting,
+            [_frame("slow", 0.3), _frame("fast", 0.0)],
+        )
+        assert ids == ["fast", "slow"]
+
+    def test_window_of_one_keeps_arrival_order(
+        self, sample_manifest: Manifest, disable_rate_limiting: ASAPRateLimiter
+    ) -> None:
+        ids = _result_ids(
+            sample_manifest,
+            disable_rate_limiting,
+            [_frame("slow", 0.2), _frame("fast", 0.0)],
+            websocket_dispatch_window=1,
+        )
+        assert ids == ["slow", "fast"]
+
+    def test_ordered_dispatch_serializes_same_correlation_id(
+        self, sample_manifest: Manifest, disable_rate_limiting: ASAPRateLimiter
+    ) -> None:
+        ids = _result_ids(
+            sample_manifest,
+            disable_rate_limiting,
+            [
+                _frame("a-slow", 0.3, correlation_id="conv-a"),
+                _frame("b-fast", 0.0, correlation_id="conv-b"),
+                _frame("a-fast", 0.0, correlation_id="conv-a"),
+            ],
+            websocket_ordered_dispatch=True,
+        )
+        assert ids.index("b-fast") < ids.index("a-slow") < ids.index("a-fast")
+
+    def test_window_exposed_on_app_state(self, sample_manifest: Manifest) -> None:
+        app_instance = create_app(
+            sample_manifest, websocket_dispatch_window=4, websocket_ordered_dispatch=True
+        )
+        assert app_instance.state.websocket_dispatch_window == 4
+        assert app_instance.state.websocket_ordered_dispatch is True
+
+    def test_invalid_window_rejected(self, sample_manifest: Manifest) -> None:
+        with pytest.raises(ValueError, match="websocket_dispatch_window"):
+            create_app(sample_manifest, websocket_dispatch_window=0)
+
+
+class TestWSDispatchWindowUnit:
+    """Window bookkeeping: cap, backpressure metrics, fatal outcomes."""
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrency_and_records_backpressure(self) -> None:
+        window = _WSDispatchWindow(2)
+        labels = {"window": "2"}
+        metrics = get_metrics()
+        backpressure_before = metrics.get_counter(
+            "asap_websocket_dispatch_backpressure_total", labels
+        )
+        dispatched_before = metrics.get_counter("asap_websocket_dispatch_total", labels)
+        active = 0
+        peak = 0
+
+        async def dispatch() -> WSCloseAction:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return WSCloseAction.CONTINUE
+
+        for _ in range(5):
+            await window.submit(dispatch)
+        await window.drain()
+
+        assert peak == 2
+        assert window.in_flight == 0
+        assert metrics.get_counter("asap_websocket_dispatch_total", labels) == (
+            dispatched_before + 5
+        )
+        assert (
+            metrics.get_counter("asap_websocket_dispatch_backpressure_total", labels)
+            > backpressure_before
+        )
+
+    @pytest.mark.asyncio
+    async def test_same_key_burst_does_not_fill_window(self) -> None:
+        window = _WSDispatchWindow(2, ordered=True)
+        release = asyncio.Event()
+        order: list[str] = []
+
+        def keyed(name: str) -> Callable[[], Awaitable[WSCloseAction]]:
+            async def dispatch() -> WSCloseAction:
+                order.append(name)
+                await release.wait()
+                return WSCloseAction.CONTINUE
+
+            return dispatch
+
+        async def unrelated() -> WSCloseAction:
+            order.append("unrelated")
+            return WSCloseAction.CONTINUE
+
+        async with asyncio.timeout(1.0):
+            for name in ("k1", "k2", "k3"):
+                await window.submit(keyed(name), order_key="conv")
+            await window.submit(unrelated, order_key="other")
+            await asyncio.sleep(0.01)
+        assert order == ["k1", "unrelated"]
+
+        release.set()
+        await asyncio.wait_for(window.drain(), timeout=1.0)
+        assert order == ["k1", "unrelated", "k2", "k3"]
+
+    @pytest.mark.asyncio
+    async def test_fatal_outcome_is_reported(self) -> None:
+        window = _WSDispatchWindow(4)
+
+        async def fatal() -> WSCloseAction:
+            return WSCloseAction.CLOSE_FATAL
+
+        async def crash() -> WSCloseAction:
+            raise RuntimeError("boom")
+
+        await window.submit(fatal)
+        await window.drain()
+        assert window.close_action is WSCloseAction.CLOSE_FATAL
+
+        crashing = _WSDispatchWindow(4)
+        await crashing.submit(crash)
+        await crashing.drain()
+        assert crashing.close_action is WSCloseAction.CLOSE_FATAL
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_in_flight(self) -> None:
+        window = _WSDispatchWindow(2)
+        started = asyncio.Event()
+
+        async def hang() -> WSCloseAction:
+            started.set()
+            await asyncio.sleep(60)
+            return WSCloseAction.CONTINUE
+
+        await window.submit(hang)
+        await started.wait()
+        await window.aclose()
+
+        assert window.in_flight == 0
+        assert window.close_action is WSCloseAction.CONTINUE
+
+    @pytest.mark.asyncio
+    async def test_fatal_outcome_stops_receive_loop_without_next_frame(self) -> None:
+        window = _WSDispatchWindow(4)
+        never = asyncio.Event()
+
+        class _IdleSocket:
+            scope: dict[str, Any] = {}
+
+            async def receive_text(self) -> str:
+                await never.wait()
+                return ""
+
+        loop = asyncio.create_task(
+            _ws_receive_loop(
+                _IdleSocket(),
+                None,
+                asyncio.Event(),
+                [0.0],
+                None,
+                None,
+                window,
+            )
+        )
+        await asyncio.sleep(0)
+
+        async def fatal() -> WSCloseAction:
+            return WSCloseAction.CLOSE_FATAL
+
+        await window.submit(fatal)
+        assert await asyncio.wait_for(loop, timeout=1.0) is WSCloseAction.CLOSE_FATAL
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_are_serialized(self) -> None:
+        active = 0
+        peak = 0
+        sent: list[str] = []
+
+        class _SlowSocket:
+            scope: dict[str, Any] = {}
+
+            async def send_text(self, text: str) -> None:
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.001)
+                sent.append(text)
+                active -= 1
+
+        websocket = _SlowSocket()
+        await asyncio.gather(*(_send_ws_frame(websocket, {"id": i}) for i in range(10)))
+
+        assert peak == 1
+        assert len(sent) == 10
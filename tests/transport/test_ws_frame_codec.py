@@ -0,0 +1,205 @@
+"""Negotiated WebSocket frame codecs.
+
+Clients may offer the ``asap.msgpack`` subprotocol to exchange MessagePack
+binary frames instead of JSON text; servers and clients that do not agree on a
+binary codec keep using JSON.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from asap.models.entities import Manifest
+from asap.models.envelope import Envelope
+from asap.models.payloads import TaskRequest
+from asap.transport.handlers import create_default_registry
+from asap.transport.jsonrpc import ASAP_METHOD
+from asap.transport.server import create_app
+from asap.transport.websocket import (
+    ASAP_ACK_METHOD,
+    FRAME_ENCODING_JSON,
+    FRAME_ENCODING_MSGPACK,
+    JSON_FRAME_CODEC,
+    WS_SUBPROTOCOL_JSON,
+    WS_SUBPROTOCOL_MSGPACK,
+    WebSocketTransport,
+    decode_frame_to_json,
+    encode_envelope_frame,
+    get_frame_codec,
+    negotiate_frame_codec,
+)
+
+from .conftest import TEST_RATE_LIMIT_DEFAULT, NoRateLimitTestBase
+
+if TYPE_CHECKING:
+    from asap.transport.rate_limit import ASAPRateLimiter
+
+msgpack = pytest.importorskip("msgpack")
+
+
+def _envelope() -> Envelope:
+    return Envelope(
+        asap_version="0.1",
+        sender="urn:asap:agent:client",
+        recipient="urn:asap:agent:test-server",
+        payload_type="task.request",
+        payload=TaskRequest(
+            conversation_id="conv-codec",
+            skill_id="echo",
+            input={"message": "hi"},
+        ).model_dump(),
+    )
+
+
+def _rpc(envelope: Envelope, request_id: str = "req-1") -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "method": ASAP_METHOD,
+        "params": {"envelope": envelope.model_dump(mode="json")},
+        "id": request_id,
+    }
+
+
+class TestFrameCodecs:
+    """Codec registry, encoding and subprotocol negotiation."""
+
+    def test_msgpack_roundtrip_matches_json(self) -> None:
+        envelope = _envelope().model_dump(mode="json")
+        binary = encode_envelope_frame(envelope, "req-1", encoding=FRAME_ENCODING_MSGPACK)
+        text = encode_envelope_frame(envelope, "req-1")
+
+        assert isinstance(binary, bytes)
+        assert isinstance(text, str)
+        assert len(binary) < len(text.encode("utf-8"))
+        assert decode_frame_to_json(binary, FRAME_ENCODING_MSGPACK) == json.loads(text)
+
+    def test_msgpack_decode_rejects_text_and_garbage(self) -> None:
+        with pytest.raises(ValueError):
+            decode_frame_to_json('{"a": 1}', FRAME_ENCODING_MSGPACK)
+        with pytest.raises(ValueError):
+            decode_frame_to_json(b"\xc1", FRAME_ENCODING_MSGPACK)
+
+    def test_unknown_encoding_rejected(self) -> None:
+        with pytest.raises(ValueError, match="cbor"):
+            get_frame_codec("cbor")
+
+    def test_negotiation_prefers_first_supported_offer(self) -> None:
+        assert negotiate_frame_codec(["chat", WS_SUBPROTOCOL_MSGPACK]) is get_frame_codec(
+            FRAME_ENCODING_MSGPACK
+        )
+        assert negotiate_frame_codec([WS_SUBPROTOCOL_JSON, WS_SUBPROTOCOL_MSGPACK]) is (
+            JSON_FRAME_CODEC
+        )
+        assert negotiate_frame_codec(["chat"]) is None
+        assert negotiate_frame_codec([]) is None
+
+
+class TestFrameCodecServer(NoRateLimitTestBase):
+    """Server-side negotiation over ``WS /asap/ws``."""
+
+    @pytest.fixture
+    def client(
+        self, sample_manifest: Manifest, disable_rate_limiting: ASAPRateLimiter
+    ) -> TestClient:
+        app_instance = create_app(
+            sample_manifest, create_default_registry(), rate_limit=TEST_RATE_LIMIT_DEFAULT
+        )
+        app_instance.state.limiter = disable_rate_limiting
+        return TestClient(app_instance)
+
+    def test_msgpack_subprotocol_round_trip(self, client: TestClient) -> None:
+        with client.websocket_connect(
+            "/asap/ws", subprotocols=[WS_SUBPROTOCOL_MSGPACK, WS_SUBPROTOCOL_JSON]
+        ) as websocket:
+            assert websocket.accepted_subprotocol == WS_SUBPROTOCOL_MSGPACK
+            websocket.send_bytes(msgpack.packb(_rpc(_envelope()), use_bin_type=True))
+            while True:
+                data = msgpack.unpackb(websocket.receive_bytes(), raw=False)
+                if data.get("method") != ASAP_ACK_METHOD:
+                    break
+
+        assert data["id"] == "req-1"
+        assert "result" in data, data
+        assert data["result"]["envelope"]["payload_type"] == "task.response"
+
+    def test_msgpack_error_response_is_binary(self, client: TestClient) -> None:
+        with client.websocket_connect("/asap/ws", subprotocols=[WS_SUBPROTOCOL_MSGPACK]) as ws:
+            ws.send_bytes(
+                msgpack.packb({"jsonrpc": "2.0", "method": "nope", "params": {}, "id": 7})
+            )
+            data = msgpack.unpackb(ws.receive_bytes(), raw=False)
+
+        assert data["id"] == 7
+        assert "error" in data
+
+    def test_without_subprotocol_uses_json_text(self, client: TestClient) -> None:
+        with client.websocket_connect("/asap/ws") as websocket:
+            assert websocket.accepted_subprotocol is None
+            websocket.send_text(json.dumps(_rpc(_envelope())))
+            while True:
+                data = json.loads(websocket.receive_text())
+                if data.get("method") != ASAP_ACK_METHOD:
+                    break
+
+        assert "result" in data, data
+
+
+def _mock_ws(subprotocol: str | None) -> MagicMock:
+    ws = MagicMock()
+    ws.subprotocol = subprotocol
+    ws.send = AsyncMock()
+    ws.recv = AsyncMock()
+    ws.close = AsyncMock()
+    return ws
+
+
+class TestFrameCodecClient:
+    """Client-side offer and fallback in :class:`WebSocketTransport`."""
+
+    @pytest.mark.asyncio
+    async def test_offers_msgpack_and_sends_binary_frames(self) -> None:
+        transport = WebSocketTransport(frame_encoding=FRAME_ENCODING_MSGPACK)
+        fake_ws = _mock_ws(WS_SUBPROTOCOL_MSGPACK)
+        seen: dict[str, Any] = {}
+
+        async def fake_connect(url: str, **kwargs: Any) -> MagicMock:
+            seen.update(kwargs)
+            return fake_ws
+
+        with patch("asap.transport.websocket.websockets.connect", side_effect=fake_connect):
+            await transport._do_connect("ws://localhost:8080/asap/ws")
+        try:
+            assert seen["subprotocols"] == [WS_SUBPROTOCOL_MSGPACK, WS_SUBPROTOCOL_JSON]
+            assert transport.frame_encoding == FRAME_ENCODING_MSGPACK
+
+            await transport.send(_envelope())
+            frame = fake_ws.send.await_args.args[0]
+            assert isinstance(frame, bytes)
+            assert msgpack.unpackb(frame, raw=False)["method"] == ASAP_METHOD
+        finally:
+            transport._ws = None
+            await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_json_when_server_declines(self) -> None:
+        transport = WebSocketTransport(frame_encoding=FRAME_ENCODING_MSGPACK)
+        fake_ws = _mock_ws(None)
+
+        with patch("asap.transport.websocket.websockets.connect", AsyncMock(return_value=fake_ws)):
+            await transport._do_connect("ws://localhost:8080/asap/ws")
+        try:
+            assert transport.frame_encoding == FRAME_ENCODING_JSON
+            await transport.send(_envelope())
+            assert isinstance(fake_ws.send.await_args.args[0], str)
+        finally:
+            transport._ws = None
+            await transport.close()
+
+    def test_unknown_encoding_fails_at_construction(self) -> None:
+        with pytest.raises(ValueError):
+            WebSocketTransport(frame_encoding="cbor")
@@ -4,11 +4,14 @@ Tests cover:
 - Compression/decompression with gzip and brotli
 - Compression threshold logic
 - Accept-Encoding header generation
+- Bounded incremental decompression
+- Streaming (per-event flushed) compression and response compression policy
 - Content-Encoding selection
 - Edge cases and error handling
 """
 
 import gzip
+import zlib
 from unittest.mock import patch
 
 import pytest
@@ -16,6 +19,10 @@ import pytest
 from asap.transport.compression import (
     COMPRESSION_THRESHOLD,
     CompressionAlgorithm,
+    DecompressedSizeExceeded,
+    IncrementalDecompressor,
+    ResponseCompressionPolicy,
+    StreamingCompressor,
     compress_gzip,
     compress_payload,
     decompress_gzip,
@@ -433,3 +440,139 @@ class TestCompressionIntegration:
             ratio = len(compressed) / len(json_data)
             # JSON typically compresses to < 30% of original
             assert ratio < 0.5, f"Compression ratio {ratio:.2%} higher than expected"
+
+
+class TestIncrementalDecompressor:
+    """Tests for chunked decompression with an output size limit."""
+
+    @staticmethod
+    def _feed(decompressor: IncrementalDecompressor, data: bytes, chunk_size: int = 7) -> bytes:
+        out = bytearray()
+        for start in range(0, len(data), chunk_size):
+            out += decompressor.decompress(data[start : start + chunk_size])
+        out += decompressor.finish()
+        return bytes(out)
+
+    def test_gzip_round_trip_in_small_chunks(self) -> None:
+        """Verify chunked gzip input reproduces the original payload."""
+        original = b'{"message": "chunked"}' * 200
+        decompressor = IncrementalDecompressor("gzip", max_output_size=len(original))
+        assert self._feed(decompressor, gzip.compress(original)) == original
+        assert decompressor.decompressed_size == len(original)
+
+    def test_gzip_multi_member_stream(self) -> None:
+        """Verify concatenated gzip members decode like gzip.decompress."""
+        data = gzip.compress(b"first,") + gzip.compress(b"second")
+        decompressor = IncrementalDecompressor("gzip", max_output_size=1024)
+        assert self._feed(decompressor, data) == b"first,second"
+
+    def test_gzip_bomb_stops_at_limit(self) -> None:
+        """Verify inflation stops just past the limit instead of expanding fully."""
+        bomb = gzip.compress(b"\0" * (10 * 1024 * 1024))
+        decompressor = IncrementalDecompressor("gzip", max_output_size=1000)
+
+        with pytest.raises(DecompressedSizeExceeded) as exc_info:
+            self._feed(decompressor, bomb, chunk_size=len(bomb))
+
+        assert exc_info.value.max_size == 1000
+        assert exc_info.value.decompressed_size == 1001
+
+    def test_truncated_gzip_rejected(self) -> None:
+        """Verify a gzip stream cut short raises EOFError on finish."""
+        data = gzip.compress(b"x" * 500)
+        decompressor = IncrementalDecompressor("gzip", max_output_size=1024)
+        decompressor.decompress(data[:-8])
+        with pytest.raises(EOFError):
+            decompressor.finish()
+
+    def test_corrupt_gzip_rejected(self) -> None:
+        """Verify invalid gzip data raises OSError."""
+        decompressor = IncrementalDecompressor("gzip", max_output_size=1024)
+        with pytest.raises(OSError):
+            decompressor.decompress(b"not gzip data at all")
+
+    @pytest.mark.skipif(not is_brotli_available(), reason="brotli not installed")
+    def test_brotli_bomb_stops_at_limit(self) -> None:
+        """Verify brotli inflation is bounded as well."""
+        from asap.transport.compression import compress_brotli
+
+        bomb = compress_brotli(b"\0" * (10 * 1024 * 1024))
+        decompressor = IncrementalDecompressor("br", max_output_size=1000)
+
+        with pytest.raises(DecompressedSizeExceeded) as exc_info:
+            self._feed(decompressor, bomb)
+
+        assert exc_info.value.decompressed_size < 1024 * 1024
+
+    def test_unsupported_encoding_rejected(self) -> None:
+        """Verify unknown encodings fail at construction."""
+        with pytest.raises(ValueError, match="Unsupported"):
+            IncrementalDecompressor("deflate", max_output_size=1024)
+
+
+class TestStreamingCompressor:
+    """Tests for per-event flushed stream compression."""
+
+    def test_gzip_events_decodable_as_they_arrive(self) -> None:
+        """Verify each compressed event decodes without waiting for the next one."""
+        compressor = StreamingCompressor(CompressionAlgorithm.GZIP)
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        events = [f'data: {{"seq": {i}, "text": "chunk"}}\n\n'.encode() for i in range(5)]
+
+        for event in events:
+            assert decoder.decompress(compressor.compress(event)) == event
+
+        decoder.decompress(compressor.finish())
+        assert decoder.eof
+        assert compressor.input_size == sum(len(event) for event in events)
+        assert compressor.cpu_seconds >= 0.0
+
+    def test_gzip_stream_is_valid_gzip_file(self) -> None:
+        """Verify the concatenated output is a complete gzip stream."""
+        compressor = StreamingCompressor(CompressionAlgorithm.GZIP)
+        body = compressor.compress(b"first ") + compressor.compress(b"second")
+        body += compressor.finish()
+        assert gzip.decompress(body) == b"first second"
+        assert compressor.output_size == len(body)
+
+    @pytest.mark.skipif(not is_brotli_available(), reason="brotli not installed")
+    def test_brotli_events_decodable_as_they_arrive(self) -> None:
+        """Verify brotli output is flushed per event as well."""
+        import brotli
+
+        compressor = StreamingCompressor(CompressionAlgorithm.BROTLI)
+        decoder = brotli.Decompressor()
+        for event in (b"data: one\n\n", b"data: two\n\n"):
+            assert decoder.process(compressor.compress(event)) == event
+        decoder.process(compressor.finish())
+        assert decoder.is_finished()
+
+    def test_identity_rejected(self) -> None:
+        """Verify identity is not a streaming encoding."""
+        with pytest.raises(ValueError, match="gzip or br"):
+            StreamingCompressor(CompressionAlgorithm.IDENTITY)
+
+
+class TestResponseCompressionPolicy:
+    """Tests for per-payload-type response compression thresholds."""
+
+    def test_default_threshold(self) -> None:
+        """Verify unknown payload types use the policy threshold."""
+        policy = ResponseCompressionPolicy()
+        assert policy.threshold_for("task.response") == COMPRESSION_THRESHOLD
+
+    def test_message_ack_never_compressed_by_default(self) -> None:
+        """Verify small acknowledgements skip compression."""
+        policy = ResponseCompressionPolicy()
+        assert policy.threshold_for("message.ack") is None
+        assert policy.threshold_for("MessageAck") is None
+
+    def test_override_matches_normalized_payload_type(self) -> None:
+        """Verify overrides match regardless of case and separators."""
+        policy = ResponseCompressionPolicy(
+            threshold=4096,
+            payload_type_thresholds={"task.response": 256, "TaskUpdate": None},
+        )
+        assert policy.threshold_for("TaskResponse") == 256
+        assert policy.threshold_for("task_update") is None
+        assert policy.threshold_for("task.request") == 4096
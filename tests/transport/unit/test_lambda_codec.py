@@ -1,6 +1,7 @@
 """Unit tests for Lambda Lang codec.
 
-Tests encode/decode round-trips, atom mappings, and edge cases.
+Tests encode/decode round-trips, atom mappings, edge cases, and the
+dictionary-based ``λ2:`` format.
 """
 
 from __future__ import annotations
@@ -15,10 +16,17 @@ from asap.transport.lambda_codec import (
     _DECODE_MAP,
     _ENCODE_MAP,
     _VERSION_PREFIX,
+    build_accept_header,
+    content_type_for,
     decode,
     encode,
+    encode_v2,
+    get_dictionary,
     is_available,
+    register_dictionary,
+    select_dictionary,
 )
+from asap.transport.lambda_dictionary import LambdaDictionary, default_dictionary
 
 from ...transport.conftest import NoRateLimitTestBase
 
@@ -229,3 +237,85 @@ class TestLambdaCodecEdgeCases(NoRateLimitTestBase):
         assert lambda_codec.decode is decode
         assert lambda_codec.is_available is is_available
         assert lambda_codec.LAMBDA_CONTENT_TYPE == LAMBDA_CONTENT_TYPE
+
+
+class TestLambdaCodecV2(NoRateLimitTestBase):
+    """Test the dictionary-based λ2 format."""
+
+    RESPONSE = {
+        "jsonrpc": "2.0",
+        "result": {
+            "envelope": {
+                "asap_version": "0.1",
+                "sender": "urn:asap:agent:worker",
+                "recipient": "urn:asap:agent:client",
+                "payload_type": "task.response",
+                "payload": {"task_id": "task_1", "status": "completed", "result": {}},
+                "correlation_id": "01HX",
+            }
+        },
+        "id": "req-1",
+    }
+
+    def test_round_trip(self) -> None:
+        json_str = json.dumps(self.RESPONSE, separators=(",", ":"))
+        encoded = encode_v2(json_str)
+        assert encoded.startswith("λ2:asap-default-1:")
+        assert decode(encoded) == json_str
+
+    def test_smaller_than_v1(self) -> None:
+        json_str = json.dumps(self.RESPONSE, separators=(",", ":"))
+        v1_size = len(encode(json_str).encode("utf-8"))
+        v2_size = len(encode_v2(json_str).encode("utf-8"))
+        assert v2_size < v1_size
+
+    def test_private_use_input_falls_back_to_v1(self) -> None:
+        json_str = json.dumps({"note": "\ue000"}, ensure_ascii=False)
+        encoded = encode_v2(json_str)
+        assert encoded.startswith(_VERSION_PREFIX)
+        assert decode(encoded) == json_str
+
+    def test_custom_dictionary_round_trip(self) -> None:
+        dictionary = LambdaDictionary("unit-custom-1", ['"custom_key":', '"custom_value"'])
+        json_str = '{"custom_key":"custom_value"}'
+        encoded = encode_v2(json_str, dictionary)
+        assert encoded == "λ2:unit-custom-1:{\ue000\ue001}"
+        assert decode(encoded) == json_str
+
+    def test_unknown_dictionary_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown Lambda dictionary"):
+            decode("λ2:never-registered-1:{}")
+
+    def test_register_conflicting_tokens_rejected(self) -> None:
+        register_dictionary(LambdaDictionary("unit-conflict-1", ['"a":']))
+        with pytest.raises(ValueError, match="already registered"):
+            register_dictionary(LambdaDictionary("unit-conflict-1", ['"b":']))
+
+    def test_default_dictionary_always_known(self) -> None:
+        assert get_dictionary(default_dictionary().id) is not None
+
+
+class TestLambdaCodecV2Negotiation(NoRateLimitTestBase):
+    """Test Accept header building and parsing for λ2."""
+
+    def test_accept_header_offers_v2_then_v1_then_json(self) -> None:
+        header = build_accept_header()
+        assert header.startswith(f"{LAMBDA_CONTENT_TYPE};v=2;dict=asap-default-1")
+        assert f"{LAMBDA_CONTENT_TYPE};q=0.95" in header
+        assert "application/json;q=0.9" in header
+
+    def test_select_registered_dictionary(self) -> None:
+        dictionary = select_dictionary(build_accept_header())
+        assert dictionary is not None
+        assert dictionary.id == "asap-default-1"
+
+    def test_select_ignores_v1_and_unknown_dictionaries(self) -> None:
+        assert select_dictionary(LAMBDA_CONTENT_TYPE) is None
+        assert select_dictionary(f"{LAMBDA_CONTENT_TYPE};v=2;dict=unknown-dict-9") is None
+        assert select_dictionary(f"{LAMBDA_CONTENT_TYPE};v=2;dict=asap-default-1;q=0") is None
+
+    def test_content_type_for(self) -> None:
+        assert content_type_for() == LAMBDA_CONTENT_TYPE
+        assert content_type_for(default_dictionary()) == (
+            f"{LAMBDA_CONTENT_TYPE};v=2;dict=asap-default-1"
+        )
@@ -0,0 +1,126 @@
+"""Unit tests for Lambda codec dictionaries and training."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from asap.transport.lambda_dictionary import (
+    DEFAULT_DICTIONARY_ID,
+    MAX_DICTIONARY_TOKENS,
+    LambdaDictionary,
+    default_dictionary,
+    load_dictionary,
+    read_jsonl_capture,
+    train_dictionary,
+)
+
+
+def _message(i: int) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "result": {
+            "envelope": {
+                "sender": "urn:asap:agent:worker",
+                "recipient": f"urn:asap:agent:client-{i}",
+                "payload_type": "task.response",
+                "payload": {"task_id": f"task_{i}", "status": "completed"},
+            }
+        },
+        "id": f"req-{i}",
+    }
+
+
+class TestLambdaDictionary:
+    """Tests for token substitution."""
+
+    def test_round_trip_with_overlapping_tokens(self) -> None:
+        dictionary = LambdaDictionary("overlap-1", ['"a', '"ab', '"abc"', "b"])
+        for text in ['"abc"', '"ab"', '"a"', '"abd"', 'bbb"a', ""]:
+            assert dictionary.decode(dictionary.encode(text)) == text
+
+    def test_longest_token_wins(self) -> None:
+        dictionary = LambdaDictionary("overlap-1", ['"ab', '"abc"'])
+        assert dictionary.encode('"abc"') == "\ue001"
+
+    def test_one_character_per_token(self) -> None:
+        dictionary = LambdaDictionary("keys-1", ['"jsonrpc":', '"2.0"'])
+        assert dictionary.encode('{"jsonrpc":"2.0"}') == "{\ue000\ue001}"
+
+    def test_empty_dictionary_is_identity(self) -> None:
+        dictionary = LambdaDictionary("empty-1", [])
+        assert dictionary.encode('{"a":1}') == '{"a":1}'
+
+    @pytest.mark.parametrize("dictionary_id", ["", "has space", "a:b", "x" * 65])
+    def test_invalid_id_rejected(self, dictionary_id: str) -> None:
+        with pytest.raises(ValueError, match="Invalid Lambda dictionary id"):
+            LambdaDictionary(dictionary_id, [])
+
+    @pytest.mark.parametrize("tokens", [[""], ["\ue000x"], ["dup", "dup"]])
+    def test_invalid_tokens_rejected(self, tokens: list[str]) -> None:
+        with pytest.raises(ValueError):
+            LambdaDictionary("bad-1", tokens)
+
+    def test_too_many_tokens_rejected(self) -> None:
+        with pytest.raises(ValueError, match="maximum"):
+            LambdaDictionary("big-1", [f"t{i}" for i in range(MAX_DICTIONARY_TOKENS + 1)])
+
+
+class TestDictionaryArtifact:
+    """Tests for the versioned JSON artifact."""
+
+    def test_json_round_trip(self, tmp_path: Path) -> None:
+        dictionary = LambdaDictionary("artifact-1", ['"status":', '"urn:asap:agent:'])
+        path = tmp_path / "artifact-1.json"
+        path.write_text(dictionary.to_json(), encoding="utf-8")
+
+        loaded = load_dictionary(path)
+
+        assert loaded.id == "artifact-1"
+        assert loaded.tokens == dictionary.tokens
+
+    def test_wrong_format_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Not a Lambda dictionary"):
+            LambdaDictionary.from_json('{"id": "x", "tokens": []}')
+
+    def test_unsupported_version_rejected(self) -> None:
+        document = {"format": "asap-lambda-dictionary", "version": 99, "id": "x", "tokens": []}
+        with pytest.raises(ValueError, match="Unsupported Lambda dictionary version"):
+            LambdaDictionary.from_json(json.dumps(document))
+
+    def test_default_dictionary_is_packaged(self) -> None:
+        dictionary = default_dictionary()
+        assert dictionary.id == DEFAULT_DICTIONARY_ID
+        assert '"payload_type":' in dictionary.tokens
+
+
+class TestTrainDictionary:
+    """Tests for learning dictionaries from captured messages."""
+
+    def test_learns_keys_values_and_urn_prefixes(self) -> None:
+        dictionary = train_dictionary([_message(i) for i in range(10)], "trained-1")
+
+        assert '"payload_type":' in dictionary.tokens
+        assert '"task.response"' in dictionary.tokens
+        assert '"urn:asap:agent:' in dictionary.tokens
+        # Unique values never reach min_count
+        assert '"req-3"' not in dictionary.tokens
+
+    def test_trained_dictionary_beats_default_on_its_traffic(self) -> None:
+        messages = [_message(i) for i in range(10)]
+        trained = train_dictionary(messages, "trained-1")
+        text = json.dumps(messages[0], separators=(",", ":"))
+
+        assert trained.decode(trained.encode(text)) == text
+        assert len(trained.encode(text)) < len(default_dictionary().encode(text))
+
+    def test_max_tokens_keeps_highest_savings(self) -> None:
+        dictionary = train_dictionary([_message(i) for i in range(10)], "small-1", max_tokens=1)
+        assert dictionary.tokens == ('"urn:asap:agent:',)
+
+    def test_read_jsonl_capture(self, tmp_path: Path) -> None:
+        capture = tmp_path / "capture.jsonl"
+        capture.write_text('{"a": 1}\n\n{"b": 2}\n', encoding="utf-8")
+        assert list(read_jsonl_capture(capture)) == [{"a": 1}, {"b": 2}]
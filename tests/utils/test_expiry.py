@@ -0,0 +1,48 @@
+"""Unit tests for the heap-backed expiring key set used by replay guards."""
+
+from asap.utils.expiry import ExpiringKeySet
+
+
+class TestExpiringKeySet:
+    """Tests for ExpiringKeySet pruning and eviction."""
+
+    def test_live_respects_expiry(self) -> None:
+        """A key is live strictly before its expiry."""
+        keys: ExpiringKeySet[str] = ExpiringKeySet()
+        keys.add("a", expires_at=10.0)
+        assert keys.live("a", now=9.9)
+        assert not keys.live("a", now=10.0)
+        assert not keys.live("missing", now=0.0)
+
+    def test_prune_removes_only_expired(self) -> None:
+        """prune() pops expired keys in expiry order and leaves the rest."""
+        keys: ExpiringKeySet[str] = ExpiringKeySet()
+        for name, expires_at in (("c", 30.0), ("a", 10.0), ("b", 20.0)):
+            keys.add(name, expires_at)
+        assert keys.prune(now=20.0) == 2
+        assert len(keys) == 1
+        assert "c" in keys and keys["c"] == 30.0
+        assert keys.prune(now=20.0) == 0
+
+    def test_re_added_key_uses_latest_expiry(self) -> None:
+        """The stale heap entry of a re-added key neither removes nor evicts it."""
+        keys: ExpiringKeySet[str] = ExpiringKeySet()
+        keys.add("a", expires_at=10.0)
+        keys.add("b", expires_at=15.0)
+        keys.add("a", expires_at=50.0)
+        assert keys.prune(now=12.0) == 0
+        assert keys.live("a", now=12.0)
+        assert keys.evict_to(1) == 1
+        assert "b" not in keys and "a" in keys
+        keys.add("a", expires_at=5.0)
+        assert keys.prune(now=6.0) == 1
+        assert len(keys) == 0
+
+    def test_evict_to_drops_earliest_expiry_first(self) -> None:
+        """evict_to() keeps the latest-expiring keys."""
+        keys: ExpiringKeySet[int] = ExpiringKeySet()
+        for i in range(10):
+            keys.add(i, expires_at=float(100 - i))
+        assert keys.evict_to(3) == 7
+        assert sorted(k for k in range(10) if k in keys) == [0, 1, 2]
+        assert keys.evict_to(5) == 0